@@ -8,6 +8,8 @@ array.array type, supporting a wide range of numeric operations including:
   - ``scale()`` - Scale elements in-place
   - ``mean()`` - Compute arithmetic mean
   - ``min()``, ``max()`` - Find minimum/maximum values
+  - ``min_max()`` - Minimum and maximum in one fused pass
+  - ``argmin()``, ``argmax()``, ``argminmax()`` - Positions of the extrema
 
 **Transformations:**
   - ``map()``, ``map_inplace()`` - Apply function to each element
@@ -17,16 +19,77 @@ array.array type, supporting a wide range of numeric operations including:
 **Statistical Operations:**
   - ``std()``, ``var()`` - Standard deviation and variance
   - ``median()`` - Find median value
+  - ``average()`` - Mean, optionally weighted (``var()``/``std()`` also take ``weights=``)
+  - ``cov()``, ``corr()`` - Covariance and Pearson correlation of two arrays
+  - ``linregress()`` - Least-squares line fit of two arrays
+  - ``nansum()``, ``nanmean()``, ``nanvar()``, ``nanstd()`` - Reductions that skip NaN
+  - ``nanmin()``, ``nanmax()``, ``nanmedian()`` - NaN-skipping extrema and median
+  - ``count_nan()`` - Number of NaN values
 
 **Element-wise Operations:**
   - ``add()``, ``multiply()`` - Element-wise arithmetic
   - ``clip()`` - Clip values to range
   - ``normalize()`` - Normalize to [0, 1] range
+  - ``where()`` - Choose between two arrays or scalars by mask
+  - ``fill_nan()``, ``replace()`` - Overwrite NaN or matching values in place
 
 **Array Manipulation:**
   - ``reverse()`` - Reverse array in-place
   - ``sort()`` - Sort array in-place
-  - ``unique()`` - Get unique elements
+  - ``argsort()`` - Stable sorting permutation as compact uint32 indices
+  - ``unique()`` - Unique elements, optionally with inverse codes and counts
+  - ``top_k()`` - Select the k largest/smallest elements without a full sort
+  - ``concatenate()`` - Join many arrays into one exactly sized buffer
+
+**Streaming Sketches:**
+  - ``QuantileSketch`` - Mergeable approximate quantiles (t-digest)
+  - ``HyperLogLog`` - Mergeable approximate distinct counting
+  - ``count_distinct()`` - Exact or approximate number of distinct values
+  - ``FrequencySketch`` - Heavy hitters and frequency estimates (count-min)
+
+**Rolling Windows:**
+  - ``rolling_sum()``, ``rolling_mean()`` - Trailing-window sum and mean
+  - ``rolling_var()``, ``rolling_std()`` - Trailing-window variance and standard deviation
+  - ``rolling_min()``, ``rolling_max()`` - Trailing-window minimum and maximum
+
+**Cumulative Operations:**
+  - ``cumsum()``, ``cumprod()`` - Inclusive/exclusive running sum and product
+  - ``cummin()``, ``cummax()`` - Running minimum and maximum
+
+**Vector Operations:**
+  - ``dot()``, ``norm()`` - Dot product and L1/L2/max norms without temporaries
+  - ``cosine()`` - Cosine similarity in a single fused pass
+  - ``dot_batch()``, ``cosine_batch()`` - Score one query against many candidates
+
+**Grouped Aggregation:**
+  - ``groupby_agg()`` - Sum/mean/count/min/max of values per distinct integer key
+  - ``segment_sum()``, ``segment_mean()``, ``segment_min()``, ``segment_max()`` - Reduce every
+    offsets-delimited segment in one call
+  - ``segment_count()`` - Length of every segment
+
+**Histograms:**
+  - ``histogram()`` - Counts per equal-width bin (O(1) per value) or per explicit edge
+  - ``bincount()`` - Occurrences of each non-negative integer, optionally accumulated
+  - ``value_counts()`` - Frequency table of distinct values as ``(values, counts)``
+  - ``mode()`` - Most frequent value
+
+**Searching:**
+  - ``searchsorted()`` - Insertion points of many queries in a sorted array
+
+**Set Operations:**
+  - ``isin()`` - Membership mask or matching positions of each element in a set of values
+  - ``intersect1d()``, ``union1d()``, ``setdiff1d()`` - Sorted set algebra by linear merge
+
+**Indexing:**
+  - ``take()`` - Gather elements at an array of indices, with ``raise``/``clip``/``wrap`` modes
+  - ``put()`` - Scatter values into an array at an array of indices, in place
+
+**Masks:**
+  - ``greater()``, ``greater_equal()``, ``less()``, ``less_equal()``, ``equal()``,
+    ``not_equal()`` - Compare with a scalar into a ``uint8`` mask
+  - ``between()`` - Mask of the elements in a closed interval
+  - ``compress()`` - Elements where a mask is set, by stream compaction
+  - ``nonzero()`` - Positions of the non-zero elements of a mask
 
 **Advanced Features:**
   - ``slice()`` - Zero-copy array slicing
@@ -58,15 +121,80 @@ __version__ = "1.0.1"
 
 # Import from organized submodules
 try:
-    from arrayops.basic import max, mean, min, scale, sum
+    from arrayops.basic import (
+        argmax,
+        argmin,
+        argminmax,
+        max,
+        mean,
+        min,
+        min_max,
+        scale,
+        sum,
+    )
     from arrayops.transform import filter, map, map_inplace, reduce
-    from arrayops.stats import median, std, var
+    from arrayops.stats import (
+        average,
+        corr,
+        count_nan,
+        cov,
+        linregress,
+        median,
+        nanmax,
+        nanmean,
+        nanmedian,
+        nanmin,
+        nanstd,
+        nansum,
+        nanvar,
+        std,
+        var,
+    )
     from arrayops.stats import std_dev  # noqa: F401  # Backward compatibility alias
-    from arrayops.elementwise import add, clip, multiply, normalize
-    from arrayops.manipulation import reverse, sort, unique
+    from arrayops.elementwise import add, clip, fill_nan, multiply, normalize, replace, where
+    from arrayops.manipulation import argsort, concatenate, reverse, sort, top_k, unique
     from arrayops.slice import slice
     from arrayops.iterator import ArrayIterator, array_iterator
     from arrayops.lazy import LazyArray, lazy_array
+    from arrayops.sketch import (
+        FrequencySketch,
+        HyperLogLog,
+        QuantileSketch,
+        count_distinct,
+    )
+    from arrayops.window import (
+        rolling_max,
+        rolling_mean,
+        rolling_min,
+        rolling_std,
+        rolling_sum,
+        rolling_var,
+    )
+    from arrayops.scan import cummax, cummin, cumprod, cumsum
+    from arrayops.vector import cosine, cosine_batch, dot, dot_batch, norm
+    from arrayops.groupby import (
+        groupby_agg,
+        segment_count,
+        segment_max,
+        segment_mean,
+        segment_min,
+        segment_sum,
+    )
+    from arrayops.histogram import bincount, histogram, mode, value_counts
+    from arrayops.search import searchsorted
+    from arrayops.sets import intersect1d, isin, setdiff1d, union1d
+    from arrayops.indexing import put, take
+    from arrayops.mask import (
+        between,
+        compress,
+        equal,
+        greater,
+        greater_equal,
+        less,
+        less_equal,
+        nonzero,
+        not_equal,
+    )
 
     __all__ = [
         # Basic operations
@@ -75,6 +203,10 @@ try:
         "mean",
         "min",
         "max",
+        "min_max",
+        "argmin",
+        "argmax",
+        "argminmax",
         # Transform operations
         "map",
         "map_inplace",
@@ -84,15 +216,33 @@ try:
         "std",
         "var",
         "median",
+        "average",
+        "cov",
+        "corr",
+        "linregress",
+        "nansum",
+        "nanmean",
+        "nanmin",
+        "nanmax",
+        "nanvar",
+        "nanstd",
+        "nanmedian",
+        "count_nan",
         # Element-wise operations
         "add",
         "multiply",
         "clip",
         "normalize",
+        "where",
+        "fill_nan",
+        "replace",
         # Manipulation operations
         "reverse",
         "sort",
+        "argsort",
         "unique",
+        "top_k",
+        "concatenate",
         # Slice operations
         "slice",
         # Iterator
@@ -101,6 +251,61 @@ try:
         # Lazy evaluation
         "lazy_array",
         "LazyArray",
+        # Streaming sketches
+        "QuantileSketch",
+        "HyperLogLog",
+        "count_distinct",
+        "FrequencySketch",
+        # Rolling-window operations
+        "rolling_sum",
+        "rolling_mean",
+        "rolling_var",
+        "rolling_std",
+        "rolling_min",
+        "rolling_max",
+        # Cumulative operations
+        "cumsum",
+        "cumprod",
+        "cummin",
+        "cummax",
+        # Vector operations
+        "dot",
+        "norm",
+        "cosine",
+        "dot_batch",
+        "cosine_batch",
+        # Grouped aggregation
+        "groupby_agg",
+        "segment_sum",
+        "segment_mean",
+        "segment_min",
+        "segment_max",
+        "segment_count",
+        # Histograms
+        "histogram",
+        "bincount",
+        "value_counts",
+        "mode",
+        # Searching
+        "searchsorted",
+        # Set operations
+        "isin",
+        "intersect1d",
+        "union1d",
+        "setdiff1d",
+        # Indexing
+        "take",
+        "put",
+        # Masks
+        "greater",
+        "greater_equal",
+        "less",
+        "less_equal",
+        "equal",
+        "not_equal",
+        "between",
+        "compress",
+        "nonzero",
     ]
 except ImportError as e:
     # Module not yet built - provide helpful error message
@@ -1,7 +1,7 @@
 """Type stubs for arrayops._arrayops Rust extension module."""
 
 import array
-from typing import Any, Callable, Optional, TYPE_CHECKING, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, TYPE_CHECKING, Tuple, Union
 
 if TYPE_CHECKING:
     try:
@@ -27,7 +27,7 @@ else:
 # Supported input types: array.array, numpy.ndarray, memoryview, or Apache Arrow buffers/arrays
 _ArrayLike = Union[array.array, "np.ndarray", memoryview]
 
-def sum(arr: _ArrayLike) -> Union[int, float]:
+def sum(arr: _ArrayLike, dtype: Optional[str] = None) -> Union[int, float]:
     """
     Compute the sum of all elements in an array.
 
@@ -41,20 +41,28 @@ def sum(arr: _ArrayLike) -> Union[int, float]:
             - ``numpy.ndarray``: must be 1-dimensional and contiguous (C_CONTIGUOUS or F_CONTIGUOUS)
             - ``memoryview``: read-only or writable memoryviews are supported
             - Apache Arrow buffers/arrays (``pyarrow.Buffer``, ``pyarrow.Array``, ``pyarrow.ChunkedArray``)
+        dtype: Accumulator to sum in. ``None`` (default) sums integer arrays exactly
+            and float arrays in their element type; ``"int64"`` and ``"uint64"``
+            raise ``OverflowError`` if the total does not fit; ``"int128"`` is exact;
+            ``"float64"`` accumulates any array in double precision.
 
     Returns:
         Union[int, float]: The sum of all elements.
             - Returns ``int`` for integer arrays (typecodes: ``b``, ``B``, ``h``, ``H``, ``i``, ``I``, ``l``, ``L``)
-            - Returns ``float`` for float arrays (typecodes: ``f``, ``d``)
+            - Returns ``float`` for float arrays (typecodes: ``f``, ``d``) or ``dtype="float64"``
 
     Raises:
         TypeError: If input is not an ``array.array``, ``numpy.ndarray``, ``memoryview``, or Arrow buffer/array
         TypeError: If array uses an unsupported typecode
         TypeError: If ``numpy.ndarray`` is not 1D or not contiguous
+        TypeError: If an integer ``dtype`` is requested for a float array
+        ValueError: If ``dtype`` is not one of the supported accumulators
+        OverflowError: If the total does not fit ``dtype="int64"`` or ``dtype="uint64"``
 
     Notes:
         - Empty arrays return ``0`` (integer) or ``0.0`` (float)
-        - Integer overflow follows Python's semantics (promotion to larger types)
+        - Integer sums never wrap: ``b``/``B``/``h``/``H``/``i``/``I`` accumulate in 64-bit lanes
+          and 64-bit inputs in 128 bits, without copying the input
         - Performance: ~100x faster than Python's built-in ``sum()`` for large arrays
         - Parallel execution: When built with ``--features parallel``, arrays with 1,000+ elements
           automatically use parallel processing for additional speedup on multi-core systems
@@ -239,6 +247,8 @@ def filter(
         - Empty result arrays are handled gracefully
         - Performance: ~15x faster than Python list comprehension for large arrays
         - The predicate function is called once per element in the array
+        - For comparisons against constants, ``compress(arr, greater(arr, 0))`` and the
+          other mask functions run natively without calling into Python
         - Type preservation: result type matches input type (NumPy → NumPy, array.array → array.array)
 
     Examples:
@@ -302,7 +312,7 @@ def reduce(
     """
     ...
 
-def mean(arr: _ArrayLike) -> float:
+def mean(arr: _ArrayLike, dtype: Optional[str] = None) -> float:
     """
     Compute the arithmetic mean (average) of all elements in an array.
 
@@ -316,6 +326,8 @@ def mean(arr: _ArrayLike) -> float:
             - ``numpy.ndarray``: must be 1-dimensional and contiguous
             - ``memoryview``: read-only or writable memoryviews are supported
             - Apache Arrow buffers/arrays
+        dtype: Accumulator for the sum, as in :func:`sum`. Integer arrays are
+            summed exactly by default.
 
     Returns:
         float: The arithmetic mean of all elements. Always returns a float,
@@ -323,7 +335,9 @@ def mean(arr: _ArrayLike) -> float:
 
     Raises:
         TypeError: If input is not an ``array.array``, ``numpy.ndarray``, ``memoryview``, or Arrow buffer/array
-        ValueError: If array is empty
+        TypeError: If an integer ``dtype`` is requested for a float array
+        ValueError: If array is empty or ``dtype`` is not supported
+        OverflowError: If the total does not fit ``dtype="int64"`` or ``dtype="uint64"``
 
     Notes:
         - Always returns a float, even for integer arrays
@@ -369,6 +383,7 @@ def min(arr: _ArrayLike) -> Union[int, float]:  # noqa: A001
 
     Notes:
         - Returns type matching array element type (int for integer arrays, float for float arrays)
+        - NaN propagates: any NaN in a float array gives NaN (use ``nanmin()`` to skip it)
         - Performance: ~30x faster than Python's built-in ``min()`` for large arrays
         - Parallel execution: When built with ``--features parallel``, arrays with 50,000+ elements
           automatically use parallel processing for additional speedup on multi-core systems
@@ -410,6 +425,7 @@ def max(arr: _ArrayLike) -> Union[int, float]:  # noqa: A001
 
     Notes:
         - Returns type matching array element type (int for integer arrays, float for float arrays)
+        - NaN propagates: any NaN in a float array gives NaN (use ``nanmax()`` to skip it)
         - Performance: ~30x faster than Python's built-in ``max()`` for large arrays
         - Parallel execution: When built with ``--features parallel``, arrays with 50,000+ elements
           automatically use parallel processing for additional speedup on multi-core systems
@@ -426,7 +442,76 @@ def max(arr: _ArrayLike) -> Union[int, float]:  # noqa: A001
     """
     ...
 
-def std(arr: _ArrayLike) -> float:
+def min_max(arr: _ArrayLike, skipna: bool = False) -> Tuple[Union[int, float], Union[int, float]]:
+    """
+    Find the minimum and maximum of an array in a single pass.
+
+    Args:
+        arr: Input array with numeric type.
+        skipna: NaN policy for float arrays. ``False`` (default) propagates NaN:
+            if the array contains NaN both values are NaN. ``True`` ignores NaN.
+
+    Returns:
+        Tuple[Union[int, float], Union[int, float]]: ``(min, max)`` with the
+        element type of the array (``int`` or ``float``).
+
+    Raises:
+        TypeError: If input is not a supported array type
+        ValueError: If array is empty, or if ``skipna=True`` and every value is NaN
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.min_max(array.array('i', [3, 1, 4, 1, 5]))
+        (1, 5)
+    """
+    ...
+
+def argmin(arr: _ArrayLike, skipna: bool = False) -> int:
+    """
+    Return the index of the first minimum of an array.
+
+    With ``skipna=False`` (default) the index of the first NaN is returned if the
+    array contains NaN; ``skipna=True`` ignores NaN. Raises ``ValueError`` for empty
+    arrays and for all-NaN arrays with ``skipna=True``.
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.argmin(array.array('i', [3, 1, 4, 1, 5]))
+        1
+    """
+    ...
+
+def argmax(arr: _ArrayLike, skipna: bool = False) -> int:
+    """
+    Return the index of the first maximum of an array.
+
+    NaN handling follows ``argmin()``.
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.argmax(array.array('i', [3, 1, 4, 1, 5]))
+        4
+    """
+    ...
+
+def argminmax(arr: _ArrayLike, skipna: bool = False) -> Tuple[int, int]:
+    """
+    Return ``(argmin, argmax)`` from a single pass.
+
+    NaN handling follows ``argmin()``.
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.argminmax(array.array('d', [2.0, -1.0, 7.0]))
+        (1, 2)
+    """
+    ...
+
+def std(arr: _ArrayLike, weights: Optional[_ArrayLike] = None) -> float:
     """
     Compute the population standard deviation of all elements in an array.
 
@@ -439,13 +524,18 @@ def std(arr: _ArrayLike) -> float:
             - ``numpy.ndarray``: must be 1-dimensional and contiguous
             - ``memoryview``: read-only or writable memoryviews are supported
             - Apache Arrow buffers/arrays
+        weights: Optional non-negative weights with the same typecode and length as
+            ``arr``. When given, the weighted population standard deviation is
+            computed in a single pass.
 
     Returns:
         float: The population standard deviation. Always returns a float.
 
     Raises:
         TypeError: If input is not an ``array.array``, ``numpy.ndarray``, ``memoryview``, or Arrow buffer/array
-        ValueError: If array is empty
+        TypeError: If ``weights`` has a different type than ``arr``
+        ValueError: If array is empty, ``weights`` has a different length, contains
+            negative values or sums to zero
 
     Notes:
         - Always returns a float
@@ -462,7 +552,7 @@ def std(arr: _ArrayLike) -> float:
     """
     ...
 
-def var(arr: _ArrayLike) -> float:
+def var(arr: _ArrayLike, weights: Optional[_ArrayLike] = None) -> float:
     """
     Compute the population variance of all elements in an array.
 
@@ -475,13 +565,18 @@ def var(arr: _ArrayLike) -> float:
             - ``numpy.ndarray``: must be 1-dimensional and contiguous
             - ``memoryview``: read-only or writable memoryviews are supported
             - Apache Arrow buffers/arrays
+        weights: Optional non-negative weights with the same typecode and length as
+            ``arr``. When given, the weighted population variance is computed in a
+            single pass.
 
     Returns:
         float: The population variance. Always returns a float.
 
     Raises:
         TypeError: If input is not an ``array.array``, ``numpy.ndarray``, ``memoryview``, or Arrow buffer/array
-        ValueError: If array is empty
+        TypeError: If ``weights`` has a different type than ``arr``
+        ValueError: If array is empty, ``weights`` has a different length, contains
+            negative values or sums to zero
 
     Notes:
         - Always returns a float
@@ -754,12 +849,12 @@ def reverse(arr: _ArrayLike) -> None:
     """
     ...
 
-def sort(arr: _ArrayLike) -> None:  # noqa: A001
+def sort(arr: _ArrayLike, stable: bool = True) -> None:  # noqa: A001
     """
     Sort array elements in-place in ascending order.
 
-    This function sorts the array elements in ascending order using a stable
-    sort algorithm. The array is modified in-place.
+    This function sorts the array elements in ascending order, with NaN values
+    after every number. The array is modified in-place.
 
     Args:
         arr: Input array with numeric type (modified in-place). Must be one of:
@@ -767,6 +862,8 @@ def sort(arr: _ArrayLike) -> None:  # noqa: A001
             - ``numpy.ndarray``: must be 1-dimensional and contiguous
             - ``memoryview``: must be writable (read-only memoryviews raise ValueError)
             - Apache Arrow buffers/arrays
+        stable: If True (default), use a stable merge sort; if False, use an unstable
+            pattern-defeating quicksort. Only the order of -0.0 and 0.0 can differ.
 
     Returns:
         None: This function modifies the array in-place and returns nothing
@@ -777,7 +874,8 @@ def sort(arr: _ArrayLike) -> None:  # noqa: A001
 
     Notes:
         - Modifies the array in-place; no new array is created
-        - Uses a stable sort algorithm (preserves relative order of equal elements)
+        - With ``stable=True`` (default) equal elements keep their relative order
+        - NaN values are placed last
         - Performance: ~10x faster than Python's ``array.sort()`` for large arrays
         - Parallel execution: When built with ``--features parallel``, large arrays
           automatically use parallel processing for additional speedup on multi-core systems
@@ -793,12 +891,55 @@ def sort(arr: _ArrayLike) -> None:  # noqa: A001
     """
     ...
 
-def unique(arr: _ArrayLike) -> _ArrayLike:
+def argsort(arr: _ArrayLike, stable: bool = True) -> _ArrayLike:
+    """
+    Return the indices that would sort an array in ascending order.
+
+    The indices are ``uint32`` (typecode ``I``) when the array has fewer than 2**32
+    elements, halving index memory compared with 64-bit indices, and ``uint64``
+    (typecode ``L``) otherwise. Reordering companion columns by one key column is one
+    ``argsort`` followed by a gather per column.
+
+    Args:
+        arr: Input array with numeric type (any supported typecode).
+        stable: If True (default), equal values keep their original order (merge
+            sort). If False, an unstable sort is used and ties may come in any order.
+
+    Returns:
+        Index array in the container type of ``arr``.
+
+    Raises:
+        TypeError: If the input type is unsupported
+
+    Notes:
+        - NaN values sort after every number, as in ``sort()``
+        - Parallel execution: With ``--features parallel``, arrays of 10,000+ elements
+          use rayon's parallel merge sort (or parallel unstable sort)
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> keys = array.array('d', [3.0, 1.0, 2.0, 1.0])
+        >>> order = ao.argsort(keys)
+        >>> order.typecode, list(order)
+        ('I', [1, 3, 2, 0])
+    """
+    ...
+
+def unique(
+    arr: _ArrayLike,
+    sorted: bool = True,
+    return_counts: bool = False,
+    return_inverse: bool = False,
+) -> Union[_ArrayLike, Tuple[_ArrayLike, _ArrayLike], Tuple[_ArrayLike, _ArrayLike, _ArrayLike]]:
     """
-    Return unique elements from an array, sorted in ascending order.
+    Return the distinct elements of an array, optionally with inverse codes and counts.
 
-    This function returns a new array containing only the unique elements from
-    the input array, sorted in ascending order. Duplicate elements are removed.
+    Distinct values are collected with a hash table over the native values in a single
+    pass (O(n) regardless of cardinality), then sorted if requested. Large inputs are
+    split into hash partitions that are built in parallel when the ``parallel`` feature
+    is enabled. 8- and 16-bit integer arrays use a counting table for sorted results
+    without ``return_inverse``.
 
     Args:
         arr: Input array with numeric type. Must be one of:
@@ -806,30 +947,109 @@ def unique(arr: _ArrayLike) -> _ArrayLike:
             - ``numpy.ndarray``: must be 1-dimensional and contiguous
             - ``memoryview``: read-only or writable memoryviews are supported
             - Apache Arrow buffers/arrays
+        sorted: If ``True`` (default), return the values in ascending order with NaN
+            last; if ``False``, return them in order of first occurrence.
+        return_counts: If ``True``, also return the number of occurrences of each value.
+        return_inverse: If ``True``, also return, for every element of ``arr``, the
+            position of its value in the result (factorization codes).
 
     Returns:
-        _ArrayLike: New array with unique elements, sorted in ascending order.
+        The unique values alone, or a tuple ``(values, inverse, counts)`` containing only
+        the requested arrays:
+            - ``values``: same typecode as ``arr``
+            - ``inverse``: ``uint32`` (``'I'``) codes, or ``uint64`` (``'L'``) for 2**32 or more elements
+            - ``counts``: ``uint64`` (``'L'``) occurrence counts
             - Returns ``numpy.ndarray`` if input is ``numpy.ndarray`` or Arrow array
             - Returns ``array.array`` if input is ``array.array`` or ``memoryview``
-            - Result type matches input type
 
     Raises:
         TypeError: If input is not an ``array.array``, ``numpy.ndarray``, ``memoryview``, or Arrow buffer/array
 
     Notes:
-        - Creates a new array; the original array is not modified
-        - Result contains unique elements in sorted (ascending) order
-        - Empty arrays return an empty array of the same type
-        - Performance: ~20x faster than Python's ``list(set(arr))`` for large arrays
-        - Type preservation: result type matches input type
+        - Creates new arrays; the original array is not modified
+        - ``-0.0`` and ``0.0`` are one value (the first one seen is kept), and all NaNs are one value
+        - ``values[inverse]`` reconstructs the input
+        - Empty arrays return empty arrays of the same types
 
     Examples:
         >>> import array
         >>> import arrayops as ao
         >>> arr = array.array('i', [5, 2, 8, 2, 1, 5, 9])
-        >>> unique_arr = ao.unique(arr)
-        >>> list(unique_arr)
+        >>> list(ao.unique(arr))
         [1, 2, 5, 8, 9]
+        >>> values, codes, counts = ao.unique(
+        ...     arr, sorted=False, return_inverse=True, return_counts=True
+        ... )
+        >>> list(values), list(codes), list(counts)
+        ([5, 2, 8, 1, 9], [0, 1, 2, 1, 3, 0, 4], [2, 2, 1, 1, 1])
+    """
+    ...
+
+def top_k(
+    arr: _ArrayLike,
+    k: int,
+    largest: bool = True,
+    return_indices: bool = False,
+) -> Union[_ArrayLike, Tuple[_ArrayLike, _ArrayLike]]:
+    """
+    Select the ``k`` largest (or smallest) elements without sorting the whole array.
+
+    Small ``k`` uses a bounded heap (one comparison for most elements); larger ``k``
+    uses partial selection followed by sorting only the selected elements.
+
+    Args:
+        arr: Input array with numeric type.
+        k: Number of elements to return. If ``k`` exceeds the array length, every
+            element is returned.
+        largest: Select the largest values (default) or the smallest.
+        return_indices: Also return the positions of the selected elements.
+
+    Returns:
+        The selected values, best first (descending for ``largest=True``,
+        ascending otherwise), in the input's container type. With
+        ``return_indices=True`` a ``(values, indices)`` tuple, where indices use
+        typecode ``I``, or ``L`` for 2**32 or more elements.
+
+    Notes:
+        - NaN ranks after every number in both directions
+        - Ties keep the earlier element first
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> arr = array.array('i', [5, 1, 9, 3, 7])
+        >>> ao.top_k(arr, 2)
+        array('i', [9, 7])
+        >>> ao.top_k(arr, 2, largest=False, return_indices=True)
+        (array('i', [1, 3]), array('I', [1, 3]))
+    """
+    ...
+
+def concatenate(arrays: Iterable[_ArrayLike], out: Optional[_ArrayLike] = None) -> _ArrayLike:
+    """
+    Join a sequence of arrays end to end.
+
+    Every typecode is checked before anything is copied, the output is allocated
+    once at the total length, and each input is copied straight into its stretch
+    of it (or of ``out``).
+
+    Args:
+        arrays: Non-empty sequence of arrays sharing one typecode.
+        out: Optional output array of the total length. It may be one of the inputs.
+
+    Returns:
+        The joined elements in the container type of the first array, or ``out``.
+
+    Raises:
+        TypeError: If an input is unsupported or the typecodes differ
+        ValueError: If ``arrays`` is empty or ``out`` has the wrong length
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> parts = [array.array('i', [1, 2]), array.array('i'), array.array('i', [3])]
+        >>> ao.concatenate(parts)
+        array('i', [1, 2, 3])
     """
     ...
 
@@ -1215,3 +1435,1903 @@ class LazyArray:
             10
         """
         ...
+
+class QuantileSketch:
+    """
+    A mergeable, bounded-memory sketch for approximate quantiles (t-digest).
+
+    QuantileSketch summarises a stream of values with a small set of weighted
+    centroids, so p50/p99/p999 can be estimated over data that is too large to
+    sort, or that arrives in chunks across processes. Whole buffers are ingested
+    natively by ``add()``, sketches combine with ``merge()``, and a sketch can be
+    shipped between workers with ``to_bytes()``/``from_bytes()`` or ``pickle``.
+
+    Notes:
+        - Memory is O(compression), independent of the number of values added
+        - Accuracy is best near the tails (q close to 0 or 1), where centroids are smallest
+        - NaN values are ignored by ``add()``
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> sketch = ao.QuantileSketch()
+        >>> sketch.add(array.array('d', [5.0, 1.0, 3.0, 2.0, 4.0]))
+        >>> sketch.quantile(0.5)
+        3.0
+        >>> sketch.cdf(3.0)
+        0.5
+    """
+
+    def __init__(self, compression: float = 100.0) -> None:
+        """
+        Create an empty sketch.
+
+        Args:
+            compression: Accuracy/memory trade-off. Higher values keep more centroids
+                (roughly ``compression / 2``) and give more accurate estimates.
+
+        Raises:
+            ValueError: If ``compression`` is not a finite number >= 10
+        """
+        ...
+
+    def add(self, arr: _ArrayLike) -> None:
+        """
+        Add every element of an array to the sketch.
+
+        Args:
+            arr: Input array with numeric type (any supported typecode, NumPy array,
+                memoryview, or Arrow buffer/array). Values are read as floats.
+
+        Raises:
+            TypeError: If input is not a supported array type or typecode
+        """
+        ...
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Fold another sketch into this one (in-place).
+
+        Args:
+            other: Sketch to merge. It is not modified.
+        """
+        ...
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the value at quantile ``q``.
+
+        Args:
+            q: Quantile in the range [0, 1] (e.g. ``0.99`` for p99).
+
+        Returns:
+            float: Estimated value. ``q=0`` and ``q=1`` return the exact min and max.
+
+        Raises:
+            ValueError: If ``q`` is outside [0, 1] or the sketch is empty
+
+        Examples:
+            >>> import array
+            >>> import arrayops as ao
+            >>> sketch = ao.QuantileSketch()
+            >>> sketch.add(array.array('i', range(1, 101)))
+            >>> sketch.quantile(0.0), sketch.quantile(1.0)
+            (1.0, 100.0)
+        """
+        ...
+
+    def cdf(self, x: float) -> float:
+        """
+        Estimate the fraction of values less than or equal to ``x``.
+
+        Args:
+            x: Value to evaluate.
+
+        Returns:
+            float: Estimated fraction in [0, 1].
+
+        Raises:
+            ValueError: If the sketch is empty
+        """
+        ...
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the sketch to a compact byte string.
+
+        Returns:
+            bytes: Serialized sketch, readable by ``QuantileSketch.from_bytes()``.
+        """
+        ...
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "QuantileSketch":
+        """
+        Rebuild a sketch from ``to_bytes()`` output.
+
+        Args:
+            data: Bytes produced by ``to_bytes()``.
+
+        Returns:
+            QuantileSketch: The restored sketch.
+
+        Raises:
+            ValueError: If ``data`` is not a valid serialized sketch
+        """
+        ...
+
+    @property
+    def compression(self) -> float:
+        """The compression parameter the sketch was created with."""
+        ...
+
+    @property
+    def count(self) -> int:
+        """Number of values added, including values from merged sketches."""
+        ...
+
+    @property
+    def min(self) -> Optional[float]:
+        """Smallest value added, or ``None`` if the sketch is empty."""
+        ...
+
+    @property
+    def max(self) -> Optional[float]:
+        """Largest value added, or ``None`` if the sketch is empty."""
+        ...
+
+class HyperLogLog:
+    """
+    A mergeable, fixed-memory sketch for approximate distinct counting.
+
+    HyperLogLog hashes each value's native representation into ``2**precision``
+    one-byte registers, so cardinality can be estimated over data far larger than
+    memory, or split across chunks and processes. Whole buffers are ingested natively
+    by ``add()``, sketches with the same precision combine losslessly with ``merge()``,
+    and a sketch can be shipped between workers with ``to_bytes()``/``from_bytes()``
+    or ``pickle``.
+
+    Notes:
+        - Memory is ``2**precision`` bytes; the relative standard error is about
+          ``1.04 / sqrt(2**precision)`` (0.8% at the default precision of 14)
+        - Values are hashed by their native representation: integers by value, floats
+          with ``-0.0 == 0.0`` and all NaNs treated as one value
+        - Hashing is deterministic, so sketches built in different processes can be merged
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> hll = ao.HyperLogLog()
+        >>> hll.add(array.array('i', [1, 2, 2, 3, 3, 3]))
+        >>> hll.count()
+        3
+    """
+
+    def __init__(self, precision: int = 14) -> None:
+        """
+        Create an empty sketch.
+
+        Args:
+            precision: Number of index bits (4 to 18). The sketch uses ``2**precision``
+                bytes; each extra bit reduces the error by a factor of ``sqrt(2)``.
+
+        Raises:
+            ValueError: If ``precision`` is outside [4, 18]
+        """
+        ...
+
+    def add(self, arr: _ArrayLike) -> None:
+        """
+        Hash and add every element of an array to the sketch.
+
+        Args:
+            arr: Input array with numeric type (any supported typecode, NumPy array,
+                memoryview, or Arrow buffer/array).
+
+        Raises:
+            TypeError: If input is not a supported array type or typecode
+        """
+        ...
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """
+        Fold another sketch into this one (in-place). The result is identical to a
+        sketch that saw both inputs.
+
+        Args:
+            other: Sketch to merge. It is not modified.
+
+        Raises:
+            ValueError: If the sketches have different precision
+        """
+        ...
+
+    def count(self) -> int:
+        """
+        Estimate the number of distinct values added.
+
+        Returns:
+            int: Estimated cardinality (0 for an empty sketch).
+        """
+        ...
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the sketch to a compact byte string.
+
+        Returns:
+            bytes: Serialized sketch, readable by ``HyperLogLog.from_bytes()``.
+        """
+        ...
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "HyperLogLog":
+        """
+        Rebuild a sketch from ``to_bytes()`` output.
+
+        Args:
+            data: Bytes produced by ``to_bytes()``.
+
+        Returns:
+            HyperLogLog: The restored sketch.
+
+        Raises:
+            ValueError: If ``data`` is not a valid serialized sketch
+        """
+        ...
+
+    @property
+    def precision(self) -> int:
+        """The precision the sketch was created with."""
+        ...
+
+def count_distinct(arr: _ArrayLike, approx: bool = True, precision: int = 14) -> int:
+    """
+    Count the number of distinct values in an array.
+
+    Args:
+        arr: Input array with numeric type (any supported typecode, NumPy array,
+            memoryview, or Arrow buffer/array).
+        approx: If True (default), estimate with a HyperLogLog sketch in fixed memory.
+            If False, count exactly with a hash set (memory proportional to the
+            number of distinct values).
+        precision: HyperLogLog precision used when ``approx=True`` (4 to 18).
+
+    Returns:
+        int: Number of distinct values (exact or estimated). Returns 0 for empty arrays.
+
+    Raises:
+        TypeError: If input is not a supported array type or typecode
+        ValueError: If ``precision`` is outside [4, 18]
+
+    Notes:
+        - Floats treat ``-0.0`` and ``0.0`` as equal and all NaNs as one value
+        - Faster than ``len(unique(arr))``: no sorting and no result array
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> arr = array.array('i', [1, 2, 2, 3, 3, 3])
+        >>> ao.count_distinct(arr, approx=False)
+        3
+        >>> ao.count_distinct(arr)
+        3
+    """
+    ...
+
+class FrequencySketch:
+    """
+    A mergeable, fixed-memory sketch for frequency estimates and heavy hitters.
+
+    FrequencySketch combines a count-min table (``width * depth`` 64-bit counters)
+    with a bounded set of ``capacity`` candidate values that have the largest
+    estimated counts. Memory does not grow with the number of distinct values, so
+    per-shard sketches over multi-GB integer streams can be built in parallel and
+    combined centrally with ``merge()``.
+
+    Notes:
+        - Only integer arrays are supported
+        - Estimates never undercount; with ``N`` values added, the overestimate is at
+          most ``e * N / width`` with probability ``1 - exp(-depth)``
+        - Counters use conservative update, which tightens estimates in practice
+        - ``top_k()`` reports the tracked candidates; values whose true frequency is
+          well above ``N / capacity`` are reliably among them
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> sketch = ao.FrequencySketch()
+        >>> sketch.add(array.array('l', [7, 7, 7, 3, 3, 9]))
+        >>> sketch.top_k(2)
+        [(7, 3), (3, 2)]
+        >>> sketch.estimate(9)
+        1
+    """
+
+    def __init__(self, width: int = 2048, depth: int = 5, capacity: int = 64) -> None:
+        """
+        Create an empty sketch.
+
+        Args:
+            width: Counters per row. Larger widths reduce overestimation.
+            depth: Number of hashed rows (1 to 16). More rows reduce the chance of a
+                large overestimate.
+            capacity: Number of heavy-hitter candidates tracked for ``top_k()``.
+
+        Raises:
+            ValueError: If any dimension is out of range
+        """
+        ...
+
+    def add(self, arr: _ArrayLike) -> None:
+        """
+        Count every element of an integer array.
+
+        Args:
+            arr: Input array with an integer type (b, B, h, H, i, I, l, L), NumPy array,
+                memoryview, or Arrow buffer/array.
+
+        Raises:
+            TypeError: If input is not a supported array type or is a float array
+        """
+        ...
+
+    def estimate(self, value: int) -> int:
+        """
+        Estimate how many times ``value`` was added.
+
+        Args:
+            value: Integer value to look up.
+
+        Returns:
+            int: Estimated count, never less than the true count.
+        """
+        ...
+
+    def top_k(self, k: int) -> List[Tuple[int, int]]:
+        """
+        Return the most frequent tracked values.
+
+        Args:
+            k: Number of values to return (at most ``capacity``).
+
+        Returns:
+            List[Tuple[int, int]]: ``(value, estimated_count)`` pairs, most frequent first.
+
+        Raises:
+            ValueError: If ``k`` exceeds ``capacity``
+        """
+        ...
+
+    def merge(self, other: "FrequencySketch") -> None:
+        """
+        Fold another sketch into this one (in-place). Counters are added and the
+        union of both candidate sets is re-ranked.
+
+        Args:
+            other: Sketch to merge. It is not modified.
+
+        Raises:
+            ValueError: If the sketches have different ``width`` or ``depth``
+        """
+        ...
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the sketch to a byte string.
+
+        Returns:
+            bytes: Serialized sketch, readable by ``FrequencySketch.from_bytes()``.
+        """
+        ...
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "FrequencySketch":
+        """
+        Rebuild a sketch from ``to_bytes()`` output.
+
+        Args:
+            data: Bytes produced by ``to_bytes()``.
+
+        Returns:
+            FrequencySketch: The restored sketch.
+
+        Raises:
+            ValueError: If ``data`` is not a valid serialized sketch
+        """
+        ...
+
+    @property
+    def width(self) -> int:
+        """Counters per row."""
+        ...
+
+    @property
+    def depth(self) -> int:
+        """Number of hashed rows."""
+        ...
+
+    @property
+    def capacity(self) -> int:
+        """Number of heavy-hitter candidates tracked."""
+        ...
+
+    @property
+    def total(self) -> int:
+        """Number of values added, including values from merged sketches."""
+        ...
+
+def rolling_sum(
+    arr: _ArrayLike,
+    window: int,
+    min_periods: Optional[int] = None,
+    out: Optional[_ArrayLike] = None,
+) -> _ArrayLike:
+    """
+    Compute the sum over a trailing window ending at each element.
+
+    ``result[i]`` covers ``arr[max(0, i - window + 1) : i + 1]``. The whole result
+    is computed in one native pass with a running (compensated) sum, so the cost is
+    O(n) regardless of ``window``.
+
+    Args:
+        arr: Input array with numeric type (any supported typecode, NumPy array,
+            memoryview, or Arrow buffer/array).
+        window: Window length (>= 1).
+        min_periods: Minimum number of non-NaN values required for a result;
+            positions with fewer values are NaN. Defaults to ``window``.
+        out: Optional writable float64 array (typecode ``'d'`` or ``numpy.float64``)
+            of the same length to write the result into.
+
+    Returns:
+        Float64 array of the same length and container type as ``arr``
+        (or ``out`` when given).
+
+    Raises:
+        TypeError: If input is not a supported array type, or ``out`` is not float64
+        ValueError: If ``window < 1``, ``min_periods`` is outside [1, window], or
+            ``out`` has the wrong length or is read-only
+
+    Notes:
+        - NaN values are skipped (they do not count towards ``min_periods``)
+        - Integer inputs are accumulated as floats (exact up to 2**53)
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.rolling_sum(array.array('i', [1, 2, 3, 4, 5]), 3)
+        array('d', [nan, nan, 6.0, 9.0, 12.0])
+        >>> ao.rolling_sum(array.array('i', [1, 2, 3, 4, 5]), 3, min_periods=1)
+        array('d', [1.0, 3.0, 6.0, 9.0, 12.0])
+    """
+    ...
+
+def rolling_mean(
+    arr: _ArrayLike,
+    window: int,
+    min_periods: Optional[int] = None,
+    out: Optional[_ArrayLike] = None,
+) -> _ArrayLike:
+    """
+    Compute the mean over a trailing window ending at each element.
+
+    Same windowing, NaN handling, ``min_periods`` and ``out`` rules as
+    ``rolling_sum()``; the mean divides by the number of non-NaN values in the window.
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.rolling_mean(array.array('d', [1.0, 2.0, 3.0, 4.0]), 2)
+        array('d', [nan, 1.5, 2.5, 3.5])
+    """
+    ...
+
+def rolling_var(
+    arr: _ArrayLike,
+    window: int,
+    min_periods: Optional[int] = None,
+    ddof: int = 0,
+    out: Optional[_ArrayLike] = None,
+) -> _ArrayLike:
+    """
+    Compute the variance over a trailing window ending at each element.
+
+    Uses Welford updates as values enter and leave the window (O(n) total).
+    Same windowing, NaN handling, ``min_periods`` and ``out`` rules as
+    ``rolling_sum()``.
+
+    Args:
+        ddof: Delta degrees of freedom; the divisor is ``count - ddof``. The default
+            of 0 gives the population variance, matching ``var()``. Windows with
+            ``count <= ddof`` or containing infinities produce NaN.
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.rolling_var(array.array('d', [1.0, 3.0, 5.0, 9.0]), 2)
+        array('d', [nan, 1.0, 1.0, 4.0])
+    """
+    ...
+
+def rolling_std(
+    arr: _ArrayLike,
+    window: int,
+    min_periods: Optional[int] = None,
+    ddof: int = 0,
+    out: Optional[_ArrayLike] = None,
+) -> _ArrayLike:
+    """
+    Compute the standard deviation over a trailing window ending at each element.
+
+    The square root of ``rolling_var()`` with the same arguments.
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.rolling_std(array.array('d', [1.0, 3.0, 5.0, 9.0]), 2)
+        array('d', [nan, 1.0, 1.0, 2.0])
+    """
+    ...
+
+def rolling_min(
+    arr: _ArrayLike,
+    window: int,
+    min_periods: Optional[int] = None,
+    out: Optional[_ArrayLike] = None,
+) -> _ArrayLike:
+    """
+    Compute the minimum over a trailing window ending at each element.
+
+    Uses a monotonic deque, so each element is pushed and popped at most once
+    (O(n) total, independent of ``window``). Same windowing, NaN handling,
+    ``min_periods`` and ``out`` rules as ``rolling_sum()``.
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.rolling_min(array.array('i', [5, 1, 4, 1, 5, 9, 2, 6]), 3)
+        array('d', [nan, nan, 1.0, 1.0, 1.0, 1.0, 2.0, 2.0])
+    """
+    ...
+
+def rolling_max(
+    arr: _ArrayLike,
+    window: int,
+    min_periods: Optional[int] = None,
+    out: Optional[_ArrayLike] = None,
+) -> _ArrayLike:
+    """
+    Compute the maximum over a trailing window ending at each element.
+
+    Uses a monotonic deque (O(n) total). Same windowing, NaN handling,
+    ``min_periods`` and ``out`` rules as ``rolling_sum()``.
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.rolling_max(array.array('i', [5, 1, 4, 1, 5, 9, 2, 6]), 3)
+        array('d', [nan, nan, 5.0, 4.0, 5.0, 9.0, 9.0, 9.0])
+    """
+    ...
+
+def cumsum(
+    arr: _ArrayLike,
+    exclusive: bool = False,
+    widen: bool = False,
+    out: Optional[_ArrayLike] = None,
+) -> _ArrayLike:
+    """
+    Compute the cumulative sum (prefix sum) of an array.
+
+    Args:
+        arr: Input array with numeric type (any supported typecode, NumPy array,
+            memoryview, or Arrow buffer/array).
+        exclusive: If False (default), ``result[i] = arr[0] + ... + arr[i]``. If True,
+            ``result[i] = arr[0] + ... + arr[i - 1]`` and ``result[0] = 0``.
+        widen: Accumulate in the 64-bit type of the same kind (``int64`` for signed,
+            ``uint64`` for unsigned, ``float64`` for floats) and return that type.
+        out: Optional writable array of the result type and same length to write into.
+
+    Returns:
+        Array of the same length and container type as ``arr`` (or ``out``), with the
+        input typecode, or the widened typecode when ``widen=True``.
+
+    Raises:
+        TypeError: If input is not a supported array type, or ``out`` has the wrong type
+        ValueError: If ``out`` has the wrong length or is read-only
+        OverflowError: If an integer running sum does not fit the accumulator type.
+            Integer scans never wrap silently.
+
+    Notes:
+        - Large arrays use a two-phase parallel scan when built with the ``parallel``
+          feature (chunk totals, then per-chunk rescans from their offsets)
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.cumsum(array.array('i', [1, 2, 3, 4]))
+        array('i', [1, 3, 6, 10])
+        >>> ao.cumsum(array.array('i', [1, 2, 3, 4]), exclusive=True)
+        array('i', [0, 1, 3, 6])
+        >>> ao.cumsum(array.array('b', [100, 100]), widen=True)
+        array('l', [100, 200])
+    """
+    ...
+
+def cumprod(
+    arr: _ArrayLike,
+    exclusive: bool = False,
+    widen: bool = False,
+    out: Optional[_ArrayLike] = None,
+) -> _ArrayLike:
+    """
+    Compute the cumulative product of an array.
+
+    Same arguments, result type, overflow checking and ``out`` rules as ``cumsum()``;
+    an exclusive product starts at 1.
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.cumprod(array.array('i', [1, 2, 3, 4]))
+        array('i', [1, 2, 6, 24])
+    """
+    ...
+
+def cummin(
+    arr: _ArrayLike,
+    exclusive: bool = False,
+    out: Optional[_ArrayLike] = None,
+) -> _ArrayLike:
+    """
+    Compute the running minimum of an array.
+
+    The result has the input typecode. An exclusive scan starts at the type's largest
+    value (``inf`` for floats). NaN propagates: once seen, every later value is NaN.
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.cummin(array.array('i', [3, 1, 4, 1, 5]))
+        array('i', [3, 1, 1, 1, 1])
+    """
+    ...
+
+def cummax(
+    arr: _ArrayLike,
+    exclusive: bool = False,
+    out: Optional[_ArrayLike] = None,
+) -> _ArrayLike:
+    """
+    Compute the running maximum of an array.
+
+    The result has the input typecode. An exclusive scan starts at the type's smallest
+    value (``-inf`` for floats). NaN propagates: once seen, every later value is NaN.
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.cummax(array.array('i', [3, 1, 4, 1, 5]))
+        array('i', [3, 3, 4, 4, 5])
+    """
+    ...
+
+def average(arr: _ArrayLike, weights: Optional[_ArrayLike] = None) -> float:
+    """
+    Compute the (optionally weighted) mean of an array.
+
+    Without ``weights`` this is ``mean()``. With ``weights`` the result is
+    ``sum(w * x) / sum(w)``, computed in one pass over both arrays.
+
+    Args:
+        arr: Input array with numeric type.
+        weights: Optional non-negative weights with the same typecode and length as ``arr``.
+
+    Returns:
+        float: The (weighted) mean.
+
+    Raises:
+        TypeError: If the arrays have different types
+        ValueError: If the arrays are empty or differ in length, or if the weights
+            are negative or sum to zero
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.average(array.array('d', [1.0, 2.0, 4.0]), weights=array.array('d', [1.0, 1.0, 2.0]))
+        2.75
+    """
+    ...
+
+def cov(x: _ArrayLike, y: _ArrayLike, ddof: int = 0) -> float:
+    """
+    Compute the covariance of two arrays.
+
+    The result is ``sum((x - mean(x)) * (y - mean(y))) / (n - ddof)``; the default
+    ``ddof=0`` matches the population ``var()``. Co-moments are accumulated in a
+    single numerically stable pass.
+
+    Args:
+        x: First input array.
+        y: Second input array with the same typecode and length as ``x``.
+        ddof: Delta degrees of freedom (use 1 for the sample covariance).
+
+    Returns:
+        float: The covariance.
+
+    Raises:
+        TypeError: If the arrays have different types
+        ValueError: If the arrays are empty or differ in length, or if ``ddof >= n``
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.cov(array.array('i', [1, 2, 3]), array.array('i', [2, 4, 6]))
+        1.3333333333333333
+    """
+    ...
+
+def corr(x: _ArrayLike, y: _ArrayLike) -> float:
+    """
+    Compute the Pearson correlation coefficient of two arrays.
+
+    Returns ``nan`` when either array is constant.
+
+    Args:
+        x: First input array.
+        y: Second input array with the same typecode and length as ``x``.
+
+    Returns:
+        float: The correlation coefficient in [-1, 1].
+
+    Raises:
+        TypeError: If the arrays have different types
+        ValueError: If the arrays are empty or differ in length
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.corr(array.array('d', [1.0, 2.0, 3.0]), array.array('d', [3.0, 2.0, 1.0]))
+        -1.0
+    """
+    ...
+
+def linregress(x: _ArrayLike, y: _ArrayLike) -> Tuple[float, float, float]:
+    """
+    Fit ``y = slope * x + intercept`` by ordinary least squares.
+
+    Args:
+        x: Independent variable.
+        y: Dependent variable with the same typecode and length as ``x``.
+
+    Returns:
+        Tuple[float, float, float]: ``(slope, intercept, rvalue)``. ``rvalue`` is
+        the Pearson correlation (0.0 when ``y`` is constant).
+
+    Raises:
+        TypeError: If the arrays have different types
+        ValueError: If the arrays are empty or differ in length, or if all ``x``
+            values are identical
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.linregress(array.array('d', [0.0, 1.0, 2.0]), array.array('d', [1.0, 3.0, 5.0]))
+        (2.0, 1.0, 1.0)
+    """
+    ...
+
+def nansum(arr: _ArrayLike) -> Union[int, float]:
+    """
+    Compute the sum of the non-NaN elements of an array.
+
+    NaN values are masked out inside the vectorized accumulation, so no filtered
+    copy is made. Integer arrays cannot hold NaN and are summed exactly as in
+    ``sum()``.
+
+    Args:
+        arr: Input array with numeric type.
+
+    Returns:
+        Union[int, float]: The sum; ``0.0`` for an empty or all-NaN float array.
+
+    Raises:
+        TypeError: If input is not a supported array type
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.nansum(array.array('d', [1.0, float('nan'), 2.5]))
+        3.5
+    """
+    ...
+
+def nanmean(arr: _ArrayLike) -> float:
+    """
+    Compute the mean of the non-NaN elements of an array.
+
+    Args:
+        arr: Input array with numeric type.
+
+    Returns:
+        float: The mean of the non-NaN values.
+
+    Raises:
+        TypeError: If input is not a supported array type
+        ValueError: If the array is empty or contains only NaN
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.nanmean(array.array('d', [1.0, float('nan'), 3.0]))
+        2.0
+    """
+    ...
+
+def nanvar(arr: _ArrayLike) -> float:
+    """
+    Compute the population variance of the non-NaN elements of an array.
+
+    Args:
+        arr: Input array with numeric type.
+
+    Returns:
+        float: The variance of the non-NaN values.
+
+    Raises:
+        TypeError: If input is not a supported array type
+        ValueError: If the array is empty or contains only NaN
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.nanvar(array.array('d', [1.0, float('nan'), 3.0]))
+        1.0
+    """
+    ...
+
+def nanstd(arr: _ArrayLike) -> float:
+    """
+    Compute the population standard deviation of the non-NaN elements of an array.
+
+    Args:
+        arr: Input array with numeric type.
+
+    Returns:
+        float: The standard deviation of the non-NaN values.
+
+    Raises:
+        TypeError: If input is not a supported array type
+        ValueError: If the array is empty or contains only NaN
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.nanstd(array.array('d', [1.0, float('nan'), 3.0]))
+        1.0
+    """
+    ...
+
+def nanmin(arr: _ArrayLike) -> Union[int, float]:
+    """
+    Find the minimum of the non-NaN elements of an array.
+
+    Equivalent to ``min_max(arr, skipna=True)[0]``.
+
+    Args:
+        arr: Input array with numeric type.
+
+    Returns:
+        Union[int, float]: The smallest non-NaN value.
+
+    Raises:
+        TypeError: If input is not a supported array type
+        ValueError: If the array is empty or contains only NaN
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.nanmin(array.array('d', [float('nan'), 3.0, 1.0]))
+        1.0
+    """
+    ...
+
+def nanmax(arr: _ArrayLike) -> Union[int, float]:
+    """
+    Find the maximum of the non-NaN elements of an array.
+
+    Equivalent to ``min_max(arr, skipna=True)[1]``.
+
+    Args:
+        arr: Input array with numeric type.
+
+    Returns:
+        Union[int, float]: The largest non-NaN value.
+
+    Raises:
+        TypeError: If input is not a supported array type
+        ValueError: If the array is empty or contains only NaN
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.nanmax(array.array('d', [float('nan'), 3.0, 1.0]))
+        3.0
+    """
+    ...
+
+def nanmedian(arr: _ArrayLike) -> Union[int, float]:
+    """
+    Find the median of the non-NaN elements of an array.
+
+    Uses the same convention as ``median()``: the lower middle element for an
+    even number of values. Selection runs in O(n) on a copy of the non-NaN values.
+
+    Args:
+        arr: Input array with numeric type.
+
+    Returns:
+        Union[int, float]: The median of the non-NaN values.
+
+    Raises:
+        TypeError: If input is not a supported array type
+        ValueError: If the array is empty or contains only NaN
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.nanmedian(array.array('d', [5.0, float('nan'), 1.0, 3.0]))
+        3.0
+    """
+    ...
+
+def count_nan(arr: _ArrayLike) -> int:
+    """
+    Count the NaN elements of an array.
+
+    Args:
+        arr: Input array with numeric type.
+
+    Returns:
+        int: The number of NaN values (always ``0`` for integer arrays).
+
+    Raises:
+        TypeError: If input is not a supported array type
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.count_nan(array.array('d', [1.0, float('nan'), float('nan')]))
+        2
+    """
+    ...
+
+def dot(a: _ArrayLike, b: _ArrayLike) -> Union[int, float]:
+    """
+    Compute the dot product of two arrays without an intermediate array.
+
+    Integer arrays are accumulated exactly in 128 bits and return an ``int``; float
+    arrays accumulate in float64 and return a ``float``.
+
+    Args:
+        a: First input array.
+        b: Second input array with the same typecode and length as ``a``.
+
+    Returns:
+        Union[int, float]: The dot product (0 for empty arrays).
+
+    Raises:
+        TypeError: If the arrays have different types
+        ValueError: If the arrays have different lengths
+        OverflowError: If an integer result does not fit in 128 bits
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.dot(array.array('i', [1, 2, 3]), array.array('i', [4, 5, 6]))
+        32
+    """
+    ...
+
+def norm(arr: _ArrayLike, ord: float = 2) -> float:
+    """
+    Compute a vector norm of an array.
+
+    Args:
+        arr: Input array with numeric type.
+        ord: ``1`` (sum of absolute values), ``2`` (Euclidean length) or
+            ``math.inf`` (largest absolute value).
+
+    Returns:
+        float: The norm (0.0 for empty arrays). NaN inputs give NaN.
+
+    Raises:
+        ValueError: If ``ord`` is not 1, 2 or inf
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.norm(array.array('d', [3.0, -4.0]))
+        5.0
+        >>> ao.norm(array.array('d', [3.0, -4.0]), ord=1)
+        7.0
+    """
+    ...
+
+def cosine(a: _ArrayLike, b: _ArrayLike) -> float:
+    """
+    Compute the cosine similarity of two arrays in one fused pass.
+
+    Args:
+        a: First input array.
+        b: Second input array with the same typecode and length as ``a``.
+
+    Returns:
+        float: ``dot(a, b) / (norm(a) * norm(b))`` in [-1, 1]; NaN if either
+        array is all zeros.
+
+    Raises:
+        TypeError: If the arrays have different types
+        ValueError: If the arrays are empty or have different lengths
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.cosine(array.array('d', [1.0, 0.0]), array.array('d', [0.0, 2.0]))
+        0.0
+    """
+    ...
+
+def dot_batch(query: _ArrayLike, candidates: Iterable[_ArrayLike]) -> _ArrayLike:
+    """
+    Compute the dot product of ``query`` with each candidate array in one call.
+
+    Every candidate must have the same typecode and length as ``query``. Scores are
+    returned as a float64 array (NumPy if ``query`` is a NumPy array, otherwise
+    ``array.array('d')``) in candidate order.
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> q = array.array('d', [1.0, 2.0])
+        >>> ao.dot_batch(q, [array.array('d', [1.0, 1.0]), array.array('d', [0.0, 3.0])])
+        array('d', [3.0, 6.0])
+    """
+    ...
+
+def cosine_batch(query: _ArrayLike, candidates: Iterable[_ArrayLike]) -> _ArrayLike:
+    """
+    Compute the cosine similarity of ``query`` with each candidate array in one call.
+
+    The query norm is computed once; each candidate is then scored in a single
+    fused pass. Validation and the result container follow ``dot_batch()``; an
+    empty ``query`` raises ``ValueError``, as in ``cosine()``.
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> q = array.array('d', [1.0, 0.0])
+        >>> ao.cosine_batch(q, [array.array('d', [2.0, 0.0]), array.array('d', [0.0, 1.0])])
+        array('d', [1.0, 0.0])
+    """
+    ...
+
+def groupby_agg(
+    keys: _ArrayLike,
+    values: _ArrayLike,
+    aggs: Optional[List[str]] = None,
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Aggregate a value column grouped by an integer key column.
+
+    The strategy follows the keys: a single pass over runs when they are already
+    sorted, a direct-indexed table when their range is small (up to 65,536 values,
+    or an eighth of the input length), and a hash table otherwise. With
+    ``--features parallel`` large inputs use per-thread dense tables or a
+    radix-partitioned hash aggregation.
+
+    Args:
+        keys: Integer key array (``b``, ``B``, ``h``, ``H``, ``i``, ``I``, ``l``, ``L``).
+        values: Numeric value array with the same length as ``keys``.
+        aggs: Aggregations to compute, any of ``"sum"``, ``"mean"``, ``"count"``,
+            ``"min"`` and ``"max"`` (default: all five).
+
+    Returns:
+        Tuple[Any, Dict[str, Any]]: ``(unique_keys, results)``. ``unique_keys`` holds the
+            distinct keys in ascending order (keys' container and typecode) and
+            ``results`` maps each aggregation name to an array aligned with it:
+            - ``sum``: 64-bit type of the value's kind (``l``, ``L`` or ``d``)
+            - ``mean``: ``d``
+            - ``count``: ``L``
+            - ``min``/``max``: the value typecode (NaN propagates)
+
+    Raises:
+        TypeError: If ``keys`` is not an integer array or an input type is unsupported
+        ValueError: If the lengths differ or an aggregation name is unknown
+        OverflowError: If ``"sum"`` is requested and an integer group sum does not
+            fit in 64 bits (means never overflow)
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> keys = array.array('l', [2, 1, 2, 1, 3])
+        >>> values = array.array('d', [1.0, 10.0, 3.0, 20.0, 5.0])
+        >>> unique, results = ao.groupby_agg(keys, values, aggs=["sum", "count"])
+        >>> list(unique), list(results["sum"]), list(results["count"])
+        ([1, 2, 3], [30.0, 4.0, 5.0], [2, 2, 1])
+    """
+    ...
+
+def segment_sum(values: Any, offsets: Any) -> Any:
+    """
+    Sum every segment of an array in one call.
+
+    Segment ``i`` is ``values[offsets[i]:offsets[i + 1]]``, the same layout as an Arrow
+    list array, so ``len(offsets) - 1`` results are produced. With
+    ``--features parallel`` whole segments are distributed across threads.
+
+    Args:
+        values: Numeric array holding the concatenated segments.
+        offsets: Non-decreasing integer array of segment boundaries, each within
+            ``[0, len(values)]``.
+
+    Returns:
+        Any: One sum per segment in the 64-bit type of the value's kind (``l``, ``L``
+            or ``d``), in the container type of ``values``. Empty segments sum to 0.
+
+    Raises:
+        TypeError: If ``offsets`` is not an integer array or an input type is unsupported
+        ValueError: If ``offsets`` is empty, decreasing or out of bounds
+        OverflowError: If an integer segment sum does not fit in 64 bits
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> values = array.array('i', [1, 2, 3, 4, 5, 6])
+        >>> offsets = array.array('l', [0, 2, 2, 6])
+        >>> list(ao.segment_sum(values, offsets))
+        [3, 0, 18]
+    """
+    ...
+
+def segment_mean(values: Any, offsets: Any) -> Any:
+    """
+    Mean of every segment of an array in one call.
+
+    Args:
+        values: Numeric array holding the concatenated segments.
+        offsets: Segment boundaries, as in ``segment_sum()``.
+
+    Returns:
+        Any: One ``d`` value per segment; NaN for empty segments.
+
+    Raises:
+        TypeError: If ``offsets`` is not an integer array or an input type is unsupported
+        ValueError: If ``offsets`` is empty, decreasing or out of bounds
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> values = array.array('i', [1, 2, 3, 4, 5, 6])
+        >>> list(ao.segment_mean(values, array.array('l', [0, 2, 6])))
+        [1.5, 4.5]
+    """
+    ...
+
+def segment_min(values: Any, offsets: Any) -> Any:
+    """
+    Minimum of every segment of an array in one call.
+
+    NaN propagates within a segment, as in ``min()``.
+
+    Args:
+        values: Numeric array holding the concatenated segments.
+        offsets: Segment boundaries, as in ``segment_sum()``.
+
+    Returns:
+        Any: One value per segment with the typecode of ``values``.
+
+    Raises:
+        TypeError: If ``offsets`` is not an integer array or an input type is unsupported
+        ValueError: If ``offsets`` is invalid or a segment is empty
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> values = array.array('i', [4, 2, 7, 1, 9])
+        >>> list(ao.segment_min(values, array.array('l', [0, 3, 5])))
+        [2, 1]
+    """
+    ...
+
+def segment_max(values: Any, offsets: Any) -> Any:
+    """
+    Maximum of every segment of an array in one call.
+
+    NaN propagates within a segment, as in ``max()``.
+
+    Args:
+        values: Numeric array holding the concatenated segments.
+        offsets: Segment boundaries, as in ``segment_sum()``.
+
+    Returns:
+        Any: One value per segment with the typecode of ``values``.
+
+    Raises:
+        TypeError: If ``offsets`` is not an integer array or an input type is unsupported
+        ValueError: If ``offsets`` is invalid or a segment is empty
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> values = array.array('i', [4, 2, 7, 1, 9])
+        >>> list(ao.segment_max(values, array.array('l', [0, 3, 5])))
+        [7, 9]
+    """
+    ...
+
+def segment_count(values: Any, offsets: Any) -> Any:
+    """
+    Length of every segment.
+
+    Only ``offsets`` is read, but ``values`` is validated like the other segment
+    reductions so the same offsets are accepted.
+
+    Args:
+        values: Numeric array holding the concatenated segments.
+        offsets: Segment boundaries, as in ``segment_sum()``.
+
+    Returns:
+        Any: One ``L`` count per segment.
+
+    Raises:
+        TypeError: If ``offsets`` is not an integer array or an input type is unsupported
+        ValueError: If ``offsets`` is empty, decreasing or out of bounds
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> values = array.array('d', [1.0, 2.0, 3.0])
+        >>> list(ao.segment_count(values, array.array('l', [0, 0, 3])))
+        [0, 3]
+    """
+    ...
+
+def histogram(
+    arr: Any,
+    bins: Union[int, Any, None] = None,
+    range: Optional[Tuple[float, float]] = None,
+    counts: Optional[Any] = None,
+) -> Tuple[Any, Any]:
+    """
+    Count the values of an array falling into each bin.
+
+    With an integer ``bins`` the bins have equal width over ``range`` and each value's
+    bin is computed directly (O(1) per value). With an array of edges the bin is
+    found by binary search. Bins are half-open ``[edge[i], edge[i + 1])`` except the
+    last, which also includes its right edge; NaN and values outside the edges are
+    not counted. With ``--features parallel`` large inputs are counted into one
+    histogram per worker and the partial histograms are summed at the end.
+
+    Args:
+        arr: Input array (any supported numeric typecode).
+        bins: Number of equal-width bins (default: 10) or an increasing array of edges.
+        range: ``(lo, hi)`` for equal-width bins (default: the min and max of the
+            non-NaN values). Ignored when ``bins`` is an array of edges.
+        counts: Writable ``L`` array with one slot per bin. The new counts are added
+            into it and it is returned, so histograms of several chunks can be merged.
+
+    Returns:
+        Tuple[Any, Any]: ``(counts, edges)`` with ``L`` counts and ``d`` edges in the
+            container type of ``arr`` (``counts`` is the given buffer when passed).
+
+    Raises:
+        TypeError: If an input type is unsupported or ``counts`` is not an ``L`` array
+        ValueError: If ``bins`` or ``range`` is invalid, the autodetected range is not
+            finite, or ``counts`` has the wrong length or is read-only
+        OverflowError: If an accumulated count does not fit in ``counts``
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> latencies = array.array('d', [1.0, 2.5, 2.7, 4.0, 9.9])
+        >>> counts, edges = ao.histogram(latencies, bins=3, range=(0.0, 9.0))
+        >>> list(counts), list(edges)
+        ([3, 1, 0], [0.0, 3.0, 6.0, 9.0])
+    """
+    ...
+
+def bincount(arr: Any, minlength: int = 0, counts: Optional[Any] = None) -> Any:
+    """
+    Count the occurrences of each value in a non-negative integer array.
+
+    Args:
+        arr: Integer array (``b``, ``B``, ``h``, ``H``, ``i``, ``I``, ``l``, ``L``) with no
+            negative values.
+        minlength: Minimum number of slots in the result (default: 0).
+        counts: Writable ``L`` array to add the occurrences into. Its length fixes the
+            number of slots and it is returned.
+
+    Returns:
+        Any: ``L`` array of ``max(max(arr) + 1, minlength)`` counts, in the container
+            type of ``arr``.
+
+    Raises:
+        TypeError: If ``arr`` is not an integer array or ``counts`` is not an ``L`` array
+        ValueError: If ``arr`` has negative values or a value does not fit ``counts``
+        OverflowError: If an accumulated count does not fit in ``counts``
+        MemoryError: If the result is too large to allocate
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> list(ao.bincount(array.array('B', [1, 3, 1, 0])))
+        [1, 2, 0, 1]
+        >>> total = array.array('L', [0] * 4)
+        >>> _ = ao.bincount(array.array('B', [1, 1]), counts=total)
+        >>> _ = ao.bincount(array.array('B', [3]), counts=total)
+        >>> list(total)
+        [0, 2, 0, 1]
+    """
+    ...
+
+def value_counts(arr: Any, sort: bool = True) -> Tuple[Any, Any]:
+    """
+    Count the occurrences of every distinct value in one native pass.
+
+    8-bit integers (and 16-bit integers in large inputs) are counted in a
+    direct-indexed table; other types use a hash table. With ``--features parallel``
+    large inputs are counted per worker and the partial tables merged.
+
+    Args:
+        arr: Input array (any supported numeric typecode).
+        sort: If True (default), most frequent values first with ties in ascending
+            value order. If False, values in ascending order as in ``unique()``.
+
+    Returns:
+        Tuple[Any, Any]: ``(values, counts)``. ``values`` has the typecode and container
+            type of ``arr`` and ``counts`` is an ``L`` array aligned with it. NaN is
+            counted as one value and sorts after every number; -0.0 and 0.0 are one value.
+
+    Raises:
+        TypeError: If the input type is unsupported
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> values, counts = ao.value_counts(array.array('i', [3, 1, 3, 2, 3, 1]))
+        >>> list(values), list(counts)
+        ([3, 1, 2], [3, 2, 1])
+    """
+    ...
+
+def mode(arr: Any) -> Union[int, float]:
+    """
+    Most frequent value of an array.
+
+    Counting works as in ``value_counts()``.
+
+    Args:
+        arr: Input array (any supported numeric typecode).
+
+    Returns:
+        Union[int, float]: The value with the highest count; ties resolve to the
+            smallest value.
+
+    Raises:
+        TypeError: If the input type is unsupported
+        ValueError: If the array is empty
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ao.mode(array.array('i', [4, 1, 4, 1, 7]))
+        1
+    """
+    ...
+
+def searchsorted(sorted_arr: Any, queries: Any, side: str = "left") -> Any:
+    """
+    Insertion points of many queries in a sorted array.
+
+    For every element of ``queries``, finds the index at which it would be inserted
+    into ``sorted_arr`` to keep it sorted. When ``queries`` is itself sorted, the
+    lookups are merged against ``sorted_arr`` in one pass (galloping between nearby
+    answers); otherwise each query uses a branchless binary search. With
+    ``--features parallel`` large query buffers are split across threads.
+
+    Args:
+        sorted_arr: Array in ascending order with NaN last, as produced by ``sort()``.
+        queries: Values to look up; must have the same typecode as ``sorted_arr``.
+        side: ``"left"`` (default) places each query before equal values,
+            ``"right"`` after them.
+
+    Returns:
+        Any: Index array aligned with ``queries`` (typecode ``I``, or ``L`` when
+            ``sorted_arr`` has 2**32 or more elements), in the container type of
+            ``queries``. -0.0 and 0.0 compare equal and NaN queries go among the NaNs.
+
+    Raises:
+        TypeError: If the inputs are unsupported or their typecodes differ
+        ValueError: If ``side`` is not ``"left"`` or ``"right"``
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> bounds = array.array('d', [0.0, 10.0, 20.0])
+        >>> list(ao.searchsorted(bounds, array.array('d', [-1.0, 10.0, 15.0, 25.0])))
+        [0, 1, 2, 3]
+        >>> list(ao.searchsorted(bounds, array.array('d', [10.0]), side="right"))
+        [2]
+    """
+    ...
+
+def isin(arr: Any, values: Any, return_indices: bool = False) -> Any:
+    """
+    Membership test of every element of an array in a set of values.
+
+    When ``arr`` is sorted it is merged against the sorted distinct ``values`` with
+    galloping search; otherwise each element is probed in a hash set of the values.
+    With ``--features parallel`` large arrays are split across threads.
+
+    Args:
+        arr: Input array (array.array, numpy.ndarray, or memoryview).
+        values: Values to look for; must have the same typecode as ``arr``.
+        return_indices: Return the positions of the matching elements instead of
+            a mask.
+
+    Returns:
+        Any: A ``B`` mask aligned with ``arr`` (1 where the element occurs in
+            ``values``), or with ``return_indices=True`` the ascending positions of
+            the matches (typecode ``I``, or ``L`` for 2**32 or more elements), in the
+            container type of ``arr``. NaN matches NaN and -0.0 matches 0.0.
+
+    Raises:
+        TypeError: If the inputs are unsupported or their typecodes differ
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> ids = array.array('i', [7, 3, 9, 3, 1])
+        >>> list(ao.isin(ids, array.array('i', [3, 9, 11])))
+        [0, 1, 1, 1, 0]
+        >>> list(ao.isin(ids, array.array('i', [3, 9, 11]), return_indices=True))
+        [1, 2, 3]
+    """
+    ...
+
+def intersect1d(a: Any, b: Any) -> Any:
+    """
+    Sorted distinct values present in both arrays.
+
+    Inputs that are already sorted, such as the output of ``unique()``, skip
+    sorting. The shorter input is walked while galloping through the longer one.
+
+    Args:
+        a: First array (array.array, numpy.ndarray, or memoryview).
+        b: Second array; must have the same typecode as ``a``.
+
+    Returns:
+        Any: Sorted distinct common values (NaN last), in the container type of ``a``.
+
+    Raises:
+        TypeError: If the inputs are unsupported or their typecodes differ
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> list(ao.intersect1d(array.array('i', [7, 3, 9, 3]), array.array('i', [9, 11, 3])))
+        [3, 9]
+    """
+    ...
+
+def union1d(a: Any, b: Any) -> Any:
+    """
+    Sorted distinct values present in either array.
+
+    Args:
+        a: First array (array.array, numpy.ndarray, or memoryview).
+        b: Second array; must have the same typecode as ``a``.
+
+    Returns:
+        Any: Sorted distinct values of both inputs (NaN last), in the container type
+            of ``a``.
+
+    Raises:
+        TypeError: If the inputs are unsupported or their typecodes differ
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> list(ao.union1d(array.array('i', [7, 3, 3]), array.array('i', [9, 3])))
+        [3, 7, 9]
+    """
+    ...
+
+def setdiff1d(a: Any, b: Any) -> Any:
+    """
+    Sorted distinct values of the first array that are not in the second.
+
+    Args:
+        a: First array (array.array, numpy.ndarray, or memoryview).
+        b: Values to remove; must have the same typecode as ``a``.
+
+    Returns:
+        Any: Sorted distinct values of ``a`` missing from ``b`` (NaN last), in the
+            container type of ``a``.
+
+    Raises:
+        TypeError: If the inputs are unsupported or their typecodes differ
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> list(ao.setdiff1d(array.array('i', [7, 3, 9, 3, 1]), array.array('i', [3, 9])))
+        [1, 7]
+    """
+    ...
+
+def take(arr: Any, indices: Any, out: Optional[Any] = None, mode: str = "raise") -> Any:
+    """
+    Elements of an array at the positions in an index array.
+
+    With ``mode="raise"`` all indices are bounds-checked in one pass before the
+    gather, so an invalid index fails before anything is gathered. With
+    ``--features parallel`` index arrays that are large, and at least as long as
+    ``arr``, are gathered across threads in runs of consecutive indices.
+
+    Args:
+        arr: Input array (array.array, numpy.ndarray, or memoryview).
+        indices: Integer array of positions (any of ``b``, ``B``, ``h``, ``H``, ``i``,
+            ``I``, ``l``, ``L``); negative positions count from the end.
+        out: Optional writable array with the typecode of ``arr`` and the length of
+            ``indices`` to receive the result.
+        mode: ``"raise"`` (default) rejects indices outside ``-len(arr)..len(arr)``,
+            ``"clip"`` clamps them to the first or last element and ``"wrap"`` takes
+            them modulo ``len(arr)``.
+
+    Returns:
+        Any: The gathered elements, with the typecode and container type of ``arr``,
+            or ``out`` when given.
+
+    Raises:
+        TypeError: If an input is unsupported, ``indices`` is not an integer array,
+            or ``out`` has the wrong typecode
+        ValueError: If ``mode`` is unknown or ``out`` has the wrong length
+        IndexError: If an index is out of bounds with ``mode="raise"``, or ``arr`` is
+            empty and ``indices`` is not
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> prices = array.array('d', [3.5, 1.25, 2.0])
+        >>> list(ao.take(prices, ao.argsort(prices)))
+        [1.25, 2.0, 3.5]
+        >>> list(ao.take(prices, array.array('i', [-1, 5]), mode="clip"))
+        [2.0, 2.0]
+    """
+    ...
+
+def put(arr: Any, indices: Any, values: Any, mode: str = "raise") -> None:
+    """
+    Write values into an array at the positions in an index array (in-place).
+
+    ``values`` is repeated when it is shorter than ``indices``; when a position
+    occurs more than once, the last write wins.
+
+    Args:
+        arr: Writable array to modify (array.array, numpy.ndarray, or writable
+            memoryview).
+        indices: Integer array of positions; negative positions count from the end.
+        values: Values to write; must have the same typecode as ``arr``.
+        mode: ``"raise"`` (default), ``"clip"`` or ``"wrap"``, as in ``take()``. With
+            ``"raise"`` nothing is written unless every index is in range.
+
+    Raises:
+        TypeError: If an input is unsupported, the typecodes of ``arr`` and
+            ``values`` differ, or ``indices`` is not an integer array
+        ValueError: If ``mode`` is unknown, ``values`` is empty, or ``arr`` is
+            read-only
+        IndexError: If an index is out of bounds with ``mode="raise"``, or ``arr`` is
+            empty and ``indices`` is not
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> arr = array.array('i', [0, 0, 0, 0])
+        >>> ao.put(arr, array.array('I', [3, 1]), array.array('i', [7, 9]))
+        >>> list(arr)
+        [0, 9, 0, 7]
+    """
+    ...
+
+def greater(arr: Any, value: Union[int, float]) -> Any:
+    """
+    Mask of the elements greater than a scalar.
+
+    ``value`` is compared in the element type when it fits it: an integer in range
+    of an integer array, or any float against a float array (rounded to float32
+    first for ``f`` arrays, as in NumPy). Against integer arrays other values are
+    still compared exactly: ``2**63`` is above every ``int64`` element, and ``2.5``
+    is compared in float64. Each comparison runs as a single vectorizable loop; with
+    ``--features parallel`` large arrays are split across threads.
+
+    Args:
+        arr: Input array (array.array, numpy.ndarray, or memoryview).
+        value: Scalar to compare with.
+
+    Returns:
+        Any: ``B`` mask aligned with ``arr``, 1 where ``arr > value`` and 0 elsewhere,
+            in the container type of ``arr``. NaN elements compare false.
+
+    Raises:
+        TypeError: If ``arr`` is unsupported or ``value`` is not a number
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> list(ao.greater(array.array('d', [0.5, -1.0, 2.0]), 0.0))
+        [1, 0, 1]
+    """
+    ...
+
+def greater_equal(arr: Any, value: Union[int, float]) -> Any:
+    """
+    Mask of the elements greater than or equal to a scalar.
+
+    ``value`` is converted as for ``greater()``.
+
+    Args:
+        arr: Input array (array.array, numpy.ndarray, or memoryview).
+        value: Scalar to compare with.
+
+    Returns:
+        Any: ``B`` mask aligned with ``arr``, 1 where ``arr >= value`` and 0 elsewhere,
+            in the container type of ``arr``. NaN elements compare false.
+
+    Raises:
+        TypeError: If ``arr`` is unsupported or ``value`` is not a number
+    """
+    ...
+
+def less(arr: Any, value: Union[int, float]) -> Any:
+    """
+    Mask of the elements less than a scalar.
+
+    ``value`` is converted as for ``greater()``.
+
+    Args:
+        arr: Input array (array.array, numpy.ndarray, or memoryview).
+        value: Scalar to compare with.
+
+    Returns:
+        Any: ``B`` mask aligned with ``arr``, 1 where ``arr < value`` and 0 elsewhere,
+            in the container type of ``arr``. NaN elements compare false.
+
+    Raises:
+        TypeError: If ``arr`` is unsupported or ``value`` is not a number
+    """
+    ...
+
+def less_equal(arr: Any, value: Union[int, float]) -> Any:
+    """
+    Mask of the elements less than or equal to a scalar.
+
+    ``value`` is converted as for ``greater()``.
+
+    Args:
+        arr: Input array (array.array, numpy.ndarray, or memoryview).
+        value: Scalar to compare with.
+
+    Returns:
+        Any: ``B`` mask aligned with ``arr``, 1 where ``arr <= value`` and 0 elsewhere,
+            in the container type of ``arr``. NaN elements compare false.
+
+    Raises:
+        TypeError: If ``arr`` is unsupported or ``value`` is not a number
+    """
+    ...
+
+def equal(arr: Any, value: Union[int, float]) -> Any:
+    """
+    Mask of the elements equal to a scalar.
+
+    ``value`` is converted as for ``greater()``.
+
+    Args:
+        arr: Input array (array.array, numpy.ndarray, or memoryview).
+        value: Scalar to compare with.
+
+    Returns:
+        Any: ``B`` mask aligned with ``arr``, 1 where ``arr == value`` and 0 elsewhere,
+            in the container type of ``arr``. NaN elements compare false.
+
+    Raises:
+        TypeError: If ``arr`` is unsupported or ``value`` is not a number
+    """
+    ...
+
+def not_equal(arr: Any, value: Union[int, float]) -> Any:
+    """
+    Mask of the elements not equal to a scalar.
+
+    ``value`` is converted as for ``greater()``.
+
+    Args:
+        arr: Input array (array.array, numpy.ndarray, or memoryview).
+        value: Scalar to compare with.
+
+    Returns:
+        Any: ``B`` mask aligned with ``arr``, 1 where ``arr != value`` and 0 elsewhere,
+            in the container type of ``arr``. NaN elements compare true.
+
+    Raises:
+        TypeError: If ``arr`` is unsupported or ``value`` is not a number
+    """
+    ...
+
+def between(arr: Any, lo: Union[int, float], hi: Union[int, float]) -> Any:
+    """
+    Mask of the elements in the closed interval ``[lo, hi]``.
+
+    ``lo`` and ``hi`` are converted as for ``greater()``.
+
+    Args:
+        arr: Input array (array.array, numpy.ndarray, or memoryview).
+        lo: Lower bound (inclusive).
+        hi: Upper bound (inclusive).
+
+    Returns:
+        Any: ``B`` mask aligned with ``arr``, 1 where ``lo <= arr <= hi`` and 0
+            elsewhere, in the container type of ``arr``. NaN elements, and every
+            element when ``lo > hi``, give 0.
+
+    Raises:
+        TypeError: If ``arr`` is unsupported or a bound is not a number
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> list(ao.between(array.array('i', [1, 5, 10, 15]), 5, 10))
+        [0, 1, 1, 0]
+    """
+    ...
+
+def compress(arr: Any, mask: Any) -> Any:
+    """
+    Elements of an array where a mask is non-zero.
+
+    The number of selected elements is counted first so the result is allocated
+    once at its exact size, then filled by branch-free stream compaction. With
+    ``--features parallel`` large arrays are compacted in chunks across threads.
+
+    Args:
+        arr: Input array (array.array, numpy.ndarray, or memoryview).
+        mask: ``B`` (uint8) array with the length of ``arr``, such as the result of
+            ``greater()`` or ``isin()``.
+
+    Returns:
+        Any: The selected elements in order, with the typecode and container type
+            of ``arr``.
+
+    Raises:
+        TypeError: If an input is unsupported or ``mask`` is not a ``B`` array
+        ValueError: If ``mask`` and ``arr`` differ in length
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> arr = array.array('d', [0.5, -1.0, 2.0, -3.0])
+        >>> list(ao.compress(arr, ao.greater(arr, 0.0)))
+        [0.5, 2.0]
+    """
+    ...
+
+def nonzero(arr: Any) -> Any:
+    """
+    Positions of the non-zero elements of an array.
+
+    Typically applied to a mask from the comparison functions. NaN counts as
+    non-zero and -0.0 does not.
+
+    Args:
+        arr: Input array (array.array, numpy.ndarray, or memoryview).
+
+    Returns:
+        Any: Ascending positions (typecode ``I``, or ``L`` for 2**32 or more
+            elements), in the container type of ``arr``.
+
+    Raises:
+        TypeError: If ``arr`` is unsupported
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> list(ao.nonzero(array.array('B', [0, 1, 1, 0, 1])))
+        [1, 2, 4]
+    """
+    ...
+
+def where(mask: Any, a: Any, b: Any, out: Optional[Any] = None) -> Any:
+    """
+    Elements of ``a`` where ``mask`` is set and of ``b`` elsewhere.
+
+    Args:
+        mask: ``uint8`` (``B``) mask, e.g. from ``greater()``.
+        a: Array of the mask's length, or a scalar.
+        b: Array of the mask's length, or a scalar.
+        out: Optional output array of the mask's length. It may be ``a`` or ``b``
+            for an in-place update.
+
+    Returns:
+        Any: The selected values, with the typecode and container type of the first
+            array among ``a`` and ``b`` (or of ``out``), or ``out`` itself.
+
+    Raises:
+        TypeError: If ``mask`` is not ``uint8``, ``a`` and ``b`` are arrays of
+            different typecodes, or neither they nor ``out`` is an array
+        ValueError: If an array operand's length differs from the mask's
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> arr = array.array('i', [-2, 5, -1, 3])
+        >>> list(ao.where(ao.less(arr, 0), 0, arr))
+        [0, 5, 0, 3]
+    """
+    ...
+
+def fill_nan(arr: Any, value: Union[int, float]) -> None:
+    """
+    Replace NaN elements with ``value`` in-place.
+
+    Args:
+        arr: Input array (modified in-place). ``memoryview`` must be writable.
+        value: Replacement value.
+
+    Returns:
+        None: This function modifies the array in-place and returns nothing
+
+    Raises:
+        TypeError: If ``arr`` is unsupported or ``value`` does not fit its typecode
+        ValueError: If ``memoryview`` is read-only
+
+    Notes:
+        - Integer arrays cannot hold NaN and are left unchanged
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> arr = array.array('d', [1.0, float('nan'), 3.0])
+        >>> ao.fill_nan(arr, 0.0)
+        >>> list(arr)
+        [1.0, 0.0, 3.0]
+    """
+    ...
+
+def replace(arr: Any, old: Union[int, float], new: Union[int, float]) -> None:
+    """
+    Replace every element equal to ``old`` with ``new`` in-place.
+
+    Args:
+        arr: Input array (modified in-place). ``memoryview`` must be writable.
+        old: Value to replace, compared as in ``equal()``. A NaN ``old`` matches
+            NaN elements.
+        new: Replacement value.
+
+    Returns:
+        None: This function modifies the array in-place and returns nothing
+
+    Raises:
+        TypeError: If ``arr`` is unsupported or ``new`` does not fit its typecode
+        ValueError: If ``memoryview`` is read-only
+
+    Examples:
+        >>> import array
+        >>> import arrayops as ao
+        >>> arr = array.array('i', [-1, 4, -1, 2])
+        >>> ao.replace(arr, -1, 0)
+        >>> list(arr)
+        [0, 4, 0, 2]
+    """
+    ...
@@ -6,8 +6,20 @@ This module provides fundamental array operations:
 - mean: Compute arithmetic mean
 - min: Find minimum value
 - max: Find maximum value
+- min_max: Find minimum and maximum in one pass
+- argmin, argmax, argminmax: Find positions of extrema
 """
 
-from arrayops._arrayops import max, mean, min, scale, sum  # noqa: F401
+from arrayops._arrayops import (  # noqa: F401
+    argmax,
+    argmin,
+    argminmax,
+    max,
+    mean,
+    min,
+    min_max,
+    scale,
+    sum,
+)
 
-__all__ = ["sum", "scale", "mean", "min", "max"]
+__all__ = ["sum", "scale", "mean", "min", "max", "min_max", "argmin", "argmax", "argminmax"]
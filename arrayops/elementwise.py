@@ -5,8 +5,19 @@ This module provides element-wise array operations:
 - multiply: Element-wise multiplication
 - clip: Clip values to range
 - normalize: Normalize to [0, 1] range
+- where: Choose between two arrays or scalars by mask
+- fill_nan: Replace NaN values in place
+- replace: Replace values equal to a scalar in place
 """
 
-from arrayops._arrayops import add, clip, multiply, normalize  # noqa: F401
+from arrayops._arrayops import (  # noqa: F401
+    add,
+    clip,
+    fill_nan,
+    multiply,
+    normalize,
+    replace,
+    where,
+)
 
-__all__ = ["add", "multiply", "clip", "normalize"]
+__all__ = ["add", "multiply", "clip", "normalize", "where", "fill_nan", "replace"]
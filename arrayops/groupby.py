@@ -0,0 +1,30 @@
+"""Keyed and segmented aggregation for arrayops.
+
+This module provides aggregation of a value column grouped by a key column:
+- groupby_agg: Sum, mean, count, min and max per distinct key
+
+and reductions over contiguous segments delimited by an offsets array:
+- segment_sum: Sum of every segment
+- segment_mean: Mean of every segment
+- segment_min: Minimum of every segment
+- segment_max: Maximum of every segment
+- segment_count: Length of every segment
+"""
+
+from arrayops._arrayops import (  # noqa: F401
+    groupby_agg,
+    segment_count,
+    segment_max,
+    segment_mean,
+    segment_min,
+    segment_sum,
+)
+
+__all__ = [
+    "groupby_agg",
+    "segment_sum",
+    "segment_mean",
+    "segment_min",
+    "segment_max",
+    "segment_count",
+]
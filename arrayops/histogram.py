@@ -0,0 +1,15 @@
+"""Histogram and counting operations for arrayops.
+
+This module provides frequency counting over numeric arrays:
+- histogram: Counts per bin for equal-width bins or explicit edges
+- bincount: Occurrences of each value in a non-negative integer array
+- value_counts: Distinct values with their number of occurrences
+- mode: Most frequent value
+
+``histogram`` and ``bincount`` accept a ``counts`` buffer to accumulate into, so
+partial results can be merged without a Python loop.
+"""
+
+from arrayops._arrayops import bincount, histogram, mode, value_counts  # noqa: F401
+
+__all__ = ["histogram", "bincount", "value_counts", "mode"]
@@ -0,0 +1,13 @@
+"""Index-based gather and scatter for arrayops.
+
+This module provides element selection by integer index arrays:
+- take: Gather elements at the given positions into a new (or ``out``) array
+- put: Scatter values into an array at the given positions, in place
+
+Index arrays may use any integer typecode, so the ``uint32`` output of ``argsort()``
+or the indices from ``isin(..., return_indices=True)`` can be applied directly.
+"""
+
+from arrayops._arrayops import put, take  # noqa: F401
+
+__all__ = ["take", "put"]
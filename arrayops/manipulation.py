@@ -3,9 +3,12 @@
 This module provides array manipulation operations:
 - reverse: Reverse array in-place
 - sort: Sort array in-place
-- unique: Get unique elements
+- argsort: Indices that would sort an array
+- unique: Get unique elements, optionally with inverse codes and counts
+- top_k: Select the k largest or smallest elements
+- concatenate: Join a sequence of arrays into one
 """
 
-from arrayops._arrayops import reverse, sort, unique  # noqa: F401
+from arrayops._arrayops import argsort, concatenate, reverse, sort, top_k, unique  # noqa: F401
 
-__all__ = ["reverse", "sort", "unique"]
+__all__ = ["reverse", "sort", "argsort", "unique", "top_k", "concatenate"]
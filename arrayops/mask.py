@@ -0,0 +1,35 @@
+"""Comparison masks and mask-based selection for arrayops.
+
+This module provides native predicates and the operations that consume them:
+- greater, greater_equal, less, less_equal, equal, not_equal: Compare with a scalar
+- between: Test membership in a closed interval
+- compress: Select the elements where a mask is set
+- nonzero: Positions of the non-zero elements
+
+Masks are ``uint8`` arrays of 0 and 1, so a threshold filter such as
+``compress(arr, greater(arr, 0.0))`` runs without calling into Python per element.
+"""
+
+from arrayops._arrayops import (  # noqa: F401
+    between,
+    compress,
+    equal,
+    greater,
+    greater_equal,
+    less,
+    less_equal,
+    nonzero,
+    not_equal,
+)
+
+__all__ = [
+    "greater",
+    "greater_equal",
+    "less",
+    "less_equal",
+    "equal",
+    "not_equal",
+    "between",
+    "compress",
+    "nonzero",
+]
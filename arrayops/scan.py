@@ -0,0 +1,12 @@
+"""Cumulative (prefix-scan) operations for arrayops.
+
+This module provides inclusive and exclusive scans:
+- cumsum: Cumulative sum
+- cumprod: Cumulative product
+- cummin: Cumulative minimum
+- cummax: Cumulative maximum
+"""
+
+from arrayops._arrayops import cummax, cummin, cumprod, cumsum  # noqa: F401
+
+__all__ = ["cumsum", "cumprod", "cummin", "cummax"]
@@ -0,0 +1,12 @@
+"""Searching operations for arrayops.
+
+This module provides lookups against sorted arrays:
+- searchsorted: Insertion points of a whole buffer of queries in a sorted array
+
+Sorted query buffers are merged against the data in one linear pass; unsorted
+queries use a branchless binary search each.
+"""
+
+from arrayops._arrayops import searchsorted  # noqa: F401
+
+__all__ = ["searchsorted"]
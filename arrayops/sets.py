@@ -0,0 +1,15 @@
+"""Set operations for arrayops.
+
+This module provides membership tests and set algebra on numeric arrays:
+- isin: Membership mask (or matching positions) of each element in a set of values
+- intersect1d: Sorted distinct values present in both arrays
+- union1d: Sorted distinct values present in either array
+- setdiff1d: Sorted distinct values of the first array missing from the second
+
+Inputs that are already sorted, such as the output of ``unique()``, are merged
+directly, with galloping search when one input is much shorter than the other.
+"""
+
+from arrayops._arrayops import intersect1d, isin, setdiff1d, union1d  # noqa: F401
+
+__all__ = ["isin", "intersect1d", "union1d", "setdiff1d"]
@@ -0,0 +1,18 @@
+"""Streaming sketches for arrayops.
+
+This module provides bounded-memory, mergeable summaries that ingest whole
+arrays natively:
+- QuantileSketch: Approximate quantiles and CDF (t-digest)
+- HyperLogLog: Approximate distinct counting
+- FrequencySketch: Frequency estimates and heavy hitters (count-min)
+- count_distinct: Exact or approximate number of distinct values
+"""
+
+from arrayops._arrayops import (  # noqa: F401
+    FrequencySketch,
+    HyperLogLog,
+    QuantileSketch,
+    count_distinct,
+)
+
+__all__ = ["QuantileSketch", "HyperLogLog", "FrequencySketch", "count_distinct"]
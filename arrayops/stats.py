@@ -5,11 +5,51 @@ This module provides statistical operations:
 - std: Compute standard deviation
 - std_dev: Alias for std (backward compatibility)
 - median: Find median value
+- average: Mean, optionally weighted
+- cov: Covariance of two arrays
+- corr: Pearson correlation of two arrays
+- linregress: Least-squares line through two arrays
+- nansum, nanmean, nanvar, nanstd: Reductions that skip NaN values
+- nanmin, nanmax, nanmedian: NaN-skipping extrema and median
+- count_nan: Number of NaN values
 """
 
-from arrayops._arrayops import median, std, var  # noqa: F401
+from arrayops._arrayops import (  # noqa: F401
+    average,
+    corr,
+    count_nan,
+    cov,
+    linregress,
+    median,
+    nanmax,
+    nanmean,
+    nanmedian,
+    nanmin,
+    nanstd,
+    nansum,
+    nanvar,
+    std,
+    var,
+)
 
 # Alias std_dev to std for backward compatibility
 std_dev = std  # noqa: F401
 
-__all__ = ["var", "std", "std_dev", "median"]
+__all__ = [
+    "var",
+    "std",
+    "std_dev",
+    "median",
+    "average",
+    "cov",
+    "corr",
+    "linregress",
+    "nansum",
+    "nanmean",
+    "nanmin",
+    "nanmax",
+    "nanvar",
+    "nanstd",
+    "nanmedian",
+    "count_nan",
+]
@@ -0,0 +1,13 @@
+"""Vector similarity operations for arrayops.
+
+This module provides fused reductions over whole vectors:
+- dot: Dot product of two arrays
+- norm: L1, L2 or max norm of an array
+- cosine: Cosine similarity of two arrays
+- dot_batch: Dot product of one query against many candidates
+- cosine_batch: Cosine similarity of one query against many candidates
+"""
+
+from arrayops._arrayops import cosine, cosine_batch, dot, dot_batch, norm  # noqa: F401
+
+__all__ = ["dot", "norm", "cosine", "dot_batch", "cosine_batch"]
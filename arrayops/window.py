@@ -0,0 +1,28 @@
+"""Rolling-window operations for arrayops.
+
+This module provides trailing-window statistics computed in a single native pass:
+- rolling_sum: Rolling sum
+- rolling_mean: Rolling mean
+- rolling_var: Rolling variance
+- rolling_std: Rolling standard deviation
+- rolling_min: Rolling minimum
+- rolling_max: Rolling maximum
+"""
+
+from arrayops._arrayops import (  # noqa: F401
+    rolling_max,
+    rolling_mean,
+    rolling_min,
+    rolling_std,
+    rolling_sum,
+    rolling_var,
+)
+
+__all__ = [
+    "rolling_sum",
+    "rolling_mean",
+    "rolling_var",
+    "rolling_std",
+    "rolling_min",
+    "rolling_max",
+]
@@ -1,5 +1,5 @@
 use pyo3::buffer::{Element, PyBuffer};
-use pyo3::exceptions::PyTypeError;
+use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::PyList;
 use pyo3::IntoPyObjectExt;
@@ -9,7 +9,9 @@ use pyo3::IntoPyObjectExt;
 use rayon::prelude::*;
 
 use crate::types::TypeCode;
-use crate::validation::InputType;
+use crate::validation::{
+    detect_input_type, get_typecode_unified, validate_for_operation, InputType,
+};
 
 /// Get the length of an array.array
 pub(crate) fn get_array_len(array: &Bound<'_, PyAny>) -> PyResult<usize> {
@@ -188,6 +190,159 @@ where
     }
 }
 
+/// Map TypeCode to the equivalent NumPy dtype name
+fn numpy_dtype_name(typecode: TypeCode) -> &'static str {
+    match typecode {
+        TypeCode::Int8 => "int8",
+        TypeCode::Int16 => "int16",
+        TypeCode::Int32 => "int32",
+        TypeCode::Int64 => "int64",
+        TypeCode::UInt8 => "uint8",
+        TypeCode::UInt16 => "uint16",
+        TypeCode::UInt32 => "uint32",
+        TypeCode::UInt64 => "uint64",
+        TypeCode::Float32 => "float32",
+        TypeCode::Float64 => "float64",
+    }
+}
+
+/// Allocate a result array of `len` elements to be filled through the buffer protocol
+///
+/// array.array results start zeroed and NumPy results uninitialized. Returns None for
+/// Arrow results, and for containers whose itemsize does not match `T` (e.g. 'l' is 4
+/// bytes on Windows); those are built with create_result_array_from_vec instead.
+pub(crate) fn allocate_result_array<'py, T>(
+    py: Python<'py>,
+    typecode: TypeCode,
+    input_type: InputType,
+    len: usize,
+) -> PyResult<Option<Bound<'py, PyAny>>>
+where
+    T: Element,
+{
+    let result = match input_type {
+        InputType::NumPyArray => {
+            let numpy_module = PyModule::import(py, "numpy")?;
+            numpy_module
+                .getattr("empty")?
+                .call1((len, numpy_dtype_name(typecode)))?
+        }
+        InputType::ArrayArray | InputType::MemoryView => {
+            let array_module = PyModule::import(py, "array")?;
+            let array_type = array_module.getattr("array")?;
+            let zero = PyList::new(py, [0])?;
+            array_type
+                .call1((typecode.as_char(), zero))?
+                .call_method1("__mul__", (len,))?
+        }
+        InputType::ArrowBuffer => return Ok(None),
+    };
+
+    if get_itemsize(&result)? != std::mem::size_of::<T>() {
+        return Ok(None);
+    }
+    Ok(Some(result))
+}
+
+/// Create result array from a native slice without an intermediate PyList
+///
+/// array.array and NumPy results are allocated at full size and filled with a single
+/// buffer copy. Arrow results, and containers whose itemsize does not match `T` (e.g.
+/// 'l' is 4 bytes on Windows), fall back to create_result_array_from_vec.
+pub(crate) fn create_result_array_from_slice<T>(
+    py: Python<'_>,
+    typecode: TypeCode,
+    input_type: InputType,
+    values: &[T],
+) -> PyResult<PyObject>
+where
+    T: Element + Copy + for<'py> IntoPyObject<'py>,
+{
+    let result = match allocate_result_array::<T>(py, typecode, input_type, values.len())? {
+        Some(result) => result,
+        None => {
+            return create_result_array_from_vec(py, typecode, input_type, values.to_vec());
+        }
+    };
+    // Skip the copy for empty results to avoid buffer alignment issues on macOS
+    if !values.is_empty() {
+        PyBuffer::<T>::get(&result)?.copy_from_slice(py, values)?;
+    }
+    Ok(result.unbind())
+}
+
+/// Check a caller-provided `out=` array can receive `len` elements of `T`
+///
+/// `out` must be a writable array.array, numpy.ndarray, or memoryview with the result
+/// typecode and length.
+pub(crate) fn check_out_array<T>(
+    out: &Bound<'_, PyAny>,
+    typecode: TypeCode,
+    len: usize,
+) -> PyResult<()>
+where
+    T: Element,
+{
+    let out_type = detect_input_type(out)?;
+    validate_for_operation(out, out_type, true)?;
+    let out_typecode = get_typecode_unified(out, out_type)?;
+    let wrong_typecode = || {
+        PyTypeError::new_err(format!(
+            "out array must have typecode '{}'",
+            typecode.as_char()
+        ))
+    };
+    if out_typecode != typecode {
+        return Err(wrong_typecode());
+    }
+    if get_array_len(out)? != len {
+        return Err(PyValueError::new_err(format!(
+            "out array must have length {}",
+            len
+        )));
+    }
+    // Empty outputs are only validated (T is irrelevant and the buffer is never read)
+    if len > 0 {
+        if get_itemsize(out)? != std::mem::size_of::<T>() {
+            return Err(wrong_typecode());
+        }
+        if PyBuffer::<T>::get(out)?.readonly() {
+            return Err(PyValueError::new_err("out array is read-only"));
+        }
+    }
+    Ok(())
+}
+
+/// Copy a native result into a caller-provided `out=` array and return that array
+///
+/// `out` is checked with check_out_array.
+pub(crate) fn write_result_to_out<T>(
+    py: Python<'_>,
+    out: &Bound<'_, PyAny>,
+    typecode: TypeCode,
+    values: &[T],
+) -> PyResult<PyObject>
+where
+    T: Element + Copy,
+{
+    check_out_array::<T>(out, typecode, values.len())?;
+    if !values.is_empty() {
+        PyBuffer::<T>::get(out)?.copy_from_slice(py, values)?;
+    }
+    Ok(out.clone().unbind())
+}
+
+/// Whether two buffers share any memory (e.g. `out=` is also an input)
+pub(crate) fn buffers_overlap<A, B>(a: &PyBuffer<A>, b: &PyBuffer<B>) -> bool
+where
+    A: Element,
+    B: Element,
+{
+    let a_start = a.buf_ptr() as usize;
+    let b_start = b.buf_ptr() as usize;
+    a_start < b_start + b.len_bytes() && b_start < a_start + a.len_bytes()
+}
+
 /// Create a memoryview slice from a buffer (helper function for zero-copy slicing)
 /// Note: This is used by the slice() function. For filter/map operations, views are
 /// not applicable because they change data/size
@@ -224,6 +379,22 @@ pub(crate) const PARALLEL_THRESHOLD_MINMAX: usize = 50_000;
 pub(crate) const PARALLEL_THRESHOLD_ADD: usize = 1_000;
 #[cfg_attr(not(feature = "parallel"), allow(dead_code))]
 pub(crate) const PARALLEL_THRESHOLD_MULTIPLY: usize = 1_000;
+#[cfg_attr(not(feature = "parallel"), allow(dead_code))]
+pub(crate) const PARALLEL_THRESHOLD_HASH: usize = 100_000;
+#[cfg_attr(not(feature = "parallel"), allow(dead_code))]
+pub(crate) const PARALLEL_THRESHOLD_WINDOW: usize = 100_000;
+#[cfg_attr(not(feature = "parallel"), allow(dead_code))]
+pub(crate) const PARALLEL_THRESHOLD_SCAN: usize = 100_000;
+#[cfg_attr(not(feature = "parallel"), allow(dead_code))]
+pub(crate) const PARALLEL_THRESHOLD_SELECT: usize = 100_000;
+#[cfg_attr(not(feature = "parallel"), allow(dead_code))]
+pub(crate) const PARALLEL_THRESHOLD_HISTOGRAM: usize = 100_000;
+#[cfg_attr(not(feature = "parallel"), allow(dead_code))]
+pub(crate) const PARALLEL_THRESHOLD_SORT: usize = 10_000;
+#[cfg_attr(not(feature = "parallel"), allow(dead_code))]
+pub(crate) const PARALLEL_THRESHOLD_SEARCH: usize = 10_000;
+#[cfg_attr(not(feature = "parallel"), allow(dead_code))]
+pub(crate) const PARALLEL_THRESHOLD_GATHER: usize = 100_000;
 #[allow(dead_code)] // Reserved for future parallel implementation
 pub(crate) const PARALLEL_THRESHOLD_CLIP: usize = 1_000;
 #[allow(dead_code)] // Reserved for future parallel implementation
@@ -232,7 +403,7 @@ pub(crate) const PARALLEL_THRESHOLD_NORMALIZE: usize = 2_000;
 // (parallel execution for these operations is limited by Python's GIL)
 #[allow(dead_code)]
 pub(crate) const PARALLEL_THRESHOLD_MAP: usize = 10_000;
-#[allow(dead_code)]
+#[cfg_attr(not(feature = "parallel"), allow(dead_code))]
 pub(crate) const PARALLEL_THRESHOLD_FILTER: usize = 10_000;
 #[allow(dead_code)]
 pub(crate) const PARALLEL_THRESHOLD_REDUCE: usize = 10_000;
@@ -0,0 +1,47 @@
+// Hashing helpers for native element values
+//
+// Hashes must be deterministic across processes (sketches built on different workers
+// are merged), so these use fixed mixing functions instead of std's randomized SipHash.
+
+use std::hash::{BuildHasherDefault, Hasher};
+
+/// SplitMix64 finalizer: a fast bijection on u64 with good avalanche behaviour
+#[inline(always)]
+pub(crate) fn mix64(x: u64) -> u64 {
+    let mut z = x.wrapping_add(0x9e37_79b9_7f4a_7c15);
+    z = (z ^ (z >> 30)).wrapping_mul(0xbf58_476d_1ce4_e5b9);
+    z = (z ^ (z >> 27)).wrapping_mul(0x94d0_49bb_1331_11eb);
+    z ^ (z >> 31)
+}
+
+/// Hasher for integer keys that are already native value bit patterns
+#[derive(Default)]
+pub(crate) struct MixHasher {
+    hash: u64,
+}
+
+impl Hasher for MixHasher {
+    #[inline]
+    fn finish(&self) -> u64 {
+        self.hash
+    }
+
+    #[inline]
+    fn write(&mut self, bytes: &[u8]) {
+        for &byte in bytes {
+            self.hash = mix64(self.hash ^ byte as u64);
+        }
+    }
+
+    #[inline]
+    fn write_u64(&mut self, value: u64) {
+        self.hash = mix64(value);
+    }
+
+    #[inline]
+    fn write_i128(&mut self, value: i128) {
+        self.hash = mix64(value as u64 ^ mix64((value >> 64) as u64));
+    }
+}
+
+pub(crate) type MixBuildHasher = BuildHasherDefault<MixHasher>;
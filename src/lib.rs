@@ -9,9 +9,12 @@ pub use types::*;
 mod validation;
 pub use validation::*;
 mod buffer;
+mod hashing;
 mod iterator;
+mod numeric;
 pub mod operations;
 pub use iterator::*;
+mod sketch;
 
 // SIMD optimizations: Use compiler auto-vectorization with chunked processing
 // For explicit SIMD, use std::arch intrinsics (stable) or std::simd (nightly)
@@ -154,6 +157,68 @@ macro_rules! dispatch_by_typecode_mut {
     };
 }
 
+/// Macro to generate a typecode dispatch over integer buffers only
+///
+/// Float typecodes raise TypeError, so the body may require integer-only traits
+/// (e.g. `crate::numeric::Integer`).
+#[macro_export]
+macro_rules! dispatch_by_int_typecode {
+    ($typecode:expr, $array:expr, |$buffer:ident| $body:block) => {
+        match $typecode {
+            $crate::types::TypeCode::Int8 => {
+                let $buffer = pyo3::buffer::PyBuffer::<i8>::get($array)?;
+                $body
+            }
+            $crate::types::TypeCode::Int16 => {
+                let $buffer = pyo3::buffer::PyBuffer::<i16>::get($array)?;
+                $body
+            }
+            $crate::types::TypeCode::Int32 => {
+                let $buffer = pyo3::buffer::PyBuffer::<i32>::get($array)?;
+                $body
+            }
+            $crate::types::TypeCode::Int64 => {
+                let itemsize = $crate::buffer::get_itemsize($array)?;
+                if itemsize == 4 {
+                    let $buffer = pyo3::buffer::PyBuffer::<i32>::get($array)?;
+                    $body
+                } else {
+                    let $buffer = pyo3::buffer::PyBuffer::<i64>::get($array)?;
+                    $body
+                }
+            }
+            $crate::types::TypeCode::UInt8 => {
+                let $buffer = pyo3::buffer::PyBuffer::<u8>::get($array)?;
+                $body
+            }
+            $crate::types::TypeCode::UInt16 => {
+                let $buffer = pyo3::buffer::PyBuffer::<u16>::get($array)?;
+                $body
+            }
+            $crate::types::TypeCode::UInt32 => {
+                let $buffer = pyo3::buffer::PyBuffer::<u32>::get($array)?;
+                $body
+            }
+            $crate::types::TypeCode::UInt64 => {
+                let itemsize = $crate::buffer::get_itemsize($array)?;
+                if itemsize == 4 {
+                    let $buffer = pyo3::buffer::PyBuffer::<u32>::get($array)?;
+                    $body
+                } else {
+                    let $buffer = pyo3::buffer::PyBuffer::<u64>::get($array)?;
+                    $body
+                }
+            }
+            tc @ ($crate::types::TypeCode::Float32 | $crate::types::TypeCode::Float64) => {
+                Err(pyo3::exceptions::PyTypeError::new_err(format!(
+                    "Unsupported typecode: '{}'. This operation requires an integer array (b, B, h, H, i, I, l, L)",
+                    tc.as_char()
+                )))
+            }
+        }
+    };
+}
+
 // SIMD thresholds - minimum array size to use SIMD
 // Reserved for future SIMD implementation
 #[cfg(feature = "simd")]
@@ -181,6 +246,10 @@ fn _arrayops(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(operations::basic::mean, m)?)?;
     m.add_function(wrap_pyfunction!(operations::basic::min, m)?)?;
     m.add_function(wrap_pyfunction!(operations::basic::max, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::extrema::min_max, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::extrema::argmin, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::extrema::argmax, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::extrema::argminmax, m)?)?;
     m.add_function(wrap_pyfunction!(operations::transform::map, m)?)?;
     m.add_function(wrap_pyfunction!(operations::transform::map_inplace, m)?)?;
     m.add_function(wrap_pyfunction!(operations::transform::filter, m)?)?;
@@ -188,18 +257,81 @@ fn _arrayops(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(operations::stats::var, m)?)?;
     m.add_function(wrap_pyfunction!(operations::stats::std_dev, m)?)?;
     m.add_function(wrap_pyfunction!(operations::stats::median, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::bivariate::cov, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::bivariate::corr, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::bivariate::linregress, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::bivariate::average, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::nanstats::nansum, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::nanstats::nanmean, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::nanstats::nanmin, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::nanstats::nanmax, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::nanstats::nanvar, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::nanstats::nanstd, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::nanstats::nanmedian, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::nanstats::count_nan, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::groupby::groupby_agg, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::segment::segment_sum, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::segment::segment_mean, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::segment::segment_min, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::segment::segment_max, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::segment::segment_count, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::histogram::histogram, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::histogram::bincount, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::histogram::value_counts, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::histogram::mode, m)?)?;
     m.add_function(wrap_pyfunction!(operations::elementwise::add, m)?)?;
     m.add_function(wrap_pyfunction!(operations::elementwise::multiply, m)?)?;
     m.add_function(wrap_pyfunction!(operations::elementwise::clip, m)?)?;
     m.add_function(wrap_pyfunction!(operations::elementwise::normalize, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::elementwise::where_, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::elementwise::fill_nan, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::elementwise::replace, m)?)?;
     m.add_function(wrap_pyfunction!(operations::manipulation::reverse, m)?)?;
     m.add_function(wrap_pyfunction!(operations::manipulation::sort, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::manipulation::argsort, m)?)?;
     m.add_function(wrap_pyfunction!(operations::manipulation::unique, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::manipulation::concatenate, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::select::top_k, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::search::searchsorted, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::sets::isin, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::sets::intersect1d, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::sets::union1d, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::sets::setdiff1d, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::indexing::take, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::indexing::put, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::mask::greater, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::mask::greater_equal, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::mask::less, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::mask::less_equal, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::mask::equal, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::mask::not_equal, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::mask::between, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::mask::compress, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::mask::nonzero, m)?)?;
     m.add_function(wrap_pyfunction!(operations::slice::slice, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::window::rolling_sum, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::window::rolling_mean, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::window::rolling_var, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::window::rolling_std, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::window::rolling_min, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::window::rolling_max, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::scan::cumsum, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::scan::cumprod, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::scan::cummin, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::scan::cummax, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::vector::dot, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::vector::norm, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::vector::cosine, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::vector::dot_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::vector::cosine_batch, m)?)?;
     m.add_class::<iterator::ArrayIterator>()?;
     m.add_function(wrap_pyfunction!(iterator::array_iterator, m)?)?;
     m.add_class::<lazy::LazyArray>()?;
     m.add_function(wrap_pyfunction!(lazy_array, m)?)?;
+    m.add_class::<sketch::QuantileSketch>()?;
+    m.add_class::<sketch::HyperLogLog>()?;
+    m.add_function(wrap_pyfunction!(sketch::count_distinct, m)?)?;
+    m.add_class::<sketch::FrequencySketch>()?;
     Ok(())
 }
 
@@ -240,7 +372,7 @@ mod tests {
             let arr = array_type
                 .call1(("i", PyList::new(py, &[1, 2, 3, 4, 5])))
                 .unwrap();
-            let result: i32 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: i32 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert_eq!(result, 15);
         });
     }
@@ -253,7 +385,7 @@ mod tests {
             let arr = array_type
                 .call1(("d", PyList::new(py, &[1.5, 2.5, 3.5])))
                 .unwrap();
-            let result: f64 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: f64 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert_eq!(result, 7.5);
         });
     }
@@ -265,7 +397,7 @@ mod tests {
             let array_type = array_module.getattr("array").unwrap();
             let empty_list = PyList::empty(py);
             let arr = array_type.call1(("i", empty_list)).unwrap();
-            let result: i32 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: i32 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert_eq!(result, 0);
         });
     }
@@ -313,7 +445,7 @@ mod tests {
             if result.is_ok() {
                 // Platform supports 'q', test our validation
                 let arr = result.unwrap();
-                let sum_result = sum(py, arr);
+                let sum_result = sum(py, arr, None);
                 assert!(sum_result.is_err());
                 assert!(sum_result
                     .unwrap_err()
@@ -330,7 +462,7 @@ mod tests {
     fn test_not_array_array() {
         Python::with_gil(|py| {
             let list = PyList::new(py, &[1, 2, 3]);
-            let result = sum(py, list);
+            let result = sum(py, list, None);
             assert!(result.is_err());
             assert!(result
                 .unwrap_err()
@@ -385,56 +517,56 @@ mod tests {
             let arr = array_type
                 .call1(("b", PyList::new(py, &[-1i8, 0, 1])))
                 .unwrap();
-            let result: i8 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: i8 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert_eq!(result, 0i8);
 
             // Test UInt8
             let arr = array_type
                 .call1(("B", PyList::new(py, &[1u8, 2, 3])))
                 .unwrap();
-            let result: u8 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: u8 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert_eq!(result, 6u8);
 
             // Test Int16
             let arr = array_type
                 .call1(("h", PyList::new(py, &[-10i16, 0, 10])))
                 .unwrap();
-            let result: i16 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: i16 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert_eq!(result, 0i16);
 
             // Test UInt16
             let arr = array_type
                 .call1(("H", PyList::new(py, &[100u16, 200])))
                 .unwrap();
-            let result: u16 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: u16 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert_eq!(result, 300u16);
 
             // Test Int32
             let arr = array_type
                 .call1(("i", PyList::new(py, &[1i32, 2, 3])))
                 .unwrap();
-            let result: i32 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: i32 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert_eq!(result, 6i32);
 
             // Test UInt32
             let arr = array_type
                 .call1(("I", PyList::new(py, &[1u32, 2, 3])))
                 .unwrap();
-            let result: u32 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: u32 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert_eq!(result, 6u32);
 
             // Test Int64
             let arr = array_type
                 .call1(("l", PyList::new(py, &[1000i64, 2000])))
                 .unwrap();
-            let result: i64 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: i64 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert_eq!(result, 3000i64);
 
             // Test UInt64
             let arr = array_type
                 .call1(("L", PyList::new(py, &[1000u64, 2000])))
                 .unwrap();
-            let result: u64 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: u64 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert_eq!(result, 3000u64);
         });
     }
@@ -449,14 +581,14 @@ mod tests {
             let arr = array_type
                 .call1(("f", PyList::new(py, &[1.5f32, 2.5, 3.5])))
                 .unwrap();
-            let result: f32 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: f32 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert!((result - 7.5).abs() < 0.001);
 
             // Test f64
             let arr = array_type
                 .call1(("d", PyList::new(py, &[1.5f64, 2.5, 3.5])))
                 .unwrap();
-            let result: f64 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: f64 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert!((result - 7.5).abs() < 0.001);
         });
     }
@@ -641,7 +773,7 @@ mod tests {
             let array_module = PyModule::import(py, "array").unwrap();
             let array_type = array_module.getattr("array").unwrap();
             let arr = array_type.call1(("i", PyList::new(py, &[42]))).unwrap();
-            let result: i32 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: i32 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert_eq!(result, 42);
         });
     }
@@ -701,7 +833,7 @@ mod tests {
             let array_type = array_module.getattr("array").unwrap();
             let values: Vec<i32> = (0..1000).collect();
             let arr = array_type.call1(("i", PyList::new(py, &values))).unwrap();
-            let result: i32 = sum(py, arr).unwrap().extract(py).unwrap();
+            let result: i32 = sum(py, arr, None).unwrap().extract(py).unwrap();
             assert_eq!(result, (0..1000).sum::<i32>());
         });
     }
@@ -745,7 +877,7 @@ mod tests {
             let arr = array_type
                 .call1(("i", PyList::new(py, &[1, 2, 3, 4, 5])))
                 .unwrap();
-            let result: f64 = mean(py, arr).unwrap();
+            let result: f64 = mean(py, arr, None).unwrap();
             assert!((result - 3.0).abs() < 1e-10);
         });
     }
@@ -758,7 +890,7 @@ mod tests {
             let arr = array_type
                 .call1(("d", PyList::new(py, &[1.5, 2.5, 3.5, 4.5])))
                 .unwrap();
-            let result: f64 = mean(py, arr).unwrap();
+            let result: f64 = mean(py, arr, None).unwrap();
             assert!((result - 3.0).abs() < 1e-10);
         });
     }
@@ -769,7 +901,7 @@ mod tests {
             let array_module = PyModule::import(py, "array").unwrap();
             let array_type = array_module.getattr("array").unwrap();
             let arr = array_type.call1(("i", PyList::empty(py))).unwrap();
-            let result = mean(py, arr);
+            let result = mean(py, arr, None);
             assert!(result.is_err());
             assert!(result.unwrap_err().to_string().contains("empty"));
         });
@@ -809,7 +941,7 @@ mod tests {
             let arr = array_type
                 .call1(("i", PyList::new(py, &[1, 2, 3, 4, 5])))
                 .unwrap();
-            let result: f64 = var(py, arr).unwrap();
+            let result: f64 = var(py, arr, None).unwrap();
             // Population variance: sum((x-mean)^2)/n = 10/5 = 2.0
             assert!((result - 2.0).abs() < 1e-10);
         });
@@ -823,7 +955,7 @@ mod tests {
             let arr = array_type
                 .call1(("i", PyList::new(py, &[1, 2, 3, 4, 5])))
                 .unwrap();
-            let result: f64 = std_dev(py, arr).unwrap();
+            let result: f64 = std_dev(py, arr, None).unwrap();
             // Population std: sqrt(2.0) ≈ 1.414
             assert!((result - (2.0_f64).sqrt()).abs() < 1e-10);
         });
@@ -956,7 +1088,7 @@ mod tests {
             let arr = array_type
                 .call1(("i", PyList::new(py, &[5, 2, 8, 1, 9])))
                 .unwrap();
-            sort(py, arr).unwrap();
+            sort(py, arr, true).unwrap();
             let buffer = PyBuffer::<i32>::get(arr).unwrap();
             let slice = buffer.as_slice(py).unwrap();
             let values: Vec<i32> = slice.iter().map(|cell| cell.get()).collect();
@@ -972,7 +1104,7 @@ mod tests {
             let arr = array_type
                 .call1(("i", PyList::new(py, &[5, 2, 8, 2, 1, 5, 9])))
                 .unwrap();
-            let result = unique(py, arr).unwrap();
+            let result = unique(py, arr, true, false, false).unwrap();
             let buffer = PyBuffer::<i32>::get(result.as_ref(py)).unwrap();
             let slice = buffer.as_slice(py).unwrap();
             let values: Vec<i32> = slice.iter().map(|cell| cell.get()).collect();
@@ -986,7 +1118,7 @@ mod tests {
             let array_module = PyModule::import(py, "array").unwrap();
             let array_type = array_module.getattr("array").unwrap();
             let arr = array_type.call1(("i", PyList::empty(py))).unwrap();
-            let result = unique(py, arr).unwrap();
+            let result = unique(py, arr, true, false, false).unwrap();
             let buffer = PyBuffer::<i32>::get(result.as_ref(py)).unwrap();
             let slice = buffer.as_slice(py).unwrap();
             assert_eq!(slice.len(), 0);
@@ -0,0 +1,162 @@
+// Numeric helpers shared by kernels that are generic over the element type
+//
+// The dispatch macros hand every operation a concrete PyBuffer<T>; this trait gives
+// those generic kernels a uniform way to convert values without repeating the
+// per-typecode special cases (e.g. i64/u64 have no `From` impl for f64).
+
+use std::cmp::Ordering;
+
+/// Conversions implemented by every supported element type
+pub(crate) trait Numeric: Copy + PartialOrd + Send + Sync + 'static {
+    /// Additive identity
+    const ZERO: Self;
+    /// Multiplicative identity
+    const ONE: Self;
+    /// Smallest value (negative infinity for floats)
+    const LOWEST: Self;
+    /// Largest value (positive infinity for floats)
+    const HIGHEST: Self;
+
+    /// 64-bit type of the same kind, used as an overflow-safe accumulator
+    type Wide: Numeric;
+
+    /// Convert to f64 (64-bit integers may round)
+    fn to_f64(self) -> f64;
+
+    /// Lossless conversion to the 64-bit accumulator type
+    fn widen(self) -> Self::Wide;
+
+    /// Addition that returns None on integer overflow (floats never fail)
+    fn add_checked(self, other: Self) -> Option<Self>;
+
+    /// Multiplication that returns None on integer overflow (floats never fail)
+    fn mul_checked(self, other: Self) -> Option<Self>;
+
+    /// Canonical 64-bit pattern used for hashing and equality of values
+    ///
+    /// Integers are sign/zero-extended; floats are widened to f64 with -0.0 folded
+    /// into 0.0 and every NaN mapped to a single NaN, so equal values share a key.
+    fn key_bits(self) -> u64;
+
+    /// True only for float NaN values
+    #[inline(always)]
+    fn is_nan(self) -> bool {
+        false
+    }
+
+    /// Total order used for sorting: numeric order with NaN after every number
+    #[inline(always)]
+    fn nan_last_cmp(&self, other: &Self) -> Ordering {
+        self.partial_cmp(other)
+            .unwrap_or_else(|| self.is_nan().cmp(&other.is_nan()))
+    }
+}
+
+/// Integer element types (the float typecodes are rejected before dispatch)
+pub(crate) trait Integer: Numeric + Ord + Eq + std::hash::Hash {
+    /// Lossless widening that covers both i64 and u64
+    fn to_i128(self) -> i128;
+}
+
+macro_rules! impl_numeric_int {
+    ($wide:ty, $key:ty; $($t:ty),*) => {
+        $(
+            impl Numeric for $t {
+                const ZERO: Self = 0;
+                const ONE: Self = 1;
+                const LOWEST: Self = <$t>::MIN;
+                const HIGHEST: Self = <$t>::MAX;
+
+                type Wide = $wide;
+
+                #[inline(always)]
+                fn to_f64(self) -> f64 {
+                    self as f64
+                }
+
+                #[inline(always)]
+                fn widen(self) -> $wide {
+                    self as $wide
+                }
+
+                #[inline(always)]
+                fn add_checked(self, other: Self) -> Option<Self> {
+                    self.checked_add(other)
+                }
+
+                #[inline(always)]
+                fn mul_checked(self, other: Self) -> Option<Self> {
+                    self.checked_mul(other)
+                }
+
+                #[inline(always)]
+                fn key_bits(self) -> u64 {
+                    self as $key as u64
+                }
+            }
+
+            impl Integer for $t {
+                #[inline(always)]
+                fn to_i128(self) -> i128 {
+                    self as i128
+                }
+            }
+        )*
+    };
+}
+
+macro_rules! impl_numeric_float {
+    ($($t:ty),*) => {
+        $(
+            impl Numeric for $t {
+                const ZERO: Self = 0.0;
+                const ONE: Self = 1.0;
+                const LOWEST: Self = <$t>::NEG_INFINITY;
+                const HIGHEST: Self = <$t>::INFINITY;
+
+                type Wide = f64;
+
+                #[inline(always)]
+                fn to_f64(self) -> f64 {
+                    self as f64
+                }
+
+                #[inline(always)]
+                fn widen(self) -> f64 {
+                    self as f64
+                }
+
+                #[inline(always)]
+                fn add_checked(self, other: Self) -> Option<Self> {
+                    Some(self + other)
+                }
+
+                #[inline(always)]
+                fn mul_checked(self, other: Self) -> Option<Self> {
+                    Some(self * other)
+                }
+
+                #[inline(always)]
+                fn is_nan(self) -> bool {
+                    <$t>::is_nan(self)
+                }
+
+                #[inline(always)]
+                fn key_bits(self) -> u64 {
+                    let value = self as f64;
+                    if value == 0.0 {
+                        0
+                    } else if value.is_nan() {
+                        f64::NAN.to_bits()
+                    } else {
+                        value.to_bits()
+                    }
+                }
+            }
+        )*
+    };
+}
+
+impl_numeric_int!(i64, i64; i8, i16, i32, i64);
+impl_numeric_int!(u64, u64; u8, u16, u32, u64);
+impl_numeric_float!(f32, f64);
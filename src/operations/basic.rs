@@ -1,19 +1,21 @@
 use pyo3::buffer::{Element, PyBuffer};
-use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::exceptions::{PyOverflowError, PyTypeError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::IntoPyObjectExt;
 
 #[cfg(feature = "parallel")]
 use rayon::prelude::*;
 
-use crate::buffer::{get_array_len, get_itemsize, CACHE_BLOCK_SIZE};
+use crate::buffer::{
+    get_array_len, get_itemsize, CACHE_BLOCK_SIZE, PARALLEL_THRESHOLD_MEAN, PARALLEL_THRESHOLD_SUM,
+};
+use crate::numeric::{Integer, Numeric};
 use crate::types::TypeCode;
 use crate::validation::{detect_input_type, get_typecode_unified, validate_for_operation};
 
 #[cfg(feature = "parallel")]
 use crate::buffer::{
-    extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_MEAN, PARALLEL_THRESHOLD_MINMAX,
-    PARALLEL_THRESHOLD_SCALE, PARALLEL_THRESHOLD_SUM,
+    extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_MINMAX, PARALLEL_THRESHOLD_SCALE,
 };
 
 // Generic sum implementation with cache-friendly processing
@@ -66,6 +68,293 @@ where
     }
 }
 
+// Lanes of independent accumulators so the widening adds vectorize
+const LANES: usize = 8;
+
+// Elements per block of 64-bit lane sums; small enough that no lane can overflow
+// for inputs up to 32 bits wide (2^20 * 2^32 < 2^63)
+const SUM_BLOCK: usize = 1 << 20;
+
+// Elements per parallel task
+#[cfg(feature = "parallel")]
+const PAR_CHUNK: usize = 65_536;
+
+/// Exact sum of values up to 32 bits wide: i64 lanes within a block, i128 across blocks
+fn sum_narrow<C, F>(data: &[C], get: F) -> i128
+where
+    F: Fn(&C) -> i64,
+{
+    let mut total = 0i128;
+    for block in data.chunks(SUM_BLOCK) {
+        let mut lanes = [0i64; LANES];
+        let chunks = block.chunks_exact(LANES);
+        let rest = chunks.remainder();
+        for chunk in chunks {
+            for lane in 0..LANES {
+                lanes[lane] += get(&chunk[lane]);
+            }
+        }
+        let block_total: i64 = lanes.iter().sum::<i64>() + rest.iter().map(&get).sum::<i64>();
+        total += block_total as i128;
+    }
+    total
+}
+
+/// Exact sum of 64-bit values using wrapping u64 lanes and per-lane carry counts
+///
+/// Each value is added to its lane with wraparound; a carry out of the lane shows up
+/// as the wrapped sum being smaller than the addend. Sign extension of negative
+/// inputs contributes -1 to the high word, so the 128-bit total of a lane is
+/// (carries - negatives) * 2^64 + low, all computed with 64-bit vector adds.
+fn sum_wide<const SIGNED: bool, C, F>(data: &[C], get: F) -> i128
+where
+    F: Fn(&C) -> u64,
+{
+    let mut low = [0u64; LANES];
+    let mut high = [0i64; LANES];
+    let chunks = data.chunks_exact(LANES);
+    let rest = chunks.remainder();
+    for chunk in chunks {
+        for lane in 0..LANES {
+            let value = get(&chunk[lane]);
+            let sum = low[lane].wrapping_add(value);
+            high[lane] += (sum < value) as i64 - (SIGNED && (value as i64) < 0) as i64;
+            low[lane] = sum;
+        }
+    }
+    let widen = |value: u64| {
+        if SIGNED {
+            value as i64 as i128
+        } else {
+            value as i128
+        }
+    };
+    let lanes: i128 = low
+        .iter()
+        .zip(high.iter())
+        .map(|(&low, &high)| ((high as i128) << 64) + low as i128)
+        .sum();
+    lanes + rest.iter().map(|cell| widen(get(cell))).sum::<i128>()
+}
+
+/// f64 sum with independent lane accumulators (the float64 accumulator)
+pub(crate) fn sum_f64<C, F>(data: &[C], get: F) -> f64
+where
+    F: Fn(&C) -> f64,
+{
+    let mut lanes = [0.0f64; LANES];
+    let chunks = data.chunks_exact(LANES);
+    let rest = chunks.remainder();
+    for chunk in chunks {
+        for lane in 0..LANES {
+            lanes[lane] += get(&chunk[lane]);
+        }
+    }
+    lanes.iter().sum::<f64>() + rest.iter().map(&get).sum::<f64>()
+}
+
+/// Integer element types that can be summed exactly into an i128
+pub(crate) trait ExactSum: Element + Integer {
+    fn exact_sum<C, F>(data: &[C], get: F) -> i128
+    where
+        F: Fn(&C) -> Self;
+}
+
+macro_rules! impl_exact_sum_narrow {
+    ($($t:ty),*) => {
+        $(
+            impl ExactSum for $t {
+                #[inline]
+                fn exact_sum<C, F>(data: &[C], get: F) -> i128
+                where
+                    F: Fn(&C) -> Self,
+                {
+                    sum_narrow(data, |cell| get(cell) as i64)
+                }
+            }
+        )*
+    };
+}
+
+impl_exact_sum_narrow!(i8, i16, i32, u8, u16, u32);
+
+impl ExactSum for i64 {
+    #[inline]
+    fn exact_sum<C, F>(data: &[C], get: F) -> i128
+    where
+        F: Fn(&C) -> Self,
+    {
+        sum_wide::<true, _, _>(data, |cell| get(cell) as u64)
+    }
+}
+
+impl ExactSum for u64 {
+    #[inline]
+    fn exact_sum<C, F>(data: &[C], get: F) -> i128
+    where
+        F: Fn(&C) -> Self,
+    {
+        sum_wide::<false, _, _>(data, get)
+    }
+}
+
+/// Accumulator chosen by the `dtype=` argument of sum() and mean()
+#[derive(Clone, Copy, PartialEq, Eq)]
+pub(crate) enum Accumulator {
+    /// Exact integer sum for integer arrays, the element type for float arrays
+    Default,
+    Int64,
+    UInt64,
+    Int128,
+    Float64,
+}
+
+impl Accumulator {
+    pub(crate) fn parse(dtype: Option<&str>) -> PyResult<Self> {
+        match dtype {
+            None => Ok(Accumulator::Default),
+            Some("int64") => Ok(Accumulator::Int64),
+            Some("uint64") => Ok(Accumulator::UInt64),
+            Some("int128") => Ok(Accumulator::Int128),
+            Some("float64") => Ok(Accumulator::Float64),
+            Some(other) => Err(PyValueError::new_err(format!(
+                "dtype must be 'int64', 'uint64', 'int128' or 'float64', got '{}'",
+                other
+            ))),
+        }
+    }
+
+    fn name(self) -> &'static str {
+        match self {
+            Accumulator::Default => "None",
+            Accumulator::Int64 => "int64",
+            Accumulator::UInt64 => "uint64",
+            Accumulator::Int128 => "int128",
+            Accumulator::Float64 => "float64",
+        }
+    }
+
+    /// Reject integer accumulators for float arrays
+    pub(crate) fn for_typecode(self, typecode: TypeCode) -> PyResult<Self> {
+        let integer_only = matches!(
+            self,
+            Accumulator::Int64 | Accumulator::UInt64 | Accumulator::Int128
+        );
+        if integer_only && typecode.is_float() {
+            return Err(PyTypeError::new_err(format!(
+                "dtype='{}' requires an integer array (b, B, h, H, i, I, l, L)",
+                self.name()
+            )));
+        }
+        Ok(self)
+    }
+
+    /// Check that an exact integer total fits the accumulator
+    fn check(self, total: i128, name: &str) -> PyResult<i128> {
+        let fits = match self {
+            Accumulator::Int64 => i64::try_from(total).is_ok(),
+            Accumulator::UInt64 => u64::try_from(total).is_ok(),
+            _ => true,
+        };
+        if fits {
+            Ok(total)
+        } else {
+            Err(PyOverflowError::new_err(format!(
+                "integer overflow in {}() with dtype='{}'; pass dtype='int128'",
+                name,
+                self.name()
+            )))
+        }
+    }
+}
+
+// Exact integer sum, split across threads above `threshold`
+#[allow(unused_variables)] // len/threshold are only used when parallel feature is enabled
+pub(crate) fn exact_sum_impl<T: ExactSum>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    len: usize,
+    threshold: usize,
+) -> PyResult<i128> {
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(len, threshold) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            return Ok(data
+                .par_chunks(PAR_CHUNK)
+                .map(|chunk| T::exact_sum(chunk, |v| *v))
+                .sum());
+        }
+    }
+
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    Ok(T::exact_sum(slice, |cell| cell.get()))
+}
+
+// Sum in an f64 accumulator, split across threads above `threshold`
+#[allow(unused_variables)] // len/threshold are only used when parallel feature is enabled
+pub(crate) fn f64_sum_impl<T: Element + Numeric>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    len: usize,
+    threshold: usize,
+) -> PyResult<f64> {
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(len, threshold) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            return Ok(data
+                .par_chunks(PAR_CHUNK)
+                .map(|chunk| sum_f64(chunk, |v| v.to_f64()))
+                .sum());
+        }
+    }
+
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    Ok(sum_f64(slice, |cell| cell.get().to_f64()))
+}
+
+/// Total of an array in the requested accumulator, as an exact int or a float
+pub(crate) enum Total {
+    Int(i128),
+    Float(f64),
+}
+
+impl Total {
+    pub(crate) fn to_f64(&self) -> f64 {
+        match *self {
+            Total::Int(value) => value as f64,
+            Total::Float(value) => value,
+        }
+    }
+}
+
+// Shared by sum() and mean(); the Default accumulator on float arrays is handled
+// by the callers, which keep accumulating in the element type
+fn accumulate(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    typecode: TypeCode,
+    acc: Accumulator,
+    len: usize,
+    threshold: usize,
+    name: &str,
+) -> PyResult<Total> {
+    if acc == Accumulator::Float64 {
+        return crate::dispatch_by_typecode!(typecode, array, |buffer| {
+            Ok(Total::Float(f64_sum_impl(py, &buffer, len, threshold)?))
+        });
+    }
+    let total = crate::dispatch_by_int_typecode!(typecode, array, |buffer| {
+        exact_sum_impl(py, &buffer, len, threshold)
+    })?;
+    Ok(Total::Int(acc.check(total, name)?))
+}
+
 // Generic scale implementation (in-place)
 fn scale_impl<T, F>(py: Python, buffer: &mut PyBuffer<T>, factor: F, len: usize) -> PyResult<()>
 where
@@ -102,57 +391,6 @@ where
     Ok(())
 }
 
-// Generic mean implementation for integer types
-fn mean_impl_int<T>(py: Python, buffer: &PyBuffer<T>, len: usize) -> PyResult<f64>
-where
-    T: Element + Copy + Default + std::ops::Add<Output = T> + Send + Sync,
-    f64: From<T>,
-{
-    let slice = buffer
-        .as_slice(py)
-        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
-
-    #[cfg(feature = "parallel")]
-    {
-        if should_parallelize(len, PARALLEL_THRESHOLD_MEAN) {
-            let data = extract_buffer_to_vec(py, buffer)?;
-            let sum: T = data
-                .par_iter()
-                .copied()
-                .reduce(|| T::default(), |a, b| a + b);
-            return Ok(f64::from(sum) / len as f64);
-        }
-    }
-
-    // Fast path for small arrays
-    if len <= 16 {
-        let sum: T = slice
-            .iter()
-            .map(|cell| cell.get())
-            .fold(T::default(), |acc, x| acc + x);
-        return Ok(f64::from(sum) / len as f64);
-    }
-
-    // Cache-friendly processing for larger arrays
-    let sum: T = if len > CACHE_BLOCK_SIZE {
-        let mut total = T::default();
-        for chunk in slice.chunks(CACHE_BLOCK_SIZE) {
-            let chunk_sum = chunk
-                .iter()
-                .map(|cell| cell.get())
-                .fold(T::default(), |acc, x| acc + x);
-            total = total + chunk_sum;
-        }
-        total
-    } else {
-        slice
-            .iter()
-            .map(|cell| cell.get())
-            .fold(T::default(), |acc, x| acc + x)
-    };
-    Ok(f64::from(sum) / len as f64)
-}
-
 // Generic mean implementation for float types
 fn mean_impl_float<T>(py: Python, buffer: &PyBuffer<T>, len: usize) -> PyResult<f64>
 where
@@ -204,69 +442,28 @@ where
     Ok(f64::from(sum) / len as f64)
 }
 
-// Generic min implementation
-fn min_impl<T>(py: Python<'_>, buffer: &PyBuffer<T>) -> PyResult<T>
-where
-    T: Element + Copy + PartialOrd + Send + Sync,
-{
-    let slice = buffer
-        .as_slice(py)
-        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
-
-    let len = slice.len();
-
-    // Fast path for very small arrays
-    match len {
-        0 => unreachable!(), // Should be checked before calling
-        1 => return Ok(slice[0].get()),
-        2 => {
-            let a = slice[0].get();
-            let b = slice[1].get();
-            return Ok(if a < b { a } else { b });
-        }
-        3 => {
-            let a = slice[0].get();
-            let b = slice[1].get();
-            let c = slice[2].get();
-            let ab = if a < b { a } else { b };
-            return Ok(if ab < c { ab } else { c });
-        }
-        4 => {
-            let a = slice[0].get();
-            let b = slice[1].get();
-            let c = slice[2].get();
-            let d = slice[3].get();
-            let ab = if a < b { a } else { b };
-            let cd = if c < d { c } else { d };
-            return Ok(if ab < cd { ab } else { cd });
-        }
-        _ => {} // Continue to general case
-    }
-
-    #[cfg(feature = "parallel")]
-    {
-        if should_parallelize(len, PARALLEL_THRESHOLD_MINMAX) {
-            let data = extract_buffer_to_vec(py, buffer)?;
-            return Ok(data
-                .par_iter()
-                .copied()
-                .min_by(|a, b| a.partial_cmp(b).unwrap())
-                .unwrap());
-        }
+// NaN-propagating binary min/max: a NaN on either side wins, so the result no
+// longer depends on where a NaN sits in the array (integers are unaffected)
+#[inline(always)]
+pub(crate) fn lesser<T: Numeric>(a: T, b: T) -> T {
+    if b < a || b.is_nan() {
+        b
+    } else {
+        a
     }
+}
 
-    let mut min_val = slice[0].get();
-    for cell in slice.iter().skip(1) {
-        let val = cell.get();
-        if val < min_val {
-            min_val = val;
-        }
+#[inline(always)]
+pub(crate) fn greater<T: Numeric>(a: T, b: T) -> T {
+    if b > a || b.is_nan() {
+        b
+    } else {
+        a
     }
-    Ok(min_val)
 }
 
-// Generic max implementation
-fn max_impl<T>(py: Python<'_>, buffer: &PyBuffer<T>) -> PyResult<T>
+// Generic min/max implementation; `pick` is `lesser` or `greater`
+fn extremum_impl<T>(py: Python<'_>, buffer: &PyBuffer<T>, pick: fn(T, T) -> T) -> PyResult<T>
 where
     T: Element + Copy + PartialOrd + Send + Sync,
 {
@@ -280,26 +477,15 @@ where
     match len {
         0 => unreachable!(), // Should be checked before calling
         1 => return Ok(slice[0].get()),
-        2 => {
-            let a = slice[0].get();
-            let b = slice[1].get();
-            return Ok(if a > b { a } else { b });
-        }
+        2 => return Ok(pick(slice[0].get(), slice[1].get())),
         3 => {
-            let a = slice[0].get();
-            let b = slice[1].get();
-            let c = slice[2].get();
-            let ab = if a > b { a } else { b };
-            return Ok(if ab > c { ab } else { c });
+            let ab = pick(slice[0].get(), slice[1].get());
+            return Ok(pick(ab, slice[2].get()));
         }
         4 => {
-            let a = slice[0].get();
-            let b = slice[1].get();
-            let c = slice[2].get();
-            let d = slice[3].get();
-            let ab = if a > b { a } else { b };
-            let cd = if c > d { c } else { d };
-            return Ok(if ab > cd { ab } else { cd });
+            let ab = pick(slice[0].get(), slice[1].get());
+            let cd = pick(slice[2].get(), slice[3].get());
+            return Ok(pick(ab, cd));
         }
         _ => {} // Continue to general case
     }
@@ -308,75 +494,56 @@ where
     {
         if should_parallelize(len, PARALLEL_THRESHOLD_MINMAX) {
             let data = extract_buffer_to_vec(py, buffer)?;
-            return Ok(data
-                .par_iter()
-                .copied()
-                .max_by(|a, b| a.partial_cmp(b).unwrap())
-                .unwrap());
+            return Ok(data.par_iter().copied().reduce_with(pick).unwrap());
         }
     }
 
-    let mut max_val = slice[0].get();
+    let mut result = slice[0].get();
     for cell in slice.iter().skip(1) {
-        let val = cell.get();
-        if val > max_val {
-            max_val = val;
-        }
+        result = pick(result, cell.get());
     }
-    Ok(max_val)
+    Ok(result)
 }
 
 /// Sum operation for array.array, numpy.ndarray, or memoryview
 ///
-/// # Integer Overflow
-///
-/// For integer types, overflow behavior follows Rust's default wrapping arithmetic:
-/// - In debug builds: may panic if overflow checks are enabled
-/// - In release builds: uses two's complement wrapping (wraps around)
+/// # Integer Accumulation
 ///
-/// For large arrays where overflow is possible, consider using a larger integer type
-/// or converting to float arrays before summing.
+/// Integer arrays are summed exactly and returned as a Python int: inputs up to
+/// 32 bits wide accumulate in i64 lanes, 64-bit inputs in u64 lanes with carry
+/// counts (an exact 128-bit total). `dtype` selects the accumulator:
+/// - `None`: exact integer sum; float arrays accumulate in their element type
+/// - `"int64"` / `"uint64"`: OverflowError if the total does not fit
+/// - `"int128"`: exact integer sum (integer arrays only)
+/// - `"float64"`: f64 accumulator for any array, returns a float
 #[pyfunction]
-pub fn sum(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+#[pyo3(signature = (array, dtype = None))]
+pub fn sum(py: Python<'_>, array: &Bound<'_, PyAny>, dtype: Option<&str>) -> PyResult<PyObject> {
     let input_type = detect_input_type(array)?;
     validate_for_operation(array, input_type, false)?;
     let typecode = get_typecode_unified(array, input_type)?;
+    let acc = Accumulator::parse(dtype)?.for_typecode(typecode)?;
 
     // Handle empty arrays early to avoid buffer alignment issues on macOS
-    if get_array_len(array)? == 0 {
-        match typecode {
-            TypeCode::Int8 => return 0i8.into_py_any(py),
-            TypeCode::Int16 => return 0i16.into_py_any(py),
-            TypeCode::Int32 => return 0i32.into_py_any(py),
-            TypeCode::Int64 => {
-                let itemsize = get_itemsize(array)?;
-                if itemsize == 4 {
-                    return 0i32.into_py_any(py);
-                } else {
-                    return 0i64.into_py_any(py);
-                }
-            }
-            TypeCode::UInt8 => return 0u8.into_py_any(py),
-            TypeCode::UInt16 => return 0u16.into_py_any(py),
-            TypeCode::UInt32 => return 0u32.into_py_any(py),
-            TypeCode::UInt64 => {
-                let itemsize = get_itemsize(array)?;
-                if itemsize == 4 {
-                    return 0u32.into_py_any(py);
-                } else {
-                    return 0u64.into_py_any(py);
-                }
-            }
-            TypeCode::Float32 => return 0.0f32.into_py_any(py),
-            TypeCode::Float64 => return 0.0f64.into_py_any(py),
-        }
+    let len = get_array_len(array)?;
+    if len == 0 {
+        return if typecode.is_float() || acc == Accumulator::Float64 {
+            0.0f64.into_py_any(py)
+        } else {
+            0i64.into_py_any(py)
+        };
     }
 
-    let len = get_array_len(array)?;
-    crate::dispatch_by_typecode!(typecode, array, |buffer| {
-        let result = sum_impl(py, &buffer, len)?;
-        result.into_py_any(py)
-    })
+    if typecode.is_float() && acc == Accumulator::Default {
+        return crate::dispatch_by_typecode!(typecode, array, |buffer| {
+            let result = sum_impl(py, &buffer, len)?;
+            result.into_py_any(py)
+        });
+    }
+    match accumulate(py, array, typecode, acc, len, PARALLEL_THRESHOLD_SUM, "sum")? {
+        Total::Int(value) => value.into_py_any(py),
+        Total::Float(value) => value.into_py_any(py),
+    }
 }
 
 /// Scale operation (in-place) for array.array, numpy.ndarray, or memoryview
@@ -449,11 +616,16 @@ pub fn scale(py: Python<'_>, array: &Bound<'_, PyAny>, factor: f64) -> PyResult<
 }
 
 /// Mean operation for array.array, numpy.ndarray, or memoryview
+///
+/// Integer arrays are summed exactly before dividing; `dtype` selects the
+/// accumulator as in `sum()`.
 #[pyfunction]
-pub fn mean(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<f64> {
+#[pyo3(signature = (array, dtype = None))]
+pub fn mean(py: Python<'_>, array: &Bound<'_, PyAny>, dtype: Option<&str>) -> PyResult<f64> {
     let input_type = detect_input_type(array)?;
     validate_for_operation(array, input_type, false)?;
     let typecode = get_typecode_unified(array, input_type)?;
+    let acc = Accumulator::parse(dtype)?.for_typecode(typecode)?;
 
     // Handle empty arrays - raise ValueError
     let len = get_array_len(array)?;
@@ -461,69 +633,27 @@ pub fn mean(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<f64> {
         return Err(PyValueError::new_err("mean() of empty array"));
     }
 
-    match typecode {
-        TypeCode::Int8 => {
-            let buffer = PyBuffer::<i8>::get(array)?;
-            mean_impl_int(py, &buffer, len)
-        }
-        TypeCode::Int16 => {
-            let buffer = PyBuffer::<i16>::get(array)?;
-            mean_impl_int(py, &buffer, len)
-        }
-        TypeCode::Int32 => {
-            let buffer = PyBuffer::<i32>::get(array)?;
-            mean_impl_int(py, &buffer, len)
-        }
-        TypeCode::Int64 => {
-            let itemsize = get_itemsize(array)?;
-            if itemsize == 4 {
-                let buffer = PyBuffer::<i32>::get(array)?;
-                mean_impl_int(py, &buffer, len)
-            } else {
-                let buffer = PyBuffer::<i64>::get(array)?;
-                // Convert sum to f64 explicitly (i64 doesn't have From<i64> for f64)
-                let slice = buffer
-                    .as_slice(py)
-                    .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
-                let sum: i64 = slice.iter().map(|cell| cell.get()).sum();
-                Ok(sum as f64 / len as f64)
-            }
-        }
-        TypeCode::UInt8 => {
-            let buffer = PyBuffer::<u8>::get(array)?;
-            mean_impl_int(py, &buffer, len)
-        }
-        TypeCode::UInt16 => {
-            let buffer = PyBuffer::<u16>::get(array)?;
-            mean_impl_int(py, &buffer, len)
-        }
-        TypeCode::UInt32 => {
-            let buffer = PyBuffer::<u32>::get(array)?;
-            mean_impl_int(py, &buffer, len)
-        }
-        TypeCode::UInt64 => {
-            let itemsize = get_itemsize(array)?;
-            if itemsize == 4 {
-                let buffer = PyBuffer::<u32>::get(array)?;
-                mean_impl_int(py, &buffer, len)
-            } else {
-                let buffer = PyBuffer::<u64>::get(array)?;
-                // Convert sum to f64 explicitly (u64 doesn't have From<u64> for f64)
-                let slice = buffer
-                    .as_slice(py)
-                    .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
-                let sum: u64 = slice.iter().map(|cell| cell.get()).sum();
-                Ok(sum as f64 / len as f64)
-            }
-        }
-        TypeCode::Float32 => {
+    match (typecode, acc) {
+        (TypeCode::Float32, Accumulator::Default) => {
             let buffer = PyBuffer::<f32>::get(array)?;
             mean_impl_float(py, &buffer, len)
         }
-        TypeCode::Float64 => {
+        (TypeCode::Float64, Accumulator::Default) => {
             let buffer = PyBuffer::<f64>::get(array)?;
             mean_impl_float(py, &buffer, len)
         }
+        _ => {
+            let total = accumulate(
+                py,
+                array,
+                typecode,
+                acc,
+                len,
+                PARALLEL_THRESHOLD_MEAN,
+                "mean",
+            )?;
+            Ok(total.to_f64() / len as f64)
+        }
     }
 }
 
@@ -541,7 +671,7 @@ pub fn min(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<PyObject> {
     }
 
     crate::dispatch_by_typecode!(typecode, array, |buffer| {
-        let result = min_impl(py, &buffer)?;
+        let result = extremum_impl(py, &buffer, lesser)?;
         result.into_py_any(py)
     })
 }
@@ -560,7 +690,7 @@ pub fn max(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<PyObject> {
     }
 
     crate::dispatch_by_typecode!(typecode, array, |buffer| {
-        let result = max_impl(py, &buffer)?;
+        let result = extremum_impl(py, &buffer, greater)?;
         result.into_py_any(py)
     })
 }
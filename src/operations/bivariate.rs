@@ -0,0 +1,313 @@
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::prelude::*;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::numeric::Numeric;
+use crate::operations::basic;
+use crate::validation::validate_array_pair;
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_MEAN};
+
+// Elements converted to f64 and centered together; small enough to stay in L1
+const BLOCK: usize = 256;
+
+// Elements per parallel task; partial moments are merged pairwise
+#[cfg(feature = "parallel")]
+const PAR_CHUNK: usize = 65_536;
+
+/// Partial statistics over a pair of input streams that can be merged exactly
+trait PairMoments: Copy + Default + Send {
+    /// Moments of one block of converted values
+    fn from_block(a: &[f64], b: &[f64]) -> Self;
+
+    /// Combine the moments of two disjoint ranges
+    fn merge(self, other: Self) -> Self;
+}
+
+/// Count, means and centered second moments of (x, y)
+///
+/// Each block is centered on its own means (two passes over values already in
+/// cache) and blocks are combined with Chan's pairwise update, so the input is read
+/// once without the cancellation of the textbook sum-of-squares formula.
+#[derive(Clone, Copy, Default)]
+struct CoMoments {
+    n: f64,
+    mean_x: f64,
+    mean_y: f64,
+    m2_x: f64,
+    m2_y: f64,
+    c_xy: f64,
+}
+
+impl PairMoments for CoMoments {
+    fn from_block(xs: &[f64], ys: &[f64]) -> Self {
+        if xs.is_empty() {
+            return Self::default();
+        }
+        let n = xs.len() as f64;
+        let mean_x = xs.iter().sum::<f64>() / n;
+        let mean_y = ys.iter().sum::<f64>() / n;
+        let (mut m2_x, mut m2_y, mut c_xy) = (0.0, 0.0, 0.0);
+        for (&x, &y) in xs.iter().zip(ys) {
+            let dx = x - mean_x;
+            let dy = y - mean_y;
+            m2_x += dx * dx;
+            m2_y += dy * dy;
+            c_xy += dx * dy;
+        }
+        Self {
+            n,
+            mean_x,
+            mean_y,
+            m2_x,
+            m2_y,
+            c_xy,
+        }
+    }
+
+    fn merge(self, other: Self) -> Self {
+        if self.n == 0.0 {
+            return other;
+        }
+        if other.n == 0.0 {
+            return self;
+        }
+        let n = self.n + other.n;
+        let dx = other.mean_x - self.mean_x;
+        let dy = other.mean_y - self.mean_y;
+        let scale = self.n * other.n / n;
+        Self {
+            n,
+            mean_x: self.mean_x + dx * other.n / n,
+            mean_y: self.mean_y + dy * other.n / n,
+            m2_x: self.m2_x + other.m2_x + dx * dx * scale,
+            m2_y: self.m2_y + other.m2_y + dy * dy * scale,
+            c_xy: self.c_xy + other.c_xy + dx * dy * scale,
+        }
+    }
+}
+
+/// Total weight, weighted mean and weighted centered second moment of x
+#[derive(Clone, Copy, Default)]
+struct WeightedMoments {
+    weight: f64,
+    mean: f64,
+    m2: f64,
+    negative: bool,
+}
+
+impl PairMoments for WeightedMoments {
+    fn from_block(xs: &[f64], ws: &[f64]) -> Self {
+        let weight = ws.iter().sum::<f64>();
+        let negative = ws.iter().any(|&w| w < 0.0);
+        if weight == 0.0 {
+            // Only reachable with all-zero weights once negatives are rejected
+            return Self {
+                negative,
+                ..Self::default()
+            };
+        }
+        let mean = xs.iter().zip(ws).map(|(&x, &w)| w * x).sum::<f64>() / weight;
+        let m2 = xs
+            .iter()
+            .zip(ws)
+            .map(|(&x, &w)| {
+                let d = x - mean;
+                w * d * d
+            })
+            .sum::<f64>();
+        Self {
+            weight,
+            mean,
+            m2,
+            negative,
+        }
+    }
+
+    fn merge(self, other: Self) -> Self {
+        let negative = self.negative || other.negative;
+        if self.weight == 0.0 {
+            return Self { negative, ..other };
+        }
+        if other.weight == 0.0 {
+            return Self { negative, ..self };
+        }
+        let weight = self.weight + other.weight;
+        let d = other.mean - self.mean;
+        Self {
+            weight,
+            mean: self.mean + d * other.weight / weight,
+            m2: self.m2 + other.m2 + d * d * self.weight * other.weight / weight,
+            negative,
+        }
+    }
+}
+
+// Single pass over two equally long slices, converting BLOCK elements at a time
+fn accumulate<M, C, F>(a: &[C], b: &[C], get: F) -> M
+where
+    M: PairMoments,
+    F: Fn(&C) -> f64,
+{
+    let mut buf_a = [0.0f64; BLOCK];
+    let mut buf_b = [0.0f64; BLOCK];
+    let mut acc = M::default();
+    for (chunk_a, chunk_b) in a.chunks(BLOCK).zip(b.chunks(BLOCK)) {
+        let len = chunk_a.len();
+        for (slot, value) in buf_a.iter_mut().zip(chunk_a) {
+            *slot = get(value);
+        }
+        for (slot, value) in buf_b.iter_mut().zip(chunk_b) {
+            *slot = get(value);
+        }
+        acc = acc.merge(M::from_block(&buf_a[..len], &buf_b[..len]));
+    }
+    acc
+}
+
+#[allow(unused_variables)] // len is only used when parallel feature is enabled
+fn moments_impl<M, T>(
+    py: Python<'_>,
+    buffer1: &PyBuffer<T>,
+    buffer2: &PyBuffer<T>,
+    len: usize,
+) -> PyResult<M>
+where
+    M: PairMoments,
+    T: Element + Numeric,
+{
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(len, PARALLEL_THRESHOLD_MEAN) {
+            let data1 = extract_buffer_to_vec(py, buffer1)?;
+            let data2 = extract_buffer_to_vec(py, buffer2)?;
+            return Ok(data1
+                .par_chunks(PAR_CHUNK)
+                .zip(data2.par_chunks(PAR_CHUNK))
+                .map(|(chunk1, chunk2)| accumulate::<M, T, _>(chunk1, chunk2, |v| v.to_f64()))
+                .reduce(M::default, M::merge));
+        }
+    }
+
+    let slice1 = buffer1
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let slice2 = buffer2
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    Ok(accumulate(slice1, slice2, |cell| cell.get().to_f64()))
+}
+
+// Validate the pair and compute its moments; empty inputs raise "<name>() of empty array"
+fn pair_moments<M: PairMoments>(
+    py: Python<'_>,
+    arr1: &Bound<'_, PyAny>,
+    arr2: &Bound<'_, PyAny>,
+    name: &str,
+) -> PyResult<M> {
+    let (typecode, len, _) = validate_array_pair(arr1, arr2)?;
+
+    // Handle empty arrays - raise ValueError
+    if len == 0 {
+        return Err(PyValueError::new_err(format!("{}() of empty array", name)));
+    }
+
+    crate::dispatch_by_typecode!(typecode, arr1, |buffer1| {
+        let buffer2 = PyBuffer::get(arr2)?;
+        moments_impl(py, &buffer1, &buffer2, len)
+    })
+}
+
+// Weighted moments of `array`; rejects negative weights and a zero total weight
+pub(crate) fn weighted_moments(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    weights: &Bound<'_, PyAny>,
+    name: &str,
+) -> PyResult<(f64, f64)> {
+    let moments: WeightedMoments = pair_moments(py, array, weights, name)?;
+    if moments.negative {
+        return Err(PyValueError::new_err("weights must be non-negative"));
+    }
+    if moments.weight == 0.0 {
+        return Err(PyValueError::new_err(
+            "Weights sum to zero, can't be normalized",
+        ));
+    }
+    Ok((moments.mean, moments.m2 / moments.weight))
+}
+
+/// Covariance of two arrays (divisor n - ddof) in a single pass
+#[pyfunction]
+#[pyo3(signature = (x, y, ddof = 0))]
+pub fn cov(
+    py: Python<'_>,
+    x: &Bound<'_, PyAny>,
+    y: &Bound<'_, PyAny>,
+    ddof: usize,
+) -> PyResult<f64> {
+    let moments: CoMoments = pair_moments(py, x, y, "cov")?;
+    if ddof as f64 >= moments.n {
+        return Err(PyValueError::new_err(
+            "ddof must be less than the number of elements",
+        ));
+    }
+    Ok(moments.c_xy / (moments.n - ddof as f64))
+}
+
+/// Pearson correlation coefficient of two arrays in a single pass
+///
+/// Returns NaN when either input is constant.
+#[pyfunction]
+pub fn corr(py: Python<'_>, x: &Bound<'_, PyAny>, y: &Bound<'_, PyAny>) -> PyResult<f64> {
+    let moments: CoMoments = pair_moments(py, x, y, "corr")?;
+    Ok(pearson(&moments))
+}
+
+fn pearson(moments: &CoMoments) -> f64 {
+    // Rounding can push |r| marginally above 1 for perfectly correlated inputs
+    (moments.c_xy / (moments.m2_x * moments.m2_y).sqrt()).clamp(-1.0, 1.0)
+}
+
+/// Ordinary least-squares fit y = slope * x + intercept in a single pass
+///
+/// Returns (slope, intercept, rvalue).
+#[pyfunction]
+pub fn linregress(
+    py: Python<'_>,
+    x: &Bound<'_, PyAny>,
+    y: &Bound<'_, PyAny>,
+) -> PyResult<(f64, f64, f64)> {
+    let moments: CoMoments = pair_moments(py, x, y, "linregress")?;
+    if moments.m2_x == 0.0 {
+        return Err(PyValueError::new_err(
+            "Cannot calculate a linear regression if all x values are identical",
+        ));
+    }
+    let slope = moments.c_xy / moments.m2_x;
+    let intercept = moments.mean_y - slope * moments.mean_x;
+    let rvalue = if moments.m2_y == 0.0 {
+        0.0
+    } else {
+        pearson(&moments)
+    };
+    Ok((slope, intercept, rvalue))
+}
+
+/// Mean of an array, optionally weighted by a second array of the same type and length
+#[pyfunction]
+#[pyo3(signature = (array, weights = None))]
+pub fn average(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    weights: Option<&Bound<'_, PyAny>>,
+) -> PyResult<f64> {
+    match weights {
+        Some(weights) => Ok(weighted_moments(py, array, weights, "average")?.0),
+        None => basic::mean(py, array, None),
+    }
+}
@@ -1,14 +1,20 @@
-use pyo3::buffer::{Element, PyBuffer};
+use std::cell::Cell;
+
+use pyo3::buffer::{Element, PyBuffer, ReadOnlyCell};
 use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
 
 use crate::buffer::{
-    create_empty_result_array, create_result_array_from_vec, get_array_len, get_itemsize,
+    create_empty_result_array, create_result_array_from_slice, create_result_array_from_vec,
+    get_array_len, get_itemsize, write_result_to_out,
 };
-use crate::operations::basic;
+use crate::numeric::Numeric;
+use crate::operations::extrema;
+use crate::operations::mask::{check_mask, Operand};
 use crate::types::TypeCode;
 use crate::validation::{
-    detect_input_type, get_typecode_unified, validate_for_operation, InputType,
+    detect_input_type, get_typecode_unified, validate_array_pair, validate_for_operation,
+    validate_same_type, InputType,
 };
 
 #[cfg(feature = "parallel")]
@@ -106,37 +112,7 @@ where
 
 #[pyfunction]
 pub fn add(py: Python<'_>, arr1: &Bound<'_, PyAny>, arr2: &Bound<'_, PyAny>) -> PyResult<PyObject> {
-    let input_type1 = detect_input_type(arr1)?;
-    validate_for_operation(arr1, input_type1, false)?;
-    let typecode1 = get_typecode_unified(arr1, input_type1)?;
-
-    let input_type2 = detect_input_type(arr2)?;
-    validate_for_operation(arr2, input_type2, false)?;
-    let typecode2 = get_typecode_unified(arr2, input_type2)?;
-
-    // Check types match
-    if typecode1 != typecode2 {
-        return Err(PyTypeError::new_err(
-            "Arrays must have the same type for element-wise operations",
-        ));
-    }
-
-    // Check lengths match
-    let len1 = get_array_len(arr1)?;
-    let len2 = get_array_len(arr2)?;
-    if len1 != len2 {
-        return Err(PyValueError::new_err(
-            "Arrays must have the same length for element-wise operations",
-        ));
-    }
-
-    // Determine result type (NumPy if both NumPy, otherwise array.array)
-    let result_type =
-        if input_type1 == InputType::NumPyArray && input_type2 == InputType::NumPyArray {
-            InputType::NumPyArray
-        } else {
-            InputType::ArrayArray
-        };
+    let (typecode1, len1, result_type) = validate_array_pair(arr1, arr2)?;
 
     // Handle empty arrays
     if len1 == 0 {
@@ -223,37 +199,7 @@ pub fn multiply(
     arr1: &Bound<'_, PyAny>,
     arr2: &Bound<'_, PyAny>,
 ) -> PyResult<PyObject> {
-    let input_type1 = detect_input_type(arr1)?;
-    validate_for_operation(arr1, input_type1, false)?;
-    let typecode1 = get_typecode_unified(arr1, input_type1)?;
-
-    let input_type2 = detect_input_type(arr2)?;
-    validate_for_operation(arr2, input_type2, false)?;
-    let typecode2 = get_typecode_unified(arr2, input_type2)?;
-
-    // Check types match
-    if typecode1 != typecode2 {
-        return Err(PyTypeError::new_err(
-            "Arrays must have the same type for element-wise operations",
-        ));
-    }
-
-    // Check lengths match
-    let len1 = get_array_len(arr1)?;
-    let len2 = get_array_len(arr2)?;
-    if len1 != len2 {
-        return Err(PyValueError::new_err(
-            "Arrays must have the same length for element-wise operations",
-        ));
-    }
-
-    // Determine result type (NumPy if both NumPy, otherwise array.array)
-    let result_type =
-        if input_type1 == InputType::NumPyArray && input_type2 == InputType::NumPyArray {
-            InputType::NumPyArray
-        } else {
-            InputType::ArrayArray
-        };
+    let (typecode1, len1, result_type) = validate_array_pair(arr1, arr2)?;
 
     // Handle empty arrays
     if len1 == 0 {
@@ -589,13 +535,8 @@ pub fn normalize(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<()> {
         return Ok(());
     }
 
-    // Get min and max using our min/max functions
-    let min_val_py = basic::min(py, array)?;
-    let max_val_py = basic::max(py, array)?;
-
-    // Extract min and max as f64
-    let min_val: f64 = min_val_py.extract(py)?;
-    let max_val: f64 = max_val_py.extract(py)?;
+    // Get min and max in a single fused pass (NaN propagates to both)
+    let (min_val, max_val) = extrema::min_max_f64(py, array)?;
 
     // Check for NaN or Infinity in min/max values
     if min_val.is_nan() || max_val.is_nan() {
@@ -694,3 +635,259 @@ pub fn normalize(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<()> {
         }
     }
 }
+
+/// One side of `where()`: an array aligned with the mask, or a scalar
+enum Choice<T: Element> {
+    Array(PyBuffer<T>),
+    Scalar(T),
+}
+
+impl<T> Choice<T>
+where
+    T: Element + for<'a> FromPyObject<'a>,
+{
+    fn extract(value: &Bound<'_, PyAny>, is_array: bool) -> PyResult<Self> {
+        if is_array {
+            Ok(Choice::Array(PyBuffer::get(value)?))
+        } else {
+            Ok(Choice::Scalar(value.extract()?))
+        }
+    }
+}
+
+/// Both sides of `where()`, reusing `probe` (the buffer the typecode was taken from)
+/// for whichever side it is
+fn choices<T>(
+    probe: PyBuffer<T>,
+    a: &Bound<'_, PyAny>,
+    a_is_array: bool,
+    b: &Bound<'_, PyAny>,
+    b_is_array: bool,
+) -> PyResult<(Choice<T>, Choice<T>)>
+where
+    T: Element + for<'a> FromPyObject<'a>,
+{
+    if a_is_array {
+        Ok((Choice::Array(probe), Choice::extract(b, b_is_array)?))
+    } else if b_is_array {
+        Ok((Choice::extract(a, false)?, Choice::Array(probe)))
+    } else {
+        Ok((Choice::extract(a, false)?, Choice::extract(b, false)?))
+    }
+}
+
+fn cells<'a, T: Element>(
+    py: Python<'a>,
+    buffer: &'a PyBuffer<T>,
+) -> PyResult<&'a [ReadOnlyCell<T>]> {
+    buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))
+}
+
+/// `x` where `flag` is set and `y` elsewhere; compiles to a select, not a branch
+#[inline(always)]
+fn pick<T: Copy>(flag: u8, x: T, y: T) -> T {
+    if flag != 0 {
+        x
+    } else {
+        y
+    }
+}
+
+fn where_impl<T>(
+    py: Python<'_>,
+    mask: &PyBuffer<u8>,
+    a: &Choice<T>,
+    b: &Choice<T>,
+) -> PyResult<Vec<T>>
+where
+    T: Element + Copy,
+{
+    let mask = cells(py, mask)?;
+    let result = match (a, b) {
+        (Choice::Array(a), Choice::Array(b)) => mask
+            .iter()
+            .zip(cells(py, a)?)
+            .zip(cells(py, b)?)
+            .map(|((m, x), y)| pick(m.get(), x.get(), y.get()))
+            .collect(),
+        (Choice::Array(a), Choice::Scalar(y)) => mask
+            .iter()
+            .zip(cells(py, a)?)
+            .map(|(m, x)| pick(m.get(), x.get(), *y))
+            .collect(),
+        (Choice::Scalar(x), Choice::Array(b)) => mask
+            .iter()
+            .zip(cells(py, b)?)
+            .map(|(m, y)| pick(m.get(), *x, y.get()))
+            .collect(),
+        (Choice::Scalar(x), Choice::Scalar(y)) => {
+            mask.iter().map(|m| pick(m.get(), *x, *y)).collect()
+        }
+    };
+    Ok(result)
+}
+
+/// Elements of `a` where `mask` is set and of `b` elsewhere
+///
+/// `mask` is a uint8 ('B') array, e.g. from `greater()`. `a` and `b` are arrays of
+/// the mask's length or scalars; the typecode and container type of the result come
+/// from the first array among them (or from `out`). The result is computed before
+/// it is written to `out`, so `out` may be `a` or `b` for an in-place update.
+#[pyfunction]
+#[pyo3(name = "where", signature = (mask, a, b, out = None))]
+pub fn where_(
+    py: Python<'_>,
+    mask: &Bound<'_, PyAny>,
+    a: &Bound<'_, PyAny>,
+    b: &Bound<'_, PyAny>,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    let len = get_array_len(mask)?;
+    check_mask(mask, len)?;
+
+    let a_is_array = detect_input_type(a).is_ok();
+    let b_is_array = detect_input_type(b).is_ok();
+    for (name, array, is_array) in [("a", a, a_is_array), ("b", b, b_is_array)] {
+        if is_array && get_array_len(array)? != len {
+            return Err(PyValueError::new_err(format!(
+                "{} must have the same length as the mask",
+                name
+            )));
+        }
+    }
+    let probe = match (a_is_array, b_is_array, out) {
+        (true, true, _) => {
+            validate_same_type(a, b)?;
+            a
+        }
+        (true, false, _) => a,
+        (false, true, _) => b,
+        (false, false, Some(out)) => out,
+        (false, false, None) => {
+            return Err(PyTypeError::new_err(
+                "where() needs a or b to be an array, or an out array",
+            ))
+        }
+    };
+    let input_type = detect_input_type(probe)?;
+    validate_for_operation(probe, input_type, false)?;
+    let typecode = get_typecode_unified(probe, input_type)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if len == 0 {
+        return match out {
+            Some(out) => write_result_to_out::<u8>(py, out, typecode, &[]),
+            None => create_empty_result_array(py, typecode, input_type),
+        };
+    }
+
+    let mask = PyBuffer::<u8>::get(mask)?;
+    crate::dispatch_by_typecode!(typecode, probe, |buffer| {
+        let (a, b) = choices(buffer, a, a_is_array, b, b_is_array)?;
+        let result = where_impl(py, &mask, &a, &b)?;
+        match out {
+            Some(out) => write_result_to_out(py, out, typecode, &result),
+            None => create_result_array_from_slice(py, typecode, input_type, &result),
+        }
+    })
+}
+
+/// Set the elements for which `matches` holds to `value`
+///
+/// Every element is written back, so the loop is a compare and select with no
+/// data-dependent branch.
+fn replace_where<T, F>(cells: &[Cell<T>], value: T, matches: F)
+where
+    T: Copy,
+    F: Fn(T) -> bool,
+{
+    for cell in cells {
+        let x = cell.get();
+        cell.set(if matches(x) { value } else { x });
+    }
+}
+
+fn fill_nan_impl<T>(py: Python<'_>, buffer: &PyBuffer<T>, value: &Bound<'_, PyAny>) -> PyResult<()>
+where
+    T: Element + Numeric + for<'a> FromPyObject<'a>,
+{
+    let value = value.extract::<T>()?;
+    let cells = buffer
+        .as_mut_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get mutable buffer slice"))?;
+    replace_where(cells, value, Numeric::is_nan);
+    Ok(())
+}
+
+/// Replace NaN elements with `value` (in-place) for array.array, numpy.ndarray, or memoryview
+///
+/// Integer arrays cannot hold NaN and are left unchanged.
+#[pyfunction]
+pub fn fill_nan(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    value: &Bound<'_, PyAny>,
+) -> PyResult<()> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, true)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(array)? == 0 || !typecode.is_float() {
+        return Ok(());
+    }
+
+    crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        fill_nan_impl(py, &buffer, value)
+    })
+}
+
+fn replace_impl<T>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    old: Operand<T>,
+    new: &Bound<'_, PyAny>,
+) -> PyResult<()>
+where
+    T: Element + Numeric + for<'a> FromPyObject<'a>,
+{
+    let new = new.extract::<T>()?;
+    let cells = buffer
+        .as_mut_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get mutable buffer slice"))?;
+    match old {
+        Operand::Native(old) if old.is_nan() => replace_where(cells, new, Numeric::is_nan),
+        Operand::Native(old) => replace_where(cells, new, |x| x == old),
+        // Only integer arrays get other operands: fractional, infinite, NaN or out of
+        // range, none of which equals an element
+        Operand::Wide(_) | Operand::Above | Operand::Below => {}
+    }
+    Ok(())
+}
+
+/// Replace every element equal to `old` with `new` (in-place)
+///
+/// `old` is compared as in `equal()`, and a NaN `old` matches NaN elements. `new`
+/// must be representable in the array's typecode.
+#[pyfunction]
+pub fn replace(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    old: &Bound<'_, PyAny>,
+    new: &Bound<'_, PyAny>,
+) -> PyResult<()> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, true)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(array)? == 0 {
+        return Ok(());
+    }
+
+    crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        replace_impl(py, &buffer, Operand::extract(old)?, new)
+    })
+}
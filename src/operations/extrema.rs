@@ -0,0 +1,284 @@
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::IntoPyObjectExt;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::buffer::get_array_len;
+use crate::numeric::Numeric;
+use crate::validation::{detect_input_type, get_typecode_unified, validate_for_operation};
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_MINMAX};
+
+// Independent (value, index) trackers per iteration so the scan vectorizes
+const LANES: usize = 8;
+
+// Elements per parallel task
+#[cfg(feature = "parallel")]
+const PAR_CHUNK: usize = 65_536;
+
+// Index marking "no candidate yet"
+const NONE: usize = usize::MAX;
+
+/// Minimum and maximum of the non-NaN values with the index of their first occurrence
+#[derive(Clone, Copy)]
+struct Extrema<T> {
+    min: T,
+    min_idx: usize,
+    max: T,
+    max_idx: usize,
+    nan_count: usize,
+}
+
+impl<T: Numeric> Extrema<T> {
+    fn empty() -> Self {
+        Extrema {
+            min: T::HIGHEST,
+            min_idx: NONE,
+            max: T::LOWEST,
+            max_idx: NONE,
+            nan_count: 0,
+        }
+    }
+
+    /// Combine two partial results; ties resolve to the smaller index
+    fn merge(self, other: Self) -> Self {
+        let (min, min_idx) = pick(
+            (self.min, self.min_idx),
+            (other.min, other.min_idx),
+            |a, b| a < b,
+        );
+        let (max, max_idx) = pick(
+            (self.max, self.max_idx),
+            (other.max, other.max_idx),
+            |a, b| a > b,
+        );
+        Extrema {
+            min,
+            min_idx,
+            max,
+            max_idx,
+            nan_count: self.nan_count + other.nan_count,
+        }
+    }
+}
+
+#[inline(always)]
+fn pick<T: Copy>(a: (T, usize), b: (T, usize), better: impl Fn(T, T) -> bool) -> (T, usize) {
+    if b.1 == NONE {
+        a
+    } else if a.1 == NONE || better(b.0, a.0) || (!better(a.0, b.0) && b.1 < a.1) {
+        b
+    } else {
+        a
+    }
+}
+
+/// One pass over `data`, reporting indices relative to `offset`
+///
+/// NaN never compares below or above anything, so it is skipped by the trackers and
+/// only counted. Values equal to the initial sentinel (the type's largest/smallest
+/// value) never replace it; `resolve_sentinels` fixes those indices afterwards.
+fn scan_extrema<C, T, F>(data: &[C], offset: usize, get: F) -> Extrema<T>
+where
+    T: Numeric,
+    F: Fn(&C) -> T,
+{
+    let mut mins = [T::HIGHEST; LANES];
+    let mut min_idx = [NONE; LANES];
+    let mut maxs = [T::LOWEST; LANES];
+    let mut max_idx = [NONE; LANES];
+    let mut nans = [0usize; LANES];
+
+    let chunks = data.chunks_exact(LANES);
+    let rest = chunks.remainder();
+    for (c, chunk) in chunks.enumerate() {
+        let base = offset + c * LANES;
+        for lane in 0..LANES {
+            let value = get(&chunk[lane]);
+            if value < mins[lane] {
+                mins[lane] = value;
+                min_idx[lane] = base + lane;
+            }
+            if value > maxs[lane] {
+                maxs[lane] = value;
+                max_idx[lane] = base + lane;
+            }
+            nans[lane] += value.is_nan() as usize;
+        }
+    }
+
+    let mut result = Extrema::empty();
+    for lane in 0..LANES {
+        result = result.merge(Extrema {
+            min: mins[lane],
+            min_idx: min_idx[lane],
+            max: maxs[lane],
+            max_idx: max_idx[lane],
+            nan_count: nans[lane],
+        });
+    }
+    let base = offset + data.len() - rest.len();
+    for (i, cell) in rest.iter().enumerate() {
+        let value = get(cell);
+        result = result.merge(Extrema {
+            min: value,
+            min_idx: if value.is_nan() { NONE } else { base + i },
+            max: value,
+            max_idx: if value.is_nan() { NONE } else { base + i },
+            nan_count: value.is_nan() as usize,
+        });
+    }
+    result
+}
+
+/// Fix the indices of extrema equal to the sentinel values (e.g. an all-MAX array)
+///
+/// A lane never records a value equal to its sentinel, so the tracked index may be
+/// missing or may not be the first occurrence; rescan for it in that rare case.
+fn resolve_sentinels<C, T, F>(data: &[C], mut extrema: Extrema<T>, get: F) -> Extrema<T>
+where
+    T: Numeric,
+    F: Fn(&C) -> T,
+{
+    if extrema.nan_count == data.len() {
+        return extrema;
+    }
+    if extrema.min == T::HIGHEST {
+        extrema.min_idx = data
+            .iter()
+            .position(|c| get(c) == T::HIGHEST)
+            .unwrap_or(NONE);
+    }
+    if extrema.max == T::LOWEST {
+        extrema.max_idx = data
+            .iter()
+            .position(|c| get(c) == T::LOWEST)
+            .unwrap_or(NONE);
+    }
+    extrema
+}
+
+fn extrema_impl<T>(py: Python<'_>, buffer: &PyBuffer<T>) -> PyResult<(Extrema<T>, Option<usize>)>
+where
+    T: Element + Numeric,
+{
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(buffer.item_count(), PARALLEL_THRESHOLD_MINMAX) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            let extrema = data
+                .par_chunks(PAR_CHUNK)
+                .enumerate()
+                .map(|(i, chunk)| scan_extrema(chunk, i * PAR_CHUNK, |v: &T| *v))
+                .reduce(Extrema::empty, Extrema::merge);
+            let extrema = resolve_sentinels(&data, extrema, |v: &T| *v);
+            let first_nan = (extrema.nan_count > 0)
+                .then(|| data.iter().position(|v| v.is_nan()))
+                .flatten();
+            return Ok((extrema, first_nan));
+        }
+    }
+
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let extrema = scan_extrema(slice, 0, |cell| cell.get());
+    let extrema = resolve_sentinels(slice, extrema, |cell| cell.get());
+    // Only arrays that contain NaN pay for locating it
+    let first_nan = (extrema.nan_count > 0)
+        .then(|| slice.iter().position(|cell| cell.get().is_nan()))
+        .flatten();
+    Ok((extrema, first_nan))
+}
+
+#[derive(Clone, Copy)]
+enum Want {
+    Values,
+    ArgMin,
+    ArgMax,
+    ArgBoth,
+}
+
+/// Shared driver for min_max/argmin/argmax/argminmax
+///
+/// NaN policy: with `skipna=False` (default) NaN propagates, so the values are NaN
+/// and the indices point at the first NaN, matching NumPy. With `skipna=True` NaN is
+/// ignored, and an all-NaN array raises ValueError.
+fn extrema(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    skipna: bool,
+    want: Want,
+    name: &str,
+) -> PyResult<PyObject> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+
+    // Handle empty arrays - raise ValueError
+    if get_array_len(array)? == 0 {
+        return Err(PyValueError::new_err(format!("{}() of empty array", name)));
+    }
+
+    crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        let (found, first_nan) = extrema_impl(py, &buffer)?;
+        let (min, min_idx, max, max_idx) = match first_nan {
+            Some(idx) if !skipna => {
+                let nan = buffer
+                    .as_slice(py)
+                    .map(|s| s[idx].get())
+                    .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+                (nan, idx, nan, idx)
+            }
+            _ => {
+                if found.min_idx == NONE {
+                    return Err(PyValueError::new_err("All-NaN slice encountered"));
+                }
+                (found.min, found.min_idx, found.max, found.max_idx)
+            }
+        };
+        match want {
+            Want::Values => (min, max).into_py_any(py),
+            Want::ArgMin => min_idx.into_py_any(py),
+            Want::ArgMax => max_idx.into_py_any(py),
+            Want::ArgBoth => (min_idx, max_idx).into_py_any(py),
+        }
+    })
+}
+
+/// Minimum and maximum of an array in one pass, as a (min, max) tuple
+#[pyfunction]
+#[pyo3(signature = (array, skipna = false))]
+pub fn min_max(py: Python<'_>, array: &Bound<'_, PyAny>, skipna: bool) -> PyResult<PyObject> {
+    extrema(py, array, skipna, Want::Values, "min_max")
+}
+
+/// Index of the first minimum of an array
+#[pyfunction]
+#[pyo3(signature = (array, skipna = false))]
+pub fn argmin(py: Python<'_>, array: &Bound<'_, PyAny>, skipna: bool) -> PyResult<PyObject> {
+    extrema(py, array, skipna, Want::ArgMin, "argmin")
+}
+
+/// Index of the first maximum of an array
+#[pyfunction]
+#[pyo3(signature = (array, skipna = false))]
+pub fn argmax(py: Python<'_>, array: &Bound<'_, PyAny>, skipna: bool) -> PyResult<PyObject> {
+    extrema(py, array, skipna, Want::ArgMax, "argmax")
+}
+
+/// Indices of the first minimum and first maximum of an array in one pass
+#[pyfunction]
+#[pyo3(signature = (array, skipna = false))]
+pub fn argminmax(py: Python<'_>, array: &Bound<'_, PyAny>, skipna: bool) -> PyResult<PyObject> {
+    extrema(py, array, skipna, Want::ArgBoth, "argminmax")
+}
+
+/// Fused (min, max) as f64 for callers such as normalize()
+pub(crate) fn min_max_f64(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<(f64, f64)> {
+    min_max(py, array, false)?.extract(py)
+}
@@ -0,0 +1,592 @@
+use std::collections::HashMap;
+
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::{PyOverflowError, PyTypeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::PyDict;
+use pyo3::IntoPyObjectExt;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::buffer::{create_empty_result_array, create_result_array_from_slice, get_array_len};
+use crate::hashing::MixBuildHasher;
+use crate::numeric::{Integer, Numeric};
+use crate::operations::basic::{greater, lesser};
+use crate::types::TypeCode;
+use crate::validation::{
+    detect_input_type, get_typecode_unified, validate_for_operation, InputType,
+};
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_HASH};
+#[cfg(feature = "parallel")]
+use crate::hashing::mix64;
+
+// Key ranges up to this size always use the dense path
+const DENSE_MIN_RANGE: u64 = 1 << 16;
+
+// Larger ranges use the dense path only with at least this many rows per slot. A
+// slot (Group) takes a few dozen bytes, so the table then stays below the size of
+// the key and value columns even when the keys are sparse within their range.
+const DENSE_ROWS_PER_SLOT: u64 = 8;
+
+// The parallel hash path splits rows into 2^PARTITION_BITS partitions by key hash,
+// so every key lands in exactly one partition and partitions aggregate independently
+#[cfg(feature = "parallel")]
+const PARTITION_BITS: u32 = 6;
+
+// Elements per task of the parallel partition histogram
+#[cfg(feature = "parallel")]
+const PAR_CHUNK: usize = 65_536;
+
+#[derive(Clone, Copy, PartialEq, Eq)]
+enum Agg {
+    Sum,
+    Mean,
+    Count,
+    Min,
+    Max,
+}
+
+impl Agg {
+    fn parse(name: &str) -> PyResult<Self> {
+        match name {
+            "sum" => Ok(Agg::Sum),
+            "mean" => Ok(Agg::Mean),
+            "count" => Ok(Agg::Count),
+            "min" => Ok(Agg::Min),
+            "max" => Ok(Agg::Max),
+            _ => Err(PyValueError::new_err(format!(
+                "Unknown aggregation '{}'; expected 'sum', 'mean', 'count', 'min' or 'max'",
+                name
+            ))),
+        }
+    }
+
+    fn name(self) -> &'static str {
+        match self {
+            Agg::Sum => "sum",
+            Agg::Mean => "mean",
+            Agg::Count => "count",
+            Agg::Min => "min",
+            Agg::Max => "max",
+        }
+    }
+}
+
+/// Running statistics the requested aggregations need besides the count
+#[derive(Clone, Copy)]
+struct Needs {
+    sum: bool,
+    min: bool,
+    max: bool,
+}
+
+impl Needs {
+    fn of(aggs: &[Agg]) -> Self {
+        Needs {
+            sum: aggs.iter().any(|&agg| agg == Agg::Sum || agg == Agg::Mean),
+            min: aggs.contains(&Agg::Min),
+            max: aggs.contains(&Agg::Max),
+        }
+    }
+}
+
+/// Running statistics of one group
+///
+/// Sums accumulate in the 64-bit type of the value's kind (`Numeric::Wide`). When an
+/// addition would overflow, the overflow is recorded and the running total moves
+/// into the f64 `spill`, so means stay available (in f64, like `segment_mean()`);
+/// only a requested sum fails. min/max propagate NaN like `min()`/`max()`.
+#[derive(Clone, Copy)]
+struct Group<K, T: Numeric> {
+    key: K,
+    count: u64,
+    sum: T::Wide,
+    spill: f64,
+    min: T,
+    max: T,
+    overflow: bool,
+}
+
+impl<K: Integer, T: Numeric> Group<K, T> {
+    fn new(key: K) -> Self {
+        Group {
+            key,
+            count: 0,
+            sum: <T::Wide as Numeric>::ZERO,
+            spill: 0.0,
+            min: T::HIGHEST,
+            max: T::LOWEST,
+            overflow: false,
+        }
+    }
+
+    /// Add `value` to the running sum, spilling the total to f64 instead of overflowing
+    #[inline(always)]
+    fn add_to_sum(&mut self, value: T::Wide) {
+        match self.sum.add_checked(value) {
+            Some(sum) => self.sum = sum,
+            None => {
+                self.overflow = true;
+                self.spill += self.sum.to_f64();
+                self.sum = value;
+            }
+        }
+    }
+
+    /// Mean of the group, including any spilled part of the sum
+    fn mean(&self) -> f64 {
+        (self.spill + self.sum.to_f64()) / self.count as f64
+    }
+
+    #[inline(always)]
+    fn push(&mut self, value: T, needs: Needs) {
+        self.count += 1;
+        if needs.sum {
+            self.add_to_sum(value.widen());
+        }
+        if needs.min {
+            self.min = lesser(self.min, value);
+        }
+        if needs.max {
+            self.max = greater(self.max, value);
+        }
+    }
+
+    /// Combine partial statistics of the same key (or of an untouched slot)
+    #[cfg_attr(not(feature = "parallel"), allow(dead_code))]
+    fn merge(&mut self, other: &Self) {
+        if self.count == 0 {
+            self.key = other.key;
+        }
+        self.count += other.count;
+        self.add_to_sum(other.sum);
+        self.spill += other.spill;
+        self.overflow |= other.overflow;
+        self.min = lesser(self.min, other.min);
+        self.max = greater(self.max, other.max);
+    }
+}
+
+/// How the keys are laid out, from one pass over them
+struct KeyLayout<K> {
+    sorted: bool,
+    min: K,
+    // max - min, computed on the sign/zero-extended bit patterns
+    span: u64,
+}
+
+fn key_layout<KC, K, FK>(keys: &[KC], key: FK) -> KeyLayout<K>
+where
+    K: Integer,
+    FK: Fn(&KC) -> K,
+{
+    let first = key(&keys[0]);
+    let (mut min, mut max, mut prev, mut sorted) = (first, first, first, true);
+    for cell in &keys[1..] {
+        let k = key(cell);
+        sorted &= prev <= k;
+        min = min.min(k);
+        max = max.max(k);
+        prev = k;
+    }
+    KeyLayout {
+        sorted,
+        min,
+        span: max.key_bits().wrapping_sub(min.key_bits()),
+    }
+}
+
+/// One group per run of equal keys; keys must be sorted
+fn aggregate_sorted<KC, TC, K, T, FK, FV>(
+    keys: &[KC],
+    values: &[TC],
+    key: FK,
+    value: FV,
+    needs: Needs,
+) -> Vec<Group<K, T>>
+where
+    K: Integer,
+    T: Numeric,
+    FK: Fn(&KC) -> K,
+    FV: Fn(&TC) -> T,
+{
+    let mut groups = Vec::new();
+    let mut current = Group::new(key(&keys[0]));
+    for (k, v) in keys.iter().zip(values) {
+        let k = key(k);
+        if k != current.key {
+            groups.push(current);
+            current = Group::new(k);
+        }
+        current.push(value(v), needs);
+    }
+    groups.push(current);
+    groups
+}
+
+/// Direct-indexed table with one slot per key in [min, min + span]
+///
+/// Slots that never see a row keep count 0; the caller drops them, which leaves the
+/// groups in key order without sorting.
+fn aggregate_dense<KC, TC, K, T, FK, FV>(
+    keys: &[KC],
+    values: &[TC],
+    key: FK,
+    value: FV,
+    needs: Needs,
+    min: K,
+    span: u64,
+) -> Vec<Group<K, T>>
+where
+    K: Integer,
+    T: Numeric,
+    FK: Fn(&KC) -> K,
+    FV: Fn(&TC) -> T,
+{
+    let base = min.key_bits();
+    let mut table = vec![Group::new(min); span as usize + 1];
+    for (k, v) in keys.iter().zip(values) {
+        let k = key(k);
+        let slot = &mut table[k.key_bits().wrapping_sub(base) as usize];
+        if slot.count == 0 {
+            slot.key = k;
+        }
+        slot.push(value(v), needs);
+    }
+    table
+}
+
+/// Open hash table from key to group index; groups come out in first-seen order
+fn aggregate_hash<KC, TC, K, T, FK, FV>(
+    keys: &[KC],
+    values: &[TC],
+    key: FK,
+    value: FV,
+    needs: Needs,
+) -> Vec<Group<K, T>>
+where
+    K: Integer,
+    T: Numeric,
+    FK: Fn(&KC) -> K,
+    FV: Fn(&TC) -> T,
+{
+    let mut index: HashMap<u64, usize, MixBuildHasher> = HashMap::default();
+    let mut groups: Vec<Group<K, T>> = Vec::new();
+    for (k, v) in keys.iter().zip(values) {
+        let k = key(k);
+        let slot = *index.entry(k.key_bits()).or_insert_with(|| {
+            groups.push(Group::new(k));
+            groups.len() - 1
+        });
+        groups[slot].push(value(v), needs);
+    }
+    groups
+}
+
+/// Sequential driver: sorted runs, then dense table, then hash table
+fn aggregate_serial<KC, TC, K, T, FK, FV>(
+    keys: &[KC],
+    values: &[TC],
+    key: FK,
+    value: FV,
+    needs: Needs,
+) -> Vec<Group<K, T>>
+where
+    K: Integer,
+    T: Numeric,
+    FK: Fn(&KC) -> K,
+    FV: Fn(&TC) -> T,
+{
+    let layout = key_layout(keys, &key);
+    if layout.sorted {
+        return aggregate_sorted(keys, values, key, value, needs);
+    }
+    if layout.span < DENSE_MIN_RANGE.max(keys.len() as u64 / DENSE_ROWS_PER_SLOT) {
+        let mut groups = aggregate_dense(keys, values, key, value, needs, layout.min, layout.span);
+        groups.retain(|group| group.count > 0);
+        return groups;
+    }
+    let mut groups = aggregate_hash(keys, values, key, value, needs);
+    groups.sort_unstable_by_key(|group| group.key);
+    groups
+}
+
+/// Parallel driver over copied columns
+///
+/// Small key ranges build one dense table per thread and merge them slot by slot.
+/// Otherwise rows are radix-partitioned on the top bits of the mixed key: a
+/// parallel histogram sizes the partitions, rows are scattered once, and each
+/// partition is hash-aggregated on its own thread with no merging, since a key
+/// never spans two partitions.
+#[cfg(feature = "parallel")]
+fn aggregate_parallel<K, T>(keys: &[K], values: &[T], needs: Needs) -> Vec<Group<K, T>>
+where
+    K: Integer,
+    T: Numeric,
+{
+    let layout = key_layout(keys, |k: &K| *k);
+    if layout.sorted {
+        return aggregate_sorted(keys, values, |k: &K| *k, |v: &T| *v, needs);
+    }
+
+    if layout.span < DENSE_MIN_RANGE {
+        let chunk = keys
+            .len()
+            .div_ceil(rayon::current_num_threads())
+            .max(PAR_CHUNK);
+        let mut groups = keys
+            .par_chunks(chunk)
+            .zip(values.par_chunks(chunk))
+            .map(|(kc, vc)| {
+                aggregate_dense(
+                    kc,
+                    vc,
+                    |k: &K| *k,
+                    |v: &T| *v,
+                    needs,
+                    layout.min,
+                    layout.span,
+                )
+            })
+            .reduce_with(|mut a, b| {
+                for (slot, other) in a.iter_mut().zip(&b) {
+                    slot.merge(other);
+                }
+                a
+            })
+            .unwrap_or_default();
+        groups.retain(|group| group.count > 0);
+        return groups;
+    }
+
+    let parts = 1usize << PARTITION_BITS;
+    let part_of = |k: K| (mix64(k.key_bits()) >> (64 - PARTITION_BITS)) as usize;
+    let counts = keys
+        .par_chunks(PAR_CHUNK)
+        .map(|chunk| {
+            let mut counts = vec![0usize; parts];
+            for &k in chunk {
+                counts[part_of(k)] += 1;
+            }
+            counts
+        })
+        .reduce(
+            || vec![0usize; parts],
+            |mut a, b| {
+                for (x, y) in a.iter_mut().zip(&b) {
+                    *x += y;
+                }
+                a
+            },
+        );
+    let mut starts = vec![0usize; parts + 1];
+    for p in 0..parts {
+        starts[p + 1] = starts[p] + counts[p];
+    }
+    let mut cursor = starts[..parts].to_vec();
+    let mut rows = vec![(K::ZERO, T::ZERO); keys.len()];
+    for (&k, &v) in keys.iter().zip(values) {
+        let p = part_of(k);
+        rows[cursor[p]] = (k, v);
+        cursor[p] += 1;
+    }
+
+    let mut groups: Vec<Group<K, T>> = starts
+        .par_windows(2)
+        .flat_map_iter(|bounds| {
+            let part = &rows[bounds[0]..bounds[1]];
+            aggregate_hash(part, part, |row| row.0, |row| row.1, needs)
+        })
+        .collect();
+    groups.sort_unstable_by_key(|group| group.key);
+    groups
+}
+
+fn aggregate<K, T>(
+    py: Python<'_>,
+    keys: &PyBuffer<K>,
+    values: &PyBuffer<T>,
+    needs: Needs,
+) -> PyResult<Vec<Group<K, T>>>
+where
+    K: Element + Integer,
+    T: Element + Numeric,
+{
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(keys.item_count(), PARALLEL_THRESHOLD_HASH) {
+            let keys = extract_buffer_to_vec(py, keys)?;
+            let values = extract_buffer_to_vec(py, values)?;
+            return Ok(aggregate_parallel(&keys, &values, needs));
+        }
+    }
+
+    let key_cells = keys
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let value_cells = values
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    Ok(aggregate_serial(
+        key_cells,
+        value_cells,
+        |cell| cell.get(),
+        |cell| cell.get(),
+        needs,
+    ))
+}
+
+/// Typecode and container type of one groupby_agg() input column
+#[derive(Clone, Copy)]
+struct Column {
+    typecode: TypeCode,
+    input_type: InputType,
+}
+
+fn groupby_impl<K, T>(
+    py: Python<'_>,
+    keys: &PyBuffer<K>,
+    values: &PyBuffer<T>,
+    aggs: &[Agg],
+    key_column: Column,
+    value_column: Column,
+) -> PyResult<PyObject>
+where
+    K: Element + Integer + for<'py> IntoPyObject<'py>,
+    T: Element + Numeric + for<'py> IntoPyObject<'py>,
+    T::Wide: Element + for<'py> IntoPyObject<'py>,
+{
+    let needs = Needs::of(aggs);
+    let groups = aggregate(py, keys, values, needs)?;
+    if aggs.contains(&Agg::Sum) && groups.iter().any(|group| group.overflow) {
+        return Err(PyOverflowError::new_err(
+            "integer overflow in groupby_agg() sum",
+        ));
+    }
+
+    let value_type = value_column.input_type;
+    let results = PyDict::new(py);
+    for &agg in aggs {
+        let array = match agg {
+            Agg::Sum => {
+                let sums: Vec<T::Wide> = groups.iter().map(|group| group.sum).collect();
+                create_result_array_from_slice(
+                    py,
+                    value_column.typecode.widened(),
+                    value_type,
+                    &sums,
+                )?
+            }
+            Agg::Mean => {
+                let means: Vec<f64> = groups.iter().map(Group::mean).collect();
+                create_result_array_from_slice(py, TypeCode::Float64, value_type, &means)?
+            }
+            Agg::Count => {
+                let counts: Vec<u64> = groups.iter().map(|group| group.count).collect();
+                create_result_array_from_slice(py, TypeCode::UInt64, value_type, &counts)?
+            }
+            Agg::Min => {
+                let mins: Vec<T> = groups.iter().map(|group| group.min).collect();
+                create_result_array_from_slice(py, value_column.typecode, value_type, &mins)?
+            }
+            Agg::Max => {
+                let maxs: Vec<T> = groups.iter().map(|group| group.max).collect();
+                create_result_array_from_slice(py, value_column.typecode, value_type, &maxs)?
+            }
+        };
+        results.set_item(agg.name(), array)?;
+    }
+
+    let unique: Vec<K> = groups.iter().map(|group| group.key).collect();
+    let unique =
+        create_result_array_from_slice(py, key_column.typecode, key_column.input_type, &unique)?;
+    (unique, results).into_py_any(py)
+}
+
+// Result typecode of each aggregation for a value column (used for empty input)
+fn agg_typecode(agg: Agg, value_typecode: TypeCode) -> TypeCode {
+    match agg {
+        Agg::Sum => value_typecode.widened(),
+        Agg::Mean => TypeCode::Float64,
+        Agg::Count => TypeCode::UInt64,
+        Agg::Min | Agg::Max => value_typecode,
+    }
+}
+
+fn column(array: &Bound<'_, PyAny>) -> PyResult<(Column, usize)> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+    Ok((
+        Column {
+            typecode,
+            input_type,
+        },
+        get_array_len(array)?,
+    ))
+}
+
+/// Group `values` by the integer `keys` and aggregate each group
+///
+/// Returns `(unique_keys, {agg: array})` with the keys in ascending order. The
+/// strategy follows the keys: runs when they are already sorted, a direct-indexed
+/// table when their range is small, and a hash table otherwise.
+#[pyfunction]
+#[pyo3(signature = (keys, values, aggs = None))]
+pub fn groupby_agg(
+    py: Python<'_>,
+    keys: &Bound<'_, PyAny>,
+    values: &Bound<'_, PyAny>,
+    aggs: Option<Vec<String>>,
+) -> PyResult<PyObject> {
+    let aggs = match aggs {
+        Some(names) => names
+            .iter()
+            .map(|name| Agg::parse(name))
+            .collect::<PyResult<Vec<_>>>()?,
+        None => vec![Agg::Sum, Agg::Mean, Agg::Count, Agg::Min, Agg::Max],
+    };
+    let (key_column, key_len) = column(keys)?;
+    let (value_column, value_len) = column(values)?;
+    if key_len != value_len {
+        return Err(PyValueError::new_err(
+            "keys and values must have the same length",
+        ));
+    }
+    if key_column.typecode.is_float() {
+        return Err(PyTypeError::new_err(format!(
+            "Unsupported typecode: '{}'. groupby_agg() keys must be an integer array (b, B, h, H, i, I, l, L)",
+            key_column.typecode.as_char()
+        )));
+    }
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if key_len == 0 {
+        let results = PyDict::new(py);
+        for &agg in &aggs {
+            let typecode = agg_typecode(agg, value_column.typecode);
+            results.set_item(
+                agg.name(),
+                create_empty_result_array(py, typecode, value_column.input_type)?,
+            )?;
+        }
+        let unique = create_empty_result_array(py, key_column.typecode, key_column.input_type)?;
+        return (unique, results).into_py_any(py);
+    }
+
+    crate::dispatch_by_int_typecode!(key_column.typecode, keys, |key_buffer| {
+        crate::dispatch_by_typecode!(value_column.typecode, values, |value_buffer| {
+            groupby_impl(
+                py,
+                &key_buffer,
+                &value_buffer,
+                &aggs,
+                key_column,
+                value_column,
+            )
+        })
+    })
+}
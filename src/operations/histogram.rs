@@ -0,0 +1,764 @@
+use std::collections::hash_map::Entry;
+use std::collections::HashMap;
+
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::{PyMemoryError, PyOverflowError, PyTypeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::IntoPyObjectExt;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::buffer::{
+    create_empty_result_array, create_result_array_from_slice, get_array_len, get_itemsize,
+};
+use crate::hashing::MixBuildHasher;
+use crate::numeric::{Integer, Numeric};
+use crate::types::TypeCode;
+use crate::validation::{
+    detect_input_type, get_typecode_unified, validate_for_operation, InputType,
+};
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{
+    extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_HASH,
+    PARALLEL_THRESHOLD_HISTOGRAM,
+};
+
+// Elements per parallel task; each task folds into its worker's private counts
+#[cfg(feature = "parallel")]
+const PAR_CHUNK: usize = 65_536;
+
+// Bin count used when `bins` is not given
+const DEFAULT_BINS: usize = 10;
+
+// 8-bit values are always tallied in a direct-indexed table; 16-bit values only
+// when the input is large enough to amortize the 65,536-slot table
+const DENSE_BITS: usize = 16;
+const DENSE_MIN_FILL: usize = 16;
+
+/// Requested binning before the data range is known
+enum BinSpec {
+    /// Equal-width bins over `range`, or over the data's range when it is None
+    Count(usize, Option<(f64, f64)>),
+    /// Explicit edges
+    Edges(Vec<f64>),
+}
+
+impl BinSpec {
+    /// Number of bins, known before the data is read
+    fn len(&self) -> usize {
+        match self {
+            BinSpec::Count(count, _) => *count,
+            BinSpec::Edges(edges) => edges.len().saturating_sub(1),
+        }
+    }
+}
+
+/// Resolved bin edges
+///
+/// Equal-width bins carry `scale = bins / (hi - lo)` so a value's bin is computed
+/// directly; explicit edges are searched.
+struct Bins {
+    edges: Vec<f64>,
+    scale: Option<f64>,
+}
+
+impl Bins {
+    /// Resolve `spec`, calling `data_range` only when the range must come from the data
+    fn resolve(spec: BinSpec, data_range: impl FnOnce() -> Option<(f64, f64)>) -> PyResult<Self> {
+        let (count, range) = match spec {
+            BinSpec::Edges(edges) => return Self::from_edges(edges),
+            BinSpec::Count(count, range) => (count, range),
+        };
+
+        let (mut lo, mut hi) = match range {
+            Some((lo, hi)) => {
+                if !(lo.is_finite() && hi.is_finite()) {
+                    return Err(PyValueError::new_err(format!(
+                        "range parameter must be finite, got ({}, {})",
+                        lo, hi
+                    )));
+                }
+                if lo > hi {
+                    return Err(PyValueError::new_err(
+                        "max must be larger than min in range parameter",
+                    ));
+                }
+                (lo, hi)
+            }
+            // Same default as NumPy for inputs without any non-NaN value
+            None => data_range().unwrap_or((0.0, 1.0)),
+        };
+        if !(lo.is_finite() && hi.is_finite()) {
+            return Err(PyValueError::new_err(format!(
+                "autodetected range of [{}, {}] is not finite",
+                lo, hi
+            )));
+        }
+        if lo == hi {
+            lo -= 0.5;
+            hi += 0.5;
+        }
+
+        let width = hi - lo;
+        let mut edges = Vec::new();
+        edges.try_reserve_exact(count + 1).map_err(|_| {
+            PyMemoryError::new_err(format!("cannot allocate {} histogram() bins", count))
+        })?;
+        edges.extend((0..=count).map(|i| {
+            let t = i as f64 / count as f64;
+            if width.is_finite() {
+                lo + width * t
+            } else {
+                // hi - lo overflows f64; interpolate without forming it
+                lo * (1.0 - t) + hi * t
+            }
+        }));
+        edges[count] = hi;
+        // Such a range also falls back to searching the edges
+        let scale = width.is_finite().then(|| count as f64 / width);
+        Ok(Bins { edges, scale })
+    }
+
+    fn from_edges(edges: Vec<f64>) -> PyResult<Self> {
+        if edges.len() < 2 {
+            return Err(PyValueError::new_err(
+                "bins must contain at least two edges",
+            ));
+        }
+        if edges.iter().any(|edge| edge.is_nan()) {
+            return Err(PyValueError::new_err("bins must not contain NaN"));
+        }
+        if edges.windows(2).any(|pair| pair[0] > pair[1]) {
+            return Err(PyValueError::new_err("bins must increase monotonically"));
+        }
+        Ok(Bins { edges, scale: None })
+    }
+
+    fn len(&self) -> usize {
+        self.edges.len() - 1
+    }
+
+    /// Bin of `x`; bins are half-open except the last, which includes its right edge.
+    /// NaN and values outside the edges have no bin.
+    #[inline(always)]
+    fn locate(&self, x: f64) -> Option<usize> {
+        let n = self.len();
+        if !(x >= self.edges[0] && x <= self.edges[n]) {
+            return None;
+        }
+        let bin = match self.scale {
+            Some(scale) => {
+                let mut bin = (((x - self.edges[0]) * scale) as usize).min(n - 1);
+                // Rounding in the scale can land one bin off next to an edge
+                if x < self.edges[bin] {
+                    bin -= 1;
+                } else if bin + 1 < n && x >= self.edges[bin + 1] {
+                    bin += 1;
+                }
+                bin
+            }
+            None => (self.edges.partition_point(|&edge| edge <= x) - 1).min(n - 1),
+        };
+        Some(bin)
+    }
+}
+
+/// (min, max) of the non-NaN values, or None if there are none
+fn data_range<C, F>(data: &[C], get: F) -> Option<(f64, f64)>
+where
+    F: Fn(&C) -> f64,
+{
+    data.iter()
+        .map(get)
+        .filter(|x| !x.is_nan())
+        .fold(None, |range, x| match range {
+            None => Some((x, x)),
+            Some((lo, hi)) => Some((lo.min(x), hi.max(x))),
+        })
+}
+
+#[cfg(feature = "parallel")]
+fn merge_ranges(a: Option<(f64, f64)>, b: Option<(f64, f64)>) -> Option<(f64, f64)> {
+    match (a, b) {
+        (Some(a), Some(b)) => Some((a.0.min(b.0), a.1.max(b.1))),
+        _ => a.or(b),
+    }
+}
+
+fn count_into<C, F>(counts: &mut [u64], data: &[C], get: F, bins: &Bins)
+where
+    F: Fn(&C) -> f64,
+{
+    for cell in data {
+        if let Some(bin) = bins.locate(get(cell)) {
+            counts[bin] += 1;
+        }
+    }
+}
+
+#[cfg(feature = "parallel")]
+fn add_counts(mut a: Vec<u64>, b: Vec<u64>) -> Vec<u64> {
+    for (total, count) in a.iter_mut().zip(b) {
+        *total += count;
+    }
+    a
+}
+
+fn histogram_impl<T>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    spec: BinSpec,
+) -> PyResult<(Vec<u64>, Vec<f64>)>
+where
+    T: Element + Numeric,
+{
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(buffer.item_count(), PARALLEL_THRESHOLD_HISTOGRAM) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            let bins = Bins::resolve(spec, || {
+                data.par_chunks(PAR_CHUNK)
+                    .map(|chunk| data_range(chunk, |v: &T| v.to_f64()))
+                    .reduce(|| None, merge_ranges)
+            })?;
+            // Each worker fills its own counts and the partial histograms are summed at
+            // the end, which only pays off while the tables are small next to the input
+            if bins.len() <= data.len() / 8 {
+                let counts = data
+                    .par_chunks(PAR_CHUNK)
+                    .fold(
+                        || vec![0u64; bins.len()],
+                        |mut counts, chunk| {
+                            count_into(&mut counts, chunk, |v: &T| v.to_f64(), &bins);
+                            counts
+                        },
+                    )
+                    .reduce(|| vec![0u64; bins.len()], add_counts);
+                return Ok((counts, bins.edges));
+            }
+            let mut counts = zeroed_counts(bins.len(), "histogram")?;
+            count_into(&mut counts, &data, |v: &T| v.to_f64(), &bins);
+            return Ok((counts, bins.edges));
+        }
+    }
+
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let bins = Bins::resolve(spec, || data_range(slice, |cell| cell.get().to_f64()))?;
+    let mut counts = zeroed_counts(bins.len(), "histogram")?;
+    count_into(&mut counts, slice, |cell| cell.get().to_f64(), &bins);
+    Ok((counts, bins.edges))
+}
+
+/// Add `counts` into `target[i]`, failing if a total does not fit the element type
+fn accumulate<T>(py: Python<'_>, buffer: &PyBuffer<T>, counts: &[u64]) -> PyResult<()>
+where
+    T: Element + Copy + Into<u64> + TryFrom<u64>,
+{
+    if buffer.readonly() {
+        return Err(PyValueError::new_err("counts array is read-only"));
+    }
+    let cells = buffer
+        .as_mut_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    // Check every total before writing so a failure leaves the buffer untouched
+    let totals = cells
+        .iter()
+        .zip(counts)
+        .map(|(cell, &count)| {
+            let current: u64 = cell.get().into();
+            current
+                .checked_add(count)
+                .and_then(|total| T::try_from(total).ok())
+                .ok_or_else(|| PyOverflowError::new_err("counts array overflowed"))
+        })
+        .collect::<PyResult<Vec<T>>>()?;
+    for (cell, total) in cells.iter().zip(totals) {
+        cell.set(total);
+    }
+    Ok(())
+}
+
+/// Return `counts` as a new array, or add them into the caller's `out` buffer
+///
+/// `out` must be a writable uint64 ('L') array with one slot per bin; accumulating
+/// lets histograms of several chunks be merged without a Python loop.
+fn emit_counts(
+    py: Python<'_>,
+    counts: &[u64],
+    out: Option<&Bound<'_, PyAny>>,
+    input_type: InputType,
+) -> PyResult<PyObject> {
+    let out = match out {
+        Some(out) => out,
+        None => return create_result_array_from_slice(py, TypeCode::UInt64, input_type, counts),
+    };
+    if !counts.is_empty() {
+        // 'L' is 4 bytes on some platforms
+        if get_itemsize(out)? == 4 {
+            accumulate(py, &PyBuffer::<u32>::get(out)?, counts)?;
+        } else {
+            accumulate(py, &PyBuffer::<u64>::get(out)?, counts)?;
+        }
+    }
+    Ok(out.clone().unbind())
+}
+
+/// Length of a `counts` buffer after checking it can receive counts
+fn counts_len(counts: &Bound<'_, PyAny>) -> PyResult<usize> {
+    let input_type = detect_input_type(counts)?;
+    validate_for_operation(counts, input_type, true)?;
+    if get_typecode_unified(counts, input_type)? != TypeCode::UInt64 {
+        return Err(PyTypeError::new_err("counts array must have typecode 'L'"));
+    }
+    get_array_len(counts)
+}
+
+fn parse_bins(
+    py: Python<'_>,
+    bins: Option<&Bound<'_, PyAny>>,
+    range: Option<(f64, f64)>,
+) -> PyResult<BinSpec> {
+    let bins = match bins {
+        Some(bins) => bins,
+        None => return Ok(BinSpec::Count(DEFAULT_BINS, range)),
+    };
+    if let Ok(count) = bins.extract::<i64>() {
+        if count < 1 {
+            return Err(PyValueError::new_err(format!(
+                "bins must be a positive integer, got {}",
+                count
+            )));
+        }
+        return Ok(BinSpec::Count(count as usize, range));
+    }
+
+    // Explicit edges; `range` is ignored as in NumPy
+    let input_type = detect_input_type(bins)?;
+    validate_for_operation(bins, input_type, false)?;
+    let typecode = get_typecode_unified(bins, input_type)?;
+    if get_array_len(bins)? == 0 {
+        return Err(PyValueError::new_err(
+            "bins must contain at least two edges",
+        ));
+    }
+    let edges = crate::dispatch_by_typecode!(typecode, bins, |buffer| {
+        let slice = buffer
+            .as_slice(py)
+            .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+        Ok::<Vec<f64>, PyErr>(slice.iter().map(|cell| cell.get().to_f64()).collect())
+    })?;
+    Ok(BinSpec::Edges(edges))
+}
+
+/// Histogram of an array as `(counts, edges)`
+///
+/// `bins` is either a bin count, giving equal-width bins over `range` (default: the
+/// data's min and max) whose index is computed in O(1), or an increasing array of
+/// edges searched per value. NaN and values outside the edges are not counted.
+/// With `counts`, the result is added into that uint64 buffer and it is returned.
+#[pyfunction]
+#[pyo3(signature = (array, bins = None, range = None, counts = None))]
+pub fn histogram(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    bins: Option<&Bound<'_, PyAny>>,
+    range: Option<(f64, f64)>,
+    counts: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+    let spec = parse_bins(py, bins, range)?;
+    if let Some(out) = counts {
+        if counts_len(out)? != spec.len() {
+            return Err(PyValueError::new_err(format!(
+                "counts array must have length {}",
+                spec.len()
+            )));
+        }
+    }
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    let (result, edges) = if get_array_len(array)? == 0 {
+        let bins = Bins::resolve(spec, || None)?;
+        (zeroed_counts(bins.len(), "histogram")?, bins.edges)
+    } else {
+        crate::dispatch_by_typecode!(typecode, array, |buffer| {
+            histogram_impl(py, &buffer, spec)
+        })?
+    };
+    let result = emit_counts(py, &result, counts, input_type)?;
+    let edges = create_result_array_from_slice(py, TypeCode::Float64, input_type, &edges)?;
+    (result, edges).into_py_any(py)
+}
+
+/// (min, max) of an integer array, widened so every typecode compares alike
+fn int_bounds<C, T, F>(data: &[C], get: F) -> (i128, i128)
+where
+    T: Integer,
+    F: Fn(&C) -> T,
+{
+    let (lo, hi) = data
+        .iter()
+        .map(get)
+        .fold((T::HIGHEST, T::LOWEST), |(lo, hi), x| {
+            (lo.min(x), hi.max(x))
+        });
+    (lo.to_i128(), hi.to_i128())
+}
+
+fn bincount_into<C, T, F>(counts: &mut [u64], data: &[C], get: F)
+where
+    T: Integer,
+    F: Fn(&C) -> T,
+{
+    for cell in data {
+        counts[get(cell).to_i128() as usize] += 1;
+    }
+}
+
+/// Zeroed counts, reporting an impossible allocation as MemoryError rather than aborting
+fn zeroed_counts(len: usize, name: &str) -> PyResult<Vec<u64>> {
+    let mut counts = Vec::new();
+    counts
+        .try_reserve_exact(len)
+        .map_err(|_| PyMemoryError::new_err(format!("cannot allocate {} {}() bins", len, name)))?;
+    counts.resize(len, 0);
+    Ok(counts)
+}
+
+/// Number of bins needed for values up to `max`
+fn bincount_len(min: i128, max: i128, minlength: usize, fixed: Option<usize>) -> PyResult<usize> {
+    if min < 0 {
+        return Err(PyValueError::new_err(
+            "bincount() requires non-negative values",
+        ));
+    }
+    match fixed {
+        Some(len) if max >= len as i128 => Err(PyValueError::new_err(format!(
+            "bincount() value {} does not fit counts array of length {}",
+            max, len
+        ))),
+        Some(len) => Ok(len),
+        None => {
+            let needed = usize::try_from(max + 1).map_err(|_| {
+                PyMemoryError::new_err(format!("cannot allocate {} bincount() bins", max + 1))
+            })?;
+            Ok(needed.max(minlength))
+        }
+    }
+}
+
+fn bincount_impl<T>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    minlength: usize,
+    fixed: Option<usize>,
+) -> PyResult<Vec<u64>>
+where
+    T: Element + Integer,
+{
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(buffer.item_count(), PARALLEL_THRESHOLD_HISTOGRAM) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            let (min, max) = data
+                .par_chunks(PAR_CHUNK)
+                .map(|chunk| int_bounds(chunk, |v: &T| *v))
+                .reduce(
+                    || (i128::MAX, i128::MIN),
+                    |a, b| (a.0.min(b.0), a.1.max(b.1)),
+                );
+            let len = bincount_len(min, max, minlength, fixed)?;
+            // Per-worker tables only pay off while they are small next to the input
+            if len <= data.len() / 8 {
+                let counts = data
+                    .par_chunks(PAR_CHUNK)
+                    .fold(
+                        || vec![0u64; len],
+                        |mut counts, chunk| {
+                            bincount_into(&mut counts, chunk, |v: &T| *v);
+                            counts
+                        },
+                    )
+                    .reduce(|| vec![0u64; len], add_counts);
+                return Ok(counts);
+            }
+            let mut counts = zeroed_counts(len, "bincount")?;
+            bincount_into(&mut counts, &data, |v: &T| *v);
+            return Ok(counts);
+        }
+    }
+
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let (min, max) = int_bounds(slice, |cell| cell.get());
+    let mut counts = zeroed_counts(bincount_len(min, max, minlength, fixed)?, "bincount")?;
+    bincount_into(&mut counts, slice, |cell| cell.get());
+    Ok(counts)
+}
+
+/// Number of occurrences of each value in a non-negative integer array
+///
+/// The result has `max(arr) + 1` slots, or at least `minlength`. With `counts`, the
+/// occurrences are added into that uint64 buffer (its length fixes the number of
+/// bins) and it is returned.
+#[pyfunction]
+#[pyo3(signature = (array, minlength = 0, counts = None))]
+pub fn bincount(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    minlength: usize,
+    counts: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+    let fixed = counts.map(counts_len).transpose()?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(array)? == 0 {
+        let result = zeroed_counts(fixed.unwrap_or(minlength), "bincount")?;
+        return emit_counts(py, &result, counts, input_type);
+    }
+
+    let result = crate::dispatch_by_int_typecode!(typecode, array, |buffer| {
+        bincount_impl(py, &buffer, minlength, fixed)
+    })?;
+    emit_counts(py, &result, counts, input_type)
+}
+
+/// Occurrence counts of the distinct values of an array
+///
+/// 8- and 16-bit integers index a table by their bit pattern. Wider types hash the
+/// canonical `key_bits`, so -0.0 and 0.0 count as one value, as do all NaNs.
+enum Tally<T> {
+    Dense {
+        counts: Vec<u64>,
+        values: Vec<T>,
+    },
+    Hash {
+        slots: HashMap<u64, usize, MixBuildHasher>,
+        entries: Vec<(T, u64)>,
+    },
+}
+
+impl<T: Numeric> Tally<T> {
+    /// Empty tally for an input of `len` values
+    fn new(len: usize) -> Self {
+        let bits = 8 * std::mem::size_of::<T>();
+        if bits <= 8 || (bits <= DENSE_BITS && len >= (1 << bits) / DENSE_MIN_FILL) {
+            Tally::Dense {
+                counts: vec![0; 1 << bits],
+                values: vec![T::ZERO; 1 << bits],
+            }
+        } else {
+            Tally::Hash {
+                slots: HashMap::default(),
+                entries: Vec::new(),
+            }
+        }
+    }
+
+    fn extend<C, F>(&mut self, data: &[C], get: F)
+    where
+        F: Fn(&C) -> T,
+    {
+        match self {
+            Tally::Dense { counts, values } => {
+                let mask = counts.len() - 1;
+                for cell in data {
+                    let value = get(cell);
+                    let slot = value.key_bits() as usize & mask;
+                    counts[slot] += 1;
+                    // Unconditional store keeps the loop branch-free
+                    values[slot] = value;
+                }
+            }
+            Tally::Hash { slots, entries } => {
+                for cell in data {
+                    insert(slots, entries, get(cell), 1);
+                }
+            }
+        }
+    }
+
+    /// Combine the tallies of two parts of the same array
+    #[cfg(feature = "parallel")]
+    fn merge(self, other: Self) -> Self {
+        match (self, other) {
+            (
+                Tally::Dense {
+                    mut counts,
+                    mut values,
+                },
+                Tally::Dense {
+                    counts: other_counts,
+                    values: other_values,
+                },
+            ) => {
+                for slot in 0..counts.len() {
+                    if other_counts[slot] > 0 {
+                        counts[slot] += other_counts[slot];
+                        values[slot] = other_values[slot];
+                    }
+                }
+                Tally::Dense { counts, values }
+            }
+            (
+                Tally::Hash { slots, entries },
+                Tally::Hash {
+                    slots: other_slots,
+                    entries: other_entries,
+                },
+            ) => {
+                // Fold the smaller table into the larger one
+                let (mut slots, mut entries, smaller) = if entries.len() >= other_entries.len() {
+                    (slots, entries, other_entries)
+                } else {
+                    (other_slots, other_entries, entries)
+                };
+                for (value, count) in smaller {
+                    insert(&mut slots, &mut entries, value, count);
+                }
+                Tally::Hash { slots, entries }
+            }
+            // Both parts were sized for the same array and so picked the same layout
+            _ => unreachable!("tallies of one array share a layout"),
+        }
+    }
+
+    /// Distinct values with their counts, in no particular order
+    fn into_entries(self) -> Vec<(T, u64)> {
+        match self {
+            Tally::Dense { counts, values } => counts
+                .into_iter()
+                .zip(values)
+                .filter(|&(count, _)| count > 0)
+                .map(|(count, value)| (value, count))
+                .collect(),
+            Tally::Hash { entries, .. } => entries,
+        }
+    }
+}
+
+#[inline(always)]
+fn insert<T: Numeric>(
+    slots: &mut HashMap<u64, usize, MixBuildHasher>,
+    entries: &mut Vec<(T, u64)>,
+    value: T,
+    count: u64,
+) {
+    match slots.entry(value.key_bits()) {
+        Entry::Occupied(slot) => entries[*slot.get()].1 += count,
+        Entry::Vacant(slot) => {
+            slot.insert(entries.len());
+            entries.push((value, count));
+        }
+    }
+}
+
+fn tally_impl<T>(py: Python<'_>, buffer: &PyBuffer<T>) -> PyResult<Vec<(T, u64)>>
+where
+    T: Element + Numeric,
+{
+    let len = buffer.item_count();
+
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(len, PARALLEL_THRESHOLD_HASH) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            let tally = data
+                .par_chunks(PAR_CHUNK)
+                .fold(
+                    || Tally::new(len),
+                    |mut tally, chunk| {
+                        tally.extend(chunk, |v: &T| *v);
+                        tally
+                    },
+                )
+                .reduce(|| Tally::new(len), Tally::merge);
+            return Ok(tally.into_entries());
+        }
+    }
+
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let mut tally = Tally::new(len);
+    tally.extend(slice, |cell| cell.get());
+    Ok(tally.into_entries())
+}
+
+fn value_counts_impl<T>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    sort: bool,
+    typecode: TypeCode,
+    input_type: InputType,
+) -> PyResult<PyObject>
+where
+    T: Element + Numeric + for<'py> IntoPyObject<'py>,
+{
+    let mut entries = tally_impl(py, buffer)?;
+    if sort {
+        entries.sort_unstable_by(|a, b| b.1.cmp(&a.1).then_with(|| a.0.nan_last_cmp(&b.0)));
+    } else {
+        entries.sort_unstable_by(|a, b| a.0.nan_last_cmp(&b.0));
+    }
+    let (values, counts): (Vec<T>, Vec<u64>) = entries.into_iter().unzip();
+    let values = create_result_array_from_slice(py, typecode, input_type, &values)?;
+    let counts = create_result_array_from_slice(py, TypeCode::UInt64, input_type, &counts)?;
+    (values, counts).into_py_any(py)
+}
+
+/// Distinct values of an array with their number of occurrences, as `(values, counts)`
+///
+/// With `sort=True` (default) the most frequent values come first, ties in ascending
+/// value order; with `sort=False` the values are in ascending order as in `unique()`.
+/// NaN is counted as a single value and sorts after every number.
+#[pyfunction]
+#[pyo3(signature = (array, sort = true))]
+pub fn value_counts(py: Python<'_>, array: &Bound<'_, PyAny>, sort: bool) -> PyResult<PyObject> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(array)? == 0 {
+        let values = create_empty_result_array(py, typecode, input_type)?;
+        let counts = create_empty_result_array(py, TypeCode::UInt64, input_type)?;
+        return (values, counts).into_py_any(py);
+    }
+
+    crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        value_counts_impl(py, &buffer, sort, typecode, input_type)
+    })
+}
+
+/// Most frequent value of an array; ties resolve to the smallest value
+#[pyfunction]
+pub fn mode(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+
+    // Handle empty arrays - raise ValueError
+    if get_array_len(array)? == 0 {
+        return Err(PyValueError::new_err("mode() of empty array"));
+    }
+
+    crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        let entries = tally_impl(py, &buffer)?;
+        let (value, _) = entries
+            .into_iter()
+            .max_by(|a, b| a.1.cmp(&b.1).then_with(|| b.0.nan_last_cmp(&a.0)))
+            .expect("non-empty input has at least one value");
+        value.into_py_any(py)
+    })
+}
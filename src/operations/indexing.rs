@@ -0,0 +1,373 @@
+use std::cell::Cell;
+
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::{PyIndexError, PyTypeError, PyValueError};
+use pyo3::prelude::*;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::buffer::{
+    allocate_result_array, buffers_overlap, check_out_array, create_empty_result_array,
+    create_result_array_from_vec, get_array_len, write_result_to_out,
+};
+use crate::numeric::{Integer, Numeric};
+use crate::types::TypeCode;
+use crate::validation::{
+    detect_input_type, get_typecode_unified, validate_for_operation, validate_same_type, InputType,
+};
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_GATHER};
+
+// Smallest run of consecutive indices handed to one parallel task, so every
+// thread streams through its own stretch of the index and output buffers
+#[cfg(feature = "parallel")]
+const PAR_CHUNK: usize = 16_384;
+
+/// How indices outside `-len..len` are treated
+#[derive(Clone, Copy, PartialEq, Eq)]
+enum Mode {
+    Raise,
+    Clip,
+    Wrap,
+}
+
+impl Mode {
+    fn parse(mode: &str) -> PyResult<Self> {
+        match mode {
+            "raise" => Ok(Mode::Raise),
+            "clip" => Ok(Mode::Clip),
+            "wrap" => Ok(Mode::Wrap),
+            _ => Err(PyValueError::new_err(format!(
+                "mode must be 'raise', 'clip' or 'wrap', got '{}'",
+                mode
+            ))),
+        }
+    }
+}
+
+/// Check every index lies in `-len..len`, naming the first one that does not
+///
+/// The common case is a single min/max reduction over the indices, which
+/// vectorizes; only a failing check scans again for the offending index.
+fn check_bounds<C, I, F>(indices: &[C], index: F, len: i128) -> PyResult<()>
+where
+    I: Integer,
+    F: Fn(&C) -> I,
+{
+    let (low, high) = indices
+        .iter()
+        .map(&index)
+        .fold((I::HIGHEST, I::LOWEST), |(low, high), i| {
+            (std::cmp::min(low, i), std::cmp::max(high, i))
+        });
+    if low.to_i128() >= -len && high.to_i128() < len {
+        return Ok(());
+    }
+    let bad = indices
+        .iter()
+        .map(|c| index(c).to_i128())
+        .find(|&i| i < -len || i >= len)
+        .unwrap_or(high.to_i128());
+    Err(PyIndexError::new_err(format!(
+        "index {} is out of bounds for size {}",
+        bad, len
+    )))
+}
+
+/// Position of a checked index; negative indices count from the end
+#[inline(always)]
+fn from_end(i: i128, len: i128) -> usize {
+    // (i >> 127) is all ones for negative i, so this adds len without a branch
+    (i + ((i >> 127) & len)) as usize
+}
+
+#[inline(always)]
+fn clip(i: i128, len: i128) -> usize {
+    i.clamp(0, len - 1) as usize
+}
+
+#[inline(always)]
+fn wrap(i: i128, len: i128) -> usize {
+    if (0..len).contains(&i) {
+        i as usize
+    } else {
+        i.rem_euclid(len) as usize
+    }
+}
+
+/// Gather `data` at every resolved index into `out`
+///
+/// When `out` shares memory with `data` or `indices` (`overlap`), the gather is
+/// staged in full before anything is written.
+fn take_with<T, I, R>(
+    py: Python<'_>,
+    data: &PyBuffer<T>,
+    indices: &PyBuffer<I>,
+    out: &[Cell<T>],
+    overlap: bool,
+    resolve: R,
+) -> PyResult<()>
+where
+    T: Element + Copy + Send + Sync,
+    I: Element + Integer,
+    R: Fn(I) -> usize + Sync,
+{
+    // The parallel path copies the whole source out of the buffer first, which only
+    // pays off when the gather reads at least as many elements as that copy
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(indices.item_count(), PARALLEL_THRESHOLD_GATHER)
+            && data.item_count() <= indices.item_count()
+        {
+            let data = extract_buffer_to_vec(py, data)?;
+            let indices = extract_buffer_to_vec(py, indices)?;
+            let values: Vec<T> = indices
+                .par_iter()
+                .with_min_len(PAR_CHUNK)
+                .map(|&i| data[resolve(i)])
+                .collect();
+            for (dst, value) in out.iter().zip(values) {
+                dst.set(value);
+            }
+            return Ok(());
+        }
+    }
+
+    let data = data
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let indices = indices
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    if overlap {
+        let values: Vec<T> = indices
+            .iter()
+            .map(|i| data[resolve(i.get())].get())
+            .collect();
+        for (dst, value) in out.iter().zip(values) {
+            dst.set(value);
+        }
+    } else {
+        for (dst, i) in out.iter().zip(indices) {
+            dst.set(data[resolve(i.get())].get());
+        }
+    }
+    Ok(())
+}
+
+fn take_impl<T, I>(
+    py: Python<'_>,
+    data: &PyBuffer<T>,
+    indices: &PyBuffer<I>,
+    out: &[Cell<T>],
+    overlap: bool,
+    mode: Mode,
+) -> PyResult<()>
+where
+    T: Element + Copy + Send + Sync,
+    I: Element + Integer,
+{
+    let len = data.item_count() as i128;
+    match mode {
+        Mode::Raise => {
+            let cells = indices
+                .as_slice(py)
+                .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+            check_bounds(cells, |cell| cell.get(), len)?;
+            take_with(py, data, indices, out, overlap, |i: I| {
+                from_end(i.to_i128(), len)
+            })
+        }
+        Mode::Clip => take_with(py, data, indices, out, overlap, |i: I| {
+            clip(i.to_i128(), len)
+        }),
+        Mode::Wrap => take_with(py, data, indices, out, overlap, |i: I| {
+            wrap(i.to_i128(), len)
+        }),
+    }
+}
+
+/// Gather straight into `out`, or into an array allocated up front
+fn take_result<T, I>(
+    py: Python<'_>,
+    data: &PyBuffer<T>,
+    indices: &PyBuffer<I>,
+    typecode: TypeCode,
+    input_type: InputType,
+    out: Option<&Bound<'_, PyAny>>,
+    mode: Mode,
+) -> PyResult<PyObject>
+where
+    T: Element + Numeric + for<'py> IntoPyObject<'py>,
+    I: Element + Integer,
+{
+    let len = indices.item_count();
+    let result = match out {
+        Some(out) => {
+            check_out_array::<T>(out, typecode, len)?;
+            Some(out.clone())
+        }
+        None => allocate_result_array::<T>(py, typecode, input_type, len)?,
+    };
+
+    match result {
+        Some(result) => {
+            let target = PyBuffer::<T>::get(&result)?;
+            let cells = target
+                .as_mut_slice(py)
+                .ok_or_else(|| PyTypeError::new_err("Failed to get mutable buffer slice"))?;
+            let overlap = buffers_overlap(data, &target) || buffers_overlap(indices, &target);
+            take_impl(py, data, indices, cells, overlap, mode)?;
+            Ok(result.unbind())
+        }
+        None => {
+            // Arrow results are built from a native buffer
+            let mut values = vec![T::ZERO; len];
+            let cells = Cell::from_mut(&mut values[..]).as_slice_of_cells();
+            take_impl(py, data, indices, cells, false, mode)?;
+            create_result_array_from_vec(py, typecode, input_type, values)
+        }
+    }
+}
+
+/// Integer typecode of an index array
+fn index_typecode(indices: &Bound<'_, PyAny>) -> PyResult<TypeCode> {
+    let input_type = detect_input_type(indices)?;
+    validate_for_operation(indices, input_type, false)?;
+    get_typecode_unified(indices, input_type)
+}
+
+/// Elements of `array` at the positions in `indices`
+///
+/// `indices` may be any integer array, e.g. the output of `argsort()`; negative
+/// indices count from the end. With `mode="raise"` every index is checked in one
+/// pass before the gather starts, so an invalid index fails before anything is
+/// gathered; `"clip"` clamps indices into range and `"wrap"` takes them modulo the
+/// length. The result has the typecode and container type of `array`, or is
+/// written into `out`.
+#[pyfunction]
+#[pyo3(signature = (array, indices, out = None, mode = "raise"))]
+pub fn take(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    indices: &Bound<'_, PyAny>,
+    out: Option<&Bound<'_, PyAny>>,
+    mode: &str,
+) -> PyResult<PyObject> {
+    let mode = Mode::parse(mode)?;
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+    let index_typecode = index_typecode(indices)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(indices)? == 0 {
+        return match out {
+            Some(out) => write_result_to_out::<u8>(py, out, typecode, &[]),
+            None => create_empty_result_array(py, typecode, input_type),
+        };
+    }
+    if get_array_len(array)? == 0 {
+        return Err(PyIndexError::new_err("cannot take from an empty array"));
+    }
+
+    crate::dispatch_by_int_typecode!(index_typecode, indices, |index_buffer| {
+        crate::dispatch_by_typecode!(typecode, array, |buffer| {
+            take_result(py, &buffer, &index_buffer, typecode, input_type, out, mode)
+        })
+    })
+}
+
+/// Write `values` at every resolved index, cycling through `values`
+fn put_with<T, I, R>(
+    py: Python<'_>,
+    array: &PyBuffer<T>,
+    indices: &PyBuffer<I>,
+    values: &[T],
+    resolve: R,
+) -> PyResult<()>
+where
+    T: Element + Copy,
+    I: Element + Integer,
+    R: Fn(I) -> usize,
+{
+    let cells = array
+        .as_mut_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get mutable buffer slice"))?;
+    let indices = indices
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    for (i, &value) in indices.iter().zip(values.iter().cycle()) {
+        cells[resolve(i.get())].set(value);
+    }
+    Ok(())
+}
+
+fn put_impl<T, I>(
+    py: Python<'_>,
+    array: &PyBuffer<T>,
+    indices: &PyBuffer<I>,
+    values: &Bound<'_, PyAny>,
+    mode: Mode,
+) -> PyResult<()>
+where
+    T: Element + Copy,
+    I: Element + Integer,
+{
+    // Copied first, so `values` may share memory with `array`
+    let values = PyBuffer::<T>::get(values)?.to_vec(py)?;
+    let len = array.item_count() as i128;
+    match mode {
+        Mode::Raise => {
+            let cells = indices
+                .as_slice(py)
+                .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+            check_bounds(cells, |cell| cell.get(), len)?;
+            put_with(py, array, indices, &values, |i: I| {
+                from_end(i.to_i128(), len)
+            })
+        }
+        Mode::Clip => put_with(py, array, indices, &values, |i: I| clip(i.to_i128(), len)),
+        Mode::Wrap => put_with(py, array, indices, &values, |i: I| wrap(i.to_i128(), len)),
+    }
+}
+
+/// Write `values` into `array` at the positions in `indices`, in place
+///
+/// `values` is repeated when it is shorter than `indices`, and a later index wins
+/// when positions repeat. `mode` treats out-of-range indices as in `take()`; with
+/// `"raise"` nothing is written unless every index is in range.
+#[pyfunction]
+#[pyo3(signature = (array, indices, values, mode = "raise"))]
+pub fn put(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    indices: &Bound<'_, PyAny>,
+    values: &Bound<'_, PyAny>,
+    mode: &str,
+) -> PyResult<()> {
+    let mode = Mode::parse(mode)?;
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, true)?;
+    let (typecode, _, _) = validate_same_type(array, values)?;
+    let index_typecode = index_typecode(indices)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(indices)? == 0 {
+        return Ok(());
+    }
+    if get_array_len(values)? == 0 {
+        return Err(PyValueError::new_err("values must not be empty"));
+    }
+    if get_array_len(array)? == 0 {
+        return Err(PyIndexError::new_err("cannot put into an empty array"));
+    }
+
+    crate::dispatch_by_int_typecode!(index_typecode, indices, |index_buffer| {
+        crate::dispatch_by_typecode!(typecode, array, |buffer| {
+            put_impl(py, &buffer, &index_buffer, values, mode)
+        })
+    })
+}
@@ -1,19 +1,43 @@
+use std::cell::Cell;
+use std::cmp::Ordering;
+use std::collections::HashMap;
+
 use pyo3::buffer::{Element, PyBuffer};
-use pyo3::exceptions::PyTypeError;
+use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::PyList;
+use pyo3::IntoPyObjectExt;
 
 use crate::buffer::{
-    create_empty_result_array, create_result_array_from_list, get_array_len, get_itemsize,
+    allocate_result_array, buffers_overlap, check_out_array, create_empty_result_array,
+    create_result_array_from_slice, create_result_array_from_vec, get_array_len, get_itemsize,
+    write_result_to_out,
 };
+use crate::hashing::MixBuildHasher;
+use crate::numeric::Numeric;
+use crate::operations::radix::{radix_sort, CountingKey, KeyCounts, RadixKey, RADIX_THRESHOLD};
 use crate::types::TypeCode;
 use crate::validation::{
     detect_input_type, get_typecode_unified, validate_for_operation, InputType,
 };
 
+#[cfg(feature = "parallel")]
+use crate::buffer::{
+    extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_HASH, PARALLEL_THRESHOLD_SORT,
+};
+#[cfg(feature = "parallel")]
+use crate::hashing::mix64;
 #[cfg(feature = "parallel")]
 use rayon::prelude::*;
 
+// The parallel unique() build splits elements into 2^PARTITION_BITS partitions by
+// key hash, so every value lands in exactly one partition
+#[cfg(feature = "parallel")]
+const PARTITION_BITS: u32 = 6;
+
+// Elements per task of the parallel partition histogram
+#[cfg(feature = "parallel")]
+const PAR_CHUNK: usize = 65_536;
+
 fn reverse_impl<T>(py: Python<'_>, buffer: &mut PyBuffer<T>) -> PyResult<()>
 where
     T: Element + Copy + Send + Sync,
@@ -100,77 +124,55 @@ pub fn reverse(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<()> {
     }
 }
 
-fn sort_impl_int<T>(py: Python, buffer: &mut PyBuffer<T>) -> PyResult<()>
+/// Sort `data` by `cmp`, with a merge sort when `stable` and pdqsort otherwise
+///
+/// Large inputs use rayon's parallel sorts (a parallel merge sort when stable).
+fn sort_with<E, F>(data: &mut [E], stable: bool, cmp: F)
 where
-    T: Element + Copy + Ord + Send + Sync,
+    E: Send,
+    F: Fn(&E, &E) -> Ordering + Sync,
 {
-    let slice = buffer
-        .as_mut_slice(py)
-        .ok_or_else(|| PyTypeError::new_err("Failed to get mutable buffer slice"))?;
-
-    let len = slice.len();
-
-    // Fast path for very small arrays
-    if len <= 1 {
-        return Ok(());
-    }
-
-    // Extract to Vec, sort, write back
-    let mut data: Vec<T> = slice.iter().map(|cell| cell.get()).collect();
-
     #[cfg(feature = "parallel")]
     {
-        // Use parallel sort for larger arrays
-        if len >= 10_000 {
-            data.par_sort();
-        } else {
-            data.sort();
+        if should_parallelize(data.len(), PARALLEL_THRESHOLD_SORT) {
+            if stable {
+                data.par_sort_by(cmp);
+            } else {
+                data.par_sort_unstable_by(cmp);
+            }
+            return;
         }
     }
 
-    #[cfg(not(feature = "parallel"))]
-    {
-        data.sort();
-    }
-
-    for (item, &val) in slice.iter().zip(data.iter()) {
-        item.set(val);
+    if stable {
+        data.sort_by(cmp);
+    } else {
+        data.sort_unstable_by(cmp);
     }
-    Ok(())
 }
 
-fn sort_impl_float<T>(py: Python, buffer: &mut PyBuffer<T>) -> PyResult<()>
+fn sort_impl<T>(py: Python, buffer: &mut PyBuffer<T>, stable: bool) -> PyResult<()>
 where
-    T: Element + Copy + PartialOrd + Send + Sync,
+    T: Element + RadixKey,
 {
     let slice = buffer
         .as_mut_slice(py)
         .ok_or_else(|| PyTypeError::new_err("Failed to get mutable buffer slice"))?;
 
-    let len = slice.len();
-
     // Fast path for very small arrays
-    if len <= 1 {
+    if slice.len() <= 1 {
         return Ok(());
     }
 
-    // Extract to Vec, sort using PartialOrd, write back
-    let mut data: Vec<T> = slice.iter().map(|cell| cell.get()).collect();
-
-    #[cfg(feature = "parallel")]
-    {
-        // Use parallel sort for larger arrays
-        if len >= 10_000 {
-            data.par_sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
-        } else {
-            data.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
-        }
+    // Large 4- and 8-byte keys: stable LSD radix sort with a single scratch buffer
+    if T::BYTES >= 4 && slice.len() >= RADIX_THRESHOLD {
+        radix_sort(slice);
+        return Ok(());
     }
 
-    #[cfg(not(feature = "parallel"))]
-    {
-        data.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
-    }
+    // Extract to Vec, sort (NaN last), write back
+    let mut data: Vec<T> = slice.iter().map(|cell| cell.get()).collect();
+    sort_with(&mut data, stable, T::nan_last_cmp);
 
     for (item, &val) in slice.iter().zip(data.iter()) {
         item.set(val);
@@ -178,9 +180,34 @@ where
     Ok(())
 }
 
+// 8- and 16-bit integers: counting sort in O(n + range), with no copy of the input
+fn counting_sort_impl<T>(py: Python, buffer: &mut PyBuffer<T>, stable: bool) -> PyResult<()>
+where
+    T: Element + CountingKey,
+{
+    let slice = buffer
+        .as_mut_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get mutable buffer slice"))?;
+
+    match KeyCounts::build(slice, |cell| cell.get()) {
+        Some(counts) => {
+            counts.write_sorted(slice);
+            Ok(())
+        }
+        // Few values spread over a wide range: comparison sort
+        None => sort_impl(py, buffer, stable),
+    }
+}
+
 /// Sort operation (in-place) for array.array, numpy.ndarray, or memoryview
+///
+/// NaN values are placed after every number. `stable` keeps equal values in their
+/// original order, which is only observable for -0.0 and 0.0. 8- and 16-bit integers
+/// use a counting sort, and large arrays of 4- and 8-byte values use a linear-time LSD
+/// radix sort, which is always stable.
 #[pyfunction]
-pub fn sort(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<()> {
+#[pyo3(signature = (array, stable = true))]
+pub fn sort(py: Python<'_>, array: &Bound<'_, PyAny>, stable: bool) -> PyResult<()> {
     let input_type = detect_input_type(array)?;
     validate_for_operation(array, input_type, true)?;
     let typecode = get_typecode_unified(array, input_type)?;
@@ -194,176 +221,706 @@ pub fn sort(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<()> {
     match typecode {
         TypeCode::Int8 => {
             let mut buffer = PyBuffer::<i8>::get(array)?;
-            sort_impl_int(py, &mut buffer)
+            counting_sort_impl(py, &mut buffer, stable)
         }
         TypeCode::Int16 => {
             let mut buffer = PyBuffer::<i16>::get(array)?;
-            sort_impl_int(py, &mut buffer)
+            counting_sort_impl(py, &mut buffer, stable)
         }
         TypeCode::Int32 => {
             let mut buffer = PyBuffer::<i32>::get(array)?;
-            sort_impl_int(py, &mut buffer)
+            sort_impl(py, &mut buffer, stable)
         }
         TypeCode::Int64 => {
             let itemsize = get_itemsize(array)?;
             if itemsize == 4 {
                 let mut buffer = PyBuffer::<i32>::get(array)?;
-                sort_impl_int(py, &mut buffer)
+                sort_impl(py, &mut buffer, stable)
             } else {
                 let mut buffer = PyBuffer::<i64>::get(array)?;
-                sort_impl_int(py, &mut buffer)
+                sort_impl(py, &mut buffer, stable)
             }
         }
         TypeCode::UInt8 => {
             let mut buffer = PyBuffer::<u8>::get(array)?;
-            sort_impl_int(py, &mut buffer)
+            counting_sort_impl(py, &mut buffer, stable)
         }
         TypeCode::UInt16 => {
             let mut buffer = PyBuffer::<u16>::get(array)?;
-            sort_impl_int(py, &mut buffer)
+            counting_sort_impl(py, &mut buffer, stable)
         }
         TypeCode::UInt32 => {
             let mut buffer = PyBuffer::<u32>::get(array)?;
-            sort_impl_int(py, &mut buffer)
+            sort_impl(py, &mut buffer, stable)
         }
         TypeCode::UInt64 => {
             let itemsize = get_itemsize(array)?;
             if itemsize == 4 {
                 let mut buffer = PyBuffer::<u32>::get(array)?;
-                sort_impl_int(py, &mut buffer)
+                sort_impl(py, &mut buffer, stable)
             } else {
                 let mut buffer = PyBuffer::<u64>::get(array)?;
-                sort_impl_int(py, &mut buffer)
+                sort_impl(py, &mut buffer, stable)
             }
         }
         TypeCode::Float32 => {
             let mut buffer = PyBuffer::<f32>::get(array)?;
-            sort_impl_float(py, &mut buffer)
+            sort_impl(py, &mut buffer, stable)
         }
         TypeCode::Float64 => {
             let mut buffer = PyBuffer::<f64>::get(array)?;
-            sort_impl_float(py, &mut buffer)
+            sort_impl(py, &mut buffer, stable)
+        }
+    }
+}
+
+/// Indices that sort `data`, built with `index` (u32 or u64)
+///
+/// Sorting (value, index) pairs keeps every comparison on contiguous memory instead
+/// of gathering `data[i]` through the index array.
+fn argsort_indices<C, T, I, F>(data: &[C], get: F, stable: bool, index: fn(usize) -> I) -> Vec<I>
+where
+    T: Numeric,
+    I: Copy + Send,
+    F: Fn(&C) -> T,
+{
+    let mut pairs: Vec<(T, I)> = data
+        .iter()
+        .enumerate()
+        .map(|(i, cell)| (get(cell), index(i)))
+        .collect();
+    sort_with(&mut pairs, stable, |a, b| a.0.nan_last_cmp(&b.0));
+    pairs.into_iter().map(|(_, i)| i).collect()
+}
+
+/// Indices that would sort an array (NaN last)
+///
+/// Returns uint32 ('I') indices when the array has fewer than 2**32 elements, halving
+/// index memory, and uint64 ('L') otherwise. With `stable=True` (default) equal values
+/// keep their original order, so companion columns can be reordered consistently.
+#[pyfunction]
+#[pyo3(signature = (array, stable = true))]
+pub fn argsort(py: Python<'_>, array: &Bound<'_, PyAny>, stable: bool) -> PyResult<PyObject> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    let len = get_array_len(array)?;
+    if len == 0 {
+        return create_empty_result_array(py, TypeCode::UInt32, input_type);
+    }
+
+    crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        let slice = buffer
+            .as_slice(py)
+            .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+        if u32::try_from(len).is_ok() {
+            let indices = argsort_indices(slice, |cell| cell.get(), stable, |i| i as u32);
+            create_result_array_from_slice(py, TypeCode::UInt32, input_type, &indices)
+        } else {
+            let indices = argsort_indices(slice, |cell| cell.get(), stable, |i| i as u64);
+            create_result_array_from_slice(py, TypeCode::UInt64, input_type, &indices)
+        }
+    })
+}
+
+/// Options of `unique()`
+#[derive(Clone, Copy)]
+struct UniqueOptions {
+    sorted: bool,
+    return_counts: bool,
+    return_inverse: bool,
+}
+
+/// Distinct values in first-occurrence order, their counts and (optionally) the
+/// code of every input element, i.e. its position in `values`
+struct Factorized<T, I> {
+    values: Vec<T>,
+    counts: Vec<u64>,
+    codes: Vec<I>,
+}
+
+impl<T: Numeric, I: Copy + Into<u64>> Factorized<T, I> {
+    /// Reorder the distinct values ascending (NaN last) and renumber the codes
+    fn sort(&mut self, index: fn(usize) -> I) {
+        let values = &self.values;
+        let mut order: Vec<usize> = (0..values.len()).collect();
+        // Distinct keys never compare equal, so the unstable sort is deterministic
+        sort_with(&mut order, false, |&a, &b| {
+            values[a].nan_last_cmp(&values[b])
+        });
+
+        let mut rank = vec![0usize; order.len()];
+        for (position, &id) in order.iter().enumerate() {
+            rank[id] = position;
+        }
+        self.values = order.iter().map(|&id| self.values[id]).collect();
+        self.counts = order.iter().map(|&id| self.counts[id]).collect();
+        for code in &mut self.codes {
+            *code = index(rank[(*code).into() as usize]);
+        }
+    }
+}
+
+/// Factorize `data` with an open hash table keyed on native value bits
+///
+/// -0.0 and 0.0 are one value (the first one seen is kept), as are all NaNs.
+fn factorize<C, T, I, F>(
+    data: &[C],
+    get: F,
+    index: fn(usize) -> I,
+    with_codes: bool,
+) -> Factorized<T, I>
+where
+    T: Numeric,
+    F: Fn(&C) -> T,
+{
+    let mut slots: HashMap<u64, usize, MixBuildHasher> = HashMap::default();
+    let mut values = Vec::new();
+    let mut counts: Vec<u64> = Vec::new();
+    let mut codes = Vec::with_capacity(if with_codes { data.len() } else { 0 });
+    for c in data {
+        let value = get(c);
+        let id = *slots.entry(value.key_bits()).or_insert_with(|| {
+            values.push(value);
+            counts.push(0);
+            values.len() - 1
+        });
+        counts[id] += 1;
+        if with_codes {
+            codes.push(index(id));
+        }
+    }
+    Factorized {
+        values,
+        counts,
+        codes,
+    }
+}
+
+/// Parallel factorization over a copied buffer
+///
+/// Elements are partitioned on the top bits of their mixed key, so every value
+/// lands in exactly one partition and partitions build their tables on separate
+/// threads. The scatter is stable, so the first row of each local value is known,
+/// and global ids follow first occurrence across all partitions.
+#[cfg(feature = "parallel")]
+fn factorize_parallel<T, I>(data: &[T], index: fn(usize) -> I, with_codes: bool) -> Factorized<T, I>
+where
+    T: Numeric,
+    I: Copy,
+{
+    let parts = 1usize << PARTITION_BITS;
+    let part_of = |v: T| (mix64(v.key_bits()) >> (64 - PARTITION_BITS)) as usize;
+    let sizes = data
+        .par_chunks(PAR_CHUNK)
+        .map(|chunk| {
+            let mut sizes = vec![0usize; parts];
+            for &v in chunk {
+                sizes[part_of(v)] += 1;
+            }
+            sizes
+        })
+        .reduce(
+            || vec![0usize; parts],
+            |mut a, b| {
+                for (x, y) in a.iter_mut().zip(&b) {
+                    *x += y;
+                }
+                a
+            },
+        );
+    let mut starts = vec![0usize; parts + 1];
+    for p in 0..parts {
+        starts[p + 1] = starts[p] + sizes[p];
+    }
+    let mut cursor = starts[..parts].to_vec();
+    let mut rows = vec![(T::ZERO, 0usize); data.len()];
+    for (row, &v) in data.iter().enumerate() {
+        let p = part_of(v);
+        rows[cursor[p]] = (v, row);
+        cursor[p] += 1;
+    }
+
+    // Local ids are handed out in row order, so the first row carrying local id j
+    // is where that value first occurs
+    let locals: Vec<(Factorized<T, usize>, Vec<usize>)> = starts
+        .par_windows(2)
+        .map(|bounds| {
+            let part = &rows[bounds[0]..bounds[1]];
+            let local = factorize(part, |row| row.0, |id| id, true);
+            let mut first_rows = Vec::with_capacity(local.values.len());
+            for (&code, row) in local.codes.iter().zip(part) {
+                if code == first_rows.len() {
+                    first_rows.push(row.1);
+                }
+            }
+            (local, first_rows)
+        })
+        .collect();
+
+    let mut order: Vec<(usize, usize, usize)> = locals
+        .iter()
+        .enumerate()
+        .flat_map(|(p, (_, first_rows))| {
+            first_rows
+                .iter()
+                .enumerate()
+                .map(move |(j, &row)| (row, p, j))
+        })
+        .collect();
+    order.par_sort_unstable();
+
+    let mut remap: Vec<Vec<usize>> = locals
+        .iter()
+        .map(|(local, _)| vec![0usize; local.values.len()])
+        .collect();
+    let mut values = Vec::with_capacity(order.len());
+    let mut counts = Vec::with_capacity(order.len());
+    for (id, &(_, p, j)) in order.iter().enumerate() {
+        remap[p][j] = id;
+        values.push(locals[p].0.values[j]);
+        counts.push(locals[p].0.counts[j]);
+    }
+
+    let mut codes = Vec::new();
+    if with_codes {
+        codes = vec![index(0); data.len()];
+        for (p, (local, _)) in locals.iter().enumerate() {
+            for (row, &code) in rows[starts[p]..starts[p + 1]].iter().zip(&local.codes) {
+                codes[row.1] = index(remap[p][code]);
+            }
         }
     }
+    Factorized {
+        values,
+        counts,
+        codes,
+    }
 }
 
-fn unique_impl_int<T>(
-    py: Python,
+fn factorize_buffer<T, I>(
+    py: Python<'_>,
     buffer: &PyBuffer<T>,
-    typecode: TypeCode,
-    input_type: InputType,
-) -> PyResult<PyObject>
+    index: fn(usize) -> I,
+    with_codes: bool,
+) -> PyResult<Factorized<T, I>>
 where
-    T: Element + Copy + Ord + Send + Sync + for<'py> IntoPyObject<'py>,
+    T: Element + Numeric,
+    I: Copy,
 {
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(buffer.item_count(), PARALLEL_THRESHOLD_HASH) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            return Ok(factorize_parallel(&data, index, with_codes));
+        }
+    }
+
     let slice = buffer
         .as_slice(py)
         .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    Ok(factorize(slice, |cell| cell.get(), index, with_codes))
+}
 
-    // Extract to Vec, sort, deduplicate
-    let mut data: Vec<T> = slice.iter().map(|cell| cell.get()).collect();
-    data.sort();
-    data.dedup();
-
-    let result_list = PyList::empty(py);
-    for val in data {
-        result_list.append(val)?;
+/// The `unique()` result: the values alone, or a tuple with the requested inverse
+/// codes and counts
+fn unique_output<FI, FC>(
+    py: Python<'_>,
+    values: PyObject,
+    inverse: FI,
+    counts: FC,
+    options: UniqueOptions,
+) -> PyResult<PyObject>
+where
+    FI: FnOnce() -> PyResult<PyObject>,
+    FC: FnOnce() -> PyResult<PyObject>,
+{
+    match (options.return_inverse, options.return_counts) {
+        (false, false) => Ok(values),
+        (true, false) => (values, inverse()?).into_py_any(py),
+        (false, true) => (values, counts()?).into_py_any(py),
+        (true, true) => (values, inverse()?, counts()?).into_py_any(py),
     }
+}
 
-    create_result_array_from_list(py, typecode, input_type, &result_list)
+fn unique_result<T, I>(
+    py: Python<'_>,
+    factorized: Factorized<T, I>,
+    typecode: TypeCode,
+    index_typecode: TypeCode,
+    input_type: InputType,
+    options: UniqueOptions,
+) -> PyResult<PyObject>
+where
+    T: Element + Copy + for<'py> IntoPyObject<'py>,
+    I: Element + Copy + for<'py> IntoPyObject<'py>,
+{
+    let values = create_result_array_from_slice(py, typecode, input_type, &factorized.values)?;
+    unique_output(
+        py,
+        values,
+        || create_result_array_from_slice(py, index_typecode, input_type, &factorized.codes),
+        || create_result_array_from_slice(py, TypeCode::UInt64, input_type, &factorized.counts),
+        options,
+    )
 }
 
-fn unique_impl_float<T>(
-    py: Python,
+fn unique_with_index<T, I>(
+    py: Python<'_>,
     buffer: &PyBuffer<T>,
     typecode: TypeCode,
     input_type: InputType,
+    options: UniqueOptions,
+    index: fn(usize) -> I,
+    index_typecode: TypeCode,
 ) -> PyResult<PyObject>
 where
-    T: Element + Copy + PartialOrd + Send + Sync + for<'py> IntoPyObject<'py>,
+    T: Element + Numeric + for<'py> IntoPyObject<'py>,
+    I: Element + Copy + Into<u64> + for<'py> IntoPyObject<'py>,
 {
-    let slice = buffer
-        .as_slice(py)
-        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
-
-    // Extract to Vec, sort, deduplicate
-    let mut data: Vec<T> = slice.iter().map(|cell| cell.get()).collect();
-    data.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
-    data.dedup_by(|a, b| (*a).partial_cmp(b) == Some(std::cmp::Ordering::Equal));
+    let mut factorized = factorize_buffer(py, buffer, index, options.return_inverse)?;
+    if options.sorted {
+        factorized.sort(index);
+    }
+    unique_result(
+        py,
+        factorized,
+        typecode,
+        index_typecode,
+        input_type,
+        options,
+    )
+}
 
-    let result_list = PyList::empty(py);
-    for val in data {
-        result_list.append(val)?;
+fn unique_impl<T>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    typecode: TypeCode,
+    input_type: InputType,
+    options: UniqueOptions,
+) -> PyResult<PyObject>
+where
+    T: Element + Numeric + for<'py> IntoPyObject<'py>,
+{
+    // Codes index the distinct values, of which there are at most len
+    if u32::try_from(buffer.item_count()).is_ok() {
+        unique_with_index(
+            py,
+            buffer,
+            typecode,
+            input_type,
+            options,
+            |i| i as u32,
+            TypeCode::UInt32,
+        )
+    } else {
+        unique_with_index(
+            py,
+            buffer,
+            typecode,
+            input_type,
+            options,
+            |i| i as u64,
+            TypeCode::UInt64,
+        )
     }
+}
 
-    create_result_array_from_list(py, typecode, input_type, &result_list)
+// 8- and 16-bit integers: sorted distinct values and counts read off a counting
+// table, without hashing or sorting
+fn unique_impl_counting<T>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    typecode: TypeCode,
+    input_type: InputType,
+    options: UniqueOptions,
+) -> PyResult<PyObject>
+where
+    T: Element + CountingKey + for<'py> IntoPyObject<'py>,
+{
+    if options.sorted && !options.return_inverse {
+        let slice = buffer
+            .as_slice(py)
+            .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+        if let Some(counts) = KeyCounts::build(slice, |cell| cell.get()) {
+            let (values, counts): (Vec<T>, Vec<u64>) = counts
+                .iter()
+                .map(|(value, count)| (value, count as u64))
+                .unzip();
+            let factorized: Factorized<T, u32> = Factorized {
+                values,
+                counts,
+                codes: Vec::new(),
+            };
+            return unique_result(
+                py,
+                factorized,
+                typecode,
+                TypeCode::UInt32,
+                input_type,
+                options,
+            );
+        }
+    }
+    unique_impl(py, buffer, typecode, input_type, options)
 }
 
 /// Unique operation for array.array, numpy.ndarray, or memoryview
+///
+/// Distinct values come from a hash table over native values, in ascending order
+/// (NaN last) when `sorted` and in first-occurrence order otherwise. -0.0 and 0.0
+/// count as one value, as do all NaNs. With `return_inverse` and/or `return_counts`
+/// the result is a tuple `(values, inverse, counts)` holding only the requested
+/// arrays: `inverse` gives each element's position in `values` (uint32 codes when
+/// the input has fewer than 2**32 elements, uint64 otherwise) and `counts` the
+/// number of occurrences of each value.
 #[pyfunction]
-pub fn unique(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+#[pyo3(signature = (array, sorted = true, return_counts = false, return_inverse = false))]
+pub fn unique(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    sorted: bool,
+    return_counts: bool,
+    return_inverse: bool,
+) -> PyResult<PyObject> {
     let input_type = detect_input_type(array)?;
     validate_for_operation(array, input_type, false)?;
     let typecode = get_typecode_unified(array, input_type)?;
+    let options = UniqueOptions {
+        sorted,
+        return_counts,
+        return_inverse,
+    };
 
-    // Handle empty arrays
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
     let len = get_array_len(array)?;
     if len == 0 {
-        return create_empty_result_array(py, typecode, input_type);
+        let values = create_empty_result_array(py, typecode, input_type)?;
+        return unique_output(
+            py,
+            values,
+            || create_empty_result_array(py, TypeCode::UInt32, input_type),
+            || create_empty_result_array(py, TypeCode::UInt64, input_type),
+            options,
+        );
     }
 
     match typecode {
         TypeCode::Int8 => {
             let buffer = PyBuffer::<i8>::get(array)?;
-            unique_impl_int(py, &buffer, typecode, input_type)
+            unique_impl_counting(py, &buffer, typecode, input_type, options)
         }
         TypeCode::Int16 => {
             let buffer = PyBuffer::<i16>::get(array)?;
-            unique_impl_int(py, &buffer, typecode, input_type)
+            unique_impl_counting(py, &buffer, typecode, input_type, options)
         }
         TypeCode::Int32 => {
             let buffer = PyBuffer::<i32>::get(array)?;
-            unique_impl_int(py, &buffer, typecode, input_type)
+            unique_impl(py, &buffer, typecode, input_type, options)
         }
         TypeCode::Int64 => {
             let itemsize = get_itemsize(array)?;
             if itemsize == 4 {
                 let buffer = PyBuffer::<i32>::get(array)?;
-                unique_impl_int(py, &buffer, typecode, input_type)
+                unique_impl(py, &buffer, typecode, input_type, options)
             } else {
                 let buffer = PyBuffer::<i64>::get(array)?;
-                unique_impl_int(py, &buffer, typecode, input_type)
+                unique_impl(py, &buffer, typecode, input_type, options)
             }
         }
         TypeCode::UInt8 => {
             let buffer = PyBuffer::<u8>::get(array)?;
-            unique_impl_int(py, &buffer, typecode, input_type)
+            unique_impl_counting(py, &buffer, typecode, input_type, options)
         }
         TypeCode::UInt16 => {
             let buffer = PyBuffer::<u16>::get(array)?;
-            unique_impl_int(py, &buffer, typecode, input_type)
+            unique_impl_counting(py, &buffer, typecode, input_type, options)
         }
         TypeCode::UInt32 => {
             let buffer = PyBuffer::<u32>::get(array)?;
-            unique_impl_int(py, &buffer, typecode, input_type)
+            unique_impl(py, &buffer, typecode, input_type, options)
         }
         TypeCode::UInt64 => {
             let itemsize = get_itemsize(array)?;
             if itemsize == 4 {
                 let buffer = PyBuffer::<u32>::get(array)?;
-                unique_impl_int(py, &buffer, typecode, input_type)
+                unique_impl(py, &buffer, typecode, input_type, options)
             } else {
                 let buffer = PyBuffer::<u64>::get(array)?;
-                unique_impl_int(py, &buffer, typecode, input_type)
+                unique_impl(py, &buffer, typecode, input_type, options)
             }
         }
         TypeCode::Float32 => {
             let buffer = PyBuffer::<f32>::get(array)?;
-            unique_impl_float(py, &buffer, typecode, input_type)
+            unique_impl(py, &buffer, typecode, input_type, options)
         }
         TypeCode::Float64 => {
             let buffer = PyBuffer::<f64>::get(array)?;
-            unique_impl_float(py, &buffer, typecode, input_type)
+            unique_impl(py, &buffer, typecode, input_type, options)
+        }
+    }
+}
+
+/// Copy every buffer of `sources` into its stretch of `target`, in order
+///
+/// A source that shares memory with `target_buffer` (an `out=` that is also an
+/// input) is read in full before anything is written.
+fn concatenate_into<T>(
+    py: Python<'_>,
+    sources: &[PyBuffer<T>],
+    target: &[Cell<T>],
+    target_buffer: Option<&PyBuffer<T>>,
+) -> PyResult<()>
+where
+    T: Element + Copy,
+{
+    let staged = sources
+        .iter()
+        .map(|buffer| match target_buffer {
+            Some(target_buffer) if buffers_overlap(buffer, target_buffer) => {
+                buffer.to_vec(py).map(Some)
+            }
+            _ => Ok(None),
+        })
+        .collect::<PyResult<Vec<Option<Vec<T>>>>>()?;
+
+    let mut offset = 0;
+    for (buffer, staged) in sources.iter().zip(&staged) {
+        let len = buffer.item_count();
+        let stretch = &target[offset..offset + len];
+        match staged {
+            Some(values) => {
+                for (dst, &value) in stretch.iter().zip(values) {
+                    dst.set(value);
+                }
+            }
+            None => {
+                let cells = buffer
+                    .as_slice(py)
+                    .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+                for (dst, src) in stretch.iter().zip(cells) {
+                    dst.set(src.get());
+                }
+            }
         }
+        offset += len;
     }
+    Ok(())
+}
+
+/// Join `first` and the arrays of `rest`, all non-empty, into `total` elements
+///
+/// The output (or `out`) is allocated once and every input is copied straight into
+/// it, with no intermediate buffer.
+fn concatenate_impl<T>(
+    py: Python<'_>,
+    first: PyBuffer<T>,
+    rest: &[&Bound<'_, PyAny>],
+    total: usize,
+    typecode: TypeCode,
+    input_type: InputType,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject>
+where
+    T: Element + Numeric + for<'py> IntoPyObject<'py>,
+{
+    let mut sources = vec![first];
+    for array in rest {
+        sources.push(PyBuffer::<T>::get(array)?);
+    }
+
+    let result = match out {
+        Some(out) => {
+            check_out_array::<T>(out, typecode, total)?;
+            Some(out.clone())
+        }
+        None => allocate_result_array::<T>(py, typecode, input_type, total)?,
+    };
+
+    match result {
+        Some(result) => {
+            let target = PyBuffer::<T>::get(&result)?;
+            let cells = target
+                .as_mut_slice(py)
+                .ok_or_else(|| PyTypeError::new_err("Failed to get mutable buffer slice"))?;
+            concatenate_into(py, &sources, cells, Some(&target))?;
+            Ok(result.unbind())
+        }
+        None => {
+            // Arrow results are built from a native buffer
+            let mut values = vec![T::ZERO; total];
+            let cells = Cell::from_mut(&mut values[..]).as_slice_of_cells();
+            concatenate_into(py, &sources, cells, None)?;
+            create_result_array_from_vec(py, typecode, input_type, values)
+        }
+    }
+}
+
+/// Join a sequence of arrays end to end
+///
+/// Typecodes (and the itemsize of `l`/`L`) are checked for every input before
+/// anything is copied, the output is allocated once at the total length, and each
+/// input is copied straight into its stretch of it. Empty inputs are skipped without
+/// opening their buffers. The result has the container type of the first array, or
+/// is written into `out`, which may be one of the inputs.
+#[pyfunction]
+#[pyo3(signature = (arrays, out = None))]
+pub fn concatenate(
+    py: Python<'_>,
+    arrays: &Bound<'_, PyAny>,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    let arrays = arrays
+        .try_iter()?
+        .collect::<PyResult<Vec<Bound<'_, PyAny>>>>()?;
+    let first = arrays
+        .first()
+        .ok_or_else(|| PyValueError::new_err("need at least one array to concatenate"))?;
+    let input_type = detect_input_type(first)?;
+    validate_for_operation(first, input_type, false)?;
+    let typecode = get_typecode_unified(first, input_type)?;
+    let itemsize = get_itemsize(first)?;
+
+    let mut total = get_array_len(first)?;
+    let mut nonempty = Vec::with_capacity(arrays.len());
+    if total > 0 {
+        nonempty.push(first);
+    }
+    for (i, array) in arrays.iter().enumerate().skip(1) {
+        let array_type = detect_input_type(array)?;
+        validate_for_operation(array, array_type, false)?;
+        let array_typecode = get_typecode_unified(array, array_type)?;
+        if array_typecode != typecode {
+            return Err(PyTypeError::new_err(format!(
+                "all arrays must have typecode '{}', array {} has '{}'",
+                typecode.as_char(),
+                i,
+                array_typecode.as_char()
+            )));
+        }
+        if matches!(typecode, TypeCode::Int64 | TypeCode::UInt64)
+            && get_itemsize(array)? != itemsize
+        {
+            return Err(PyTypeError::new_err("Array itemsizes must match"));
+        }
+        let len = get_array_len(array)?;
+        if len > 0 {
+            nonempty.push(array);
+        }
+        total += len;
+    }
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if nonempty.is_empty() {
+        return match out {
+            Some(out) => write_result_to_out::<u8>(py, out, typecode, &[]),
+            None => create_empty_result_array(py, typecode, input_type),
+        };
+    }
+
+    crate::dispatch_by_typecode!(typecode, nonempty[0], |buffer| {
+        concatenate_impl(py, buffer, &nonempty[1..], total, typecode, input_type, out)
+    })
 }
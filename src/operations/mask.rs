@@ -0,0 +1,546 @@
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::PyInt;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::buffer::{create_empty_result_array, create_result_array_from_slice, get_array_len};
+use crate::numeric::Numeric;
+use crate::types::TypeCode;
+use crate::validation::{
+    detect_input_type, get_typecode_unified, validate_for_operation, InputType,
+};
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_FILTER};
+
+// Elements per parallel task
+#[cfg(feature = "parallel")]
+const PAR_CHUNK: usize = 65_536;
+
+/// Element-wise test against one or two scalars
+#[derive(Clone, Copy)]
+enum Comparison {
+    Greater,
+    GreaterEqual,
+    Less,
+    LessEqual,
+    Equal,
+    NotEqual,
+    Between,
+}
+
+/// A scalar operand, compared natively when it extracts as the element type
+///
+/// Integers extract only when they are in range, so those comparisons are exact. A
+/// float always extracts for f32 arrays and is rounded to f32 first, as in NumPy.
+/// Against integer arrays, integral operands outside the element range are `Above`
+/// or `Below` every element, and integral floats in range (e.g. 3.0) are native.
+/// Only fractional values, infinities and NaN are left to compare in f64, which is
+/// exact for them: a fractional f64 is below 2**53 in magnitude, and rounding an
+/// element to f64 cannot carry it past one.
+#[derive(Clone, Copy)]
+pub(crate) enum Operand<T> {
+    Native(T),
+    Wide(f64),
+    Above,
+    Below,
+}
+
+impl<T: Numeric> Operand<T> {
+    pub(crate) fn extract(value: &Bound<'_, PyAny>) -> PyResult<Self>
+    where
+        T: for<'a> FromPyObject<'a>,
+    {
+        let error = match value.extract::<T>() {
+            Ok(value) => return Ok(Operand::Native(value)),
+            Err(error) => error,
+        };
+        // Float elements take every number natively, so `value` is not one
+        if T::HIGHEST.to_f64().is_infinite() {
+            return Err(error);
+        }
+
+        let int = match value.extract::<i128>() {
+            Ok(int) => int,
+            // Past either end of every element range
+            Err(_) if value.is_instance_of::<PyInt>() => {
+                if value.gt(0)? {
+                    i128::MAX
+                } else {
+                    i128::MIN
+                }
+            }
+            Err(_) => {
+                let wide = value.extract::<f64>()?;
+                // fract() is NaN for NaN and the infinities, so they stay in f64 too
+                if wide.fract() != 0.0 {
+                    return Ok(Operand::Wide(wide));
+                }
+                // Saturates beyond i128, which is past either end as well
+                wide as i128
+            }
+        };
+        Ok(match int.into_pyobject(value.py())?.extract::<T>() {
+            Ok(native) => Operand::Native(native),
+            Err(_) if int > 0 => Operand::Above,
+            Err(_) => Operand::Below,
+        })
+    }
+}
+
+/// Set every flag of `out` to `test` of the matching element
+#[inline(always)]
+fn fill<C, F>(data: &[C], out: &mut [u8], test: F)
+where
+    F: Fn(&C) -> bool,
+{
+    for (c, flag) in data.iter().zip(out.iter_mut()) {
+        *flag = test(c) as u8;
+    }
+}
+
+/// Comparison flags (1 or 0) of `data` against `lo` (and `hi` for `Between`)
+///
+/// Each comparison gets its own loop, so the loop body is a single compare and
+/// store that the compiler can vectorize.
+fn compare_into<C, V, F>(data: &[C], value: F, op: Comparison, lo: V, hi: V, out: &mut [u8])
+where
+    V: PartialOrd + Copy,
+    F: Fn(&C) -> V,
+{
+    match op {
+        Comparison::Greater => fill(data, out, |c| value(c) > lo),
+        Comparison::GreaterEqual => fill(data, out, |c| value(c) >= lo),
+        Comparison::Less => fill(data, out, |c| value(c) < lo),
+        Comparison::LessEqual => fill(data, out, |c| value(c) <= lo),
+        Comparison::Equal => fill(data, out, |c| value(c) == lo),
+        Comparison::NotEqual => fill(data, out, |c| value(c) != lo),
+        Comparison::Between => fill(data, out, |c| {
+            let x = value(c);
+            (lo <= x) & (x <= hi)
+        }),
+    }
+}
+
+/// Comparison flags of `data` against a single operand
+fn compare_operand<C, T, F>(data: &[C], get: &F, op: Comparison, value: Operand<T>, out: &mut [u8])
+where
+    T: Numeric,
+    F: Fn(&C) -> T,
+{
+    match value {
+        Operand::Native(value) => compare_into(data, get, op, value, value, out),
+        Operand::Wide(value) => compare_into(data, |c| get(c).to_f64(), op, value, value, out),
+        Operand::Above | Operand::Below => {
+            // Integer elements are all on one side, so every flag is the same
+            let above = matches!(value, Operand::Above);
+            let flag = match op {
+                Comparison::Greater | Comparison::GreaterEqual => !above,
+                Comparison::Less | Comparison::LessEqual => above,
+                Comparison::Equal | Comparison::Between => false,
+                Comparison::NotEqual => true,
+            };
+            out.fill(flag as u8);
+        }
+    }
+}
+
+fn compare_slice<C, T, F>(
+    data: &[C],
+    get: F,
+    op: Comparison,
+    lo: Operand<T>,
+    hi: Operand<T>,
+    out: &mut [u8],
+) where
+    T: Numeric,
+    F: Fn(&C) -> T,
+{
+    match (op, lo, hi) {
+        (_, Operand::Native(lo), Operand::Native(hi)) => compare_into(data, get, op, lo, hi, out),
+        // Mixed bounds are tested one at a time, each in its own exact form
+        (Comparison::Between, lo, hi) => {
+            compare_operand(data, &get, Comparison::GreaterEqual, lo, out);
+            let mut upper = vec![0u8; out.len()];
+            compare_operand(data, &get, Comparison::LessEqual, hi, &mut upper);
+            for (flag, upper) in out.iter_mut().zip(upper) {
+                *flag &= upper;
+            }
+        }
+        _ => compare_operand(data, &get, op, lo, out),
+    }
+}
+
+fn compare_impl<T>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    op: Comparison,
+    lo: Operand<T>,
+    hi: Operand<T>,
+) -> PyResult<Vec<u8>>
+where
+    T: Element + Numeric,
+{
+    let mut mask = vec![0u8; buffer.item_count()];
+
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(mask.len(), PARALLEL_THRESHOLD_FILTER) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            data.par_chunks(PAR_CHUNK)
+                .zip(mask.par_chunks_mut(PAR_CHUNK))
+                .for_each(|(data, mask)| compare_slice(data, |x: &T| *x, op, lo, hi, mask));
+            return Ok(mask);
+        }
+    }
+
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    compare_slice(slice, |cell| cell.get(), op, lo, hi, &mut mask);
+    Ok(mask)
+}
+
+fn compare(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    op: Comparison,
+    lo: &Bound<'_, PyAny>,
+    hi: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(array)? == 0 {
+        return create_empty_result_array(py, TypeCode::UInt8, input_type);
+    }
+
+    let mask = crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        compare_impl(
+            py,
+            &buffer,
+            op,
+            Operand::extract(lo)?,
+            Operand::extract(hi)?,
+        )
+    })?;
+    create_result_array_from_slice(py, TypeCode::UInt8, input_type, &mask)
+}
+
+/// Mask (uint8, 1 or 0) of the elements greater than `value`
+///
+/// `value` is compared in the element type when it extracts as it; against integer
+/// arrays every other value is still compared exactly. NaN elements compare false.
+#[pyfunction]
+pub fn greater(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    value: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    compare(py, array, Comparison::Greater, value, value)
+}
+
+/// Mask (uint8, 1 or 0) of the elements greater than or equal to `value`
+#[pyfunction]
+pub fn greater_equal(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    value: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    compare(py, array, Comparison::GreaterEqual, value, value)
+}
+
+/// Mask (uint8, 1 or 0) of the elements less than `value`
+#[pyfunction]
+pub fn less(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    value: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    compare(py, array, Comparison::Less, value, value)
+}
+
+/// Mask (uint8, 1 or 0) of the elements less than or equal to `value`
+#[pyfunction]
+pub fn less_equal(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    value: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    compare(py, array, Comparison::LessEqual, value, value)
+}
+
+/// Mask (uint8, 1 or 0) of the elements equal to `value`
+#[pyfunction]
+pub fn equal(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    value: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    compare(py, array, Comparison::Equal, value, value)
+}
+
+/// Mask (uint8, 1 or 0) of the elements not equal to `value`; NaN elements compare true
+#[pyfunction]
+pub fn not_equal(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    value: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    compare(py, array, Comparison::NotEqual, value, value)
+}
+
+/// Mask (uint8, 1 or 0) of the elements in the closed interval `[lo, hi]`
+#[pyfunction]
+pub fn between(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    lo: &Bound<'_, PyAny>,
+    hi: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    compare(py, array, Comparison::Between, lo, hi)
+}
+
+fn count_set<C, F>(data: &[C], is_set: F) -> usize
+where
+    F: Fn(&C) -> bool,
+{
+    data.iter().map(|c| is_set(c) as usize).sum()
+}
+
+/// Number of leading elements up to and including the last one that is set
+fn set_prefix<C, F>(data: &[C], is_set: F) -> usize
+where
+    F: Fn(&C) -> bool,
+{
+    data.iter().rposition(is_set).map_or(0, |last| last + 1)
+}
+
+/// Stream compaction: the elements of `data` whose flag is set, written to `out`
+///
+/// `out` holds exactly the set count. Every element is stored at the write cursor
+/// and the cursor advances by the flag, so the loop has no data-dependent branch;
+/// stopping after the last set flag keeps the cursor in bounds.
+fn compact_into<C, M, T, F, G>(data: &[C], get: F, mask: &[M], is_set: G, out: &mut [T])
+where
+    F: Fn(&C) -> T,
+    G: Fn(&M) -> bool,
+{
+    let end = set_prefix(mask, &is_set);
+    let mut k = 0;
+    for (c, m) in data[..end].iter().zip(&mask[..end]) {
+        out[k] = get(c);
+        k += is_set(m) as usize;
+    }
+}
+
+/// Positions (offset by `start`) of the set elements of `data`, written to `out`
+///
+/// The same branch-free compaction as `compact_into`, applied to the positions.
+fn positions_into<C, F, I>(
+    data: &[C],
+    is_set: F,
+    start: usize,
+    out: &mut [I],
+    index: fn(usize) -> I,
+) where
+    F: Fn(&C) -> bool,
+{
+    let end = set_prefix(data, &is_set);
+    let mut k = 0;
+    for (i, c) in data[..end].iter().enumerate() {
+        out[k] = index(start + i);
+        k += is_set(c) as usize;
+    }
+}
+
+/// Positions of the elements of `data` for which `is_set` holds
+pub(crate) fn positions<C, F, I>(data: &[C], is_set: F, index: fn(usize) -> I) -> Vec<I>
+where
+    F: Fn(&C) -> bool,
+    I: Copy,
+{
+    let count = count_set(data, &is_set);
+    if count == 0 {
+        return Vec::new();
+    }
+    let mut out = vec![index(0); count];
+    positions_into(data, is_set, 0, &mut out, index);
+    out
+}
+
+/// Split `out` into consecutive pieces of the given lengths
+#[cfg(feature = "parallel")]
+fn split_by_counts<'a, T>(mut out: &'a mut [T], counts: &[usize]) -> Vec<&'a mut [T]> {
+    let mut pieces = Vec::with_capacity(counts.len());
+    for &count in counts {
+        let (piece, rest) = std::mem::take(&mut out).split_at_mut(count);
+        pieces.push(piece);
+        out = rest;
+    }
+    pieces
+}
+
+/// Check `mask` is a uint8 ('B') array of length `len`
+pub(crate) fn check_mask(mask: &Bound<'_, PyAny>, len: usize) -> PyResult<()> {
+    let input_type = detect_input_type(mask)?;
+    validate_for_operation(mask, input_type, false)?;
+    if get_typecode_unified(mask, input_type)? != TypeCode::UInt8 {
+        return Err(PyTypeError::new_err("mask must be a uint8 ('B') array"));
+    }
+    if get_array_len(mask)? != len {
+        return Err(PyValueError::new_err(
+            "mask must have the same length as the array",
+        ));
+    }
+    Ok(())
+}
+
+fn compress_impl<T>(py: Python<'_>, buffer: &PyBuffer<T>, mask: &PyBuffer<u8>) -> PyResult<Vec<T>>
+where
+    T: Element + Numeric,
+{
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(buffer.item_count(), PARALLEL_THRESHOLD_FILTER) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            let mask = extract_buffer_to_vec(py, mask)?;
+            // Each chunk writes to its own stretch of the exactly sized result
+            let counts: Vec<usize> = mask
+                .par_chunks(PAR_CHUNK)
+                .map(|mask| count_set(mask, |&flag| flag != 0))
+                .collect();
+            let mut out = vec![T::ZERO; counts.iter().sum()];
+            data.par_chunks(PAR_CHUNK)
+                .zip(mask.par_chunks(PAR_CHUNK))
+                .zip(split_by_counts(&mut out, &counts))
+                .for_each(|((data, mask), out)| {
+                    compact_into(data, |x: &T| *x, mask, |&flag| flag != 0, out)
+                });
+            return Ok(out);
+        }
+    }
+
+    let data = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let mask = mask
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let mut out = vec![T::ZERO; count_set(mask, |flag| flag.get() != 0)];
+    compact_into(
+        data,
+        |cell| cell.get(),
+        mask,
+        |flag| flag.get() != 0,
+        &mut out,
+    );
+    Ok(out)
+}
+
+/// Elements of `array` where `mask` is non-zero
+///
+/// `mask` is a uint8 ('B') array of the same length, as returned by the comparison
+/// functions or `isin()`. The selected count is taken first so the result is
+/// allocated once at its exact size, then filled by branch-free stream compaction.
+#[pyfunction]
+pub fn compress(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    mask: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+
+    let len = get_array_len(array)?;
+    check_mask(mask, len)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if len == 0 {
+        return create_empty_result_array(py, typecode, input_type);
+    }
+
+    let mask = PyBuffer::<u8>::get(mask)?;
+    crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        let result = compress_impl(py, &buffer, &mask)?;
+        create_result_array_from_slice(py, typecode, input_type, &result)
+    })
+}
+
+fn nonzero_positions<T, I>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    index: fn(usize) -> I,
+) -> PyResult<Vec<I>>
+where
+    T: Element + Numeric,
+    I: Copy + Send,
+{
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(buffer.item_count(), PARALLEL_THRESHOLD_FILTER) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            let counts: Vec<usize> = data
+                .par_chunks(PAR_CHUNK)
+                .map(|data| count_set(data, |&x| x != T::ZERO))
+                .collect();
+            let mut out = vec![index(0); counts.iter().sum()];
+            data.par_chunks(PAR_CHUNK)
+                .enumerate()
+                .zip(split_by_counts(&mut out, &counts))
+                .for_each(|((chunk, data), out)| {
+                    positions_into(data, |&x| x != T::ZERO, chunk * PAR_CHUNK, out, index)
+                });
+            return Ok(out);
+        }
+    }
+
+    let data = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    Ok(positions(data, |cell| cell.get() != T::ZERO, index))
+}
+
+fn nonzero_impl<T>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    input_type: InputType,
+) -> PyResult<PyObject>
+where
+    T: Element + Numeric,
+{
+    if u32::try_from(buffer.item_count()).is_ok() {
+        let indices = nonzero_positions(py, buffer, |i| i as u32)?;
+        create_result_array_from_slice(py, TypeCode::UInt32, input_type, &indices)
+    } else {
+        let indices = nonzero_positions(py, buffer, |i| i as u64)?;
+        create_result_array_from_slice(py, TypeCode::UInt64, input_type, &indices)
+    }
+}
+
+/// Positions of the non-zero elements of `array`
+///
+/// Typically applied to a mask from the comparison functions. Positions are uint32
+/// for arrays with fewer than 2**32 elements and uint64 otherwise, in the container
+/// type of `array`. NaN counts as non-zero; -0.0 does not.
+#[pyfunction]
+pub fn nonzero(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(array)? == 0 {
+        return create_empty_result_array(py, TypeCode::UInt32, input_type);
+    }
+
+    crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        nonzero_impl(py, &buffer, input_type)
+    })
+}
@@ -1,6 +1,21 @@
 pub mod basic;
+pub mod bivariate;
 pub mod elementwise;
+pub mod extrema;
+pub mod groupby;
+pub mod histogram;
+pub mod indexing;
 pub mod manipulation;
+pub mod mask;
+pub mod nanstats;
+pub mod radix;
+pub mod scan;
+pub mod search;
+pub mod segment;
+pub mod select;
+pub mod sets;
 pub mod slice;
 pub mod stats;
 pub mod transform;
+pub mod vector;
+pub mod window;
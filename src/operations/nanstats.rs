@@ -0,0 +1,290 @@
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::IntoPyObjectExt;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::buffer::get_array_len;
+use crate::numeric::Numeric;
+use crate::operations::{basic, extrema, stats};
+use crate::types::TypeCode;
+use crate::validation::{detect_input_type, get_typecode_unified, validate_for_operation};
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_SUM};
+
+// Independent accumulators per iteration so the masked adds vectorize
+const LANES: usize = 8;
+
+// Elements per parallel task
+#[cfg(feature = "parallel")]
+const PAR_CHUNK: usize = 65_536;
+
+/// Sum and count of the non-NaN values
+///
+/// NaN lanes add 0.0 and count 0 rather than branching, which compiles to a
+/// compare-and-blend per vector.
+fn masked_sum<C, F>(data: &[C], get: F) -> (f64, usize)
+where
+    F: Fn(&C) -> f64,
+{
+    let mut sums = [0.0f64; LANES];
+    let mut counts = [0usize; LANES];
+    let chunks = data.chunks_exact(LANES);
+    let rest = chunks.remainder();
+    for chunk in chunks {
+        for lane in 0..LANES {
+            let value = get(&chunk[lane]);
+            let keep = !value.is_nan();
+            sums[lane] += if keep { value } else { 0.0 };
+            counts[lane] += keep as usize;
+        }
+    }
+    let mut sum = sums.iter().sum::<f64>();
+    let mut count = counts.iter().sum::<usize>();
+    for cell in rest {
+        let value = get(cell);
+        if !value.is_nan() {
+            sum += value;
+            count += 1;
+        }
+    }
+    (sum, count)
+}
+
+/// Sum of squared deviations from `mean` over the non-NaN values
+fn masked_sq_dev<C, F>(data: &[C], get: F, mean: f64) -> f64
+where
+    F: Fn(&C) -> f64,
+{
+    let mut sums = [0.0f64; LANES];
+    let chunks = data.chunks_exact(LANES);
+    let rest = chunks.remainder();
+    for chunk in chunks {
+        for lane in 0..LANES {
+            let diff = get(&chunk[lane]) - mean;
+            sums[lane] += if diff.is_nan() { 0.0 } else { diff * diff };
+        }
+    }
+    let tail = rest
+        .iter()
+        .map(|cell| get(cell) - mean)
+        .filter(|diff| !diff.is_nan())
+        .map(|diff| diff * diff)
+        .sum::<f64>();
+    sums.iter().sum::<f64>() + tail
+}
+
+fn masked_sum_impl<T>(py: Python<'_>, buffer: &PyBuffer<T>) -> PyResult<(f64, usize)>
+where
+    T: Element + Numeric,
+{
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(buffer.item_count(), PARALLEL_THRESHOLD_SUM) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            return Ok(data
+                .par_chunks(PAR_CHUNK)
+                .map(|chunk| masked_sum(chunk, |v: &T| v.to_f64()))
+                .reduce(|| (0.0, 0), |a, b| (a.0 + b.0, a.1 + b.1)));
+        }
+    }
+
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    Ok(masked_sum(slice, |cell| cell.get().to_f64()))
+}
+
+fn masked_sq_dev_impl<T>(py: Python<'_>, buffer: &PyBuffer<T>, mean: f64) -> PyResult<f64>
+where
+    T: Element + Numeric,
+{
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(buffer.item_count(), PARALLEL_THRESHOLD_SUM) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            return Ok(data
+                .par_chunks(PAR_CHUNK)
+                .map(|chunk| masked_sq_dev(chunk, |v: &T| v.to_f64(), mean))
+                .sum());
+        }
+    }
+
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    Ok(masked_sq_dev(slice, |cell| cell.get().to_f64(), mean))
+}
+
+// Validate the input and return its typecode and length
+fn inspect(array: &Bound<'_, PyAny>) -> PyResult<(TypeCode, usize)> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+    Ok((typecode, get_array_len(array)?))
+}
+
+// Mean and count of the non-NaN values; raises if nothing is left to average
+fn nan_mean_count(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    typecode: TypeCode,
+) -> PyResult<(f64, usize)> {
+    let (sum, count) =
+        crate::dispatch_by_typecode!(typecode, array, |buffer| { masked_sum_impl(py, &buffer) })?;
+    if count == 0 {
+        return Err(PyValueError::new_err("All-NaN slice encountered"));
+    }
+    Ok((sum / count as f64, count))
+}
+
+/// Number of NaN values in an array (always 0 for integer arrays)
+#[pyfunction]
+pub fn count_nan(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<usize> {
+    let (typecode, len) = inspect(array)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if len == 0 || !typecode.is_float() {
+        return Ok(0);
+    }
+
+    let (_, count) =
+        crate::dispatch_by_typecode!(typecode, array, |buffer| { masked_sum_impl(py, &buffer) })?;
+    Ok(len - count)
+}
+
+/// Sum of the non-NaN values; 0.0 if there are none
+///
+/// Integer arrays cannot hold NaN and are summed exactly as in `sum()`.
+#[pyfunction]
+pub fn nansum(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+    let (typecode, len) = inspect(array)?;
+    if !typecode.is_float() {
+        return basic::sum(py, array, None);
+    }
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if len == 0 {
+        return 0.0f64.into_py_any(py);
+    }
+
+    let (sum, _) =
+        crate::dispatch_by_typecode!(typecode, array, |buffer| { masked_sum_impl(py, &buffer) })?;
+    sum.into_py_any(py)
+}
+
+/// Mean of the non-NaN values
+#[pyfunction]
+pub fn nanmean(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<f64> {
+    let (typecode, len) = inspect(array)?;
+    if !typecode.is_float() {
+        return basic::mean(py, array, None);
+    }
+
+    // Handle empty arrays - raise ValueError
+    if len == 0 {
+        return Err(PyValueError::new_err("nanmean() of empty array"));
+    }
+
+    Ok(nan_mean_count(py, array, typecode)?.0)
+}
+
+/// Population variance of the non-NaN values
+#[pyfunction]
+pub fn nanvar(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<f64> {
+    let (typecode, len) = inspect(array)?;
+    if !typecode.is_float() {
+        return stats::var(py, array, None);
+    }
+
+    // Handle empty arrays - raise ValueError
+    if len == 0 {
+        return Err(PyValueError::new_err("nanvar() of empty array"));
+    }
+
+    let (mean, count) = nan_mean_count(py, array, typecode)?;
+    let sq_dev = crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        masked_sq_dev_impl(py, &buffer, mean)
+    })?;
+    Ok(sq_dev / count as f64)
+}
+
+/// Population standard deviation of the non-NaN values
+#[pyfunction]
+pub fn nanstd(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<f64> {
+    Ok(nanvar(py, array)?.sqrt())
+}
+
+// Fused NaN-skipping (min, max); the empty check keeps the caller's name in the error
+fn nan_extremum(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    name: &str,
+) -> PyResult<(PyObject, PyObject)> {
+    let (_, len) = inspect(array)?;
+
+    // Handle empty arrays - raise ValueError
+    if len == 0 {
+        return Err(PyValueError::new_err(format!("{}() of empty array", name)));
+    }
+
+    extrema::min_max(py, array, true)?.extract(py)
+}
+
+/// Minimum of the non-NaN values
+#[pyfunction]
+pub fn nanmin(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+    Ok(nan_extremum(py, array, "nanmin")?.0)
+}
+
+/// Maximum of the non-NaN values
+#[pyfunction]
+pub fn nanmax(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+    Ok(nan_extremum(py, array, "nanmax")?.1)
+}
+
+// Lower median of the non-NaN values, selected in place on a filtered copy
+fn nanmedian_impl<T>(py: Python<'_>, buffer: &PyBuffer<T>) -> PyResult<T>
+where
+    T: Element + Numeric,
+{
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let mut data: Vec<T> = slice
+        .iter()
+        .map(|cell| cell.get())
+        .filter(|value| !value.is_nan())
+        .collect();
+    if data.is_empty() {
+        return Err(PyValueError::new_err("All-NaN slice encountered"));
+    }
+
+    // Same convention as median(): the lower middle element for even lengths
+    let mid = (data.len() - 1) / 2;
+    let (_, value, _) = data.select_nth_unstable_by(mid, |a, b| {
+        a.partial_cmp(b).expect("NaN values were filtered out")
+    });
+    Ok(*value)
+}
+
+/// Median of the non-NaN values (lower median for even counts, as in `median()`)
+#[pyfunction]
+pub fn nanmedian(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+    let (typecode, len) = inspect(array)?;
+    if !typecode.is_float() {
+        return stats::median(py, array);
+    }
+
+    // Handle empty arrays - raise ValueError
+    if len == 0 {
+        return Err(PyValueError::new_err("nanmedian() of empty array"));
+    }
+
+    crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        nanmedian_impl(py, &buffer)?.into_py_any(py)
+    })
+}
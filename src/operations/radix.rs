@@ -0,0 +1,288 @@
+// LSD radix sort and counting tables for numeric buffers
+//
+// Every element type maps to an unsigned key whose natural order matches
+// `Numeric::nan_last_cmp`, so integers and floats share one byte-wise sort.
+// 8- and 16-bit keys are small enough to index a counting table directly.
+
+use std::cell::Cell;
+use std::marker::PhantomData;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::numeric::Numeric;
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{should_parallelize, PARALLEL_THRESHOLD_HISTOGRAM};
+
+/// Inputs shorter than this are left to comparison sorts
+pub(crate) const RADIX_THRESHOLD: usize = 4_096;
+
+// One pass per 8-bit digit
+const RADIX: usize = 256;
+
+// Elements per parallel histogram task
+#[cfg(feature = "parallel")]
+const PAR_CHUNK: usize = 65_536;
+
+/// Order-preserving unsigned key for radix sorting
+pub(crate) trait RadixKey: Numeric {
+    /// Key width in bytes, i.e. the number of 8-bit digits
+    const BYTES: usize;
+
+    /// Unsigned key whose order matches `nan_last_cmp`
+    fn radix_key(self) -> u64;
+}
+
+macro_rules! impl_radix_unsigned {
+    ($($t:ty),*) => {
+        $(
+            impl RadixKey for $t {
+                const BYTES: usize = std::mem::size_of::<$t>();
+
+                #[inline(always)]
+                fn radix_key(self) -> u64 {
+                    self as u64
+                }
+            }
+        )*
+    };
+}
+
+macro_rules! impl_radix_signed {
+    ($($t:ty => $u:ty),*) => {
+        $(
+            impl RadixKey for $t {
+                const BYTES: usize = std::mem::size_of::<$t>();
+
+                // Flipping the sign bit moves negative values below positive ones
+                #[inline(always)]
+                fn radix_key(self) -> u64 {
+                    ((self as $u) ^ (1 << (<$u>::BITS - 1))) as u64
+                }
+            }
+        )*
+    };
+}
+
+macro_rules! impl_radix_float {
+    ($($t:ty => $u:ty),*) => {
+        $(
+            impl RadixKey for $t {
+                const BYTES: usize = std::mem::size_of::<$t>();
+
+                // Negative floats invert all bits and positive ones set the sign bit,
+                // giving IEEE 754 total order. Every NaN maps to the largest key so NaN
+                // sorts last, and -0.0 shares the key of 0.0 so the sort stays stable
+                // across them like the comparison sort.
+                #[inline(always)]
+                fn radix_key(self) -> u64 {
+                    const SIGN: $u = 1 << (<$u>::BITS - 1);
+                    if self.is_nan() {
+                        return <$u>::MAX as u64;
+                    }
+                    let bits = if self == 0.0 { 0 } else { self.to_bits() };
+                    (if bits & SIGN != 0 { !bits } else { bits | SIGN }) as u64
+                }
+            }
+        )*
+    };
+}
+
+impl_radix_unsigned!(u8, u16, u32, u64);
+impl_radix_signed!(i8 => u8, i16 => u16, i32 => u32, i64 => u64);
+impl_radix_float!(f32 => u32, f64 => u64);
+
+#[inline(always)]
+fn digit<T: RadixKey>(value: T, shift: usize) -> usize {
+    ((value.radix_key() >> shift) & (RADIX as u64 - 1)) as usize
+}
+
+/// Counts of every digit value for every digit position, in one pass
+fn digit_counts<T: RadixKey>(data: &[T]) -> Vec<[usize; RADIX]> {
+    let mut counts = vec![[0usize; RADIX]; T::BYTES];
+    for &value in data {
+        let key = value.radix_key();
+        for (byte, digit_counts) in counts.iter_mut().enumerate() {
+            digit_counts[((key >> (8 * byte)) & (RADIX as u64 - 1)) as usize] += 1;
+        }
+    }
+    counts
+}
+
+fn histograms<T: RadixKey>(data: &[T]) -> Vec<[usize; RADIX]> {
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(data.len(), PARALLEL_THRESHOLD_HISTOGRAM) {
+            return data.par_chunks(PAR_CHUNK).map(digit_counts).reduce(
+                || vec![[0usize; RADIX]; T::BYTES],
+                |mut a, b| {
+                    for (a, b) in a.iter_mut().zip(&b) {
+                        for (total, count) in a.iter_mut().zip(b) {
+                            *total += count;
+                        }
+                    }
+                    a
+                },
+            );
+        }
+    }
+
+    digit_counts(data)
+}
+
+/// Stable LSD radix sort of `cells` in place, with NaN last
+///
+/// The values are copied once into a scratch buffer, which also feeds the digit
+/// histograms; each pass then scatters between the scratch buffer and the cells.
+/// Digits shared by every element are skipped.
+pub(crate) fn radix_sort<T: RadixKey>(cells: &[Cell<T>]) {
+    let len = cells.len();
+    let mut scratch: Vec<T> = cells.iter().map(Cell::get).collect();
+    let counts = histograms(&scratch);
+
+    // Whether the current order lives in `scratch` (true) or in `cells`
+    let mut in_scratch = true;
+    for (byte, digit_counts) in counts.iter().enumerate() {
+        if digit_counts.contains(&len) {
+            continue;
+        }
+        let mut offsets = [0usize; RADIX];
+        let mut total = 0;
+        for (offset, &count) in offsets.iter_mut().zip(digit_counts) {
+            *offset = total;
+            total += count;
+        }
+
+        let shift = 8 * byte;
+        if in_scratch {
+            for &value in &scratch {
+                let d = digit(value, shift);
+                cells[offsets[d]].set(value);
+                offsets[d] += 1;
+            }
+        } else {
+            for cell in cells {
+                let value = cell.get();
+                let d = digit(value, shift);
+                scratch[offsets[d]] = value;
+                offsets[d] += 1;
+            }
+        }
+        in_scratch = !in_scratch;
+    }
+
+    if in_scratch {
+        for (cell, &value) in cells.iter().zip(&scratch) {
+            cell.set(value);
+        }
+    }
+}
+
+/// 8- and 16-bit types, whose keys index a counting table directly
+pub(crate) trait CountingKey: RadixKey {
+    /// Inverse of `radix_key`
+    fn from_key(key: usize) -> Self;
+}
+
+macro_rules! impl_counting_unsigned {
+    ($($t:ty),*) => {
+        $(
+            impl CountingKey for $t {
+                #[inline(always)]
+                fn from_key(key: usize) -> Self {
+                    key as $t
+                }
+            }
+        )*
+    };
+}
+
+macro_rules! impl_counting_signed {
+    ($($t:ty => $u:ty),*) => {
+        $(
+            impl CountingKey for $t {
+                #[inline(always)]
+                fn from_key(key: usize) -> Self {
+                    ((key as $u) ^ (1 << (<$u>::BITS - 1))) as $t
+                }
+            }
+        )*
+    };
+}
+
+impl_counting_unsigned!(u8, u16);
+impl_counting_signed!(i8 => u8, i16 => u16);
+
+// A counting table wider than this many slots per element loses to sorting
+const COUNTING_MAX_SPARSITY: usize = 16;
+
+/// Occurrence count of every key between the smallest and largest one present
+pub(crate) struct KeyCounts<T> {
+    base: usize,
+    counts: Vec<usize>,
+    marker: PhantomData<T>,
+}
+
+impl<T: CountingKey> KeyCounts<T> {
+    /// Count `data` in one pass after a pass for its key range
+    ///
+    /// Returns `None` for empty input, or when the range holds more than
+    /// `COUNTING_MAX_SPARSITY` slots per element (and more than one byte's worth),
+    /// where a comparison sort is cheaper than scanning the table.
+    pub(crate) fn build<C, F>(data: &[C], get: F) -> Option<Self>
+    where
+        F: Fn(&C) -> T,
+    {
+        let mut keys = data.iter().map(|c| get(c).radix_key() as usize);
+        let first = keys.next()?;
+        let (low, high) = keys.fold((first, first), |(low, high), key| {
+            (low.min(key), high.max(key))
+        });
+        let span = high - low + 1;
+        if span > RADIX && span / COUNTING_MAX_SPARSITY > data.len() {
+            return None;
+        }
+
+        let mut counts = vec![0usize; span];
+        for c in data {
+            counts[get(c).radix_key() as usize - low] += 1;
+        }
+        Some(KeyCounts {
+            base: low,
+            counts,
+            marker: PhantomData,
+        })
+    }
+
+    /// Distinct values with their counts, in ascending order
+    pub(crate) fn iter(&self) -> impl Iterator<Item = (T, usize)> + '_ {
+        self.counts
+            .iter()
+            .enumerate()
+            .filter(|&(_, &count)| count > 0)
+            .map(move |(i, &count)| (T::from_key(self.base + i), count))
+    }
+
+    /// Value at position `rank` of the sorted input
+    pub(crate) fn select(&self, rank: usize) -> T {
+        let mut seen = 0;
+        for (i, &count) in self.counts.iter().enumerate() {
+            seen += count;
+            if seen > rank {
+                return T::from_key(self.base + i);
+            }
+        }
+        unreachable!("rank {} is out of bounds for {} elements", rank, seen)
+    }
+
+    /// Overwrite `cells` with the counted values in ascending order
+    pub(crate) fn write_sorted(&self, cells: &[Cell<T>]) {
+        let mut cells = cells.iter();
+        for (value, count) in self.iter() {
+            for cell in cells.by_ref().take(count) {
+                cell.set(value);
+            }
+        }
+    }
+}
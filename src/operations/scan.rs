@@ -0,0 +1,366 @@
+use std::cell::Cell;
+
+use pyo3::buffer::{Element, PyBuffer, ReadOnlyCell};
+use pyo3::exceptions::{PyOverflowError, PyTypeError};
+use pyo3::prelude::*;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::buffer::{
+    allocate_result_array, buffers_overlap, check_out_array, create_empty_result_array,
+    create_result_array_from_vec, get_array_len, write_result_to_out,
+};
+use crate::numeric::Numeric;
+use crate::types::TypeCode;
+use crate::validation::{
+    detect_input_type, get_typecode_unified, validate_for_operation, InputType,
+};
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{should_parallelize, PARALLEL_THRESHOLD_SCAN};
+
+// Elements per parallel task in the two-phase scan
+#[cfg(feature = "parallel")]
+const SCAN_CHUNK: usize = 65_536;
+
+#[derive(Clone, Copy)]
+enum ScanOp {
+    Sum,
+    Prod,
+    Min,
+    Max,
+}
+
+impl ScanOp {
+    fn name(self) -> &'static str {
+        match self {
+            ScanOp::Sum => "cumsum",
+            ScanOp::Prod => "cumprod",
+            ScanOp::Min => "cummin",
+            ScanOp::Max => "cummax",
+        }
+    }
+
+    fn identity<A: Numeric>(self) -> A {
+        match self {
+            ScanOp::Sum => A::ZERO,
+            ScanOp::Prod => A::ONE,
+            ScanOp::Min => A::HIGHEST,
+            ScanOp::Max => A::LOWEST,
+        }
+    }
+
+    /// Combine the running value with the next element; None on integer overflow.
+    /// NaN propagates through min/max (once the running value is NaN it stays NaN).
+    #[inline(always)]
+    fn combine<A: Numeric>(self, acc: A, value: A) -> Option<A> {
+        match self {
+            ScanOp::Sum => acc.add_checked(value),
+            ScanOp::Prod => acc.mul_checked(value),
+            ScanOp::Min => Some(if value < acc || value.is_nan() {
+                value
+            } else {
+                acc
+            }),
+            ScanOp::Max => Some(if value > acc || value.is_nan() {
+                value
+            } else {
+                acc
+            }),
+        }
+    }
+}
+
+// Inclusive scan of data into out starting from `init`; false on integer overflow
+fn scan_into<C, A, F>(data: &[C], out: &[Cell<A>], init: A, op: ScanOp, get: &F) -> bool
+where
+    A: Numeric,
+    F: Fn(&C) -> A,
+{
+    let mut acc = init;
+    for (slot, value) in out.iter().zip(data.iter()) {
+        match op.combine(acc, get(value)) {
+            Some(next) => acc = next,
+            None => return false,
+        }
+        slot.set(acc);
+    }
+    true
+}
+
+// Two-phase scan: reduce each chunk in parallel, scan the chunk totals sequentially,
+// then rescan every chunk in parallel from its offset. Returns None when a chunk-local
+// total overflows; the caller then falls back to the sequential scan, which decides
+// whether the full scan genuinely overflows.
+#[cfg(feature = "parallel")]
+fn scan_parallel<T, A, F>(data: &[T], out: &mut [A], op: ScanOp, convert: &F) -> Option<bool>
+where
+    T: Numeric,
+    A: Numeric,
+    F: Fn(T) -> A + Sync,
+{
+    let totals: Vec<Option<A>> = data
+        .par_chunks(SCAN_CHUNK)
+        .map(|chunk| {
+            chunk.iter().try_fold(op.identity::<A>(), |acc, &value| {
+                op.combine(acc, convert(value))
+            })
+        })
+        .collect();
+
+    let mut offsets = Vec::with_capacity(totals.len());
+    let mut acc = op.identity::<A>();
+    for total in totals {
+        offsets.push(acc);
+        acc = op.combine(acc, total?)?;
+    }
+
+    // Offsets are exact prefix values, so an overflow here is a genuine overflow
+    Some(
+        out.par_chunks_mut(SCAN_CHUNK)
+            .zip(data.par_chunks(SCAN_CHUNK))
+            .zip(offsets.into_par_iter())
+            .all(|((out_chunk, chunk), offset)| {
+                let out_chunk = Cell::from_mut(out_chunk).as_slice_of_cells();
+                scan_into(chunk, out_chunk, offset, op, &|value: &T| convert(*value))
+            }),
+    )
+}
+
+// Inclusive scan of the first out.len() elements of `buffer` into `out`; false if
+// the integer accumulator overflows
+//
+// The serial path reads the buffer's cells in place. The parallel path, and an `out`
+// that overlaps the input, work from a copy of the input instead.
+fn scan_impl<T, A, F>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    out: &[Cell<A>],
+    overlap: bool,
+    op: ScanOp,
+    convert: F,
+) -> PyResult<bool>
+where
+    T: Element + Numeric,
+    A: Numeric,
+    F: Fn(T) -> A + Sync,
+{
+    let len = out.len();
+    let copied = |value: &T| convert(*value);
+
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(len, PARALLEL_THRESHOLD_SCAN) {
+            let data = buffer.to_vec(py)?;
+            // Python buffer cells are not Sync, so threads scan into a staging buffer
+            let mut staged = vec![op.identity::<A>(); len];
+            if let Some(ok) = scan_parallel(&data[..len], &mut staged, op, &convert) {
+                if ok {
+                    for (slot, value) in out.iter().zip(staged) {
+                        slot.set(value);
+                    }
+                }
+                return Ok(ok);
+            }
+            return Ok(scan_into(&data[..len], out, op.identity(), op, &copied));
+        }
+    }
+
+    if overlap {
+        let data = buffer.to_vec(py)?;
+        return Ok(scan_into(&data[..len], out, op.identity(), op, &copied));
+    }
+    let cells = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let get = |cell: &ReadOnlyCell<T>| convert(cell.get());
+    Ok(scan_into(&cells[..len], out, op.identity(), op, &get))
+}
+
+// Scan `buffer` into `out` (inclusive or exclusive); false on integer overflow
+//
+// An exclusive scan is the inclusive scan of data[..n-1] shifted right by one, so the
+// (unused) grand total can never raise a spurious overflow. The leading identity is
+// written last, after the input has been read.
+fn scan_cells<T, A, F>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    out: &[Cell<A>],
+    overlap: bool,
+    op: ScanOp,
+    exclusive: bool,
+    convert: F,
+) -> PyResult<bool>
+where
+    T: Element + Numeric,
+    A: Numeric,
+    F: Fn(T) -> A + Sync,
+{
+    if !exclusive {
+        return scan_impl(py, buffer, out, overlap, op, convert);
+    }
+    let ok = scan_impl(py, buffer, &out[1..], overlap, op, convert)?;
+    out[0].set(op.identity());
+    Ok(ok)
+}
+
+#[allow(clippy::too_many_arguments)]
+fn scan_result<T, A, F>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    op: ScanOp,
+    exclusive: bool,
+    widen: bool,
+    convert: F,
+    result_typecode: TypeCode,
+    input_type: InputType,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject>
+where
+    T: Element + Numeric,
+    A: Element + Numeric + for<'py> IntoPyObject<'py>,
+    F: Fn(T) -> A + Sync,
+{
+    let overflow = || {
+        let hint = if widen {
+            ""
+        } else {
+            "; pass widen=True to accumulate in 64 bits"
+        };
+        PyOverflowError::new_err(format!("integer overflow in {}(){}", op.name(), hint))
+    };
+    let len = buffer.item_count();
+
+    // Results are written straight into `out`, or into an array allocated up front
+    let result = match out {
+        Some(out) => {
+            check_out_array::<A>(out, result_typecode, len)?;
+            Some(out.clone())
+        }
+        None => allocate_result_array::<A>(py, result_typecode, input_type, len)?,
+    };
+
+    match result {
+        Some(result) => {
+            let target = PyBuffer::<A>::get(&result)?;
+            let cells = target
+                .as_mut_slice(py)
+                .ok_or_else(|| PyTypeError::new_err("Failed to get mutable buffer slice"))?;
+            let overlap = buffers_overlap(buffer, &target);
+            if !scan_cells(py, buffer, cells, overlap, op, exclusive, convert)? {
+                return Err(overflow());
+            }
+            Ok(result.unbind())
+        }
+        None => {
+            // Arrow results are built from a native buffer
+            let mut values = vec![op.identity::<A>(); len];
+            let cells = Cell::from_mut(&mut values[..]).as_slice_of_cells();
+            if !scan_cells(py, buffer, cells, false, op, exclusive, convert)? {
+                return Err(overflow());
+            }
+            create_result_array_from_vec(py, result_typecode, input_type, values)
+        }
+    }
+}
+
+fn scan(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    op: ScanOp,
+    exclusive: bool,
+    widen: bool,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+    let result_typecode = if widen { typecode.widened() } else { typecode };
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(array)? == 0 {
+        return match out {
+            Some(out) => write_result_to_out::<f64>(py, out, result_typecode, &[]),
+            None => create_empty_result_array(py, result_typecode, input_type),
+        };
+    }
+
+    crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        if widen {
+            scan_result(
+                py,
+                &buffer,
+                op,
+                exclusive,
+                widen,
+                |value| value.widen(),
+                result_typecode,
+                input_type,
+                out,
+            )
+        } else {
+            scan_result(
+                py,
+                &buffer,
+                op,
+                exclusive,
+                widen,
+                |value| value,
+                result_typecode,
+                input_type,
+                out,
+            )
+        }
+    })
+}
+
+/// Cumulative sum for array.array, numpy.ndarray, or memoryview
+#[pyfunction]
+#[pyo3(signature = (array, exclusive = false, widen = false, out = None))]
+pub fn cumsum(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    exclusive: bool,
+    widen: bool,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    scan(py, array, ScanOp::Sum, exclusive, widen, out)
+}
+
+/// Cumulative product for array.array, numpy.ndarray, or memoryview
+#[pyfunction]
+#[pyo3(signature = (array, exclusive = false, widen = false, out = None))]
+pub fn cumprod(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    exclusive: bool,
+    widen: bool,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    scan(py, array, ScanOp::Prod, exclusive, widen, out)
+}
+
+/// Cumulative minimum for array.array, numpy.ndarray, or memoryview
+#[pyfunction]
+#[pyo3(signature = (array, exclusive = false, out = None))]
+pub fn cummin(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    exclusive: bool,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    scan(py, array, ScanOp::Min, exclusive, false, out)
+}
+
+/// Cumulative maximum for array.array, numpy.ndarray, or memoryview
+#[pyfunction]
+#[pyo3(signature = (array, exclusive = false, out = None))]
+pub fn cummax(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    exclusive: bool,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    scan(py, array, ScanOp::Max, exclusive, false, out)
+}
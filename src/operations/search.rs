@@ -0,0 +1,225 @@
+use pyo3::buffer::{Element, PyBuffer, ReadOnlyCell};
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::prelude::*;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::buffer::{create_empty_result_array, create_result_array_from_slice, get_array_len};
+use crate::operations::radix::RadixKey;
+use crate::types::TypeCode;
+use crate::validation::{validate_same_type, InputType};
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_SEARCH};
+
+// Queries per parallel task
+#[cfg(feature = "parallel")]
+const PAR_CHUNK: usize = 16_384;
+
+/// Which end of a run of equal values a query is placed at
+#[derive(Clone, Copy, PartialEq, Eq)]
+enum Side {
+    Left,
+    Right,
+}
+
+impl Side {
+    fn parse(side: &str) -> PyResult<Self> {
+        match side {
+            "left" => Ok(Side::Left),
+            "right" => Ok(Side::Right),
+            _ => Err(PyValueError::new_err(format!(
+                "side must be 'left' or 'right', got '{}'",
+                side
+            ))),
+        }
+    }
+
+    /// Whether an element with key `x` comes before a query with key `query`
+    #[inline(always)]
+    fn before(self, x: u64, query: u64) -> bool {
+        match self {
+            Side::Left => x < query,
+            Side::Right => x <= query,
+        }
+    }
+}
+
+/// Number of leading elements of `data` that satisfy `before`
+///
+/// Branchless binary search: the loop runs exactly log2(len) times and the
+/// midpoint update compiles to a conditional move.
+#[inline]
+fn partition_point<C, F, P>(data: &[C], key: &F, before: &P) -> usize
+where
+    F: Fn(&C) -> u64,
+    P: Fn(u64) -> bool,
+{
+    if data.is_empty() {
+        return 0;
+    }
+    let mut base = 0;
+    let mut size = data.len();
+    while size > 1 {
+        let half = size / 2;
+        let mid = base + half;
+        base = if before(key(&data[mid])) { mid } else { base };
+        size -= half;
+    }
+    base + before(key(&data[base])) as usize
+}
+
+/// Like `partition_point`, for an answer known to be at or after `from`
+///
+/// Exponential search from `from` bounds the answer in O(log d) steps for a
+/// distance d, so a run of sorted queries costs a linear merge when they are dense
+/// and a binary search per query when they are sparse.
+#[inline]
+pub(crate) fn gallop<C, F, P>(data: &[C], key: &F, from: usize, before: &P) -> usize
+where
+    F: Fn(&C) -> u64,
+    P: Fn(u64) -> bool,
+{
+    let mut low = from;
+    let mut high = from;
+    let mut step = 1;
+    while high < data.len() && before(key(&data[high])) {
+        low = high + 1;
+        high += step;
+        step *= 2;
+    }
+    let high = high.min(data.len());
+    low + partition_point(&data[low..high], key, before)
+}
+
+fn is_sorted<C, F>(data: &[C], key: F) -> bool
+where
+    F: Fn(&C) -> u64,
+{
+    data.windows(2).all(|pair| key(&pair[0]) <= key(&pair[1]))
+}
+
+/// Insertion point in `data` of every query, written to `out`
+fn search_into<C, F, I>(
+    data: &[C],
+    queries: &[C],
+    key: F,
+    side: Side,
+    sorted_queries: bool,
+    out: &mut [I],
+    index: fn(usize) -> I,
+) where
+    F: Fn(&C) -> u64,
+{
+    if sorted_queries {
+        let mut cursor = 0;
+        for (query, slot) in queries.iter().zip(out.iter_mut()) {
+            let query = key(query);
+            cursor = gallop(data, &key, cursor, &|x| side.before(x, query));
+            *slot = index(cursor);
+        }
+    } else {
+        for (query, slot) in queries.iter().zip(out.iter_mut()) {
+            let query = key(query);
+            *slot = index(partition_point(data, &key, &|x| side.before(x, query)));
+        }
+    }
+}
+
+fn search_buffers<T, I>(
+    py: Python<'_>,
+    data: &PyBuffer<T>,
+    queries: &PyBuffer<T>,
+    side: Side,
+    index: fn(usize) -> I,
+) -> PyResult<Vec<I>>
+where
+    T: Element + RadixKey,
+    I: Copy + Send,
+{
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(queries.item_count(), PARALLEL_THRESHOLD_SEARCH) {
+            let data = extract_buffer_to_vec(py, data)?;
+            let queries = extract_buffer_to_vec(py, queries)?;
+            let key = |x: &T| x.radix_key();
+            let sorted = is_sorted(&queries, key);
+            let mut out = vec![index(0); queries.len()];
+            queries
+                .par_chunks(PAR_CHUNK)
+                .zip(out.par_chunks_mut(PAR_CHUNK))
+                .for_each(|(queries, out)| {
+                    search_into(&data, queries, key, side, sorted, out, index)
+                });
+            return Ok(out);
+        }
+    }
+
+    let data = data
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let queries = queries
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let key = |cell: &ReadOnlyCell<T>| cell.get().radix_key();
+    let sorted = is_sorted(queries, key);
+    let mut out = vec![index(0); queries.len()];
+    search_into(data, queries, key, side, sorted, &mut out, index);
+    Ok(out)
+}
+
+fn searchsorted_impl<T>(
+    py: Python<'_>,
+    data: &PyBuffer<T>,
+    queries: &PyBuffer<T>,
+    side: Side,
+    input_type: InputType,
+) -> PyResult<PyObject>
+where
+    T: Element + RadixKey,
+{
+    // Insertion points range over 0..=len
+    if u32::try_from(data.item_count()).is_ok() {
+        let indices = search_buffers(py, data, queries, side, |i| i as u32)?;
+        create_result_array_from_slice(py, TypeCode::UInt32, input_type, &indices)
+    } else {
+        let indices = search_buffers(py, data, queries, side, |i| i as u64)?;
+        create_result_array_from_slice(py, TypeCode::UInt64, input_type, &indices)
+    }
+}
+
+/// Insertion points of many queries in a sorted array
+///
+/// For every query, returns the index at which it would be inserted into
+/// `sorted_array` to keep it sorted: before any equal values with `side="left"`,
+/// after them with `side="right"`. `sorted_array` must be in ascending order with
+/// NaN last, as produced by `sort()`. Sorted query arrays are merged against the
+/// data with galloping search; other queries use a branchless binary search each.
+/// Indices are uint32 for arrays with fewer than 2**32 elements and uint64
+/// otherwise, in the container type of `queries`.
+#[pyfunction]
+#[pyo3(signature = (sorted_array, queries, side = "left"))]
+pub fn searchsorted(
+    py: Python<'_>,
+    sorted_array: &Bound<'_, PyAny>,
+    queries: &Bound<'_, PyAny>,
+    side: &str,
+) -> PyResult<PyObject> {
+    let side = Side::parse(side)?;
+    let (typecode, _, input_type) = validate_same_type(sorted_array, queries)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    let len = get_array_len(queries)?;
+    if len == 0 {
+        return create_empty_result_array(py, TypeCode::UInt32, input_type);
+    }
+    if get_array_len(sorted_array)? == 0 {
+        return create_result_array_from_slice(py, TypeCode::UInt32, input_type, &vec![0u32; len]);
+    }
+
+    crate::dispatch_by_typecode!(typecode, sorted_array, |buffer| {
+        let queries = PyBuffer::get(queries)?;
+        searchsorted_impl(py, &buffer, &queries, side, input_type)
+    })
+}
@@ -0,0 +1,379 @@
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::{PyOverflowError, PyTypeError, PyValueError};
+use pyo3::prelude::*;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::buffer::{create_empty_result_array, create_result_array_from_slice, get_array_len};
+use crate::numeric::{Integer, Numeric};
+use crate::operations::basic::{greater, lesser, sum_f64};
+use crate::types::TypeCode;
+use crate::validation::{
+    detect_input_type, get_typecode_unified, validate_for_operation, InputType,
+};
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_SUM};
+
+/// Reduction applied to each segment independently
+///
+/// `reduce` is generic over the element container so the same kernel runs on the
+/// buffer's cells in the serial path and on an extracted Vec in the parallel path.
+/// `index` is the position of the segment, for the error raised when it has no
+/// result (integer overflow, or min/max of an empty segment).
+trait SegmentKernel<T: Numeric>: Sync {
+    type Output: Numeric;
+
+    fn reduce<C, F>(&self, index: usize, segment: &[C], get: F) -> PyResult<Self::Output>
+    where
+        F: Fn(&C) -> T;
+}
+
+/// Overflow-checked sum in the 64-bit accumulator type
+struct SumKernel;
+
+impl<T: Numeric> SegmentKernel<T> for SumKernel {
+    type Output = T::Wide;
+
+    fn reduce<C, F>(&self, index: usize, segment: &[C], get: F) -> PyResult<T::Wide>
+    where
+        F: Fn(&C) -> T,
+    {
+        segment
+            .iter()
+            .try_fold(T::Wide::ZERO, |acc, cell| {
+                acc.add_checked(get(cell).widen())
+            })
+            .ok_or_else(|| {
+                PyOverflowError::new_err(format!(
+                    "integer overflow in segment_sum() at segment {}",
+                    index
+                ))
+            })
+    }
+}
+
+/// Mean as f64; NaN for an empty segment
+struct MeanKernel;
+
+impl<T: Numeric> SegmentKernel<T> for MeanKernel {
+    type Output = f64;
+
+    fn reduce<C, F>(&self, _index: usize, segment: &[C], get: F) -> PyResult<f64>
+    where
+        F: Fn(&C) -> T,
+    {
+        if segment.is_empty() {
+            return Ok(f64::NAN);
+        }
+        Ok(sum_f64(segment, |cell| get(cell).to_f64()) / segment.len() as f64)
+    }
+}
+
+/// Minimum or maximum with the same NaN propagation as min() and max()
+struct ExtremumKernel<T> {
+    pick: fn(T, T) -> T,
+    name: &'static str,
+}
+
+impl<T: Numeric> SegmentKernel<T> for ExtremumKernel<T> {
+    type Output = T;
+
+    fn reduce<C, F>(&self, index: usize, segment: &[C], get: F) -> PyResult<T>
+    where
+        F: Fn(&C) -> T,
+    {
+        segment
+            .iter()
+            .map(get)
+            .reduce(self.pick)
+            .ok_or_else(|| empty_segment_error(self.name, index))
+    }
+}
+
+fn empty_segment_error(name: &str, segment: usize) -> PyErr {
+    PyValueError::new_err(format!("{}() of empty segment {}", name, segment))
+}
+
+/// Apply `kernel` to every segment
+fn reduce_segments<C, T, K, F>(
+    data: &[C],
+    offsets: &[usize],
+    kernel: &K,
+    get: F,
+) -> PyResult<Vec<K::Output>>
+where
+    T: Numeric,
+    K: SegmentKernel<T>,
+    F: Fn(&C) -> T + Copy,
+{
+    offsets
+        .windows(2)
+        .enumerate()
+        .map(|(i, bounds)| kernel.reduce(i, &data[bounds[0]..bounds[1]], get))
+        .collect()
+}
+
+fn segment_impl<T, K>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    offsets: &[usize],
+    kernel: &K,
+) -> PyResult<Vec<K::Output>>
+where
+    T: Element + Numeric,
+    K: SegmentKernel<T>,
+{
+    // Segments are independent, so whole segments are handed out to threads
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(buffer.item_count(), PARALLEL_THRESHOLD_SUM) && offsets.len() > 2 {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            return offsets
+                .par_windows(2)
+                .enumerate()
+                .map(|(i, bounds)| kernel.reduce(i, &data[bounds[0]..bounds[1]], |v: &T| *v))
+                .collect();
+        }
+    }
+
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    reduce_segments(slice, offsets, kernel, |cell| cell.get())
+}
+
+/// Read and validate the segment boundaries
+///
+/// `offsets` holds one more entry than there are segments; segment `i` is
+/// `values[offsets[i]:offsets[i + 1]]`, as in Arrow list arrays.
+fn read_offsets(
+    py: Python<'_>,
+    offsets: &Bound<'_, PyAny>,
+    values_len: usize,
+) -> PyResult<Vec<usize>> {
+    let input_type = detect_input_type(offsets)?;
+    validate_for_operation(offsets, input_type, false)?;
+    let typecode = get_typecode_unified(offsets, input_type)?;
+
+    // Handle empty arrays - raise ValueError
+    if get_array_len(offsets)? == 0 {
+        return Err(PyValueError::new_err(
+            "offsets must contain at least one element",
+        ));
+    }
+
+    crate::dispatch_by_int_typecode!(typecode, offsets, |buffer| {
+        let slice = buffer
+            .as_slice(py)
+            .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+        let mut bounds = Vec::with_capacity(slice.len());
+        let mut previous = 0i128;
+        for cell in slice {
+            let offset = cell.get().to_i128();
+            if offset < 0 || offset > values_len as i128 {
+                return Err(PyValueError::new_err(format!(
+                    "offset {} is out of bounds for values of length {}",
+                    offset, values_len
+                )));
+            }
+            if offset < previous {
+                return Err(PyValueError::new_err("offsets must be non-decreasing"));
+            }
+            previous = offset;
+            bounds.push(offset as usize);
+        }
+        Ok(bounds)
+    })
+}
+
+/// Values typecode and container type plus the validated offsets
+fn inspect(
+    py: Python<'_>,
+    values: &Bound<'_, PyAny>,
+    offsets: &Bound<'_, PyAny>,
+) -> PyResult<(TypeCode, InputType, Vec<usize>)> {
+    let input_type = detect_input_type(values)?;
+    validate_for_operation(values, input_type, false)?;
+    let typecode = get_typecode_unified(values, input_type)?;
+    let bounds = read_offsets(py, offsets, get_array_len(values)?)?;
+    Ok((typecode, input_type, bounds))
+}
+
+/// Result for empty `values`: every segment is empty and gets `fill`
+///
+/// Built without taking a buffer, since the caller has not dispatched yet.
+fn fill_segments<R>(
+    py: Python<'_>,
+    offsets: &[usize],
+    fill: R,
+    result_typecode: TypeCode,
+    input_type: InputType,
+) -> PyResult<PyObject>
+where
+    R: Element + Copy + for<'py> IntoPyObject<'py>,
+{
+    let segments = offsets.len().saturating_sub(1);
+    create_result_array_from_slice(py, result_typecode, input_type, &vec![fill; segments])
+}
+
+// Shared driver: run `kernel` over the segments and build the result array
+fn segment_reduce<T, K>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    offsets: &[usize],
+    kernel: &K,
+    result_typecode: TypeCode,
+    input_type: InputType,
+) -> PyResult<PyObject>
+where
+    T: Element + Numeric,
+    K: SegmentKernel<T>,
+    K::Output: Element + for<'py> IntoPyObject<'py>,
+{
+    // No segments: skip the buffer entirely
+    if offsets.len() < 2 {
+        return create_empty_result_array(py, result_typecode, input_type);
+    }
+
+    let results = segment_impl(py, buffer, offsets, kernel)?;
+    create_result_array_from_slice(py, result_typecode, input_type, &results)
+}
+
+/// Sum of every segment of `values` delimited by `offsets`
+///
+/// Integer sums accumulate in 64 bits (i64 or u64) and raise OverflowError if a
+/// segment overflows, as in groupby_agg().
+#[pyfunction]
+pub fn segment_sum(
+    py: Python<'_>,
+    values: &Bound<'_, PyAny>,
+    offsets: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    let (typecode, input_type, bounds) = inspect(py, values, offsets)?;
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(values)? == 0 {
+        let result_typecode = typecode.widened();
+        return match result_typecode {
+            TypeCode::Int64 => fill_segments(py, &bounds, 0i64, result_typecode, input_type),
+            TypeCode::UInt64 => fill_segments(py, &bounds, 0u64, result_typecode, input_type),
+            _ => fill_segments(py, &bounds, 0.0f64, result_typecode, input_type),
+        };
+    }
+    crate::dispatch_by_typecode!(typecode, values, |buffer| {
+        segment_reduce(
+            py,
+            &buffer,
+            &bounds,
+            &SumKernel,
+            typecode.widened(),
+            input_type,
+        )
+    })
+}
+
+/// Mean of every segment as float64 (NaN for empty segments)
+#[pyfunction]
+pub fn segment_mean(
+    py: Python<'_>,
+    values: &Bound<'_, PyAny>,
+    offsets: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    let (typecode, input_type, bounds) = inspect(py, values, offsets)?;
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(values)? == 0 {
+        return fill_segments(py, &bounds, f64::NAN, TypeCode::Float64, input_type);
+    }
+    crate::dispatch_by_typecode!(typecode, values, |buffer| {
+        segment_reduce(
+            py,
+            &buffer,
+            &bounds,
+            &MeanKernel,
+            TypeCode::Float64,
+            input_type,
+        )
+    })
+}
+
+/// Minimum of every segment; raises ValueError for an empty segment
+#[pyfunction]
+pub fn segment_min(
+    py: Python<'_>,
+    values: &Bound<'_, PyAny>,
+    offsets: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    let (typecode, input_type, bounds) = inspect(py, values, offsets)?;
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(values)? == 0 {
+        if bounds.len() < 2 {
+            return create_empty_result_array(py, typecode, input_type);
+        }
+        return Err(empty_segment_error("segment_min", 0));
+    }
+    crate::dispatch_by_typecode!(typecode, values, |buffer| {
+        segment_reduce(
+            py,
+            &buffer,
+            &bounds,
+            &ExtremumKernel {
+                pick: lesser,
+                name: "segment_min",
+            },
+            typecode,
+            input_type,
+        )
+    })
+}
+
+/// Maximum of every segment; raises ValueError for an empty segment
+#[pyfunction]
+pub fn segment_max(
+    py: Python<'_>,
+    values: &Bound<'_, PyAny>,
+    offsets: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    let (typecode, input_type, bounds) = inspect(py, values, offsets)?;
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(values)? == 0 {
+        if bounds.len() < 2 {
+            return create_empty_result_array(py, typecode, input_type);
+        }
+        return Err(empty_segment_error("segment_max", 0));
+    }
+    crate::dispatch_by_typecode!(typecode, values, |buffer| {
+        segment_reduce(
+            py,
+            &buffer,
+            &bounds,
+            &ExtremumKernel {
+                pick: greater,
+                name: "segment_max",
+            },
+            typecode,
+            input_type,
+        )
+    })
+}
+
+/// Length of every segment as uint64
+///
+/// Only the offsets are read, but `values` is still validated so that out-of-range
+/// offsets are reported the same way as by the other segment reductions.
+#[pyfunction]
+pub fn segment_count(
+    py: Python<'_>,
+    values: &Bound<'_, PyAny>,
+    offsets: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    let (_, input_type, bounds) = inspect(py, values, offsets)?;
+    if bounds.len() < 2 {
+        return create_empty_result_array(py, TypeCode::UInt64, input_type);
+    }
+    let counts: Vec<u64> = bounds
+        .windows(2)
+        .map(|bounds| (bounds[1] - bounds[0]) as u64)
+        .collect();
+    create_result_array_from_slice(py, TypeCode::UInt64, input_type, &counts)
+}
@@ -0,0 +1,231 @@
+use std::cmp::Ordering;
+use std::collections::BinaryHeap;
+
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::PyTypeError;
+use pyo3::prelude::*;
+use pyo3::IntoPyObjectExt;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::buffer::{create_empty_result_array, create_result_array_from_slice, get_array_len};
+use crate::numeric::Numeric;
+use crate::types::TypeCode;
+use crate::validation::{
+    detect_input_type, get_typecode_unified, validate_for_operation, InputType,
+};
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_SELECT};
+
+// A bounded heap is used while k is at most 1/HEAP_RATIO of the input; beyond that,
+// partial selection over all (value, index) pairs does less work per element
+const HEAP_RATIO: usize = 16;
+
+// Elements per parallel task; each task keeps its own bounded heap
+#[cfg(feature = "parallel")]
+const PAR_CHUNK: usize = 65_536;
+
+/// A value with its position; orders by preference (best first), then by index
+#[derive(Clone, Copy)]
+struct Candidate<T> {
+    value: T,
+    index: usize,
+    largest: bool,
+}
+
+/// Ordering::Less means `a` is selected before `b`; NaN ranks after every number
+#[inline(always)]
+fn preference<T: Numeric>(a: T, b: T, largest: bool) -> Ordering {
+    match (a.is_nan(), b.is_nan()) {
+        (false, false) => {
+            let ord = a.partial_cmp(&b).unwrap_or(Ordering::Equal);
+            if largest {
+                ord.reverse()
+            } else {
+                ord
+            }
+        }
+        (true, true) => Ordering::Equal,
+        (true, false) => Ordering::Greater,
+        (false, true) => Ordering::Less,
+    }
+}
+
+impl<T: Numeric> Ord for Candidate<T> {
+    fn cmp(&self, other: &Self) -> Ordering {
+        preference(self.value, other.value, self.largest).then(self.index.cmp(&other.index))
+    }
+}
+
+impl<T: Numeric> PartialOrd for Candidate<T> {
+    fn partial_cmp(&self, other: &Self) -> Option<Ordering> {
+        Some(self.cmp(other))
+    }
+}
+
+impl<T: Numeric> PartialEq for Candidate<T> {
+    fn eq(&self, other: &Self) -> bool {
+        self.cmp(other) == Ordering::Equal
+    }
+}
+
+impl<T: Numeric> Eq for Candidate<T> {}
+
+/// The k best candidates of `data` (unordered), using a max-heap of the current
+/// k best so the worst kept candidate is always on top and most inputs are
+/// rejected with a single comparison
+fn heap_select<C, T, F>(
+    data: &[C],
+    offset: usize,
+    k: usize,
+    largest: bool,
+    get: F,
+) -> Vec<Candidate<T>>
+where
+    T: Numeric,
+    F: Fn(&C) -> T,
+{
+    let mut heap = BinaryHeap::with_capacity(k);
+    for (i, cell) in data.iter().enumerate() {
+        let candidate = Candidate {
+            value: get(cell),
+            index: offset + i,
+            largest,
+        };
+        if heap.len() < k {
+            heap.push(candidate);
+        } else if let Some(mut worst) = heap.peek_mut() {
+            if candidate < *worst {
+                *worst = candidate;
+            }
+        }
+    }
+    heap.into_vec()
+}
+
+/// Keep the k best candidates in preference order
+fn select_sorted<T: Numeric>(mut candidates: Vec<Candidate<T>>, k: usize) -> Vec<Candidate<T>> {
+    if k == 0 {
+        return Vec::new();
+    }
+    if k < candidates.len() {
+        candidates.select_nth_unstable(k - 1);
+        candidates.truncate(k);
+    }
+    candidates.sort_unstable();
+    candidates
+}
+
+fn top_k_impl<T>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    k: usize,
+    largest: bool,
+) -> PyResult<Vec<Candidate<T>>>
+where
+    T: Element + Numeric,
+{
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let len = slice.len();
+    let use_heap = k.saturating_mul(HEAP_RATIO) <= len;
+
+    #[cfg(feature = "parallel")]
+    {
+        // Per-chunk heaps only pay off while k is small relative to a chunk
+        if use_heap
+            && k.saturating_mul(HEAP_RATIO) <= PAR_CHUNK
+            && should_parallelize(len, PARALLEL_THRESHOLD_SELECT)
+        {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            let merged: Vec<Candidate<T>> = data
+                .par_chunks(PAR_CHUNK)
+                .enumerate()
+                .flat_map_iter(|(i, chunk)| {
+                    heap_select(chunk, i * PAR_CHUNK, k, largest, |v: &T| *v)
+                })
+                .collect();
+            return Ok(select_sorted(merged, k));
+        }
+    }
+
+    let candidates = if use_heap {
+        heap_select(slice, 0, k, largest, |cell| cell.get())
+    } else {
+        slice
+            .iter()
+            .enumerate()
+            .map(|(index, cell)| Candidate {
+                value: cell.get(),
+                index,
+                largest,
+            })
+            .collect()
+    };
+    Ok(select_sorted(candidates, k))
+}
+
+fn top_k_result<T>(
+    py: Python<'_>,
+    candidates: &[Candidate<T>],
+    typecode: TypeCode,
+    input_type: InputType,
+    len: usize,
+    return_indices: bool,
+) -> PyResult<PyObject>
+where
+    T: Element + Numeric + for<'py> IntoPyObject<'py>,
+{
+    let values: Vec<T> = candidates.iter().map(|c| c.value).collect();
+    let values = create_result_array_from_slice(py, typecode, input_type, &values)?;
+    if !return_indices {
+        return Ok(values);
+    }
+    let indices = if u32::try_from(len).is_ok() {
+        let indices: Vec<u32> = candidates.iter().map(|c| c.index as u32).collect();
+        create_result_array_from_slice(py, TypeCode::UInt32, input_type, &indices)?
+    } else {
+        let indices: Vec<u64> = candidates.iter().map(|c| c.index as u64).collect();
+        create_result_array_from_slice(py, TypeCode::UInt64, input_type, &indices)?
+    };
+    (values, indices).into_py_any(py)
+}
+
+/// The k largest (or smallest) values of an array, best first
+///
+/// Returns min(k, len) values in the input's container type. NaN ranks after every
+/// number in both directions; ties keep the earlier element first. With
+/// `return_indices=True` a (values, indices) tuple is returned; indices are uint32
+/// ('I') when the input has fewer than 2**32 elements and uint64 ('L') otherwise.
+#[pyfunction]
+#[pyo3(signature = (array, k, largest = true, return_indices = false))]
+pub fn top_k(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    k: usize,
+    largest: bool,
+    return_indices: bool,
+) -> PyResult<PyObject> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    let len = get_array_len(array)?;
+    if len == 0 || k == 0 {
+        let values = create_empty_result_array(py, typecode, input_type)?;
+        if !return_indices {
+            return Ok(values);
+        }
+        let indices = create_empty_result_array(py, TypeCode::UInt32, input_type)?;
+        return (values, indices).into_py_any(py);
+    }
+
+    crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        let candidates = top_k_impl(py, &buffer, k, largest)?;
+        top_k_result(py, &candidates, typecode, input_type, len, return_indices)
+    })
+}
@@ -0,0 +1,323 @@
+use std::cell::Cell;
+use std::collections::HashSet;
+
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::PyTypeError;
+use pyo3::prelude::*;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::buffer::{create_empty_result_array, create_result_array_from_slice, get_array_len};
+use crate::hashing::MixBuildHasher;
+use crate::operations::mask::positions;
+use crate::operations::radix::{radix_sort, RadixKey, RADIX_THRESHOLD};
+use crate::operations::search::gallop;
+use crate::types::TypeCode;
+use crate::validation::{validate_same_type, InputType};
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_SEARCH};
+
+// Elements per parallel membership task
+#[cfg(feature = "parallel")]
+const PAR_CHUNK: usize = 65_536;
+
+#[inline(always)]
+fn key<T: RadixKey>(value: &T) -> u64 {
+    value.radix_key()
+}
+
+fn is_sorted<C, T, F>(data: &[C], get: F) -> bool
+where
+    T: RadixKey,
+    F: Fn(&C) -> T,
+{
+    data.windows(2)
+        .all(|pair| key(&get(&pair[0])) <= key(&get(&pair[1])))
+}
+
+/// Distinct values of `data` in ascending order (NaN last)
+///
+/// Already sorted input, such as the output of `unique()`, skips the sort. -0.0 and
+/// 0.0 are one value, as are all NaNs; the first one seen is kept.
+fn sorted_distinct<T: RadixKey>(mut data: Vec<T>) -> Vec<T> {
+    if !is_sorted(&data, |x: &T| *x) {
+        if T::BYTES >= 4 && data.len() >= RADIX_THRESHOLD {
+            radix_sort(Cell::from_mut(data.as_mut_slice()).as_slice_of_cells());
+        } else {
+            // Stable, so the first of -0.0 and 0.0 survives the dedup
+            data.sort_by_key(key);
+        }
+    }
+    data.dedup_by_key(|value| key(value));
+    data
+}
+
+/// Position of `value` in sorted `data` at or after `from`, and whether it is there
+#[inline]
+fn seek<T: RadixKey>(data: &[T], from: usize, value: u64) -> (usize, bool) {
+    let at = gallop(data, &key, from, &|x| x < value);
+    (at, at < data.len() && key(&data[at]) == value)
+}
+
+/// Values of sorted distinct `a` that are also in sorted distinct `b`
+///
+/// Walks the shorter input and gallops through the longer one, so skewed sizes
+/// cost O(m log(n/m)) rather than O(n + m).
+fn intersect_sorted<T: RadixKey>(a: &[T], b: &[T]) -> Vec<T> {
+    let a_is_short = a.len() <= b.len();
+    let (short, long) = if a_is_short { (a, b) } else { (b, a) };
+    let mut out = Vec::new();
+    let mut cursor = 0;
+    for value in short {
+        let (at, found) = seek(long, cursor, key(value));
+        if found {
+            out.push(if a_is_short { *value } else { long[at] });
+        }
+        cursor = at;
+    }
+    out
+}
+
+/// Values in either sorted distinct input, copying whole runs found by galloping
+fn union_sorted<T: RadixKey>(a: &[T], b: &[T]) -> Vec<T> {
+    let mut out = Vec::with_capacity(a.len() + b.len());
+    let (mut i, mut j) = (0, 0);
+    while i < a.len() && j < b.len() {
+        let (ka, kb) = (key(&a[i]), key(&b[j]));
+        if ka < kb {
+            let end = gallop(a, &key, i, &|x| x < kb);
+            out.extend_from_slice(&a[i..end]);
+            i = end;
+        } else if kb < ka {
+            let end = gallop(b, &key, j, &|x| x < ka);
+            out.extend_from_slice(&b[j..end]);
+            j = end;
+        } else {
+            out.push(a[i]);
+            i += 1;
+            j += 1;
+        }
+    }
+    out.extend_from_slice(&a[i..]);
+    out.extend_from_slice(&b[j..]);
+    out
+}
+
+/// Values of sorted distinct `a` that are not in sorted distinct `b`
+fn difference_sorted<T: RadixKey>(a: &[T], b: &[T]) -> Vec<T> {
+    let mut out = Vec::new();
+    let mut cursor = 0;
+    for value in a {
+        let (at, found) = seek(b, cursor, key(value));
+        if !found {
+            out.push(*value);
+        }
+        cursor = at;
+    }
+    out
+}
+
+#[derive(Clone, Copy)]
+enum SetOp {
+    Intersect,
+    Union,
+    Difference,
+}
+
+fn values_of<T: Element + Copy>(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<Vec<T>> {
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(array)? == 0 {
+        return Ok(Vec::new());
+    }
+    PyBuffer::<T>::get(array)?.to_vec(py)
+}
+
+/// `buffer` holds `a`, or `b` when `a` is empty
+fn set_op_impl<T>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    a_is_empty: bool,
+    b: &Bound<'_, PyAny>,
+    op: SetOp,
+    typecode: TypeCode,
+    input_type: InputType,
+) -> PyResult<PyObject>
+where
+    T: Element + RadixKey + for<'py> IntoPyObject<'py>,
+{
+    let (a, b) = if a_is_empty {
+        (Vec::new(), buffer.to_vec(py)?)
+    } else {
+        (buffer.to_vec(py)?, values_of(py, b)?)
+    };
+    let (a, b) = (sorted_distinct(a), sorted_distinct(b));
+    let result = match op {
+        SetOp::Intersect => intersect_sorted(&a, &b),
+        SetOp::Union => union_sorted(&a, &b),
+        SetOp::Difference => difference_sorted(&a, &b),
+    };
+    create_result_array_from_slice(py, typecode, input_type, &result)
+}
+
+fn set_op(
+    py: Python<'_>,
+    a: &Bound<'_, PyAny>,
+    b: &Bound<'_, PyAny>,
+    op: SetOp,
+) -> PyResult<PyObject> {
+    let (typecode, input_type, _) = validate_same_type(a, b)?;
+    let a_is_empty = get_array_len(a)? == 0;
+    if a_is_empty && get_array_len(b)? == 0 {
+        return create_empty_result_array(py, typecode, input_type);
+    }
+
+    let probe = if a_is_empty { b } else { a };
+    crate::dispatch_by_typecode!(typecode, probe, |buffer| {
+        set_op_impl(py, &buffer, a_is_empty, b, op, typecode, input_type)
+    })
+}
+
+/// Sorted distinct values present in both arrays
+///
+/// Inputs that are already sorted (for example from `unique()`) are merged
+/// directly; others are sorted first. The result keeps the container type of `a`.
+#[pyfunction]
+pub fn intersect1d(
+    py: Python<'_>,
+    a: &Bound<'_, PyAny>,
+    b: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    set_op(py, a, b, SetOp::Intersect)
+}
+
+/// Sorted distinct values present in either array
+#[pyfunction]
+pub fn union1d(py: Python<'_>, a: &Bound<'_, PyAny>, b: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+    set_op(py, a, b, SetOp::Union)
+}
+
+/// Sorted distinct values of `a` that are not in `b`
+#[pyfunction]
+pub fn setdiff1d(py: Python<'_>, a: &Bound<'_, PyAny>, b: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+    set_op(py, a, b, SetOp::Difference)
+}
+
+/// The values of `isin`, prepared once for the shape of the data
+enum Lookup<T> {
+    /// Sorted distinct values, merged against sorted data
+    Sorted(Vec<T>),
+    /// Keys of the values, probed by every element of unsorted data
+    Hashed(HashSet<u64, MixBuildHasher>),
+}
+
+impl<T: RadixKey> Lookup<T> {
+    /// Sort the values only when the data is sorted and will be merged against them
+    fn new(values: Vec<T>, data_sorted: bool) -> Self {
+        if data_sorted {
+            Lookup::Sorted(sorted_distinct(values))
+        } else {
+            Lookup::Hashed(values.iter().map(key).collect())
+        }
+    }
+}
+
+/// Membership flag (1 or 0) of every element of `data` in the values of `lookup`
+fn membership<C, T, F>(data: &[C], get: F, lookup: &Lookup<T>, out: &mut [u8])
+where
+    T: RadixKey,
+    F: Fn(&C) -> T,
+{
+    match lookup {
+        Lookup::Sorted(values) => {
+            // Sorted data: one galloping merge against the values
+            let mut cursor = 0;
+            for (x, flag) in data.iter().zip(out.iter_mut()) {
+                let (at, found) = seek(values, cursor, key(&get(x)));
+                *flag = found as u8;
+                cursor = at;
+            }
+        }
+        Lookup::Hashed(set) => {
+            for (x, flag) in data.iter().zip(out.iter_mut()) {
+                *flag = set.contains(&key(&get(x))) as u8;
+            }
+        }
+    }
+}
+
+fn isin_impl<T>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    values: &Bound<'_, PyAny>,
+) -> PyResult<Vec<u8>>
+where
+    T: Element + RadixKey,
+{
+    let values = values_of(py, values)?;
+    let mut mask = vec![0u8; buffer.item_count()];
+    if values.is_empty() {
+        return Ok(mask);
+    }
+
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(mask.len(), PARALLEL_THRESHOLD_SEARCH) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            let lookup = Lookup::new(values, is_sorted(&data, |x: &T| *x));
+            data.par_chunks(PAR_CHUNK)
+                .zip(mask.par_chunks_mut(PAR_CHUNK))
+                .for_each(|(data, mask)| membership(data, |x: &T| *x, &lookup, mask));
+            return Ok(mask);
+        }
+    }
+
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let lookup = Lookup::new(values, is_sorted(slice, |cell| cell.get()));
+    membership(slice, |cell| cell.get(), &lookup, &mut mask);
+    Ok(mask)
+}
+
+/// Membership test of every element of `array` in `values`
+///
+/// Returns a uint8 mask (1 where the element occurs in `values`) in the container type
+/// of `array`, or with `return_indices=True` the positions of the matching elements
+/// (uint32 below 2**32 elements, uint64 otherwise). Sorted inputs are merged with
+/// galloping search; otherwise elements are probed in a hash set of the values.
+/// NaN matches NaN, and -0.0 matches 0.0.
+#[pyfunction]
+#[pyo3(signature = (array, values, return_indices = false))]
+pub fn isin(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    values: &Bound<'_, PyAny>,
+    return_indices: bool,
+) -> PyResult<PyObject> {
+    let (typecode, input_type, _) = validate_same_type(array, values)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    let len = get_array_len(array)?;
+    if len == 0 {
+        let result_typecode = if return_indices {
+            TypeCode::UInt32
+        } else {
+            TypeCode::UInt8
+        };
+        return create_empty_result_array(py, result_typecode, input_type);
+    }
+
+    let mask =
+        crate::dispatch_by_typecode!(typecode, array, |buffer| { isin_impl(py, &buffer, values) })?;
+    if !return_indices {
+        create_result_array_from_slice(py, TypeCode::UInt8, input_type, &mask)
+    } else if u32::try_from(len).is_ok() {
+        let indices = positions(&mask, |&flag| flag != 0, |i| i as u32);
+        create_result_array_from_slice(py, TypeCode::UInt32, input_type, &indices)
+    } else {
+        let indices = positions(&mask, |&flag| flag != 0, |i| i as u64);
+        create_result_array_from_slice(py, TypeCode::UInt64, input_type, &indices)
+    }
+}
@@ -4,7 +4,8 @@ use pyo3::prelude::*;
 use pyo3::IntoPyObjectExt;
 
 use crate::buffer::{get_array_len, get_itemsize};
-use crate::operations::basic;
+use crate::operations::radix::{CountingKey, KeyCounts};
+use crate::operations::{basic, bivariate};
 use crate::types::TypeCode;
 use crate::validation::{detect_input_type, get_typecode_unified, validate_for_operation};
 
@@ -56,7 +57,16 @@ where
 
 /// Variance operation for array.array, numpy.ndarray, or memoryview
 #[pyfunction]
-pub fn var(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<f64> {
+#[pyo3(signature = (array, weights = None))]
+pub fn var(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    weights: Option<&Bound<'_, PyAny>>,
+) -> PyResult<f64> {
+    if let Some(weights) = weights {
+        return Ok(bivariate::weighted_moments(py, array, weights, "var")?.1);
+    }
+
     let input_type = detect_input_type(array)?;
     validate_for_operation(array, input_type, false)?;
     let typecode = get_typecode_unified(array, input_type)?;
@@ -68,7 +78,7 @@ pub fn var(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<f64> {
     }
 
     // Calculate mean first
-    let mean_val = basic::mean(py, array)?;
+    let mean_val = basic::mean(py, array, None)?;
 
     match typecode {
         TypeCode::Int8 => {
@@ -152,8 +162,13 @@ pub fn var(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<f64> {
 
 /// Standard deviation operation for array.array, numpy.ndarray, or memoryview
 #[pyfunction(name = "std")]
-pub fn std_dev(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<f64> {
-    let variance = var(py, array)?;
+#[pyo3(signature = (array, weights = None))]
+pub fn std_dev(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    weights: Option<&Bound<'_, PyAny>>,
+) -> PyResult<f64> {
+    let variance = var(py, array, weights)?;
     Ok(variance.sqrt())
 }
 
@@ -177,6 +192,22 @@ where
     Ok(data[mid])
 }
 
+// Median for 8- and 16-bit integers: walk a counting table in O(n + range)
+fn median_impl_counting<T>(py: Python, buffer: &PyBuffer<T>) -> PyResult<T>
+where
+    T: Element + CountingKey + Ord,
+{
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+
+    // Lower median, as in median_impl_int
+    match KeyCounts::build(slice, |cell| cell.get()) {
+        Some(counts) => Ok(counts.select((slice.len() - 1) / 2)),
+        None => median_impl_int(py, buffer),
+    }
+}
+
 // Generic median implementation for float types (PartialOrd)
 fn median_impl_float<T>(py: Python, buffer: &PyBuffer<T>) -> PyResult<T>
 where
@@ -213,12 +244,12 @@ pub fn median(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<PyObject> {
     match typecode {
         TypeCode::Int8 => {
             let buffer = PyBuffer::<i8>::get(array)?;
-            let result = median_impl_int(py, &buffer)?;
+            let result = median_impl_counting(py, &buffer)?;
             result.into_py_any(py)
         }
         TypeCode::Int16 => {
             let buffer = PyBuffer::<i16>::get(array)?;
-            let result = median_impl_int(py, &buffer)?;
+            let result = median_impl_counting(py, &buffer)?;
             result.into_py_any(py)
         }
         TypeCode::Int32 => {
@@ -240,12 +271,12 @@ pub fn median(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<PyObject> {
         }
         TypeCode::UInt8 => {
             let buffer = PyBuffer::<u8>::get(array)?;
-            let result = median_impl_int(py, &buffer)?;
+            let result = median_impl_counting(py, &buffer)?;
             result.into_py_any(py)
         }
         TypeCode::UInt16 => {
             let buffer = PyBuffer::<u16>::get(array)?;
-            let result = median_impl_int(py, &buffer)?;
+            let result = median_impl_counting(py, &buffer)?;
             result.into_py_any(py)
         }
         TypeCode::UInt32 => {
@@ -0,0 +1,508 @@
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::{PyOverflowError, PyTypeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::IntoPyObjectExt;
+
+use crate::buffer::{create_result_array_from_slice, get_array_len, get_itemsize};
+use crate::numeric::{Integer, Numeric};
+use crate::types::TypeCode;
+use crate::validation::{
+    detect_input_type, get_typecode_unified, validate_array_pair, validate_for_operation,
+};
+
+// Independent accumulators per loop iteration so the reduction vectorizes
+const LANES: usize = 8;
+
+/// Sum of f(a[i], b[i]) over LANES partial sums, so the compiler can keep one SIMD
+/// register per accumulator instead of a single serial dependency chain
+#[inline(always)]
+fn lane_sum<C, F>(a: &[C], b: &[C], f: F) -> f64
+where
+    F: Fn(&C, &C) -> f64,
+{
+    let mut acc = [0.0f64; LANES];
+    let chunks_a = a.chunks_exact(LANES);
+    let chunks_b = b.chunks_exact(LANES);
+    let (rest_a, rest_b) = (chunks_a.remainder(), chunks_b.remainder());
+    for (xa, xb) in chunks_a.zip(chunks_b) {
+        for lane in 0..LANES {
+            acc[lane] += f(&xa[lane], &xb[lane]);
+        }
+    }
+    let mut total = acc.iter().sum::<f64>();
+    for (x, y) in rest_a.iter().zip(rest_b) {
+        total += f(x, y);
+    }
+    total
+}
+
+/// Dot product, squared norms and dot product of a and b in one pass (for cosine)
+fn fused_cosine<C, F>(a: &[C], b: &[C], get: F) -> (f64, f64, f64)
+where
+    F: Fn(&C) -> f64,
+{
+    let mut ab = [0.0f64; LANES];
+    let mut aa = [0.0f64; LANES];
+    let mut bb = [0.0f64; LANES];
+    let chunks_a = a.chunks_exact(LANES);
+    let chunks_b = b.chunks_exact(LANES);
+    let (rest_a, rest_b) = (chunks_a.remainder(), chunks_b.remainder());
+    for (xa, xb) in chunks_a.zip(chunks_b) {
+        for lane in 0..LANES {
+            let (x, y) = (get(&xa[lane]), get(&xb[lane]));
+            ab[lane] += x * y;
+            aa[lane] += x * x;
+            bb[lane] += y * y;
+        }
+    }
+    let mut sums = (
+        ab.iter().sum::<f64>(),
+        aa.iter().sum::<f64>(),
+        bb.iter().sum::<f64>(),
+    );
+    for (x, y) in rest_a.iter().zip(rest_b) {
+        let (x, y) = (get(x), get(y));
+        sums.0 += x * y;
+        sums.1 += x * x;
+        sums.2 += y * y;
+    }
+    sums
+}
+
+fn cosine_from_sums(ab: f64, aa: f64, bb: f64) -> f64 {
+    // Zero vectors have no direction; follow corr() and report NaN
+    (ab / (aa.sqrt() * bb.sqrt())).clamp(-1.0, 1.0)
+}
+
+/// Exact dot product for integer types (i128 accumulator) and f64 for floats
+trait DotProduct: Element + Numeric {
+    /// None if an integer result does not fit in 128 bits
+    fn dot<C, F>(a: &[C], b: &[C], get: F) -> Option<DotValue>
+    where
+        F: Fn(&C) -> Self;
+}
+
+enum DotValue {
+    Int(i128),
+    Float(f64),
+}
+
+impl DotValue {
+    fn to_f64(&self) -> f64 {
+        match *self {
+            DotValue::Int(value) => value as f64,
+            DotValue::Float(value) => value,
+        }
+    }
+}
+
+// Products of 8- and 16-bit values stay below 2^32 in magnitude, so an i64 lane can
+// absorb 2^31 of them; blocks hand each lane far fewer before widening to i128
+const DOT_BLOCK: usize = 1 << 20;
+
+/// Exact dot product of values up to 16 bits wide: i64 lanes within a block, i128
+/// across blocks, with no per-element overflow checks
+fn dot_narrow<C, F>(a: &[C], b: &[C], get: F) -> i128
+where
+    F: Fn(&C) -> i64,
+{
+    let mut total = 0i128;
+    for (block_a, block_b) in a.chunks(DOT_BLOCK).zip(b.chunks(DOT_BLOCK)) {
+        let mut lanes = [0i64; LANES];
+        let chunks_a = block_a.chunks_exact(LANES);
+        let chunks_b = block_b.chunks_exact(LANES);
+        let (rest_a, rest_b) = (chunks_a.remainder(), chunks_b.remainder());
+        for (xa, xb) in chunks_a.zip(chunks_b) {
+            for lane in 0..LANES {
+                lanes[lane] += get(&xa[lane]) * get(&xb[lane]);
+            }
+        }
+        let rest: i64 = rest_a
+            .iter()
+            .zip(rest_b)
+            .map(|(x, y)| get(x) * get(y))
+            .sum();
+        total += (lanes.iter().sum::<i64>() + rest) as i128;
+    }
+    total
+}
+
+/// Exact dot product of 32-bit values
+///
+/// Every product is exact in 64 bits and returned as its bit pattern; products are
+/// summed as in `sum()` of 64-bit values, in wrapping u64 lanes with per-lane carry
+/// counts (and -1 in the high word per negative product when `SIGNED`).
+fn dot_wide<const SIGNED: bool, C, F>(a: &[C], b: &[C], product: F) -> i128
+where
+    F: Fn(&C, &C) -> u64,
+{
+    let mut low = [0u64; LANES];
+    let mut high = [0i64; LANES];
+    let chunks_a = a.chunks_exact(LANES);
+    let chunks_b = b.chunks_exact(LANES);
+    let (rest_a, rest_b) = (chunks_a.remainder(), chunks_b.remainder());
+    for (xa, xb) in chunks_a.zip(chunks_b) {
+        for lane in 0..LANES {
+            let value = product(&xa[lane], &xb[lane]);
+            let sum = low[lane].wrapping_add(value);
+            high[lane] += (sum < value) as i64 - (SIGNED && (value as i64) < 0) as i64;
+            low[lane] = sum;
+        }
+    }
+    let widen = |value: u64| {
+        if SIGNED {
+            value as i64 as i128
+        } else {
+            value as i128
+        }
+    };
+    let lanes: i128 = low
+        .iter()
+        .zip(high.iter())
+        .map(|(&low, &high)| ((high as i128) << 64) + low as i128)
+        .sum();
+    lanes
+        + rest_a
+            .iter()
+            .zip(rest_b)
+            .map(|(x, y)| widen(product(x, y)))
+            .sum::<i128>()
+}
+
+macro_rules! impl_dot_narrow {
+    ($($t:ty),*) => {
+        $(
+            impl DotProduct for $t {
+                fn dot<C, F>(a: &[C], b: &[C], get: F) -> Option<DotValue>
+                where
+                    F: Fn(&C) -> Self,
+                {
+                    Some(DotValue::Int(dot_narrow(a, b, |x| get(x) as i64)))
+                }
+            }
+        )*
+    };
+}
+
+macro_rules! impl_dot_wide {
+    ($($t:ty => $wide:ty, $signed:expr);*) => {
+        $(
+            impl DotProduct for $t {
+                fn dot<C, F>(a: &[C], b: &[C], get: F) -> Option<DotValue>
+                where
+                    F: Fn(&C) -> Self,
+                {
+                    Some(DotValue::Int(dot_wide::<$signed, C, _>(a, b, |x, y| {
+                        (get(x) as $wide * get(y) as $wide) as u64
+                    })))
+                }
+            }
+        )*
+    };
+}
+
+// 64-bit products need all of i128 and their sum can overflow it, so these check
+// every step
+macro_rules! impl_dot_checked {
+    ($($t:ty),*) => {
+        $(
+            impl DotProduct for $t {
+                fn dot<C, F>(a: &[C], b: &[C], get: F) -> Option<DotValue>
+                where
+                    F: Fn(&C) -> Self,
+                {
+                    let mut total: i128 = 0;
+                    for (x, y) in a.iter().zip(b) {
+                        let product = get(x).to_i128().checked_mul(get(y).to_i128())?;
+                        total = total.checked_add(product)?;
+                    }
+                    Some(DotValue::Int(total))
+                }
+            }
+        )*
+    };
+}
+
+macro_rules! impl_dot_float {
+    ($($t:ty),*) => {
+        $(
+            impl DotProduct for $t {
+                fn dot<C, F>(a: &[C], b: &[C], get: F) -> Option<DotValue>
+                where
+                    F: Fn(&C) -> Self,
+                {
+                    Some(DotValue::Float(lane_sum(a, b, |x, y| {
+                        get(x).to_f64() * get(y).to_f64()
+                    })))
+                }
+            }
+        )*
+    };
+}
+
+impl_dot_narrow!(i8, i16, u8, u16);
+impl_dot_wide!(i32 => i64, true; u32 => u64, false);
+impl_dot_checked!(i64, u64);
+impl_dot_float!(f32, f64);
+
+fn dot_impl<T: DotProduct>(
+    py: Python<'_>,
+    buffer1: &PyBuffer<T>,
+    buffer2: &PyBuffer<T>,
+) -> PyResult<DotValue> {
+    let slice1 = buffer1
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let slice2 = buffer2
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    T::dot(slice1, slice2, |cell| cell.get())
+        .ok_or_else(|| PyOverflowError::new_err("integer overflow in dot()"))
+}
+
+fn cosine_impl<T: Element + Numeric>(
+    py: Python<'_>,
+    buffer1: &PyBuffer<T>,
+    buffer2: &PyBuffer<T>,
+) -> PyResult<(f64, f64, f64)> {
+    let slice1 = buffer1
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let slice2 = buffer2
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    Ok(fused_cosine(slice1, slice2, |cell| cell.get().to_f64()))
+}
+
+#[derive(Clone, Copy)]
+enum NormOrd {
+    One,
+    Two,
+    Inf,
+}
+
+impl NormOrd {
+    fn from_f64(ord: f64) -> PyResult<Self> {
+        if ord == 1.0 {
+            Ok(NormOrd::One)
+        } else if ord == 2.0 {
+            Ok(NormOrd::Two)
+        } else if ord == f64::INFINITY {
+            Ok(NormOrd::Inf)
+        } else {
+            Err(PyValueError::new_err("ord must be 1, 2 or inf"))
+        }
+    }
+}
+
+fn norm_impl<T: Element + Numeric>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    ord: NormOrd,
+) -> PyResult<f64> {
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let get = |cell: &pyo3::buffer::ReadOnlyCell<T>| cell.get().to_f64();
+    Ok(match ord {
+        NormOrd::One => lane_sum(slice, slice, |x, _| get(x).abs()),
+        NormOrd::Two => lane_sum(slice, slice, |x, _| {
+            let value = get(x);
+            value * value
+        })
+        .sqrt(),
+        // NaN propagates: once acc is NaN no comparison can replace it
+        NormOrd::Inf => slice.iter().map(get).fold(0.0f64, |acc, value| {
+            let value = value.abs();
+            if value > acc || value.is_nan() {
+                value
+            } else {
+                acc
+            }
+        }),
+    })
+}
+
+/// Dot product of two arrays without an intermediate array
+///
+/// Integer arrays are accumulated exactly in 128 bits and return an int; float
+/// arrays accumulate in f64 and return a float.
+#[pyfunction]
+pub fn dot(py: Python<'_>, a: &Bound<'_, PyAny>, b: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+    let (typecode, len, _) = validate_array_pair(a, b)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if len == 0 {
+        return if matches!(typecode, TypeCode::Float32 | TypeCode::Float64) {
+            0.0f64.into_py_any(py)
+        } else {
+            0i64.into_py_any(py)
+        };
+    }
+
+    let value = crate::dispatch_by_typecode!(typecode, a, |buffer1| {
+        let buffer2 = PyBuffer::get(b)?;
+        dot_impl(py, &buffer1, &buffer2)
+    })?;
+    match value {
+        DotValue::Int(value) => value.into_py_any(py),
+        DotValue::Float(value) => value.into_py_any(py),
+    }
+}
+
+/// Vector norm (ord 1, 2 or inf) of an array as a float
+#[pyfunction]
+#[pyo3(signature = (array, ord = 2.0))]
+pub fn norm(py: Python<'_>, array: &Bound<'_, PyAny>, ord: f64) -> PyResult<f64> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+    let ord = NormOrd::from_f64(ord)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(array)? == 0 {
+        return Ok(0.0);
+    }
+
+    crate::dispatch_by_typecode!(typecode, array, |buffer| { norm_impl(py, &buffer, ord) })
+}
+
+/// Cosine similarity of two arrays, fused into a single pass
+#[pyfunction]
+pub fn cosine(py: Python<'_>, a: &Bound<'_, PyAny>, b: &Bound<'_, PyAny>) -> PyResult<f64> {
+    let (typecode, len, _) = validate_array_pair(a, b)?;
+
+    // Handle empty arrays - raise ValueError
+    if len == 0 {
+        return Err(PyValueError::new_err("cosine() of empty array"));
+    }
+
+    let (ab, aa, bb) = crate::dispatch_by_typecode!(typecode, a, |buffer1| {
+        let buffer2 = PyBuffer::get(b)?;
+        cosine_impl(py, &buffer1, &buffer2)
+    })?;
+    Ok(cosine_from_sums(ab, aa, bb))
+}
+
+/// Check a batch candidate against the query with the same rules as `add()`
+fn validate_candidate(
+    candidate: &Bound<'_, PyAny>,
+    typecode: TypeCode,
+    len: usize,
+    itemsize: usize,
+) -> PyResult<()> {
+    let input_type = detect_input_type(candidate)?;
+    validate_for_operation(candidate, input_type, false)?;
+    if get_typecode_unified(candidate, input_type)? != typecode {
+        return Err(PyTypeError::new_err(
+            "Arrays must have the same type for element-wise operations",
+        ));
+    }
+    if get_array_len(candidate)? != len {
+        return Err(PyValueError::new_err(
+            "Arrays must have the same length for element-wise operations",
+        ));
+    }
+    if matches!(typecode, TypeCode::Int64 | TypeCode::UInt64)
+        && get_itemsize(candidate)? != itemsize
+    {
+        return Err(PyTypeError::new_err("Array itemsizes must match"));
+    }
+    Ok(())
+}
+
+#[derive(Clone, Copy)]
+enum BatchOp {
+    Dot,
+    Cosine,
+}
+
+fn batch_scores<T: DotProduct>(
+    py: Python<'_>,
+    query: &PyBuffer<T>,
+    candidates: &Bound<'_, PyAny>,
+    typecode: TypeCode,
+    itemsize: usize,
+    op: BatchOp,
+) -> PyResult<Vec<f64>> {
+    let query_slice = query
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let len = query_slice.len();
+    // The query norm is shared by every candidate
+    let query_sq = lane_sum(query_slice, query_slice, |x, _| {
+        let value = x.get().to_f64();
+        value * value
+    });
+
+    let mut scores = Vec::with_capacity(candidates.len().unwrap_or(0));
+    for candidate in candidates.try_iter()? {
+        let candidate = candidate?;
+        validate_candidate(&candidate, typecode, len, itemsize)?;
+        let buffer = PyBuffer::<T>::get(&candidate)?;
+        let slice = buffer
+            .as_slice(py)
+            .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+        scores.push(match op {
+            BatchOp::Dot => T::dot(query_slice, slice, |cell| cell.get())
+                .ok_or_else(|| PyOverflowError::new_err("integer overflow in dot_batch()"))?
+                .to_f64(),
+            BatchOp::Cosine => {
+                let (ab, _, bb) = fused_cosine(query_slice, slice, |cell| cell.get().to_f64());
+                cosine_from_sums(ab, query_sq, bb)
+            }
+        });
+    }
+    Ok(scores)
+}
+
+fn batch(
+    py: Python<'_>,
+    query: &Bound<'_, PyAny>,
+    candidates: &Bound<'_, PyAny>,
+    op: BatchOp,
+) -> PyResult<PyObject> {
+    let input_type = detect_input_type(query)?;
+    validate_for_operation(query, input_type, false)?;
+    let typecode = get_typecode_unified(query, input_type)?;
+    let itemsize = get_itemsize(query)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(query)? == 0 {
+        // Like cosine(), an empty query has no direction
+        if let BatchOp::Cosine = op {
+            return Err(PyValueError::new_err("cosine_batch() of empty array"));
+        }
+        let mut scores = Vec::new();
+        for candidate in candidates.try_iter()? {
+            validate_candidate(&candidate?, typecode, 0, itemsize)?;
+            scores.push(0.0);
+        }
+        return create_result_array_from_slice(py, TypeCode::Float64, input_type, &scores);
+    }
+
+    let scores = crate::dispatch_by_typecode!(typecode, query, |buffer| {
+        batch_scores(py, &buffer, candidates, typecode, itemsize, op)
+    })?;
+    create_result_array_from_slice(py, TypeCode::Float64, input_type, &scores)
+}
+
+/// Dot product of one query array with each of many candidate arrays
+#[pyfunction]
+pub fn dot_batch(
+    py: Python<'_>,
+    query: &Bound<'_, PyAny>,
+    candidates: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    batch(py, query, candidates, BatchOp::Dot)
+}
+
+/// Cosine similarity of one query array with each of many candidate arrays
+#[pyfunction]
+pub fn cosine_batch(
+    py: Python<'_>,
+    query: &Bound<'_, PyAny>,
+    candidates: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    batch(py, query, candidates, BatchOp::Cosine)
+}
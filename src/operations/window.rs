@@ -0,0 +1,494 @@
+use std::cell::Cell;
+use std::collections::VecDeque;
+
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::prelude::*;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::buffer::{
+    allocate_result_array, buffers_overlap, check_out_array, create_empty_result_array,
+    create_result_array_from_vec, get_array_len, write_result_to_out,
+};
+use crate::numeric::Numeric;
+use crate::types::TypeCode;
+use crate::validation::{detect_input_type, get_typecode_unified, validate_for_operation};
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_WINDOW};
+
+// Output positions per parallel task; each task re-reads `window` inputs to warm up
+#[cfg(feature = "parallel")]
+const WINDOW_CHUNK: usize = 65_536;
+
+#[derive(Clone, Copy)]
+enum RollingOp {
+    Sum,
+    Mean,
+    Var(usize),
+    Std(usize),
+    Min,
+    Max,
+}
+
+// Running sum with Neumaier compensation; infinities are counted separately so that
+// an inf leaving the window does not leave NaN behind (inf - inf) in the running sum.
+#[derive(Default)]
+struct RunningSum {
+    sum: f64,
+    compensation: f64,
+    count: usize,
+    pos_inf: usize,
+    neg_inf: usize,
+}
+
+impl RunningSum {
+    #[inline(always)]
+    fn update(&mut self, value: f64, sign: f64) {
+        if value.is_nan() {
+            return;
+        }
+        if sign > 0.0 {
+            self.count += 1;
+        } else {
+            self.count -= 1;
+        }
+        if value.is_infinite() {
+            let counter = if value > 0.0 {
+                &mut self.pos_inf
+            } else {
+                &mut self.neg_inf
+            };
+            if sign > 0.0 {
+                *counter += 1;
+            } else {
+                *counter -= 1;
+            }
+        } else {
+            let x = sign * value;
+            let t = self.sum + x;
+            if self.sum.abs() >= x.abs() {
+                self.compensation += (self.sum - t) + x;
+            } else {
+                self.compensation += (x - t) + self.sum;
+            }
+            self.sum = t;
+        }
+        if self.count == 0 {
+            // Drop accumulated rounding error whenever the window empties
+            self.sum = 0.0;
+            self.compensation = 0.0;
+        }
+    }
+
+    #[inline(always)]
+    fn value(&self) -> f64 {
+        match (self.pos_inf > 0, self.neg_inf > 0) {
+            (true, true) => f64::NAN,
+            (true, false) => f64::INFINITY,
+            (false, true) => f64::NEG_INFINITY,
+            (false, false) => self.sum + self.compensation,
+        }
+    }
+}
+
+// Welford mean / sum of squared deviations with removal
+#[derive(Default)]
+struct RunningMoments {
+    mean: f64,
+    m2: f64,
+    count: usize,
+    nonfinite: usize,
+}
+
+impl RunningMoments {
+    #[inline(always)]
+    fn add(&mut self, value: f64) {
+        if value.is_nan() {
+            return;
+        }
+        self.count += 1;
+        if value.is_infinite() {
+            self.nonfinite += 1;
+            return;
+        }
+        let finite = (self.count - self.nonfinite) as f64;
+        let delta = value - self.mean;
+        self.mean += delta / finite;
+        self.m2 += delta * (value - self.mean);
+    }
+
+    #[inline(always)]
+    fn remove(&mut self, value: f64) {
+        if value.is_nan() {
+            return;
+        }
+        self.count -= 1;
+        if value.is_infinite() {
+            self.nonfinite -= 1;
+            return;
+        }
+        let finite = self.count - self.nonfinite;
+        if finite == 0 {
+            self.mean = 0.0;
+            self.m2 = 0.0;
+            return;
+        }
+        let delta = value - self.mean;
+        self.mean -= delta / finite as f64;
+        self.m2 -= delta * (value - self.mean);
+        if finite == 1 {
+            self.m2 = 0.0;
+        }
+    }
+
+    #[inline(always)]
+    fn variance(&self, ddof: usize) -> f64 {
+        if self.nonfinite > 0 || self.count <= ddof {
+            return f64::NAN;
+        }
+        self.m2.max(0.0) / (self.count - ddof) as f64
+    }
+}
+
+// Each kernel fills out[j] with the statistic of the trailing window ending at input
+// position start + j, reading inputs through `at`, so independent output chunks can
+// be computed in parallel and the serial path can read and write Python buffers
+// directly.
+fn rolling_sum_kernel<T, A>(
+    at: &A,
+    start: usize,
+    out: &[Cell<f64>],
+    window: usize,
+    min_periods: usize,
+    mean: bool,
+) where
+    T: Numeric,
+    A: Fn(usize) -> T,
+{
+    let mut running = RunningSum::default();
+    for i in start.saturating_sub(window)..start {
+        running.update(at(i).to_f64(), 1.0);
+    }
+    for (i, slot) in (start..).zip(out) {
+        running.update(at(i).to_f64(), 1.0);
+        if i >= window {
+            running.update(at(i - window).to_f64(), -1.0);
+        }
+        slot.set(if running.count < min_periods {
+            f64::NAN
+        } else if mean {
+            running.value() / running.count as f64
+        } else {
+            running.value()
+        });
+    }
+}
+
+fn rolling_var_kernel<T, A>(
+    at: &A,
+    start: usize,
+    out: &[Cell<f64>],
+    window: usize,
+    min_periods: usize,
+    ddof: usize,
+    std: bool,
+) where
+    T: Numeric,
+    A: Fn(usize) -> T,
+{
+    let mut moments = RunningMoments::default();
+    for i in start.saturating_sub(window)..start {
+        moments.add(at(i).to_f64());
+    }
+    for (i, slot) in (start..).zip(out) {
+        moments.add(at(i).to_f64());
+        if i >= window {
+            moments.remove(at(i - window).to_f64());
+        }
+        slot.set(if moments.count < min_periods {
+            f64::NAN
+        } else if std {
+            moments.variance(ddof).sqrt()
+        } else {
+            moments.variance(ddof)
+        });
+    }
+}
+
+// Monotonic deque of indices: values are kept strictly worse-to-better from back to
+// front, so the front is always the extreme of the current window (amortized O(1)).
+fn rolling_extreme_kernel<T, A, const MAX: bool>(
+    at: &A,
+    start: usize,
+    out: &[Cell<f64>],
+    window: usize,
+    min_periods: usize,
+) where
+    T: Numeric,
+    A: Fn(usize) -> T,
+{
+    let end = start + out.len();
+    let mut deque: VecDeque<usize> = VecDeque::with_capacity(window.min(end) + 1);
+    let mut count = 0usize;
+    let warm = start.saturating_sub(window);
+    for i in warm..end {
+        let value = at(i);
+        if !value.is_nan() {
+            count += 1;
+            while let Some(&back) = deque.back() {
+                let dominated = if MAX {
+                    at(back) <= value
+                } else {
+                    at(back) >= value
+                };
+                if !dominated {
+                    break;
+                }
+                deque.pop_back();
+            }
+            deque.push_back(i);
+        }
+        if i >= warm + window {
+            if !at(i - window).is_nan() {
+                count -= 1;
+            }
+            if deque.front().is_some_and(|&front| front + window <= i) {
+                deque.pop_front();
+            }
+        }
+        if i >= start {
+            out[i - start].set(match deque.front() {
+                Some(&front) if count >= min_periods => at(front).to_f64(),
+                _ => f64::NAN,
+            });
+        }
+    }
+}
+
+fn rolling_kernel<T, A>(
+    at: &A,
+    start: usize,
+    out: &[Cell<f64>],
+    window: usize,
+    min_periods: usize,
+    op: RollingOp,
+) where
+    T: Numeric,
+    A: Fn(usize) -> T,
+{
+    match op {
+        RollingOp::Sum => rolling_sum_kernel(at, start, out, window, min_periods, false),
+        RollingOp::Mean => rolling_sum_kernel(at, start, out, window, min_periods, true),
+        RollingOp::Var(ddof) => {
+            rolling_var_kernel(at, start, out, window, min_periods, ddof, false)
+        }
+        RollingOp::Std(ddof) => rolling_var_kernel(at, start, out, window, min_periods, ddof, true),
+        RollingOp::Min => {
+            rolling_extreme_kernel::<T, A, false>(at, start, out, window, min_periods)
+        }
+        RollingOp::Max => rolling_extreme_kernel::<T, A, true>(at, start, out, window, min_periods),
+    }
+}
+
+/// Compute the rolling statistic of `buffer` into `out`
+///
+/// The serial path reads the input buffer in place and writes every result straight
+/// into `out`. Only when `out` shares memory with the input (`overlap`, e.g. `out=`
+/// is the input) is the input copied first, so no window reads an overwritten value.
+fn rolling_impl<T>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    out: &[Cell<f64>],
+    overlap: bool,
+    window: usize,
+    min_periods: usize,
+    op: RollingOp,
+) -> PyResult<()>
+where
+    T: Element + Numeric,
+{
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(out.len(), PARALLEL_THRESHOLD_WINDOW) && window <= WINDOW_CHUNK {
+            // Python buffers cannot be shared across threads, so the workers read a
+            // copy of the input and fill a staging buffer that is copied out once
+            let data = extract_buffer_to_vec(py, buffer)?;
+            let mut staged = vec![0.0f64; out.len()];
+            staged
+                .par_chunks_mut(WINDOW_CHUNK)
+                .enumerate()
+                .for_each(|(chunk_index, chunk)| {
+                    rolling_kernel(
+                        &|i| data[i],
+                        chunk_index * WINDOW_CHUNK,
+                        Cell::from_mut(chunk).as_slice_of_cells(),
+                        window,
+                        min_periods,
+                        op,
+                    )
+                });
+            for (slot, &value) in out.iter().zip(&staged) {
+                slot.set(value);
+            }
+            return Ok(());
+        }
+    }
+
+    if overlap {
+        let data = buffer.to_vec(py)?;
+        rolling_kernel(&|i| data[i], 0, out, window, min_periods, op);
+    } else {
+        let cells = buffer
+            .as_slice(py)
+            .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+        rolling_kernel(&|i| cells[i].get(), 0, out, window, min_periods, op);
+    }
+    Ok(())
+}
+
+fn rolling(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    window: usize,
+    min_periods: Option<usize>,
+    op: RollingOp,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+
+    if window == 0 {
+        return Err(PyValueError::new_err("window must be >= 1"));
+    }
+    let min_periods = min_periods.unwrap_or(window);
+    if min_periods == 0 || min_periods > window {
+        return Err(PyValueError::new_err(
+            "min_periods must be between 1 and window",
+        ));
+    }
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    let len = get_array_len(array)?;
+    if len == 0 {
+        return match out {
+            Some(out) => write_result_to_out::<f64>(py, out, TypeCode::Float64, &[]),
+            None => create_empty_result_array(py, TypeCode::Float64, input_type),
+        };
+    }
+
+    // Results are written straight into `out`, or into a float64 array allocated up front
+    let result = match out {
+        Some(out) => {
+            check_out_array::<f64>(out, TypeCode::Float64, len)?;
+            Some(out.clone())
+        }
+        None => allocate_result_array::<f64>(py, TypeCode::Float64, input_type, len)?,
+    };
+
+    match result {
+        Some(result) => {
+            let target = PyBuffer::<f64>::get(&result)?;
+            let cells = target
+                .as_mut_slice(py)
+                .ok_or_else(|| PyTypeError::new_err("Failed to get mutable buffer slice"))?;
+            crate::dispatch_by_typecode!(typecode, array, |buffer| {
+                let overlap = buffers_overlap(&buffer, &target);
+                rolling_impl(py, &buffer, cells, overlap, window, min_periods, op)
+            })?;
+            Ok(result.unbind())
+        }
+        None => {
+            // Arrow results are built from a native buffer
+            let mut values = vec![0.0f64; len];
+            let cells = Cell::from_mut(&mut values[..]).as_slice_of_cells();
+            crate::dispatch_by_typecode!(typecode, array, |buffer| {
+                rolling_impl(py, &buffer, cells, false, window, min_periods, op)
+            })?;
+            create_result_array_from_vec(py, TypeCode::Float64, input_type, values)
+        }
+    }
+}
+
+/// Rolling (trailing window) sum for array.array, numpy.ndarray, or memoryview
+#[pyfunction]
+#[pyo3(signature = (array, window, min_periods = None, out = None))]
+pub fn rolling_sum(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    window: usize,
+    min_periods: Option<usize>,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    rolling(py, array, window, min_periods, RollingOp::Sum, out)
+}
+
+/// Rolling (trailing window) mean for array.array, numpy.ndarray, or memoryview
+#[pyfunction]
+#[pyo3(signature = (array, window, min_periods = None, out = None))]
+pub fn rolling_mean(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    window: usize,
+    min_periods: Option<usize>,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    rolling(py, array, window, min_periods, RollingOp::Mean, out)
+}
+
+/// Rolling (trailing window) variance for array.array, numpy.ndarray, or memoryview
+#[pyfunction]
+#[pyo3(signature = (array, window, min_periods = None, ddof = 0, out = None))]
+pub fn rolling_var(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    window: usize,
+    min_periods: Option<usize>,
+    ddof: usize,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    rolling(py, array, window, min_periods, RollingOp::Var(ddof), out)
+}
+
+/// Rolling (trailing window) standard deviation for array.array, numpy.ndarray, or memoryview
+#[pyfunction]
+#[pyo3(signature = (array, window, min_periods = None, ddof = 0, out = None))]
+pub fn rolling_std(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    window: usize,
+    min_periods: Option<usize>,
+    ddof: usize,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    rolling(py, array, window, min_periods, RollingOp::Std(ddof), out)
+}
+
+/// Rolling (trailing window) minimum for array.array, numpy.ndarray, or memoryview
+#[pyfunction]
+#[pyo3(signature = (array, window, min_periods = None, out = None))]
+pub fn rolling_min(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    window: usize,
+    min_periods: Option<usize>,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    rolling(py, array, window, min_periods, RollingOp::Min, out)
+}
+
+/// Rolling (trailing window) maximum for array.array, numpy.ndarray, or memoryview
+#[pyfunction]
+#[pyo3(signature = (array, window, min_periods = None, out = None))]
+pub fn rolling_max(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    window: usize,
+    min_periods: Option<usize>,
+    out: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    rolling(py, array, window, min_periods, RollingOp::Max, out)
+}
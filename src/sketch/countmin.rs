@@ -0,0 +1,364 @@
+// Count-min sketch with a bounded heavy-hitter candidate set (pure Rust, no PyO3 types)
+//
+// The count-min table answers point queries with a one-sided error (estimates never
+// undercount). Alongside it a fixed number of candidate keys with the largest estimates
+// are kept, which is what top_k() reports. Both parts merge: counters add, and the
+// union of candidates is re-ranked against the merged table.
+
+use std::cmp::Reverse;
+use std::collections::{BinaryHeap, HashMap, TryReserveError};
+
+use crate::hashing::{mix64, MixBuildHasher};
+
+const MAGIC: &[u8; 4] = b"AOFS";
+const VERSION: u8 = 1;
+const HEADER_LEN: usize = 4 + 1 + 4 + 4 + 4 + 8 + 4;
+
+pub(crate) const MAX_DEPTH: usize = 16;
+
+#[derive(Clone, Debug)]
+pub(crate) struct CountMinTopK {
+    width: usize,
+    depth: usize,
+    capacity: usize,
+    counters: Vec<u64>,
+    candidates: HashMap<i128, u64, MixBuildHasher>,
+    // One (count, key) entry per candidate, smallest first. Counts only grow, so an
+    // entry may lag its candidate's count and the top is a lower bound on the
+    // smallest candidate; stale entries are refreshed only when they reach the top.
+    floor: BinaryHeap<Reverse<(u64, i128)>>,
+    total: u64,
+}
+
+#[inline(always)]
+fn key_hash(key: i128) -> u64 {
+    mix64(key as u64 ^ mix64((key >> 64) as u64))
+}
+
+impl CountMinTopK {
+    /// Create an empty sketch (callers validate the dimensions)
+    ///
+    /// Fails rather than aborting when the counter table cannot be allocated.
+    pub(crate) fn new(
+        width: usize,
+        depth: usize,
+        capacity: usize,
+    ) -> Result<Self, TryReserveError> {
+        debug_assert!(width >= 1 && width <= u32::MAX as usize);
+        debug_assert!((1..=MAX_DEPTH).contains(&depth) && capacity >= 1);
+        let mut counters = Vec::new();
+        counters.try_reserve_exact(width * depth)?;
+        counters.resize(width * depth, 0);
+        Ok(CountMinTopK {
+            width,
+            depth,
+            capacity,
+            counters,
+            candidates: HashMap::default(),
+            floor: BinaryHeap::new(),
+            total: 0,
+        })
+    }
+
+    pub(crate) fn width(&self) -> usize {
+        self.width
+    }
+
+    pub(crate) fn depth(&self) -> usize {
+        self.depth
+    }
+
+    pub(crate) fn capacity(&self) -> usize {
+        self.capacity
+    }
+
+    /// Number of values added (including merged sketches)
+    pub(crate) fn total(&self) -> u64 {
+        self.total
+    }
+
+    // Counter index for each row via double hashing and multiply-shift range reduction
+    #[inline(always)]
+    fn cells(&self, key: i128) -> [usize; MAX_DEPTH] {
+        let hash = key_hash(key);
+        let h1 = hash as u32;
+        let h2 = (hash >> 32) as u32 | 1;
+        let mut cells = [0usize; MAX_DEPTH];
+        for (row, cell) in cells.iter_mut().enumerate().take(self.depth) {
+            let g = h1.wrapping_add((row as u32).wrapping_mul(h2));
+            *cell = row * self.width + ((g as u64 * self.width as u64) >> 32) as usize;
+        }
+        cells
+    }
+
+    /// Record one occurrence of `key` (conservative update)
+    #[inline]
+    pub(crate) fn add(&mut self, key: i128) {
+        let cells = self.cells(key);
+        let cells = &cells[..self.depth];
+        let mut estimate = u64::MAX;
+        for &cell in cells {
+            estimate = estimate.min(self.counters[cell]);
+        }
+        let estimate = estimate.saturating_add(1);
+        // Only counters at the current minimum can be too small, so only raise those
+        for &cell in cells {
+            if self.counters[cell] < estimate {
+                self.counters[cell] = estimate;
+            }
+        }
+        self.total = self.total.saturating_add(1);
+        self.offer(key, estimate);
+    }
+
+    fn offer(&mut self, key: i128, estimate: u64) {
+        if let Some(count) = self.candidates.get_mut(&key) {
+            *count = estimate;
+        } else if self.candidates.len() < self.capacity {
+            self.candidates.insert(key, estimate);
+            self.floor.push(Reverse((estimate, key)));
+        } else if estimate > self.floor.peek().map_or(0, |entry| entry.0 .0)
+            && estimate > self.smallest()
+        {
+            // The top entry is a lower bound, so most offers stop at the first test
+            if let Some(Reverse((_, smallest_key))) = self.floor.pop() {
+                self.candidates.remove(&smallest_key);
+            }
+            self.candidates.insert(key, estimate);
+            self.floor.push(Reverse((estimate, key)));
+        }
+    }
+
+    /// Smallest candidate count, after bringing the stale entries that sit at the top
+    /// of the heap up to date (amortized O(log capacity))
+    fn smallest(&mut self) -> u64 {
+        while let Some(&Reverse((count, key))) = self.floor.peek() {
+            let current = self.candidates[&key];
+            if current == count {
+                return count;
+            }
+            self.floor.pop();
+            self.floor.push(Reverse((current, key)));
+        }
+        0
+    }
+
+    fn rebuild_floor(&mut self) {
+        self.floor = self
+            .candidates
+            .iter()
+            .map(|(&key, &count)| Reverse((count, key)))
+            .collect();
+    }
+
+    /// Estimated number of occurrences of `key` (never less than the true count)
+    pub(crate) fn estimate(&self, key: i128) -> u64 {
+        let cells = self.cells(key);
+        cells[..self.depth]
+            .iter()
+            .map(|&cell| self.counters[cell])
+            .min()
+            .unwrap_or(0)
+    }
+
+    /// Up to `k` candidates with the largest estimates, most frequent first
+    pub(crate) fn top_k(&self, k: usize) -> Vec<(i128, u64)> {
+        let mut ranked: Vec<(i128, u64)> = self
+            .candidates
+            .keys()
+            .map(|&key| (key, self.estimate(key)))
+            .collect();
+        ranked.sort_unstable_by(|a, b| b.1.cmp(&a.1).then(a.0.cmp(&b.0)));
+        ranked.truncate(k);
+        ranked
+    }
+
+    /// Fold in another sketch with the same width and depth
+    pub(crate) fn merge(&mut self, other: &CountMinTopK) -> Result<(), &'static str> {
+        if self.width != other.width || self.depth != other.depth {
+            return Err("cannot merge FrequencySketch instances with different width or depth");
+        }
+        for (counter, &value) in self.counters.iter_mut().zip(other.counters.iter()) {
+            *counter = counter.saturating_add(value);
+        }
+        self.total = self.total.saturating_add(other.total);
+
+        let mut keys: Vec<i128> = self.candidates.keys().copied().collect();
+        keys.extend(
+            other
+                .candidates
+                .keys()
+                .filter(|key| !self.candidates.contains_key(key)),
+        );
+        let mut ranked: Vec<(i128, u64)> = keys
+            .into_iter()
+            .map(|key| (key, self.estimate(key)))
+            .collect();
+        ranked.sort_unstable_by(|a, b| b.1.cmp(&a.1).then(a.0.cmp(&b.0)));
+        ranked.truncate(self.capacity);
+        self.candidates = ranked.into_iter().collect();
+        self.rebuild_floor();
+        Ok(())
+    }
+
+    /// Serialize to bytes (little-endian header, counters, then candidate keys)
+    pub(crate) fn serialize(&self) -> Vec<u8> {
+        let mut out =
+            Vec::with_capacity(HEADER_LEN + self.counters.len() * 8 + self.candidates.len() * 16);
+        out.extend_from_slice(MAGIC);
+        out.push(VERSION);
+        out.extend_from_slice(&(self.width as u32).to_le_bytes());
+        out.extend_from_slice(&(self.depth as u32).to_le_bytes());
+        out.extend_from_slice(&(self.capacity as u32).to_le_bytes());
+        out.extend_from_slice(&self.total.to_le_bytes());
+        out.extend_from_slice(&(self.candidates.len() as u32).to_le_bytes());
+        for &counter in &self.counters {
+            out.extend_from_slice(&counter.to_le_bytes());
+        }
+        let mut keys: Vec<i128> = self.candidates.keys().copied().collect();
+        keys.sort_unstable();
+        for key in keys {
+            out.extend_from_slice(&key.to_le_bytes());
+        }
+        out
+    }
+
+    /// Rebuild a sketch from `serialize()` output
+    pub(crate) fn deserialize(data: &[u8]) -> Result<Self, &'static str> {
+        const INVALID: &str = "invalid FrequencySketch data";
+        if data.len() < HEADER_LEN || &data[..4] != MAGIC {
+            return Err(INVALID);
+        }
+        if data[4] != VERSION {
+            return Err("unsupported FrequencySketch data version");
+        }
+        let read_u32 =
+            |at: usize| u32::from_le_bytes(data[at..at + 4].try_into().unwrap()) as usize;
+        let width = read_u32(5);
+        let depth = read_u32(9);
+        let capacity = read_u32(13);
+        let total = u64::from_le_bytes(data[17..25].try_into().unwrap());
+        let n_candidates = read_u32(25);
+        if width == 0
+            || !(1..=MAX_DEPTH).contains(&depth)
+            || capacity == 0
+            || n_candidates > capacity
+        {
+            return Err(INVALID);
+        }
+        let expected = width
+            .checked_mul(depth)
+            .and_then(|cells| cells.checked_mul(8))
+            .and_then(|bytes| bytes.checked_add(n_candidates * 16))
+            .and_then(|bytes| bytes.checked_add(HEADER_LEN));
+        if expected != Some(data.len()) {
+            return Err(INVALID);
+        }
+
+        let (counter_bytes, key_bytes) = data[HEADER_LEN..].split_at(width * depth * 8);
+        let mut sketch = CountMinTopK::new(width, depth, capacity)
+            .map_err(|_| "cannot allocate FrequencySketch counters")?;
+        for (counter, chunk) in sketch
+            .counters
+            .iter_mut()
+            .zip(counter_bytes.chunks_exact(8))
+        {
+            *counter = u64::from_le_bytes(chunk.try_into().unwrap());
+        }
+        sketch.total = total;
+        for chunk in key_bytes.chunks_exact(16) {
+            let key = i128::from_le_bytes(chunk.try_into().unwrap());
+            let estimate = sketch.estimate(key);
+            sketch.candidates.insert(key, estimate);
+        }
+        sketch.rebuild_floor();
+        Ok(sketch)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    // Zipf-like stream: key k appears (1000 / k) times, plus a long tail of singletons
+    fn skewed_stream() -> Vec<i128> {
+        let mut stream = Vec::new();
+        for key in 1..=200i128 {
+            for _ in 0..(1000 / key) {
+                stream.push(key);
+            }
+        }
+        stream.extend(10_000..60_000i128);
+        // Interleave deterministically so heavy keys are not all at the front
+        let n = stream.len();
+        (0..n).map(|i| stream[(i * 7919) % n]).collect()
+    }
+
+    #[test]
+    fn estimates_never_undercount() {
+        let mut sketch = CountMinTopK::new(1024, 4, 16).unwrap();
+        for key in skewed_stream() {
+            sketch.add(key);
+        }
+        for key in 1..=200i128 {
+            assert!(sketch.estimate(key) >= (1000 / key) as u64);
+        }
+        assert_eq!(CountMinTopK::new(1024, 4, 16).unwrap().estimate(-5), 0);
+    }
+
+    #[test]
+    fn top_k_finds_heavy_hitters() {
+        let mut sketch = CountMinTopK::new(2048, 5, 32).unwrap();
+        for key in skewed_stream() {
+            sketch.add(key);
+        }
+        let top: Vec<i128> = sketch.top_k(5).into_iter().map(|(key, _)| key).collect();
+        assert_eq!(top, vec![1, 2, 3, 4, 5]);
+        assert_eq!(sketch.top_k(1)[0].1, 1000);
+        assert_eq!(sketch.total(), skewed_stream().len() as u64);
+    }
+
+    #[test]
+    fn floor_tracks_smallest_candidate() {
+        let mut sketch = CountMinTopK::new(256, 4, 8).unwrap();
+        for key in skewed_stream() {
+            sketch.add(key);
+            assert_eq!(sketch.floor.len(), sketch.candidates.len());
+        }
+        let smallest = *sketch.candidates.values().min().unwrap();
+        assert_eq!(sketch.smallest(), smallest);
+    }
+
+    #[test]
+    fn merge_combines_shards() {
+        let stream = skewed_stream();
+        let (left, right) = stream.split_at(stream.len() / 3);
+        let mut a = CountMinTopK::new(2048, 5, 32).unwrap();
+        let mut b = CountMinTopK::new(2048, 5, 32).unwrap();
+        left.iter().for_each(|&key| a.add(key));
+        right.iter().for_each(|&key| b.add(key));
+        a.merge(&b).unwrap();
+        let top: Vec<i128> = a.top_k(3).into_iter().map(|(key, _)| key).collect();
+        assert_eq!(top, vec![1, 2, 3]);
+        assert!(a.estimate(1) >= 1000);
+        assert!(a.merge(&CountMinTopK::new(16, 5, 32).unwrap()).is_err());
+    }
+
+    #[test]
+    fn serialize_roundtrip() {
+        let mut sketch = CountMinTopK::new(64, 3, 4).unwrap();
+        for key in [u64::MAX as i128, -1, -1, 7, 7, 7] {
+            sketch.add(key);
+        }
+        let restored = CountMinTopK::deserialize(&sketch.serialize()).unwrap();
+        assert_eq!(restored.top_k(4), sketch.top_k(4));
+        assert_eq!(restored.total(), 6);
+        assert_eq!(
+            restored.estimate(u64::MAX as i128),
+            sketch.estimate(u64::MAX as i128)
+        );
+        assert!(CountMinTopK::deserialize(b"AOFS").is_err());
+        let bytes = sketch.serialize();
+        assert!(CountMinTopK::deserialize(&bytes[..bytes.len() - 1]).is_err());
+    }
+}
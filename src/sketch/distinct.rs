@@ -0,0 +1,210 @@
+use std::collections::HashSet;
+
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::buffer::get_array_len;
+use crate::hashing::{mix64, MixBuildHasher};
+use crate::numeric::Numeric;
+use crate::sketch::hyperloglog::{self, MAX_PRECISION, MIN_PRECISION};
+use crate::validation::{detect_input_type, get_typecode_unified, validate_for_operation};
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_HASH};
+
+fn check_precision(precision: u8) -> PyResult<()> {
+    if !(MIN_PRECISION..=MAX_PRECISION).contains(&precision) {
+        return Err(PyValueError::new_err(format!(
+            "precision must be between {} and {}",
+            MIN_PRECISION, MAX_PRECISION
+        )));
+    }
+    Ok(())
+}
+
+// Hash every element into the registers; large buffers are split into per-thread
+// sketches whose registers are max-merged, which is exact for HyperLogLog.
+fn hll_add_impl<T>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    sketch: &mut hyperloglog::HyperLogLog,
+) -> PyResult<()>
+where
+    T: Element + Numeric,
+{
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(buffer.item_count(), PARALLEL_THRESHOLD_HASH) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            let precision = sketch.precision();
+            let partial = data
+                .par_chunks(PARALLEL_THRESHOLD_HASH)
+                .map(|chunk| {
+                    let mut local = hyperloglog::HyperLogLog::new(precision);
+                    for &value in chunk {
+                        local.add_hash(mix64(value.key_bits()));
+                    }
+                    local
+                })
+                .reduce(
+                    || hyperloglog::HyperLogLog::new(precision),
+                    |mut a, b| {
+                        let _ = a.merge(&b);
+                        a
+                    },
+                );
+            return sketch.merge(&partial).map_err(PyValueError::new_err);
+        }
+    }
+
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    for cell in slice {
+        sketch.add_hash(mix64(cell.get().key_bits()));
+    }
+    Ok(())
+}
+
+fn hll_add(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    sketch: &mut hyperloglog::HyperLogLog,
+) -> PyResult<()> {
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(array)? == 0 {
+        return Ok(());
+    }
+
+    crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        hll_add_impl(py, &buffer, sketch)
+    })
+}
+
+/// HyperLogLog - Mergeable approximate distinct counter with fixed memory
+#[pyclass(module = "arrayops")]
+pub struct HyperLogLog {
+    sketch: hyperloglog::HyperLogLog,
+}
+
+#[pymethods]
+#[allow(non_local_definitions)]
+impl HyperLogLog {
+    /// Create an empty sketch with 2**precision one-byte registers
+    #[new]
+    #[pyo3(signature = (precision = 14))]
+    pub fn new(precision: u8) -> PyResult<Self> {
+        check_precision(precision)?;
+        Ok(HyperLogLog {
+            sketch: hyperloglog::HyperLogLog::new(precision),
+        })
+    }
+
+    /// Hash and add every element of an array
+    fn add(&mut self, py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<()> {
+        hll_add(py, array, &mut self.sketch)
+    }
+
+    /// Fold another sketch with the same precision into this one
+    fn merge(slf: &Bound<'_, Self>, other: &Bound<'_, Self>) -> PyResult<()> {
+        // Clone first so that merging a sketch into itself does not double-borrow
+        let other_sketch = other.borrow().sketch.clone();
+        slf.borrow_mut()
+            .sketch
+            .merge(&other_sketch)
+            .map_err(PyValueError::new_err)
+    }
+
+    /// Estimated number of distinct values added
+    fn count(&self) -> u64 {
+        self.sketch.count().round() as u64
+    }
+
+    /// Serialize the sketch to bytes
+    fn to_bytes<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new(py, &self.sketch.serialize())
+    }
+
+    /// Rebuild a sketch from to_bytes() output
+    #[staticmethod]
+    fn from_bytes(data: &[u8]) -> PyResult<Self> {
+        let sketch = hyperloglog::HyperLogLog::deserialize(data).map_err(PyValueError::new_err)?;
+        Ok(HyperLogLog { sketch })
+    }
+
+    /// Pickle support via to_bytes()/from_bytes()
+    fn __reduce__<'py>(
+        slf: &Bound<'py, Self>,
+    ) -> PyResult<(Bound<'py, PyAny>, (Bound<'py, PyBytes>,))> {
+        let py = slf.py();
+        let data = slf.borrow().sketch.serialize();
+        let constructor = slf.get_type().getattr("from_bytes")?;
+        Ok((constructor, (PyBytes::new(py, &data),)))
+    }
+
+    #[getter]
+    fn precision(&self) -> u8 {
+        self.sketch.precision()
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "HyperLogLog(precision={}, count={})",
+            self.sketch.precision(),
+            self.count()
+        )
+    }
+}
+
+fn count_distinct_exact_impl<T>(py: Python<'_>, buffer: &PyBuffer<T>) -> PyResult<u64>
+where
+    T: Element + Numeric,
+{
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    let mut seen: HashSet<u64, MixBuildHasher> = HashSet::default();
+    for cell in slice {
+        seen.insert(cell.get().key_bits());
+    }
+    Ok(seen.len() as u64)
+}
+
+/// Count distinct values, approximately (HyperLogLog) or exactly (hash set)
+#[pyfunction]
+#[pyo3(signature = (array, approx = true, precision = 14))]
+pub fn count_distinct(
+    py: Python<'_>,
+    array: &Bound<'_, PyAny>,
+    approx: bool,
+    precision: u8,
+) -> PyResult<u64> {
+    if approx {
+        check_precision(precision)?;
+        let mut sketch = hyperloglog::HyperLogLog::new(precision);
+        hll_add(py, array, &mut sketch)?;
+        return Ok(sketch.count().round() as u64);
+    }
+
+    let input_type = detect_input_type(array)?;
+    validate_for_operation(array, input_type, false)?;
+    let typecode = get_typecode_unified(array, input_type)?;
+
+    // Handle empty arrays early to avoid buffer alignment issues on macOS
+    if get_array_len(array)? == 0 {
+        return Ok(0);
+    }
+
+    crate::dispatch_by_typecode!(typecode, array, |buffer| {
+        count_distinct_exact_impl(py, &buffer)
+    })
+}
@@ -0,0 +1,196 @@
+use pyo3::buffer::{Element, PyBuffer};
+use std::collections::TryReserveError;
+
+use pyo3::exceptions::{PyMemoryError, PyTypeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
+use crate::buffer::get_array_len;
+use crate::numeric::Integer;
+use crate::sketch::countmin::{CountMinTopK, MAX_DEPTH};
+use crate::validation::{detect_input_type, get_typecode_unified, validate_for_operation};
+
+#[cfg(feature = "parallel")]
+use crate::buffer::{extract_buffer_to_vec, should_parallelize, PARALLEL_THRESHOLD_HASH};
+
+// Count every element; large buffers are sketched per chunk in parallel and merged,
+// which keeps counts exact in the table and re-ranks the union of candidates.
+fn frequency_add_impl<T>(
+    py: Python<'_>,
+    buffer: &PyBuffer<T>,
+    sketch: &mut CountMinTopK,
+) -> PyResult<()>
+where
+    T: Element + Integer,
+{
+    #[cfg(feature = "parallel")]
+    {
+        if should_parallelize(buffer.item_count(), PARALLEL_THRESHOLD_HASH) {
+            let data = extract_buffer_to_vec(py, buffer)?;
+            let (width, depth, capacity) = (sketch.width(), sketch.depth(), sketch.capacity());
+            let partial = data
+                .par_chunks(PARALLEL_THRESHOLD_HASH)
+                .map(|chunk| {
+                    let mut local =
+                        CountMinTopK::new(width, depth, capacity).map_err(allocation_error)?;
+                    for &value in chunk {
+                        local.add(value.to_i128());
+                    }
+                    Ok(local)
+                })
+                .try_reduce_with(|mut a, b| {
+                    a.merge(&b).map_err(PyValueError::new_err)?;
+                    Ok(a)
+                });
+            if let Some(partial) = partial {
+                sketch.merge(&partial?).map_err(PyValueError::new_err)?;
+            }
+            return Ok(());
+        }
+    }
+
+    let slice = buffer
+        .as_slice(py)
+        .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+    for cell in slice {
+        sketch.add(cell.get().to_i128());
+    }
+    Ok(())
+}
+
+fn allocation_error(_: TryReserveError) -> PyErr {
+    PyMemoryError::new_err("cannot allocate FrequencySketch counters")
+}
+
+/// FrequencySketch - Count-min sketch with bounded heavy-hitter tracking
+#[pyclass(module = "arrayops")]
+pub struct FrequencySketch {
+    sketch: CountMinTopK,
+}
+
+#[pymethods]
+#[allow(non_local_definitions)]
+impl FrequencySketch {
+    /// Create an empty sketch with a width x depth counter table
+    #[new]
+    #[pyo3(signature = (width = 2048, depth = 5, capacity = 64))]
+    pub fn new(width: usize, depth: usize, capacity: usize) -> PyResult<Self> {
+        if width == 0 || width > u32::MAX as usize {
+            return Err(PyValueError::new_err(
+                "width must be between 1 and 2**32 - 1",
+            ));
+        }
+        if !(1..=MAX_DEPTH).contains(&depth) {
+            return Err(PyValueError::new_err(format!(
+                "depth must be between 1 and {MAX_DEPTH}"
+            )));
+        }
+        if capacity == 0 || capacity > u32::MAX as usize {
+            return Err(PyValueError::new_err(
+                "capacity must be between 1 and 2**32 - 1",
+            ));
+        }
+        Ok(FrequencySketch {
+            sketch: CountMinTopK::new(width, depth, capacity).map_err(allocation_error)?,
+        })
+    }
+
+    /// Count every element of an integer array
+    fn add(&mut self, py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<()> {
+        let input_type = detect_input_type(array)?;
+        validate_for_operation(array, input_type, false)?;
+        let typecode = get_typecode_unified(array, input_type)?;
+
+        // Handle empty arrays early to avoid buffer alignment issues on macOS
+        if get_array_len(array)? == 0 {
+            return Ok(());
+        }
+
+        let sketch = &mut self.sketch;
+        crate::dispatch_by_int_typecode!(typecode, array, |buffer| {
+            frequency_add_impl(py, &buffer, sketch)
+        })
+    }
+
+    /// Estimated occurrences of value (an upper bound on the true count)
+    fn estimate(&self, value: i128) -> u64 {
+        self.sketch.estimate(value)
+    }
+
+    /// The k most frequent tracked values as (value, estimated_count) pairs
+    fn top_k(&self, k: usize) -> PyResult<Vec<(i128, u64)>> {
+        if k > self.sketch.capacity() {
+            return Err(PyValueError::new_err(format!(
+                "k must not exceed the sketch capacity ({})",
+                self.sketch.capacity()
+            )));
+        }
+        Ok(self.sketch.top_k(k))
+    }
+
+    /// Fold another sketch with the same width and depth into this one
+    fn merge(slf: &Bound<'_, Self>, other: &Bound<'_, Self>) -> PyResult<()> {
+        // Clone first so that merging a sketch into itself does not double-borrow
+        let other_sketch = other.borrow().sketch.clone();
+        slf.borrow_mut()
+            .sketch
+            .merge(&other_sketch)
+            .map_err(PyValueError::new_err)
+    }
+
+    /// Serialize the sketch to bytes
+    fn to_bytes<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new(py, &self.sketch.serialize())
+    }
+
+    /// Rebuild a sketch from to_bytes() output
+    #[staticmethod]
+    fn from_bytes(data: &[u8]) -> PyResult<Self> {
+        let sketch = CountMinTopK::deserialize(data).map_err(PyValueError::new_err)?;
+        Ok(FrequencySketch { sketch })
+    }
+
+    /// Pickle support via to_bytes()/from_bytes()
+    fn __reduce__<'py>(
+        slf: &Bound<'py, Self>,
+    ) -> PyResult<(Bound<'py, PyAny>, (Bound<'py, PyBytes>,))> {
+        let py = slf.py();
+        let data = slf.borrow().sketch.serialize();
+        let constructor = slf.get_type().getattr("from_bytes")?;
+        Ok((constructor, (PyBytes::new(py, &data),)))
+    }
+
+    #[getter]
+    fn width(&self) -> usize {
+        self.sketch.width()
+    }
+
+    #[getter]
+    fn depth(&self) -> usize {
+        self.sketch.depth()
+    }
+
+    #[getter]
+    fn capacity(&self) -> usize {
+        self.sketch.capacity()
+    }
+
+    /// Number of values added (including merged sketches)
+    #[getter]
+    fn total(&self) -> u64 {
+        self.sketch.total()
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "FrequencySketch(width={}, depth={}, capacity={}, total={})",
+            self.sketch.width(),
+            self.sketch.depth(),
+            self.sketch.capacity(),
+            self.sketch.total()
+        )
+    }
+}
@@ -0,0 +1,215 @@
+// HyperLogLog core (pure Rust, no PyO3 types)
+//
+// Registers hold the maximum "rank" (position of the first set bit) seen for hashes
+// routed to them. The estimate uses Ertl's improved raw estimator, which stays
+// unbiased from tiny to huge cardinalities without HLL++'s empirical bias tables.
+
+const MAGIC: &[u8; 4] = b"AOHL";
+const VERSION: u8 = 1;
+const HEADER_LEN: usize = 6;
+
+pub(crate) const MIN_PRECISION: u8 = 4;
+pub(crate) const MAX_PRECISION: u8 = 18;
+
+/// Fixed-size HyperLogLog over pre-hashed 64-bit values
+#[derive(Clone, Debug)]
+pub(crate) struct HyperLogLog {
+    precision: u8,
+    registers: Vec<u8>,
+}
+
+impl HyperLogLog {
+    /// Create an empty sketch with 2^precision registers
+    ///
+    /// Callers validate precision against MIN_PRECISION..=MAX_PRECISION.
+    pub(crate) fn new(precision: u8) -> Self {
+        debug_assert!((MIN_PRECISION..=MAX_PRECISION).contains(&precision));
+        HyperLogLog {
+            precision,
+            registers: vec![0; 1 << precision],
+        }
+    }
+
+    pub(crate) fn precision(&self) -> u8 {
+        self.precision
+    }
+
+    /// Record one hashed value
+    #[inline(always)]
+    pub(crate) fn add_hash(&mut self, hash: u64) {
+        let p = self.precision as u32;
+        let index = (hash >> (64 - p)) as usize;
+        // The guard bit caps the rank at 65 - p when the remaining bits are all zero
+        let rank = ((hash << p) | (1 << (p - 1))).leading_zeros() as u8 + 1;
+        let register = &mut self.registers[index];
+        if rank > *register {
+            *register = rank;
+        }
+    }
+
+    /// Union with another sketch of the same precision (register-wise max)
+    pub(crate) fn merge(&mut self, other: &HyperLogLog) -> Result<(), &'static str> {
+        if self.precision != other.precision {
+            return Err("cannot merge HyperLogLog sketches with different precision");
+        }
+        for (register, &value) in self.registers.iter_mut().zip(other.registers.iter()) {
+            if value > *register {
+                *register = value;
+            }
+        }
+        Ok(())
+    }
+
+    /// Estimated number of distinct hashes added
+    pub(crate) fn count(&self) -> f64 {
+        let m = self.registers.len() as f64;
+        let q = 64 - self.precision as usize;
+
+        // Histogram of register values 0..=q+1
+        let mut histogram = vec![0u32; q + 2];
+        for &register in &self.registers {
+            histogram[register as usize] += 1;
+        }
+        if histogram[0] as f64 == m {
+            return 0.0;
+        }
+
+        let mut z = m * tau(1.0 - histogram[q + 1] as f64 / m);
+        for k in (1..=q).rev() {
+            z = 0.5 * (z + histogram[k] as f64);
+        }
+        z += m * sigma(histogram[0] as f64 / m);
+        m * m / (2.0 * std::f64::consts::LN_2 * z)
+    }
+
+    /// Serialize to a compact byte string (magic, version, precision, registers)
+    pub(crate) fn serialize(&self) -> Vec<u8> {
+        let mut out = Vec::with_capacity(HEADER_LEN + self.registers.len());
+        out.extend_from_slice(MAGIC);
+        out.push(VERSION);
+        out.push(self.precision);
+        out.extend_from_slice(&self.registers);
+        out
+    }
+
+    /// Rebuild a sketch from `serialize()` output
+    pub(crate) fn deserialize(data: &[u8]) -> Result<Self, &'static str> {
+        if data.len() < HEADER_LEN || &data[..4] != MAGIC {
+            return Err("invalid HyperLogLog data");
+        }
+        if data[4] != VERSION {
+            return Err("unsupported HyperLogLog data version");
+        }
+        let precision = data[5];
+        if !(MIN_PRECISION..=MAX_PRECISION).contains(&precision) {
+            return Err("invalid HyperLogLog data");
+        }
+        let registers = &data[HEADER_LEN..];
+        let max_rank = 65 - precision;
+        if registers.len() != 1 << precision || registers.iter().any(|&r| r > max_rank) {
+            return Err("invalid HyperLogLog data");
+        }
+        Ok(HyperLogLog {
+            precision,
+            registers: registers.to_vec(),
+        })
+    }
+}
+
+// Correction terms from Ertl, "New cardinality estimation algorithms for HyperLogLog
+// sketches" (2017); both series converge to machine precision in a few iterations.
+fn sigma(mut x: f64) -> f64 {
+    if x == 1.0 {
+        return f64::INFINITY;
+    }
+    let mut y = 1.0;
+    let mut z = x;
+    loop {
+        x *= x;
+        let previous = z;
+        z += x * y;
+        y += y;
+        if z == previous {
+            return z;
+        }
+    }
+}
+
+fn tau(mut x: f64) -> f64 {
+    if x == 0.0 || x == 1.0 {
+        return 0.0;
+    }
+    let mut y = 1.0;
+    let mut z = 1.0 - x;
+    loop {
+        x = x.sqrt();
+        let previous = z;
+        y *= 0.5;
+        z -= (1.0 - x) * (1.0 - x) * y;
+        if z == previous {
+            return z / 3.0;
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::hashing::mix64;
+
+    fn sketch_of(range: std::ops::Range<u64>, precision: u8) -> HyperLogLog {
+        let mut hll = HyperLogLog::new(precision);
+        for value in range {
+            hll.add_hash(mix64(value));
+        }
+        hll
+    }
+
+    #[test]
+    fn empty_counts_zero() {
+        assert_eq!(HyperLogLog::new(14).count(), 0.0);
+    }
+
+    #[test]
+    fn small_cardinalities_are_near_exact() {
+        for n in [1u64, 10, 100, 1000] {
+            let estimate = sketch_of(0..n, 14).count();
+            assert!((estimate - n as f64).abs() <= (n as f64 * 0.01).max(0.5));
+        }
+    }
+
+    #[test]
+    fn large_cardinality_within_error_bound() {
+        let n = 200_000u64;
+        let estimate = sketch_of(0..n, 14).count();
+        // Standard error is 1.04 / sqrt(2^14) ~ 0.8%; allow four sigma
+        assert!((estimate / n as f64 - 1.0).abs() < 0.033);
+    }
+
+    #[test]
+    fn duplicates_do_not_change_estimate() {
+        let once = sketch_of(0..5000, 12).count();
+        let mut twice = sketch_of(0..5000, 12);
+        twice.merge(&sketch_of(0..5000, 12)).unwrap();
+        assert_eq!(once, twice.count());
+    }
+
+    #[test]
+    fn merge_matches_union() {
+        let mut left = sketch_of(0..50_000, 14);
+        left.merge(&sketch_of(25_000..100_000, 14)).unwrap();
+        let union = sketch_of(0..100_000, 14);
+        assert_eq!(left.count(), union.count());
+        assert!(left.merge(&HyperLogLog::new(10)).is_err());
+    }
+
+    #[test]
+    fn serialize_roundtrip() {
+        let hll = sketch_of(0..1234, 10);
+        let restored = HyperLogLog::deserialize(&hll.serialize()).unwrap();
+        assert_eq!(restored.precision(), 10);
+        assert_eq!(restored.count(), hll.count());
+        assert!(HyperLogLog::deserialize(b"AOHL").is_err());
+        assert!(HyperLogLog::deserialize(&hll.serialize()[..100]).is_err());
+    }
+}
@@ -0,0 +1,15 @@
+// Streaming sketches: bounded-memory, mergeable summaries of array data
+//
+// Each sketch keeps a pure-Rust core (no PyO3 types) next to the #[pyclass] wrapper
+// that ingests whole buffers through the usual typecode dispatch.
+
+mod countmin;
+mod distinct;
+mod frequency;
+mod hyperloglog;
+mod quantile;
+mod tdigest;
+
+pub use distinct::{count_distinct, HyperLogLog};
+pub use frequency::FrequencySketch;
+pub use quantile::QuantileSketch;
@@ -0,0 +1,129 @@
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+
+use crate::buffer::get_array_len;
+use crate::numeric::Numeric;
+use crate::sketch::tdigest::TDigest;
+use crate::validation::{detect_input_type, get_typecode_unified, validate_for_operation};
+
+/// QuantileSketch - Mergeable t-digest for approximate quantiles over streams
+#[pyclass(module = "arrayops")]
+pub struct QuantileSketch {
+    digest: TDigest,
+}
+
+#[pymethods]
+#[allow(non_local_definitions)]
+impl QuantileSketch {
+    /// Create an empty sketch; higher compression trades memory for accuracy
+    #[new]
+    #[pyo3(signature = (compression = 100.0))]
+    pub fn new(compression: f64) -> PyResult<Self> {
+        if !compression.is_finite() || compression < 10.0 {
+            return Err(PyValueError::new_err(
+                "compression must be a finite number >= 10",
+            ));
+        }
+        Ok(QuantileSketch {
+            digest: TDigest::new(compression),
+        })
+    }
+
+    /// Add every element of an array (NaN values are skipped)
+    fn add(&mut self, py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<()> {
+        let input_type = detect_input_type(array)?;
+        validate_for_operation(array, input_type, false)?;
+        let typecode = get_typecode_unified(array, input_type)?;
+
+        // Handle empty arrays early to avoid buffer alignment issues on macOS
+        if get_array_len(array)? == 0 {
+            return Ok(());
+        }
+
+        let digest = &mut self.digest;
+        crate::dispatch_by_typecode!(typecode, array, |buffer| {
+            let slice = buffer
+                .as_slice(py)
+                .ok_or_else(|| PyTypeError::new_err("Failed to get buffer slice"))?;
+            digest.extend(slice.iter().map(|cell| cell.get().to_f64()));
+            Ok(())
+        })
+    }
+
+    /// Fold another sketch into this one
+    fn merge(slf: &Bound<'_, Self>, other: &Bound<'_, Self>) -> PyResult<()> {
+        // Clone first so that merging a sketch into itself does not double-borrow
+        let other_digest = other.borrow().digest.clone();
+        slf.borrow_mut().digest.merge(&other_digest);
+        Ok(())
+    }
+
+    /// Estimate the value at quantile q (0 <= q <= 1)
+    fn quantile(&mut self, q: f64) -> PyResult<f64> {
+        if !(0.0..=1.0).contains(&q) {
+            return Err(PyValueError::new_err("q must be in the range [0, 1]"));
+        }
+        self.digest
+            .quantile(q)
+            .ok_or_else(|| PyValueError::new_err("quantile() of empty sketch"))
+    }
+
+    /// Estimate the fraction of values less than or equal to x
+    fn cdf(&mut self, x: f64) -> PyResult<f64> {
+        self.digest
+            .cdf(x)
+            .ok_or_else(|| PyValueError::new_err("cdf() of empty sketch"))
+    }
+
+    /// Serialize the sketch to bytes
+    fn to_bytes<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new(py, &self.digest.serialize())
+    }
+
+    /// Rebuild a sketch from to_bytes() output
+    #[staticmethod]
+    fn from_bytes(data: &[u8]) -> PyResult<Self> {
+        let digest = TDigest::deserialize(data).map_err(PyValueError::new_err)?;
+        Ok(QuantileSketch { digest })
+    }
+
+    /// Pickle support via to_bytes()/from_bytes()
+    fn __reduce__<'py>(
+        slf: &Bound<'py, Self>,
+    ) -> PyResult<(Bound<'py, PyAny>, (Bound<'py, PyBytes>,))> {
+        let py = slf.py();
+        let data = slf.borrow().digest.serialize();
+        let constructor = slf.get_type().getattr("from_bytes")?;
+        Ok((constructor, (PyBytes::new(py, &data),)))
+    }
+
+    #[getter]
+    fn compression(&self) -> f64 {
+        self.digest.compression()
+    }
+
+    /// Number of values added (including merged sketches)
+    #[getter]
+    fn count(&self) -> u64 {
+        self.digest.count() as u64
+    }
+
+    #[getter]
+    fn min(&self) -> Option<f64> {
+        self.digest.min()
+    }
+
+    #[getter]
+    fn max(&self) -> Option<f64> {
+        self.digest.max()
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "QuantileSketch(compression={:?}, count={})",
+            self.digest.compression(),
+            self.digest.count() as u64
+        )
+    }
+}
@@ -0,0 +1,451 @@
+// Merging t-digest used by QuantileSketch
+//
+// Incoming values are buffered as unit-weight centroids and periodically folded into
+// a sorted centroid list. Centroid sizes are bounded by the k1 scale function
+// (k(q) = compression / 2pi * asin(2q - 1)), which keeps centroids small near the
+// tails, so p99/p999 stay accurate while memory stays O(compression).
+
+use std::f64::consts::PI;
+
+const SERIALIZATION_MAGIC: &[u8; 4] = b"AOTD";
+const SERIALIZATION_VERSION: u8 = 1;
+const HEADER_LEN: usize = 4 + 1 + 8 * 4;
+
+/// A cluster of nearby values summarised by their mean and count
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub(crate) struct Centroid {
+    pub mean: f64,
+    pub weight: f64,
+}
+
+/// Bounded-memory, mergeable quantile summary
+#[derive(Debug, Clone)]
+pub(crate) struct TDigest {
+    compression: f64,
+    centroids: Vec<Centroid>,
+    buffer: Vec<Centroid>,
+    buffer_capacity: usize,
+    total_weight: f64, // includes buffered values
+    min: f64,
+    max: f64,
+}
+
+impl TDigest {
+    pub fn new(compression: f64) -> Self {
+        // Buffering several times the centroid budget amortises the sort in compress()
+        let buffer_capacity = (compression * 5.0).ceil() as usize;
+        TDigest {
+            compression,
+            centroids: Vec::new(),
+            buffer: Vec::with_capacity(buffer_capacity),
+            buffer_capacity,
+            total_weight: 0.0,
+            min: f64::INFINITY,
+            max: f64::NEG_INFINITY,
+        }
+    }
+
+    pub fn compression(&self) -> f64 {
+        self.compression
+    }
+
+    pub fn count(&self) -> f64 {
+        self.total_weight
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.total_weight == 0.0
+    }
+
+    pub fn min(&self) -> Option<f64> {
+        (!self.is_empty()).then_some(self.min)
+    }
+
+    pub fn max(&self) -> Option<f64> {
+        (!self.is_empty()).then_some(self.max)
+    }
+
+    /// Add a single value (NaN is ignored)
+    #[inline]
+    pub fn add(&mut self, value: f64) {
+        if value.is_nan() {
+            return;
+        }
+        if value < self.min {
+            self.min = value;
+        }
+        if value > self.max {
+            self.max = value;
+        }
+        self.push_centroid(Centroid {
+            mean: value,
+            weight: 1.0,
+        });
+    }
+
+    pub fn extend<I: IntoIterator<Item = f64>>(&mut self, values: I) {
+        for value in values {
+            self.add(value);
+        }
+    }
+
+    /// Fold another digest into this one
+    pub fn merge(&mut self, other: &TDigest) {
+        if other.is_empty() {
+            return;
+        }
+        self.min = self.min.min(other.min);
+        self.max = self.max.max(other.max);
+        for centroid in other.centroids.iter().chain(other.buffer.iter()) {
+            self.push_centroid(*centroid);
+        }
+    }
+
+    #[inline]
+    fn push_centroid(&mut self, centroid: Centroid) {
+        self.total_weight += centroid.weight;
+        self.buffer.push(centroid);
+        if self.buffer.len() >= self.buffer_capacity {
+            self.compress();
+        }
+    }
+
+    /// Merge buffered values into the centroid list
+    pub fn compress(&mut self) {
+        if self.buffer.is_empty() {
+            return;
+        }
+        let mut all = std::mem::take(&mut self.centroids);
+        all.append(&mut self.buffer);
+        all.sort_unstable_by(|a, b| a.mean.total_cmp(&b.mean));
+
+        let total = self.total_weight;
+        let mut merged = Vec::with_capacity(all.len().min(self.buffer_capacity));
+        let mut iter = all.into_iter();
+        let mut current = iter.next().expect("buffer is non-empty");
+        let mut weight_so_far = 0.0;
+        let mut limit = total * self.q_limit(0.0);
+
+        for centroid in iter {
+            if weight_so_far + current.weight + centroid.weight <= limit {
+                let weight = current.weight + centroid.weight;
+                current.mean += (centroid.mean - current.mean) * centroid.weight / weight;
+                current.weight = weight;
+            } else {
+                weight_so_far += current.weight;
+                merged.push(current);
+                limit = total * self.q_limit(weight_so_far / total);
+                current = centroid;
+            }
+        }
+        merged.push(current);
+        self.centroids = merged;
+    }
+
+    /// Largest quantile a centroid starting at `q` may reach (one k1 unit further)
+    fn q_limit(&self, q: f64) -> f64 {
+        let k = self.compression / (2.0 * PI) * (2.0 * q - 1.0).clamp(-1.0, 1.0).asin();
+        let next_k = k + 1.0;
+        if next_k >= self.compression / 4.0 {
+            1.0
+        } else {
+            ((next_k * 2.0 * PI / self.compression).sin() + 1.0) / 2.0
+        }
+    }
+
+    /// Estimate the value at quantile `q` in [0, 1]; None if the digest is empty
+    pub fn quantile(&mut self, q: f64) -> Option<f64> {
+        self.compress();
+        if self.centroids.is_empty() {
+            return None;
+        }
+        if q <= 0.0 {
+            return Some(self.min);
+        }
+        if q >= 1.0 {
+            return Some(self.max);
+        }
+
+        let centroids = &self.centroids;
+        let index = q * self.total_weight;
+
+        // Left tail: interpolate between the minimum and the first centroid
+        let first = centroids[0];
+        if index < first.weight / 2.0 {
+            return Some(self.min + (first.mean - self.min) * index / (first.weight / 2.0));
+        }
+
+        let mut weight_so_far = first.weight / 2.0;
+        for pair in centroids.windows(2) {
+            let step = (pair[0].weight + pair[1].weight) / 2.0;
+            if weight_so_far + step > index {
+                let left = index - weight_so_far;
+                let right = weight_so_far + step - index;
+                return Some((pair[0].mean * right + pair[1].mean * left) / (left + right));
+            }
+            weight_so_far += step;
+        }
+
+        // Right tail: interpolate between the last centroid and the maximum
+        let last = centroids[centroids.len() - 1];
+        let half = last.weight / 2.0;
+        let fraction = ((index - weight_so_far) / half).min(1.0);
+        Some(last.mean + (self.max - last.mean) * fraction)
+    }
+
+    /// Estimate the fraction of values <= `x`; None if the digest is empty
+    pub fn cdf(&mut self, x: f64) -> Option<f64> {
+        self.compress();
+        if self.centroids.is_empty() {
+            return None;
+        }
+        if x.is_nan() {
+            return Some(f64::NAN);
+        }
+        if x < self.min {
+            return Some(0.0);
+        }
+        if x >= self.max {
+            return Some(1.0);
+        }
+
+        let centroids = &self.centroids;
+        let total = self.total_weight;
+
+        let first = centroids[0];
+        if x < first.mean {
+            let fraction = (x - self.min) / (first.mean - self.min);
+            return Some(first.weight / 2.0 * fraction / total);
+        }
+
+        let mut weight_so_far = first.weight / 2.0;
+        for pair in centroids.windows(2) {
+            let step = (pair[0].weight + pair[1].weight) / 2.0;
+            if x < pair[1].mean {
+                let fraction = (x - pair[0].mean) / (pair[1].mean - pair[0].mean);
+                return Some((weight_so_far + step * fraction) / total);
+            }
+            weight_so_far += step;
+        }
+
+        let last = centroids[centroids.len() - 1];
+        let fraction = (x - last.mean) / (self.max - last.mean);
+        Some((weight_so_far + last.weight / 2.0 * fraction) / total)
+    }
+
+    /// Serialize to a compact little-endian byte string
+    pub fn serialize(&self) -> Vec<u8> {
+        if !self.buffer.is_empty() {
+            let mut compressed = self.clone();
+            compressed.compress();
+            return compressed.serialize();
+        }
+        let mut out = Vec::with_capacity(HEADER_LEN + self.centroids.len() * 16);
+        out.extend_from_slice(SERIALIZATION_MAGIC);
+        out.push(SERIALIZATION_VERSION);
+        out.extend_from_slice(&self.compression.to_le_bytes());
+        out.extend_from_slice(&self.min.to_le_bytes());
+        out.extend_from_slice(&self.max.to_le_bytes());
+        out.extend_from_slice(&(self.centroids.len() as u64).to_le_bytes());
+        for centroid in &self.centroids {
+            out.extend_from_slice(&centroid.mean.to_le_bytes());
+            out.extend_from_slice(&centroid.weight.to_le_bytes());
+        }
+        out
+    }
+
+    /// Rebuild a digest from `serialize()` output
+    pub fn deserialize(data: &[u8]) -> Result<Self, &'static str> {
+        if data.len() < HEADER_LEN || &data[..4] != SERIALIZATION_MAGIC {
+            return Err("Invalid QuantileSketch data");
+        }
+        if data[4] != SERIALIZATION_VERSION {
+            return Err("Unsupported QuantileSketch serialization version");
+        }
+        let read_f64 = |offset: usize| {
+            let mut bytes = [0u8; 8];
+            bytes.copy_from_slice(&data[offset..offset + 8]);
+            f64::from_le_bytes(bytes)
+        };
+        let compression = read_f64(5);
+        let min = read_f64(13);
+        let max = read_f64(21);
+        let mut count_bytes = [0u8; 8];
+        count_bytes.copy_from_slice(&data[29..37]);
+        let count = u64::from_le_bytes(count_bytes) as usize;
+
+        if !compression.is_finite() || compression <= 0.0 {
+            return Err("Invalid QuantileSketch data");
+        }
+        let expected_len = count
+            .checked_mul(16)
+            .and_then(|n| n.checked_add(HEADER_LEN));
+        if expected_len != Some(data.len()) {
+            return Err("Truncated QuantileSketch data");
+        }
+
+        let mut digest = TDigest::new(compression);
+        digest.centroids = (0..count)
+            .map(|i| {
+                let offset = HEADER_LEN + i * 16;
+                Centroid {
+                    mean: read_f64(offset),
+                    weight: read_f64(offset + 8),
+                }
+            })
+            .collect();
+        // quantile() and merge() rely on finite, positively weighted centroids in
+        // mean order, and on min <= max
+        for centroid in &digest.centroids {
+            if !centroid.mean.is_finite() {
+                return Err("QuantileSketch centroid mean is not finite");
+            }
+            if !centroid.weight.is_finite() || centroid.weight <= 0.0 {
+                return Err("QuantileSketch centroid weight is not finite and positive");
+            }
+        }
+        if digest.centroids.windows(2).any(|w| w[0].mean > w[1].mean) {
+            return Err("QuantileSketch centroids are not sorted by mean");
+        }
+        if count > 0 && (min.is_nan() || max.is_nan() || min > max) {
+            return Err("QuantileSketch min is greater than max");
+        }
+        digest.total_weight = digest.centroids.iter().map(|c| c.weight).sum();
+        if !digest.total_weight.is_finite() {
+            return Err("QuantileSketch centroid weight is not finite and positive");
+        }
+        if !digest.is_empty() {
+            digest.min = min;
+            digest.max = max;
+        }
+        Ok(digest)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn exact_quantile(sorted: &[f64], q: f64) -> f64 {
+        sorted[((sorted.len() - 1) as f64 * q).round() as usize]
+    }
+
+    #[test]
+    fn test_quantiles_uniform() {
+        let mut digest = TDigest::new(100.0);
+        let n = 100_000;
+        digest.extend((0..n).map(|i| ((i * 7919) % n) as f64));
+        let sorted: Vec<f64> = (0..n).map(|i| i as f64).collect();
+        for &q in &[0.001, 0.01, 0.25, 0.5, 0.75, 0.99, 0.999] {
+            let estimate = digest.quantile(q).unwrap();
+            let exact = exact_quantile(&sorted, q);
+            assert!(
+                (estimate - exact).abs() / n as f64 <= 0.01,
+                "q={q}: {estimate} vs {exact}"
+            );
+        }
+        assert_eq!(digest.quantile(0.0), Some(0.0));
+        assert_eq!(digest.quantile(1.0), Some((n - 1) as f64));
+        assert!(digest.centroids.len() < 200);
+    }
+
+    #[test]
+    fn test_small_exact() {
+        let mut digest = TDigest::new(100.0);
+        digest.extend([5.0, 1.0, 3.0, 2.0, 4.0]);
+        assert_eq!(digest.quantile(0.5), Some(3.0));
+        assert_eq!(digest.cdf(3.0), Some(0.5));
+        assert_eq!(digest.cdf(0.0), Some(0.0));
+        assert_eq!(digest.cdf(5.0), Some(1.0));
+    }
+
+    #[test]
+    fn test_merge_matches_single() {
+        let mut left = TDigest::new(100.0);
+        let mut right = TDigest::new(100.0);
+        left.extend((0..50_000).map(|i| i as f64));
+        right.extend((50_000..100_000).map(|i| i as f64));
+        left.merge(&right);
+        assert_eq!(left.count(), 100_000.0);
+        let median = left.quantile(0.5).unwrap();
+        assert!((median - 50_000.0).abs() < 500.0);
+        assert_eq!(left.min(), Some(0.0));
+        assert_eq!(left.max(), Some(99_999.0));
+    }
+
+    #[test]
+    fn test_nan_ignored_and_empty() {
+        let mut digest = TDigest::new(100.0);
+        digest.add(f64::NAN);
+        assert!(digest.is_empty());
+        assert_eq!(digest.quantile(0.5), None);
+        assert_eq!(digest.cdf(1.0), None);
+    }
+
+    #[test]
+    fn test_serialization_roundtrip() {
+        let mut digest = TDigest::new(50.0);
+        digest.extend((0..10_000).map(|i| (i as f64).sqrt()));
+        let bytes = digest.serialize();
+        let mut restored = TDigest::deserialize(&bytes).unwrap();
+        assert_eq!(restored.compression(), 50.0);
+        assert_eq!(restored.count(), digest.count());
+        assert_eq!(restored.quantile(0.9), digest.quantile(0.9));
+        assert!(TDigest::deserialize(&bytes[..bytes.len() - 1]).is_err());
+        assert!(TDigest::deserialize(b"nope").is_err());
+    }
+
+    // Serialized digest over 0..10 with centroid `index` overwritten
+    fn with_centroid(index: usize, mean: f64, weight: f64) -> Vec<u8> {
+        let mut digest = TDigest::new(100.0);
+        digest.extend((0..10).map(f64::from));
+        let mut bytes = digest.serialize();
+        let offset = HEADER_LEN + index * 16;
+        bytes[offset..offset + 8].copy_from_slice(&mean.to_le_bytes());
+        bytes[offset + 8..offset + 16].copy_from_slice(&weight.to_le_bytes());
+        bytes
+    }
+
+    #[test]
+    fn test_deserialize_rejects_non_finite_mean() {
+        for mean in [f64::NAN, f64::INFINITY, f64::NEG_INFINITY] {
+            let err = TDigest::deserialize(&with_centroid(0, mean, 1.0)).unwrap_err();
+            assert_eq!(err, "QuantileSketch centroid mean is not finite");
+        }
+    }
+
+    #[test]
+    fn test_deserialize_rejects_bad_weight() {
+        for weight in [0.0, -1.0, f64::NAN, f64::INFINITY] {
+            let err = TDigest::deserialize(&with_centroid(0, 0.0, weight)).unwrap_err();
+            assert_eq!(
+                err,
+                "QuantileSketch centroid weight is not finite and positive"
+            );
+        }
+        // Finite weights whose total overflows
+        let mut bytes = with_centroid(0, 0.0, f64::MAX);
+        bytes[HEADER_LEN + 24..HEADER_LEN + 32].copy_from_slice(&f64::MAX.to_le_bytes());
+        let err = TDigest::deserialize(&bytes).unwrap_err();
+        assert_eq!(
+            err,
+            "QuantileSketch centroid weight is not finite and positive"
+        );
+    }
+
+    #[test]
+    fn test_deserialize_rejects_unsorted_means() {
+        let err = TDigest::deserialize(&with_centroid(0, 100.0, 1.0)).unwrap_err();
+        assert_eq!(err, "QuantileSketch centroids are not sorted by mean");
+    }
+
+    #[test]
+    fn test_deserialize_rejects_min_above_max() {
+        let mut bytes = with_centroid(0, 0.0, 1.0);
+        bytes[13..21].copy_from_slice(&20.0f64.to_le_bytes());
+        let err = TDigest::deserialize(&bytes).unwrap_err();
+        assert_eq!(err, "QuantileSketch min is greater than max");
+        bytes[13..21].copy_from_slice(&f64::NAN.to_le_bytes());
+        assert!(TDigest::deserialize(&bytes).is_err());
+    }
+}
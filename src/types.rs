@@ -54,6 +54,22 @@ impl TypeCode {
             TypeCode::Float64 => 'd',
         }
     }
+
+    /// 64-bit typecode of the same kind (matches `Numeric::Wide`)
+    pub(crate) fn widened(&self) -> TypeCode {
+        match self {
+            TypeCode::Int8 | TypeCode::Int16 | TypeCode::Int32 | TypeCode::Int64 => TypeCode::Int64,
+            TypeCode::UInt8 | TypeCode::UInt16 | TypeCode::UInt32 | TypeCode::UInt64 => {
+                TypeCode::UInt64
+            }
+            TypeCode::Float32 | TypeCode::Float64 => TypeCode::Float64,
+        }
+    }
+
+    /// True for the float typecodes ('f', 'd')
+    pub(crate) fn is_float(&self) -> bool {
+        matches!(self, TypeCode::Float32 | TypeCode::Float64)
+    }
 }
 
 /// Get typecode from Python array.array object
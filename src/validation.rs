@@ -1,6 +1,7 @@
 use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
 
+use crate::buffer::{get_array_len, get_itemsize};
 use crate::types::{
     get_arrow_typecode, get_memoryview_typecode, get_numpy_typecode, get_typecode, TypeCode,
 };
@@ -210,3 +211,83 @@ pub(crate) fn validate_for_operation(
     }
     Ok(())
 }
+
+/// Validate two arrays that are read together but may differ in length
+///
+/// Both inputs must pass `validate_for_operation` and share a typecode (and itemsize,
+/// for the platform-dependent `l`/`L` codes). Returns the shared typecode and the
+/// container type of each input.
+pub(crate) fn validate_same_type(
+    arr1: &Bound<'_, PyAny>,
+    arr2: &Bound<'_, PyAny>,
+) -> PyResult<(TypeCode, InputType, InputType)> {
+    let input_type1 = detect_input_type(arr1)?;
+    validate_for_operation(arr1, input_type1, false)?;
+    let typecode1 = get_typecode_unified(arr1, input_type1)?;
+
+    let input_type2 = detect_input_type(arr2)?;
+    validate_for_operation(arr2, input_type2, false)?;
+    let typecode2 = get_typecode_unified(arr2, input_type2)?;
+
+    if typecode1 != typecode2 {
+        return Err(PyTypeError::new_err("Arrays must have the same type"));
+    }
+    if matches!(typecode1, TypeCode::Int64 | TypeCode::UInt64)
+        && get_itemsize(arr1)? != get_itemsize(arr2)?
+    {
+        return Err(PyTypeError::new_err("Array itemsizes must match"));
+    }
+
+    Ok((typecode1, input_type1, input_type2))
+}
+
+/// Validate a pair of arrays for an operation that combines them element by element
+///
+/// Both inputs must pass `validate_for_operation`, share a typecode (and itemsize, for
+/// the platform-dependent `l`/`L` codes) and have the same length. Returns the shared
+/// typecode, the common length and the container type for results: NumPy only when
+/// both inputs are NumPy arrays, array.array otherwise.
+pub(crate) fn validate_array_pair(
+    arr1: &Bound<'_, PyAny>,
+    arr2: &Bound<'_, PyAny>,
+) -> PyResult<(TypeCode, usize, InputType)> {
+    let input_type1 = detect_input_type(arr1)?;
+    validate_for_operation(arr1, input_type1, false)?;
+    let typecode1 = get_typecode_unified(arr1, input_type1)?;
+
+    let input_type2 = detect_input_type(arr2)?;
+    validate_for_operation(arr2, input_type2, false)?;
+    let typecode2 = get_typecode_unified(arr2, input_type2)?;
+
+    // Check types match
+    if typecode1 != typecode2 {
+        return Err(PyTypeError::new_err(
+            "Arrays must have the same type for element-wise operations",
+        ));
+    }
+
+    // Check lengths match
+    let len1 = get_array_len(arr1)?;
+    let len2 = get_array_len(arr2)?;
+    if len1 != len2 {
+        return Err(PyValueError::new_err(
+            "Arrays must have the same length for element-wise operations",
+        ));
+    }
+
+    if matches!(typecode1, TypeCode::Int64 | TypeCode::UInt64)
+        && get_itemsize(arr1)? != get_itemsize(arr2)?
+    {
+        return Err(PyTypeError::new_err("Array itemsizes must match"));
+    }
+
+    // Determine result type (NumPy if both NumPy, otherwise array.array)
+    let result_type =
+        if input_type1 == InputType::NumPyArray && input_type2 == InputType::NumPyArray {
+            InputType::NumPyArray
+        } else {
+            InputType::ArrayArray
+        };
+
+    Ok((typecode1, len1, result_type))
+}
@@ -0,0 +1,151 @@
+"""Tests for argsort and the stable/NaN semantics of sort."""
+
+import array
+import math
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class TestArgsort:
+    """Tests for argsort."""
+
+    def test_all_types(self):
+        """Test argsort against sorted(range) for every typecode."""
+        import arrayops as ao
+
+        data = [5, 2, 8, 2, 9, 1, 5, 0]
+        expected = sorted(range(len(data)), key=lambda i: data[i])
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            result = ao.argsort(array.array(typecode, data))
+            assert list(result) == expected, f"Failed for type {typecode}"
+            assert result.typecode == "I"
+
+    def test_stable_ties(self):
+        """Test equal keys keep their original order with stable=True."""
+        import arrayops as ao
+
+        keys = array.array("i", [3, 1, 3, 1, 2, 1, 3])
+        assert list(ao.argsort(keys)) == [1, 3, 5, 4, 0, 2, 6]
+
+    def test_unstable_is_sorting_permutation(self):
+        """Test stable=False still returns a permutation that sorts the array."""
+        import arrayops as ao
+
+        data = [(i * 37) % 11 for i in range(500)]
+        order = ao.argsort(array.array("h", data), stable=False)
+        assert sorted(order) == list(range(len(data)))
+        assert [data[i] for i in order] == sorted(data)
+
+    def test_nan_last(self):
+        """Test NaN indices come after every number."""
+        import arrayops as ao
+
+        arr = array.array("d", [2.0, float("nan"), -math.inf, 1.0, float("nan")])
+        assert list(ao.argsort(arr)) == [2, 3, 0, 1, 4]
+
+    def test_reorder_companion_column(self):
+        """Test reordering a second column by the argsort of a key column."""
+        import arrayops as ao
+
+        keys = array.array("l", [30, 10, 20, 10])
+        names = ["c", "a", "b", "a2"]
+        order = ao.argsort(keys)
+        assert [names[i] for i in order] == ["a", "a2", "b", "c"]
+
+    def test_empty(self):
+        """Test argsort of an empty array is an empty index array."""
+        import arrayops as ao
+
+        result = ao.argsort(array.array("d"))
+        assert len(result) == 0 and result.typecode == "I"
+
+    def test_large(self):
+        """Test a large input (exercises the parallel sort if enabled)."""
+        import arrayops as ao
+
+        n = 100_000
+        data = array.array("i", [(i * 7919) % 1000 for i in range(n)])
+        order = ao.argsort(data)
+        expected = sorted(range(n), key=lambda i: data[i])
+        assert list(order) == expected
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy input matches numpy.argsort(kind='stable')."""
+        import arrayops as ao
+
+        data = np.random.default_rng(0).integers(0, 100, size=5000).astype(np.float64)
+        result = ao.argsort(data)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.uint32
+        np.testing.assert_array_equal(result, np.argsort(data, kind="stable"))
+
+
+class TestSortSemantics:
+    """Tests for the stable flag and NaN placement of sort."""
+
+    def test_nan_last(self):
+        """Test sort places NaN after every number instead of scrambling the order."""
+        import arrayops as ao
+
+        arr = array.array("d", [3.0, float("nan"), 1.0, float("nan"), -2.0, 0.5])
+        ao.sort(arr)
+        assert list(arr[:4]) == [-2.0, 0.5, 1.0, 3.0]
+        assert math.isnan(arr[4]) and math.isnan(arr[5])
+
+    def test_stable_flag(self):
+        """Test both stable and unstable sorts order the values."""
+        import arrayops as ao
+
+        data = [(i * 13) % 17 for i in range(200)]
+        for stable in (True, False):
+            arr = array.array("i", data)
+            ao.sort(arr, stable=stable)
+            assert list(arr) == sorted(data)
+
+    def test_stable_signed_zero(self):
+        """Test stable sorting keeps -0.0 and 0.0 in their original order."""
+        import arrayops as ao
+
+        arr = array.array("d", [0.0, -1.0, -0.0, 0.0])
+        ao.sort(arr, stable=True)
+        assert [math.copysign(1.0, x) for x in arr] == [-1.0, 1.0, -1.0, 1.0]
+
+    def test_radix_sort_large(self):
+        """Test large 4- and 8-byte arrays (radix path) against sorted() for every typecode."""
+        import arrayops as ao
+
+        n = 20_000
+        data = [(i * 7919) % 20011 - 10000 for i in range(n)]
+        for typecode in ["i", "l", "f", "d"]:
+            arr = array.array(typecode, data)
+            ao.sort(arr)
+            assert list(arr) == sorted(data), f"Failed for type {typecode}"
+        unsigned = [(i * 2654435761) % (2**32) for i in range(n)]
+        for typecode in ["I", "L"]:
+            arr = array.array(typecode, unsigned)
+            ao.sort(arr)
+            assert list(arr) == sorted(unsigned), f"Failed for type {typecode}"
+
+    def test_radix_sort_special_floats(self):
+        """Test the radix path orders infinities, signed zeros and NaN like the comparison sort."""
+        import arrayops as ao
+
+        specials = [float("nan"), math.inf, -math.inf, 0.0, -0.0, 5e-324, -5e-324]
+        data = [specials[i % 7] if i % 3 == 0 else (i * 31) % 997 - 498.5 for i in range(10_000)]
+        for typecode in ["f", "d"]:
+            arr = array.array(typecode, data)
+            ao.sort(arr)
+            numbers = [x for x in array.array(typecode, data) if not math.isnan(x)]
+            assert list(arr[: len(numbers)]) == sorted(numbers), f"Failed for type {typecode}"
+            assert all(math.isnan(x) for x in arr[len(numbers) :])
+            zeros = [math.copysign(1.0, x) for x in arr if x == 0.0]
+            expected = [math.copysign(1.0, x) for x in array.array(typecode, data) if x == 0.0]
+            assert zeros == expected
@@ -113,6 +113,85 @@ class TestSum:
             arrayops.sum(arr)
 
 
+class TestSumAccumulator:
+    """Tests for widened integer accumulation and the dtype= argument."""
+
+    def test_sum_does_not_wrap(self):
+        """Test narrow integer sums exceed the element range without wrapping."""
+        import arrayops
+
+        test_cases = [
+            ("b", [127] * 1000),
+            ("B", [255] * 1000),
+            ("h", [-32768] * 1000),
+            ("H", [65535] * 1000),
+            ("i", [2**31 - 1] * 1000),
+            ("I", [2**32 - 1] * 1000),
+        ]
+        for typecode, values in test_cases:
+            arr = array.array(typecode, values)
+            assert arrayops.sum(arr) == sum(values), f"Failed for type {typecode}"
+            assert arrayops.mean(arr) == values[0], f"Failed for type {typecode}"
+
+    @pytest.mark.skipif(array.array("l").itemsize < 8, reason="Requires 64-bit long")
+    def test_sum_64bit_exact(self):
+        """Test 64-bit sums are exact beyond the 64-bit range."""
+        import arrayops
+
+        signed = [2**63 - 1, 2**63 - 1, -(2**63), 5, -7] * 37
+        assert arrayops.sum(array.array("l", signed)) == sum(signed)
+        unsigned = [2**64 - 1, 2**63, 1] * 41
+        assert arrayops.sum(array.array("L", unsigned)) == sum(unsigned)
+        assert arrayops.mean(array.array("L", unsigned)) == pytest.approx(
+            sum(unsigned) / len(unsigned)
+        )
+
+    def test_dtype_int64_overflow(self):
+        """Test dtype='int64' raises OverflowError only when the total does not fit."""
+        import arrayops
+
+        arr = array.array("i", [2**31 - 1] * 10)
+        assert arrayops.sum(arr, dtype="int64") == 10 * (2**31 - 1)
+        assert arrayops.sum(arr, dtype="int128") == 10 * (2**31 - 1)
+        if array.array("l").itemsize == 8:
+            big = array.array("l", [2**62, 2**62])
+            with pytest.raises(OverflowError, match="int128"):
+                arrayops.sum(big, dtype="int64")
+            assert arrayops.sum(big, dtype="int128") == 2**63
+        with pytest.raises(OverflowError):
+            arrayops.sum(array.array("i", [-1, -2]), dtype="uint64")
+
+    def test_dtype_float64(self):
+        """Test dtype='float64' returns a float for every typecode."""
+        import arrayops
+
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            arr = array.array(typecode, [1, 2, 3, 4])
+            result = arrayops.sum(arr, dtype="float64")
+            assert isinstance(result, float), f"Failed for type {typecode}"
+            assert result == 10.0, f"Failed for type {typecode}"
+            assert arrayops.mean(arr, dtype="float64") == 2.5
+
+    def test_dtype_validation(self):
+        """Test unknown dtypes and integer dtypes on float arrays are rejected."""
+        import arrayops
+
+        with pytest.raises(ValueError, match="dtype"):
+            arrayops.sum(array.array("i", [1]), dtype="int32")
+        with pytest.raises(TypeError, match="integer array"):
+            arrayops.sum(array.array("d", [1.0]), dtype="int64")
+        with pytest.raises(TypeError, match="integer array"):
+            arrayops.mean(array.array("f", [1.0]), dtype="int128")
+
+    def test_empty_with_dtype(self):
+        """Test empty arrays return zero of the accumulator's kind."""
+        import arrayops
+
+        assert arrayops.sum(array.array("i"), dtype="int64") == 0
+        result = arrayops.sum(array.array("i"), dtype="float64")
+        assert result == 0.0 and isinstance(result, float)
+
+
 class TestScale:
     """Tests for scale operation."""
 
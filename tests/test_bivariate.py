@@ -0,0 +1,190 @@
+"""Tests for two-array statistics (cov, corr, linregress) and weighted moments."""
+
+import array
+import math
+import statistics
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _cov(x, y, ddof=0):
+    mx = sum(x) / len(x)
+    my = sum(y) / len(y)
+    return sum((a - mx) * (b - my) for a, b in zip(x, y)) / (len(x) - ddof)
+
+
+def _corr(x, y):
+    return _cov(x, y) / math.sqrt(_cov(x, x) * _cov(y, y))
+
+
+class TestCovCorr:
+    """Tests for cov and corr."""
+
+    def test_cov_all_types(self):
+        """Test cov against a pure Python reference for every typecode."""
+        import arrayops as ao
+
+        x = [1, 5, 2, 8, 3, 9, 4]
+        y = [7, 3, 6, 1, 5, 0, 2]
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            result = ao.cov(array.array(typecode, x), array.array(typecode, y))
+            assert result == pytest.approx(_cov(x, y)), f"Failed for type {typecode}"
+
+    def test_cov_ddof(self):
+        """Test the sample covariance with ddof=1."""
+        import arrayops as ao
+
+        x = array.array("d", [1.0, 2.0, 3.0, 4.0])
+        y = array.array("d", [2.0, 1.0, 4.0, 3.0])
+        assert ao.cov(x, y, ddof=1) == pytest.approx(_cov(list(x), list(y), ddof=1))
+        assert ao.cov(x, x) == pytest.approx(ao.var(x))
+        with pytest.raises(ValueError, match="ddof"):
+            ao.cov(x, y, ddof=4)
+
+    def test_corr(self):
+        """Test corr against a pure Python reference."""
+        import arrayops as ao
+
+        x = [1.0, 2.5, 3.0, 4.5, 7.0, 8.0]
+        y = [2.0, 2.0, 4.0, 5.0, 6.5, 9.0]
+        result = ao.corr(array.array("d", x), array.array("d", y))
+        assert result == pytest.approx(_corr(x, y))
+        assert ao.corr(array.array("d", x), array.array("d", x)) == pytest.approx(1.0)
+
+    def test_corr_constant_is_nan(self):
+        """Test corr of a constant array is NaN."""
+        import arrayops as ao
+
+        x = array.array("i", [3, 3, 3])
+        y = array.array("i", [1, 2, 3])
+        assert math.isnan(ao.corr(x, y))
+
+    def test_large_offset_is_stable(self):
+        """Test co-moments stay accurate for values far from zero."""
+        import arrayops as ao
+
+        n = 10_000
+        x = [1e9 + (i % 17) for i in range(n)]
+        y = [2e9 - 3 * (i % 17) for i in range(n)]
+        result = ao.cov(array.array("d", x), array.array("d", y))
+        assert result == pytest.approx(-3 * statistics.pvariance([i % 17 for i in range(n)]))
+        assert ao.corr(array.array("d", x), array.array("d", y)) == pytest.approx(-1.0)
+
+    def test_validation(self):
+        """Test the same type/length validation as add()."""
+        import arrayops as ao
+
+        with pytest.raises(TypeError, match="same type"):
+            ao.cov(array.array("i", [1, 2]), array.array("d", [1.0, 2.0]))
+        with pytest.raises(ValueError, match="same length"):
+            ao.corr(array.array("i", [1, 2]), array.array("i", [1, 2, 3]))
+        with pytest.raises(ValueError, match="empty"):
+            ao.cov(array.array("i"), array.array("i"))
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test cov and corr with NumPy arrays."""
+        import arrayops as ao
+
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=5000)
+        y = 0.5 * x + rng.normal(size=5000)
+        assert ao.cov(x, y, ddof=1) == pytest.approx(np.cov(x, y)[0, 1])
+        assert ao.corr(x, y) == pytest.approx(np.corrcoef(x, y)[0, 1])
+
+
+class TestLinregress:
+    """Tests for linregress."""
+
+    def test_exact_line(self):
+        """Test a perfect linear relationship."""
+        import arrayops as ao
+
+        x = array.array("i", [0, 1, 2, 3, 4])
+        y = array.array("i", [1, 3, 5, 7, 9])
+        slope, intercept, rvalue = ao.linregress(x, y)
+        assert slope == pytest.approx(2.0)
+        assert intercept == pytest.approx(1.0)
+        assert rvalue == pytest.approx(1.0)
+
+    def test_matches_closed_form(self):
+        """Test against the closed-form least-squares solution."""
+        import arrayops as ao
+
+        x = [1.0, 2.0, 4.0, 5.0, 7.0]
+        y = [2.0, 3.5, 3.0, 6.0, 8.5]
+        slope, intercept, rvalue = ao.linregress(array.array("d", x), array.array("d", y))
+        expected_slope = _cov(x, y) / _cov(x, x)
+        expected_intercept = sum(y) / len(y) - expected_slope * sum(x) / len(x)
+        assert slope == pytest.approx(expected_slope)
+        assert intercept == pytest.approx(expected_intercept)
+        assert rvalue == pytest.approx(_corr(x, y))
+
+    def test_constant_x(self):
+        """Test a constant x raises ValueError."""
+        import arrayops as ao
+
+        with pytest.raises(ValueError, match="identical"):
+            ao.linregress(array.array("d", [2.0, 2.0]), array.array("d", [1.0, 3.0]))
+
+
+class TestWeighted:
+    """Tests for average and weighted var/std."""
+
+    def test_average_unweighted(self):
+        """Test average without weights equals mean."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2, 3, 4])
+        assert ao.average(arr) == ao.mean(arr)
+
+    def test_average_weighted(self):
+        """Test weighted average for every typecode."""
+        import arrayops as ao
+
+        x = [1, 2, 4, 7]
+        w = [1, 1, 2, 0]
+        expected = sum(a * b for a, b in zip(x, w)) / sum(w)
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            result = ao.average(array.array(typecode, x), weights=array.array(typecode, w))
+            assert result == pytest.approx(expected), f"Failed for type {typecode}"
+
+    def test_weighted_var_std(self):
+        """Test weighted variance matches the expanded-sample variance."""
+        import arrayops as ao
+
+        x = array.array("d", [1.0, 2.0, 5.0])
+        w = array.array("d", [2.0, 1.0, 3.0])
+        expanded = array.array("d", [1.0, 1.0, 2.0, 5.0, 5.0, 5.0])
+        assert ao.var(x, weights=w) == pytest.approx(ao.var(expanded))
+        assert ao.std(x, weights=w) == pytest.approx(ao.std(expanded))
+
+    def test_unit_weights_match_unweighted(self):
+        """Test unit weights reproduce the unweighted statistics on a longer array."""
+        import arrayops as ao
+
+        x = array.array("d", [math.sin(i) * 100 for i in range(3000)])
+        w = array.array("d", [1.0] * 3000)
+        assert ao.average(x, weights=w) == pytest.approx(ao.mean(x))
+        assert ao.var(x, weights=w) == pytest.approx(ao.var(x))
+
+    def test_invalid_weights(self):
+        """Test negative, zero-sum and mismatched weights raise."""
+        import arrayops as ao
+
+        x = array.array("d", [1.0, 2.0])
+        with pytest.raises(ValueError, match="non-negative"):
+            ao.average(x, weights=array.array("d", [1.0, -1.0]))
+        with pytest.raises(ValueError, match="sum to zero"):
+            ao.var(x, weights=array.array("d", [0.0, 0.0]))
+        with pytest.raises(TypeError, match="same type"):
+            ao.average(x, weights=array.array("i", [1, 1]))
+        with pytest.raises(ValueError, match="same length"):
+            ao.average(x, weights=array.array("d", [1.0]))
@@ -0,0 +1,113 @@
+"""Tests for concatenate."""
+
+import array
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+TYPECODES = ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]
+
+
+class TestConcatenate:
+    """Tests for concatenate."""
+
+    def test_all_types(self):
+        """Test joining several arrays for every typecode."""
+        import arrayops as ao
+
+        for typecode in TYPECODES:
+            parts = [
+                array.array(typecode, [1, 2]),
+                array.array(typecode),
+                array.array(typecode, [3]),
+                array.array(typecode, [4, 5, 6]),
+            ]
+            result = ao.concatenate(parts)
+            assert result.typecode == typecode
+            assert list(result) == [1, 2, 3, 4, 5, 6], f"Failed for type {typecode}"
+
+    def test_single_and_iterables(self):
+        """Test a single array and non-list iterables."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2, 3])
+        result = ao.concatenate([arr])
+        assert result is not arr
+        assert list(result) == [1, 2, 3]
+        assert list(ao.concatenate((arr, arr))) == [1, 2, 3, 1, 2, 3]
+        assert list(ao.concatenate(a for a in [arr, arr])) == [1, 2, 3, 1, 2, 3]
+
+    def test_memoryview_inputs(self):
+        """Test memoryviews may be mixed with array.array inputs."""
+        import arrayops as ao
+
+        first = array.array("d", [1.0])
+        result = ao.concatenate([first, memoryview(array.array("d", [2.0, 3.0]))])
+        assert isinstance(result, array.array)
+        assert list(result) == [1.0, 2.0, 3.0]
+
+    def test_empty(self):
+        """Test empty inputs, including a leading one, and an empty sequence."""
+        import arrayops as ao
+
+        result = ao.concatenate([array.array("f"), array.array("f")])
+        assert len(result) == 0 and result.typecode == "f"
+        result = ao.concatenate([array.array("f"), array.array("f", [1.5])])
+        assert result.typecode == "f" and list(result) == [1.5]
+        with pytest.raises(ValueError, match="at least one"):
+            ao.concatenate([])
+
+    def test_mismatched_typecodes(self):
+        """Test a typecode mismatch names the offending array."""
+        import arrayops as ao
+
+        with pytest.raises(TypeError, match="array 2 has 'd'"):
+            ao.concatenate([array.array("i", [1]), array.array("i", [2]), array.array("d", [3.0])])
+        with pytest.raises(TypeError):
+            ao.concatenate([array.array("i", [1]), [2, 3]])
+
+    def test_out(self):
+        """Test writing into a preallocated out array, including an input."""
+        import arrayops as ao
+
+        a = array.array("h", [1, 2])
+        b = array.array("h", [3, 4])
+        out = array.array("h", [0] * 4)
+        assert ao.concatenate([a, b], out=out) is out
+        assert list(out) == [1, 2, 3, 4]
+        with pytest.raises(ValueError, match="length"):
+            ao.concatenate([a, b], out=array.array("h", [0] * 3))
+
+        c = array.array("h", [7, 8, 9])
+        ao.concatenate([c[1:], c[:1]], out=c)
+        assert list(c) == [8, 9, 7]
+
+        view = memoryview(c)
+        ao.concatenate([view[1:], view[:1]], out=c)
+        assert list(c) == [9, 7, 8]
+
+    def test_many_partitions(self):
+        """Test joining many small per-partition results."""
+        import arrayops as ao
+
+        parts = [array.array("l", range(i, i + 7)) for i in range(0, 7000, 7)]
+        assert list(ao.concatenate(parts)) == list(range(7000))
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs match numpy.concatenate and keep the NumPy container."""
+        import arrayops as ao
+
+        rng = np.random.default_rng(0)
+        parts = [rng.normal(size=int(n)) for n in rng.integers(0, 5000, size=100)]
+        result = ao.concatenate(parts)
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_array_equal(result, np.concatenate(parts))
+        with pytest.raises(TypeError):
+            ao.concatenate([parts[0], parts[1].astype(np.float32)])
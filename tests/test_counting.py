@@ -0,0 +1,82 @@
+"""Tests for the counting-table sort, unique and median paths of 8- and 16-bit arrays."""
+
+import array
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+SMALL_TYPES = {
+    "b": (-128, 127),
+    "B": (0, 255),
+    "h": (-32768, 32767),
+    "H": (0, 65535),
+}
+
+
+def _lower_median(values):
+    return sorted(values)[(len(values) - 1) // 2]
+
+
+class TestCountingPaths:
+    """Tests for sort, unique and median on b, B, h and H arrays."""
+
+    def test_dense_values(self):
+        """Test sort, unique and median for every small typecode."""
+        import arrayops as ao
+
+        for typecode, (low, high) in SMALL_TYPES.items():
+            span = min(high - low + 1, 1000)
+            data = [low + (i * 7919) % span for i in range(5000)]
+            arr = array.array(typecode, data)
+            assert list(ao.unique(arr)) == sorted(set(data)), f"Failed for type {typecode}"
+            assert ao.median(arr) == _lower_median(data), f"Failed for type {typecode}"
+            ao.sort(arr)
+            assert list(arr) == sorted(data), f"Failed for type {typecode}"
+
+    def test_type_extremes(self):
+        """Test the smallest and largest value of each type survive the key mapping."""
+        import arrayops as ao
+
+        for typecode, (low, high) in SMALL_TYPES.items():
+            data = [high, low, 0, high, low, low]
+            arr = array.array(typecode, data)
+            assert list(ao.unique(arr)) == sorted(set(data)), f"Failed for type {typecode}"
+            assert ao.median(arr) == _lower_median(data)
+            ao.sort(arr)
+            assert list(arr) == sorted(data)
+
+    def test_sparse_wide_range(self):
+        """Test a few values spread over the whole 16-bit range (comparison fallback)."""
+        import arrayops as ao
+
+        data = [30000, -32768, 5, 32767, -1]
+        arr = array.array("h", data)
+        assert list(ao.unique(arr)) == sorted(data)
+        assert ao.median(arr) == 5
+        ao.sort(arr, stable=False)
+        assert list(arr) == sorted(data)
+
+    def test_median_even_length(self):
+        """Test an even-length median is the lower middle value."""
+        import arrayops as ao
+
+        assert ao.median(array.array("B", [4, 1, 3, 2])) == 2
+        assert ao.median(array.array("b", [-5, -5, 7, 7])) == -5
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test a uint16 image-like array matches NumPy."""
+        import arrayops as ao
+
+        data = np.random.default_rng(0).integers(0, 4096, size=100_000, dtype=np.uint16)
+        np.testing.assert_array_equal(ao.unique(data), np.unique(data))
+        assert ao.median(data) == np.sort(data)[(len(data) - 1) // 2]
+        expected = np.sort(data)
+        ao.sort(data)
+        np.testing.assert_array_equal(data, expected)
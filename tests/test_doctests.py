@@ -275,6 +275,17 @@ class TestUniqueExamples:
         unique_arr = ao.unique(arr)
         assert list(unique_arr) == [1, 2, 5, 8, 9]
 
+    def test_unique_factorize_example(self):
+        import arrayops as ao
+
+        arr = array.array("i", [5, 2, 8, 2, 1, 5, 9])
+        values, codes, counts = ao.unique(
+            arr, sorted=False, return_inverse=True, return_counts=True
+        )
+        assert list(values) == [5, 2, 8, 1, 9]
+        assert list(codes) == [0, 1, 2, 1, 3, 0, 4]
+        assert list(counts) == [2, 2, 1, 1, 1]
+
 
 class TestSliceExamples:
     """Test examples from slice() docstring."""
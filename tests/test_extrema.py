@@ -0,0 +1,113 @@
+"""Tests for fused extrema operations (min_max, argmin, argmax, argminmax)."""
+
+import array
+import math
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class TestMinMax:
+    """Tests for min_max."""
+
+    def test_all_types(self):
+        """Test min_max matches min() and max() for every typecode."""
+        import arrayops as ao
+
+        values = [5, 3, 9, 1, 7, 2, 8, 6, 4, 10, 0]
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            arr = array.array(typecode, values)
+            assert ao.min_max(arr) == (0, 10), f"Failed for type {typecode}"
+            lo, hi = ao.min_max(arr)
+            assert isinstance(lo, float if typecode in "fd" else int)
+
+    def test_type_limits(self):
+        """Test arrays made of the type's extreme values."""
+        import arrayops as ao
+
+        arr = array.array("i", [2**31 - 1] * 20)
+        assert ao.min_max(arr) == (2**31 - 1, 2**31 - 1)
+        assert ao.argminmax(arr) == (0, 0)
+        arr = array.array("B", [0, 255, 0, 255] * 5)
+        assert ao.argminmax(arr) == (0, 1)
+
+    def test_nan_policy(self):
+        """Test NaN propagates by default and is ignored with skipna=True."""
+        import arrayops as ao
+
+        arr = array.array("d", [3.0, math.nan, -1.0, 8.0])
+        lo, hi = ao.min_max(arr)
+        assert math.isnan(lo) and math.isnan(hi)
+        assert ao.min_max(arr, skipna=True) == (-1.0, 8.0)
+        with pytest.raises(ValueError, match="All-NaN"):
+            ao.min_max(array.array("d", [math.nan, math.nan]), skipna=True)
+
+    def test_infinities(self):
+        """Test infinities are ordinary extrema."""
+        import arrayops as ao
+
+        arr = array.array("f", [1.0, math.inf, -math.inf, 2.0])
+        assert ao.min_max(arr) == (-math.inf, math.inf)
+        assert ao.argminmax(arr) == (2, 1)
+
+    def test_empty(self):
+        """Test empty arrays raise ValueError."""
+        import arrayops as ao
+
+        with pytest.raises(ValueError, match="empty"):
+            ao.min_max(array.array("i"))
+        with pytest.raises(ValueError, match="empty"):
+            ao.argmax(array.array("d"))
+
+
+class TestArgExtrema:
+    """Tests for argmin, argmax and argminmax."""
+
+    def test_first_occurrence(self):
+        """Test ties resolve to the first index."""
+        import arrayops as ao
+
+        values = [4, 1, 7, 1, 7, 3, 1, 7, 0, 9, 9, 0, 5]
+        for typecode in ["b", "h", "i", "l", "f", "d"]:
+            arr = array.array(typecode, values)
+            assert ao.argmin(arr) == values.index(min(values)), f"Failed for type {typecode}"
+            assert ao.argmax(arr) == values.index(max(values)), f"Failed for type {typecode}"
+            assert ao.argminmax(arr) == (8, 9)
+
+    def test_nan_policy(self):
+        """Test the index of the first NaN is returned unless skipna=True."""
+        import arrayops as ao
+
+        arr = array.array("d", [3.0, -1.0, math.nan, 8.0, math.nan])
+        assert ao.argmin(arr) == 2
+        assert ao.argmax(arr) == 2
+        assert ao.argminmax(arr, skipna=True) == (1, 3)
+
+    def test_long_array(self):
+        """Test a long array against Python's min/max."""
+        import arrayops as ao
+
+        values = [(i * 7919) % 100_003 for i in range(200_000)]
+        arr = array.array("l", values)
+        assert ao.argmin(arr) == values.index(min(values))
+        assert ao.argmax(arr) == values.index(max(values))
+        assert ao.min_max(arr) == (min(values), max(values))
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test against numpy.argmin/argmax, including NaN."""
+        import arrayops as ao
+
+        rng = np.random.default_rng(1)
+        arr = rng.normal(size=1000)
+        assert ao.argmin(arr) == int(np.argmin(arr))
+        assert ao.argmax(arr) == int(np.argmax(arr))
+        arr[500] = np.nan
+        assert ao.argmin(arr) == int(np.argmin(arr))
+        assert ao.argmax(arr, skipna=True) == int(np.nanargmax(arr))
@@ -0,0 +1,161 @@
+"""Tests for groupby_agg keyed aggregation."""
+
+import array
+import math
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _reference(keys, values):
+    groups = {}
+    for k, v in zip(keys, values):
+        groups.setdefault(k, []).append(v)
+    unique = sorted(groups)
+    return unique, {
+        "sum": [sum(groups[k]) for k in unique],
+        "mean": [sum(groups[k]) / len(groups[k]) for k in unique],
+        "count": [len(groups[k]) for k in unique],
+        "min": [min(groups[k]) for k in unique],
+        "max": [max(groups[k]) for k in unique],
+    }
+
+
+def _check(keys, values, key_typecode="l", value_typecode="d"):
+    import arrayops as ao
+
+    unique, results = ao.groupby_agg(
+        array.array(key_typecode, keys), array.array(value_typecode, values)
+    )
+    expected_unique, expected = _reference(keys, values)
+    assert list(unique) == expected_unique
+    assert list(results) == ["sum", "mean", "count", "min", "max"]
+    for name in ["sum", "count", "min", "max"]:
+        assert list(results[name]) == pytest.approx(expected[name]), name
+    assert list(results["mean"]) == pytest.approx(expected["mean"])
+
+
+class TestGroupbyAgg:
+    """Tests for groupby_agg."""
+
+    def test_small_range_keys(self):
+        """Test the dense path with keys from a small range."""
+        keys = [(i * 7) % 13 - 6 for i in range(500)]
+        values = [float((i * 31) % 17) for i in range(500)]
+        _check(keys, values)
+
+    def test_sorted_keys(self):
+        """Test the sorted-run path."""
+        keys = sorted((i * 7) % 13 for i in range(500))
+        values = [float(i % 5) for i in range(500)]
+        _check(keys, values)
+
+    def test_sparse_keys(self):
+        """Test the hash path with keys spread over a wide range."""
+        keys = [((i * 7919) % 101) * 1_000_003 - 50_000_000 for i in range(2000)]
+        values = [float(i % 23) - 11.0 for i in range(2000)]
+        _check(keys, values, key_typecode="i")
+
+    def test_large_input(self):
+        """Test inputs large enough for the parallel paths."""
+        n = 200_000
+        _check([(i * 37) % 1000 for i in range(n)], [float(i % 97) for i in range(n)])
+        _check([(i * 37) % 1000 * 100_003 for i in range(n)], [float(i % 97) for i in range(n)])
+
+    def test_all_typecodes(self):
+        """Test every key and value typecode."""
+        import arrayops as ao
+
+        keys = [3, 1, 3, 2, 1, 3]
+        values = [1, 2, 3, 4, 5, 6]
+        for key_typecode in ["b", "B", "h", "H", "i", "I", "l", "L"]:
+            for value_typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+                unique, results = ao.groupby_agg(
+                    array.array(key_typecode, keys), array.array(value_typecode, values)
+                )
+                msg = f"Failed for type {key_typecode}/{value_typecode}"
+                assert list(unique) == [1, 2, 3], msg
+                assert unique.typecode == key_typecode, msg
+                assert list(results["sum"]) == [7, 4, 10], msg
+                assert list(results["count"]) == [2, 1, 3], msg
+                assert list(results["min"]) == [2, 4, 1], msg
+                assert results["min"].typecode == value_typecode, msg
+                assert list(results["max"]) == [5, 4, 6], msg
+
+    def test_selected_aggs(self):
+        """Test that only the requested aggregations are returned, in order."""
+        import arrayops as ao
+
+        keys = array.array("i", [1, 2, 1])
+        values = array.array("d", [1.0, 2.0, 4.0])
+        unique, results = ao.groupby_agg(keys, values, aggs=["count", "mean"])
+        assert list(results) == ["count", "mean"]
+        assert list(results["mean"]) == [2.5, 2.0]
+
+    def test_empty(self):
+        """Test empty inputs return empty arrays."""
+        import arrayops as ao
+
+        unique, results = ao.groupby_agg(array.array("l"), array.array("d"), aggs=["sum"])
+        assert len(unique) == 0
+        assert len(results["sum"]) == 0
+
+    def test_nan_values(self):
+        """Test NaN values propagate into their group's sum, min and max."""
+        import arrayops as ao
+
+        keys = array.array("i", [1, 1, 2])
+        values = array.array("d", [math.nan, 1.0, 2.0])
+        _, results = ao.groupby_agg(keys, values, aggs=["sum", "min", "max"])
+        assert math.isnan(results["sum"][0]) and results["sum"][1] == 2.0
+        assert math.isnan(results["min"][0]) and math.isnan(results["max"][0])
+
+    def test_errors(self):
+        """Test validation of keys, lengths and aggregation names."""
+        import arrayops as ao
+
+        keys = array.array("i", [1, 2])
+        values = array.array("d", [1.0, 2.0])
+        with pytest.raises(TypeError, match="integer"):
+            ao.groupby_agg(values, values)
+        with pytest.raises(ValueError, match="same length"):
+            ao.groupby_agg(keys, array.array("d", [1.0]))
+        with pytest.raises(ValueError, match="Unknown aggregation"):
+            ao.groupby_agg(keys, values, aggs=["median"])
+
+    @pytest.mark.skipif(array.array("l").itemsize < 8, reason="Requires 64-bit long")
+    def test_sum_overflow(self):
+        """Test integer group sums that exceed 64 bits raise OverflowError."""
+        import arrayops as ao
+
+        keys = array.array("i", [1, 1])
+        values = array.array("l", [2**62, 2**62])
+        with pytest.raises(OverflowError):
+            ao.groupby_agg(keys, values, aggs=["sum"])
+        _, results = ao.groupby_agg(keys, values, aggs=["count", "max"])
+        assert list(results["count"]) == [2]
+
+        keys = array.array("i", [1, 1, 1, 2])
+        values = array.array("l", [2**62, 2**62, 2**62, 5])
+        _, results = ao.groupby_agg(keys, values, aggs=["mean"])
+        assert list(results["mean"]) == [float(2**62), 5.0]
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs return NumPy outputs."""
+        import arrayops as ao
+
+        rng = np.random.default_rng(0)
+        keys = rng.integers(0, 50, size=10_000)
+        values = rng.normal(size=10_000)
+        unique, results = ao.groupby_agg(keys, values, aggs=["sum", "count"])
+        assert isinstance(unique, np.ndarray)
+        np.testing.assert_array_equal(unique, np.unique(keys))
+        np.testing.assert_allclose(results["sum"], np.bincount(keys, weights=values))
+        np.testing.assert_array_equal(results["count"], np.bincount(keys))
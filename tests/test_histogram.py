@@ -0,0 +1,219 @@
+"""Tests for histogram and bincount."""
+
+import array
+import math
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _histogram(values, edges):
+    counts = [0] * (len(edges) - 1)
+    for x in values:
+        if math.isnan(x) or x < edges[0] or x > edges[-1]:
+            continue
+        for i in range(len(counts)):
+            if edges[i] <= x < edges[i + 1] or (i == len(counts) - 1 and x == edges[-1]):
+                counts[i] += 1
+                break
+    return counts
+
+
+class TestHistogram:
+    """Tests for histogram."""
+
+    def test_all_types(self):
+        """Test uniform bins over the data range for every typecode."""
+        import arrayops as ao
+
+        values = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 3]
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            counts, edges = ao.histogram(array.array(typecode, values), bins=3)
+            assert list(edges) == pytest.approx([0.0, 3.0, 6.0, 9.0])
+            assert list(counts) == [3, 4, 5], f"Failed for type {typecode}"
+            assert counts.typecode == "L" and edges.typecode == "d"
+
+    def test_default_bins(self):
+        """Test 10 bins by default and the right edge is inclusive."""
+        import arrayops as ao
+
+        counts, edges = ao.histogram(array.array("d", [0.0, 10.0]))
+        assert len(counts) == 10 and len(edges) == 11
+        assert counts[0] == 1 and counts[9] == 1 and sum(counts) == 2
+
+    def test_range_excludes_outside_and_nan(self):
+        """Test values outside range and NaN are not counted."""
+        import arrayops as ao
+
+        arr = array.array("d", [-1.0, 0.0, 0.5, float("nan"), 1.0, 2.0])
+        counts, edges = ao.histogram(arr, bins=2, range=(0.0, 1.0))
+        assert list(edges) == [0.0, 0.5, 1.0]
+        assert list(counts) == [1, 2]
+
+    def test_uniform_bins_match_reference(self):
+        """Test the O(1) bin computation agrees with an edge search near every edge."""
+        import arrayops as ao
+
+        _, edges = ao.histogram(array.array("d"), bins=7, range=(0.1, 9.7))
+        edge_values = list(edges)
+        values = [i * 0.01 for i in range(-50, 1051)]
+        values += edge_values
+        counts, _ = ao.histogram(array.array("d", values), bins=7, range=(0.1, 9.7))
+        assert list(counts) == _histogram(values, edge_values)
+
+    def test_explicit_edges(self):
+        """Test non-uniform edges located by binary search."""
+        import arrayops as ao
+
+        values = [0.5, 1.0, 1.5, 3.0, 9.0, 10.0, 11.0, -1.0]
+        edges = array.array("d", [0.0, 1.0, 2.0, 10.0])
+        counts, result_edges = ao.histogram(array.array("d", values), bins=edges)
+        assert list(result_edges) == list(edges)
+        assert list(counts) == _histogram(values, list(edges)) == [1, 2, 3]
+
+    def test_constant_input(self):
+        """Test a constant array widens the range by 0.5 on each side."""
+        import arrayops as ao
+
+        counts, edges = ao.histogram(array.array("i", [5, 5, 5]), bins=2)
+        assert list(edges) == [4.5, 5.0, 5.5]
+        assert list(counts) == [0, 3]
+
+    def test_empty(self):
+        """Test an empty array gives zero counts over the default range."""
+        import arrayops as ao
+
+        counts, edges = ao.histogram(array.array("d"), bins=4)
+        assert list(counts) == [0, 0, 0, 0]
+        assert list(edges) == [0.0, 0.25, 0.5, 0.75, 1.0]
+
+    def test_accumulate(self):
+        """Test histograms of several chunks merge into one counts buffer."""
+        import arrayops as ao
+
+        total = array.array("L", [0, 0, 0])
+        for chunk in ([0.5, 1.5], [2.5, 2.9], [0.1]):
+            result, _ = ao.histogram(
+                array.array("d", chunk), bins=3, range=(0.0, 3.0), counts=total
+            )
+            assert result is total
+        assert list(total) == [2, 1, 2]
+
+    def test_invalid_arguments(self):
+        """Test invalid bins, range and counts are rejected."""
+        import arrayops as ao
+
+        arr = array.array("d", [1.0, 2.0])
+        with pytest.raises(ValueError, match="positive"):
+            ao.histogram(arr, bins=0)
+        with pytest.raises(ValueError, match="range"):
+            ao.histogram(arr, range=(2.0, 1.0))
+        with pytest.raises(ValueError, match="finite"):
+            ao.histogram(arr, range=(0.0, float("inf")))
+        with pytest.raises(ValueError, match="not finite"):
+            ao.histogram(array.array("d", [1.0, float("inf")]))
+        with pytest.raises(ValueError, match="monotonically"):
+            ao.histogram(arr, bins=array.array("d", [0.0, 2.0, 1.0]))
+        with pytest.raises(ValueError, match="two edges"):
+            ao.histogram(arr, bins=array.array("d", [0.0]))
+        with pytest.raises(ValueError, match="length 10"):
+            ao.histogram(arr, counts=array.array("L", [0] * 3))
+        with pytest.raises(TypeError, match="'L'"):
+            ao.histogram(arr, bins=2, counts=array.array("i", [0, 0]))
+        for values in [arr, array.array("d")]:
+            with pytest.raises(MemoryError, match="histogram"):
+                ao.histogram(values, bins=2**62)
+
+    def test_large(self):
+        """Test a large input (exercises the parallel path if enabled)."""
+        import arrayops as ao
+
+        n = 300_000
+        arr = array.array("i", [(i * 31) % 1000 for i in range(n)])
+        counts, _ = ao.histogram(arr, bins=10, range=(0.0, 1000.0))
+        assert list(counts) == [n // 10] * 10
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test results match numpy.histogram."""
+        import arrayops as ao
+
+        rng = np.random.default_rng(0)
+        data = rng.exponential(size=50_000)
+        counts, edges = ao.histogram(data, bins=25)
+        expected_counts, expected_edges = np.histogram(data, bins=25)
+        assert isinstance(counts, np.ndarray)
+        np.testing.assert_array_equal(counts, expected_counts)
+        np.testing.assert_allclose(edges, expected_edges)
+        custom = np.array([0.0, 0.1, 0.5, 2.0, 8.0])
+        counts, _ = ao.histogram(data, bins=custom)
+        np.testing.assert_array_equal(counts, np.histogram(data, bins=custom)[0])
+
+
+class TestBincount:
+    """Tests for bincount."""
+
+    def test_all_integer_types(self):
+        """Test bincount for every integer typecode."""
+        import arrayops as ao
+
+        values = [1, 3, 1, 0, 7]
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L"]:
+            result = ao.bincount(array.array(typecode, values))
+            assert list(result) == [1, 2, 0, 1, 0, 0, 0, 1], f"Failed for type {typecode}"
+            assert result.typecode == "L"
+
+    def test_minlength(self):
+        """Test minlength pads the result but never truncates it."""
+        import arrayops as ao
+
+        arr = array.array("B", [2, 2])
+        assert list(ao.bincount(arr, minlength=5)) == [0, 0, 2, 0, 0]
+        assert list(ao.bincount(arr, minlength=1)) == [0, 0, 2]
+        assert list(ao.bincount(array.array("B"), minlength=2)) == [0, 0]
+
+    def test_accumulate(self):
+        """Test counts accumulate into an existing buffer."""
+        import arrayops as ao
+
+        total = array.array("L", [0] * 4)
+        ao.bincount(array.array("h", [1, 1, 2]), counts=total)
+        result = ao.bincount(array.array("h", [3, 1]), counts=total)
+        assert result is total
+        assert list(total) == [0, 3, 1, 1]
+        with pytest.raises(ValueError, match="does not fit"):
+            ao.bincount(array.array("h", [4]), counts=total)
+        assert list(total) == [0, 3, 1, 1]
+
+    def test_invalid(self):
+        """Test negative values and float arrays are rejected."""
+        import arrayops as ao
+
+        with pytest.raises(ValueError, match="non-negative"):
+            ao.bincount(array.array("i", [1, -1]))
+        with pytest.raises(TypeError, match="integer"):
+            ao.bincount(array.array("d", [1.0]))
+
+    def test_large(self):
+        """Test a large input (exercises the parallel path if enabled)."""
+        import arrayops as ao
+
+        n = 400_000
+        result = ao.bincount(array.array("i", [i % 100 for i in range(n)]))
+        assert list(result) == [n // 100] * 100
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test results match numpy.bincount."""
+        import arrayops as ao
+
+        data = np.random.default_rng(1).integers(0, 500, size=20_000, dtype=np.int32)
+        result = ao.bincount(data, minlength=600)
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_array_equal(result, np.bincount(data, minlength=600))
@@ -0,0 +1,206 @@
+"""Tests for take and put."""
+
+import array
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+TYPECODES = ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]
+INDEX_TYPECODES = ["b", "B", "h", "H", "i", "I", "l", "L"]
+
+
+class TestTake:
+    """Tests for take."""
+
+    def test_all_types(self):
+        """Test every data typecode with every index typecode."""
+        import arrayops as ao
+
+        data = [5, 1, 4, 2, 3]
+        positions = [4, 0, 0, 2, 1]
+        for typecode in TYPECODES:
+            arr = array.array(typecode, data)
+            for index_typecode in INDEX_TYPECODES:
+                result = ao.take(arr, array.array(index_typecode, positions))
+                assert result.typecode == typecode
+                assert list(result) == [data[i] for i in positions], (
+                    f"Failed for type {typecode} with indices {index_typecode}"
+                )
+
+    def test_argsort_indices(self):
+        """Test applying argsort output reorders the array."""
+        import arrayops as ao
+
+        arr = array.array("d", [3.5, -1.0, 2.25, 0.0])
+        assert list(ao.take(arr, ao.argsort(arr))) == sorted(arr)
+
+    def test_negative_indices(self):
+        """Test negative indices count from the end."""
+        import arrayops as ao
+
+        arr = array.array("i", [10, 20, 30])
+        assert list(ao.take(arr, array.array("b", [-1, -3, 0]))) == [30, 10, 10]
+
+    def test_modes(self):
+        """Test raise, clip and wrap handling of out-of-range indices."""
+        import arrayops as ao
+
+        arr = array.array("i", [10, 20, 30])
+        indices = array.array("l", [-5, -1, 3, 7])
+        with pytest.raises(IndexError, match="index -5 is out of bounds for size 3"):
+            ao.take(arr, indices)
+        assert list(ao.take(arr, indices, mode="clip")) == [10, 10, 30, 30]
+        assert list(ao.take(arr, indices, mode="wrap")) == [20, 30, 10, 20]
+        with pytest.raises(ValueError, match="mode"):
+            ao.take(arr, indices, mode="ignore")
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_large_unsigned_index(self):
+        """Test uint64 indices beyond the signed range are reported and wrapped."""
+        import arrayops as ao
+
+        arr = np.array([0.0, 1.0, 2.0])
+        big = np.array([2**64 - 1], dtype=np.uint64)
+        with pytest.raises(IndexError, match=str(2**64 - 1)):
+            ao.take(arr, big)
+        assert list(ao.take(arr, big, mode="wrap")) == [float((2**64 - 1) % 3)]
+
+    def test_out(self):
+        """Test writing into a preallocated out array."""
+        import arrayops as ao
+
+        arr = array.array("f", [1.0, 2.0, 3.0])
+        out = array.array("f", [0.0, 0.0])
+        result = ao.take(arr, array.array("I", [2, 0]), out=out)
+        assert result is out
+        assert list(out) == [3.0, 1.0]
+        with pytest.raises(ValueError, match="length"):
+            ao.take(arr, array.array("I", [2]), out=out)
+        with pytest.raises(TypeError, match="typecode"):
+            ao.take(arr, array.array("I", [2, 0]), out=array.array("d", [0.0, 0.0]))
+        with pytest.raises(IndexError):
+            ao.take(arr, array.array("i", [0, 3]), out=out)
+        assert list(out) == [3.0, 1.0]
+
+    def test_out_aliases_input(self):
+        """Test out may be the input array itself."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2, 3, 4])
+        ao.take(arr, array.array("I", [3, 2, 1, 0]), out=arr)
+        assert list(arr) == [4, 3, 2, 1]
+
+    def test_empty(self):
+        """Test empty indices and an empty source array."""
+        import arrayops as ao
+
+        result = ao.take(array.array("d", [1.0]), array.array("I"))
+        assert len(result) == 0 and result.typecode == "d"
+        assert len(ao.take(array.array("d"), array.array("I"))) == 0
+        with pytest.raises(IndexError, match="empty"):
+            ao.take(array.array("d"), array.array("I", [0]), mode="clip")
+
+    def test_float_indices_rejected(self):
+        """Test float index arrays are rejected."""
+        import arrayops as ao
+
+        with pytest.raises(TypeError, match="integer"):
+            ao.take(array.array("i", [1, 2]), array.array("d", [0.0]))
+
+    def test_large(self):
+        """Test a large gather (exercises the parallel path if enabled)."""
+        import arrayops as ao
+
+        data = array.array("d", [float(i) for i in range(50_000)])
+        positions = [(i * 7919) % 50_000 for i in range(300_000)]
+        result = ao.take(data, array.array("I", positions))
+        assert list(result) == [float(i) for i in positions]
+        with pytest.raises(IndexError):
+            ao.take(data, array.array("I", positions + [50_000]))
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs match numpy.take in every mode."""
+        import arrayops as ao
+
+        rng = np.random.default_rng(0)
+        data = rng.normal(size=1000)
+        indices = rng.integers(-1500, 1500, size=20_000, dtype=np.int64)
+        for mode in ("clip", "wrap"):
+            result = ao.take(data, indices, mode=mode)
+            assert isinstance(result, np.ndarray)
+            np.testing.assert_array_equal(result, np.take(data, indices, mode=mode))
+        in_range = indices % 1000
+        np.testing.assert_array_equal(ao.take(data, in_range), np.take(data, in_range))
+
+
+class TestPut:
+    """Tests for put."""
+
+    def test_all_types(self):
+        """Test every data typecode with every index typecode."""
+        import arrayops as ao
+
+        for typecode in TYPECODES:
+            for index_typecode in INDEX_TYPECODES:
+                arr = array.array(typecode, [0, 0, 0, 0])
+                ao.put(arr, array.array(index_typecode, [3, 1]), array.array(typecode, [7, 9]))
+                assert list(arr) == [0, 9, 0, 7], (
+                    f"Failed for type {typecode} with indices {index_typecode}"
+                )
+
+    def test_repeated_values_and_indices(self):
+        """Test short values are cycled and the last write to a position wins."""
+        import arrayops as ao
+
+        arr = array.array("i", [0] * 5)
+        ao.put(arr, array.array("i", [0, 2, 4, -1]), array.array("i", [1, 2]))
+        assert list(arr) == [1, 0, 2, 0, 2]
+        ao.put(arr, array.array("i", [1, 1, 1]), array.array("i", [5]))
+        assert list(arr) == [1, 5, 2, 0, 2]
+
+    def test_modes(self):
+        """Test raise writes nothing on a bad index; clip and wrap redirect it."""
+        import arrayops as ao
+
+        arr = array.array("h", [0, 0, 0])
+        with pytest.raises(IndexError, match="out of bounds"):
+            ao.put(arr, array.array("i", [0, 3]), array.array("h", [1, 2]))
+        assert list(arr) == [0, 0, 0]
+        ao.put(arr, array.array("i", [9]), array.array("h", [4]), mode="clip")
+        assert list(arr) == [0, 0, 4]
+        ao.put(arr, array.array("i", [-4]), array.array("h", [6]), mode="wrap")
+        assert list(arr) == [0, 0, 6]
+
+    def test_invalid(self):
+        """Test empty values, mismatched typecodes and read-only targets."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2])
+        ao.put(arr, array.array("i"), array.array("i"))
+        with pytest.raises(ValueError, match="empty"):
+            ao.put(arr, array.array("i", [0]), array.array("i"))
+        with pytest.raises(TypeError, match="same type"):
+            ao.put(arr, array.array("i", [0]), array.array("d", [1.0]))
+        with pytest.raises(ValueError, match="read-only"):
+            ao.put(memoryview(bytes(8)).cast("i"), array.array("i", [0]), arr)
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs match numpy.put."""
+        import arrayops as ao
+
+        rng = np.random.default_rng(0)
+        arr = np.zeros(1000)
+        expected = arr.copy()
+        indices = rng.integers(0, 1000, size=300, dtype=np.uint32)
+        values = rng.normal(size=300)
+        ao.put(arr, indices, values)
+        np.put(expected, indices, values)
+        np.testing.assert_array_equal(arr, expected)
@@ -0,0 +1,257 @@
+"""Tests for the comparison masks, compress and nonzero."""
+
+import array
+import math
+import operator
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+TYPECODES = ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]
+
+COMPARISONS = {
+    "greater": operator.gt,
+    "greater_equal": operator.ge,
+    "less": operator.lt,
+    "less_equal": operator.le,
+    "equal": operator.eq,
+    "not_equal": operator.ne,
+}
+
+
+class TestComparisons:
+    """Tests for greater, less, equal, between and friends."""
+
+    def test_all_types(self):
+        """Test every comparison for every typecode."""
+        import arrayops as ao
+
+        data = [0, 3, 7, 3, 1, 9]
+        for typecode in TYPECODES:
+            arr = array.array(typecode, data)
+            for name, op in COMPARISONS.items():
+                mask = getattr(ao, name)(arr, 3)
+                assert mask.typecode == "B"
+                assert list(mask) == [int(op(x, 3)) for x in data], (
+                    f"Failed for type {typecode} with {name}"
+                )
+            assert list(ao.between(arr, 1, 7)) == [int(1 <= x <= 7) for x in data], (
+                f"Failed for type {typecode}"
+            )
+
+    def test_fractional_scalar_on_integers(self):
+        """Test a float threshold against an integer array is compared exactly."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2, 3, 4])
+        assert list(ao.greater(arr, 2.5)) == [0, 0, 1, 1]
+        assert list(ao.less_equal(arr, 2.5)) == [1, 1, 0, 0]
+        assert list(ao.equal(arr, 2.0)) == [0, 1, 0, 0]
+        assert list(ao.between(arr, 1.5, 3.5)) == [0, 1, 1, 0]
+
+    def test_scalar_out_of_type_range(self):
+        """Test scalars outside the element type's range."""
+        import arrayops as ao
+
+        arr = array.array("b", [-128, 0, 127])
+        assert list(ao.less(arr, 300)) == [1, 1, 1]
+        assert list(ao.greater(arr, -1000)) == [1, 1, 1]
+        assert list(ao.equal(array.array("B", [0, 255]), -1)) == [0, 0]
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_64bit_boundary(self):
+        """Test operands just past the 64-bit ranges, where float64 would round."""
+        import arrayops as ao
+
+        i64 = np.array([np.iinfo(np.int64).min, 0, np.iinfo(np.int64).max], dtype=np.int64)
+        assert list(ao.equal(i64, 2**63)) == [0, 0, 0]
+        assert list(ao.greater_equal(i64, 2**63)) == [0, 0, 0]
+        assert list(ao.less(i64, 2**63)) == [1, 1, 1]
+        assert list(ao.not_equal(i64, 2**63)) == [1, 1, 1]
+        assert list(ao.less_equal(i64, -(2**63) - 1)) == [0, 0, 0]
+        assert list(ao.greater(i64, float(2**63))) == [0, 0, 0]
+        assert list(ao.greater(i64, -(2**200))) == [1, 1, 1]
+        assert list(ao.between(i64, 2**62, 2**64)) == [0, 0, 1]
+        assert list(ao.between(i64, -0.5, float(2**62))) == [0, 1, 0]
+
+        u64 = np.array([0, 2**64 - 1], dtype=np.uint64)
+        assert list(ao.equal(u64, 2**64)) == [0, 0]
+        assert list(ao.greater_equal(u64, 2**64)) == [0, 0]
+        assert list(ao.equal(u64, float(2**63))) == [0, 0]
+        assert list(ao.greater(u64, -1)) == [1, 1]
+
+    def test_float_scalar_rounded_for_float32(self):
+        """Test a Python float is rounded to float32 against 'f' arrays, as in NumPy."""
+        import arrayops as ao
+
+        arr = array.array("f", [0.1, 0.5])
+        assert list(ao.equal(arr, 0.1)) == [1, 0]
+        assert list(ao.equal(array.array("d", [0.1]), 0.1)) == [1]
+
+    def test_nan(self):
+        """Test NaN elements and NaN thresholds follow IEEE comparison rules."""
+        import arrayops as ao
+
+        nan = float("nan")
+        arr = array.array("d", [nan, 1.0, -0.0])
+        assert list(ao.greater(arr, 0.5)) == [0, 1, 0]
+        assert list(ao.equal(arr, 0.0)) == [0, 0, 1]
+        assert list(ao.not_equal(arr, 1.0)) == [1, 0, 1]
+        assert list(ao.less(arr, nan)) == [0, 0, 0]
+        assert list(ao.between(arr, -1.0, 2.0)) == [0, 1, 1]
+
+    def test_empty_bounds_and_empty_array(self):
+        """Test an inverted interval and an empty input."""
+        import arrayops as ao
+
+        assert list(ao.between(array.array("i", [1, 2, 3]), 3, 1)) == [0, 0, 0]
+        empty = ao.greater(array.array("d"), 0.0)
+        assert len(empty) == 0 and empty.typecode == "B"
+
+    def test_invalid_scalar(self):
+        """Test non-numeric scalars are rejected."""
+        import arrayops as ao
+
+        with pytest.raises(TypeError):
+            ao.greater(array.array("i", [1]), "1")
+
+    def test_large(self):
+        """Test a large input (exercises the parallel path if enabled)."""
+        import arrayops as ao
+
+        data = [((i * 7919) % 1000) / 10.0 for i in range(100_000)]
+        mask = ao.between(array.array("d", data), 25.0, 75.0)
+        assert list(mask) == [int(25.0 <= x <= 75.0) for x in data]
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs match the NumPy comparison operators."""
+        import arrayops as ao
+
+        data = np.random.default_rng(0).normal(size=50_000)
+        for name, op in COMPARISONS.items():
+            mask = getattr(ao, name)(data, 0.25)
+            assert isinstance(mask, np.ndarray)
+            np.testing.assert_array_equal(mask.view(bool), op(data, 0.25))
+
+
+class TestCompress:
+    """Tests for compress."""
+
+    def test_all_types(self):
+        """Test compress for every typecode."""
+        import arrayops as ao
+
+        data = [4, 0, 7, 1, 9, 2]
+        flags = [1, 0, 1, 0, 0, 1]
+        for typecode in TYPECODES:
+            result = ao.compress(array.array(typecode, data), array.array("B", flags))
+            assert result.typecode == typecode
+            assert list(result) == [4, 7, 2], f"Failed for type {typecode}"
+
+    def test_threshold_filter(self):
+        """Test compress of a comparison mask matches filter with a lambda."""
+        import arrayops as ao
+
+        arr = array.array("f", [0.5, -1.0, 2.0, -3.0, 0.0])
+        expected = ao.filter(arr, lambda x: x > 0)
+        assert list(ao.compress(arr, ao.greater(arr, 0))) == list(expected)
+
+    def test_nonzero_flags_and_edges(self):
+        """Test any non-zero flag selects, and none or all selected."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2, 3])
+        assert list(ao.compress(arr, array.array("B", [0, 255, 2]))) == [2, 3]
+        assert len(ao.compress(arr, array.array("B", [0, 0, 0]))) == 0
+        assert list(ao.compress(arr, array.array("B", [1, 1, 1]))) == [1, 2, 3]
+        assert len(ao.compress(array.array("i"), array.array("B"))) == 0
+
+    def test_nan_values_kept(self):
+        """Test NaN elements are copied like any other value."""
+        import arrayops as ao
+
+        arr = array.array("d", [float("nan"), 1.0])
+        result = ao.compress(arr, array.array("B", [1, 0]))
+        assert len(result) == 1 and math.isnan(result[0])
+
+    def test_invalid_mask(self):
+        """Test non-uint8 masks and length mismatches are rejected."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2, 3])
+        with pytest.raises(TypeError, match="uint8"):
+            ao.compress(arr, array.array("i", [1, 0, 1]))
+        with pytest.raises(ValueError, match="same length"):
+            ao.compress(arr, array.array("B", [1, 0]))
+
+    def test_large(self):
+        """Test a large compaction (exercises the parallel path if enabled)."""
+        import arrayops as ao
+
+        data = [(i * 7919) % 1000 for i in range(200_000)]
+        arr = array.array("l", data)
+        result = ao.compress(arr, ao.less(arr, 100))
+        assert list(result) == [x for x in data if x < 100]
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs match boolean indexing."""
+        import arrayops as ao
+
+        data = np.random.default_rng(0).normal(size=100_000)
+        mask = ao.greater(data, 1.0)
+        result = ao.compress(data, mask)
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_array_equal(result, data[data > 1.0])
+
+
+class TestNonzero:
+    """Tests for nonzero."""
+
+    def test_all_types(self):
+        """Test nonzero for every typecode."""
+        import arrayops as ao
+
+        for typecode in TYPECODES:
+            result = ao.nonzero(array.array(typecode, [0, 3, 0, 0, 1, 2]))
+            assert result.typecode == "I"
+            assert list(result) == [1, 4, 5], f"Failed for type {typecode}"
+
+    def test_floats(self):
+        """Test NaN counts as non-zero and -0.0 does not."""
+        import arrayops as ao
+
+        arr = array.array("d", [-0.0, float("nan"), 0.0, 0.5])
+        assert list(ao.nonzero(arr)) == [1, 3]
+
+    def test_empty_and_all_zero(self):
+        """Test empty and all-zero inputs give empty positions."""
+        import arrayops as ao
+
+        assert len(ao.nonzero(array.array("B"))) == 0
+        assert len(ao.nonzero(array.array("B", [0, 0]))) == 0
+
+    def test_large(self):
+        """Test a large mask (exercises the parallel path if enabled)."""
+        import arrayops as ao
+
+        flags = [int((i * 7919) % 13 == 0) for i in range(300_000)]
+        result = ao.nonzero(array.array("B", flags))
+        assert list(result) == [i for i, flag in enumerate(flags) if flag]
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs match numpy.flatnonzero."""
+        import arrayops as ao
+
+        data = np.random.default_rng(0).integers(0, 3, size=100_000, dtype=np.int32)
+        result = ao.nonzero(data)
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_array_equal(result, np.flatnonzero(data))
@@ -26,21 +26,88 @@ class TestModuleInitialization:
             "mean",
             "min",
             "max",
+            "min_max",
+            "argmin",
+            "argmax",
+            "argminmax",
             "std",
             "var",
             "median",
+            "average",
+            "cov",
+            "corr",
+            "linregress",
+            "nansum",
+            "nanmean",
+            "nanmin",
+            "nanmax",
+            "nanvar",
+            "nanstd",
+            "nanmedian",
+            "count_nan",
             "add",
             "multiply",
             "clip",
             "normalize",
+            "where",
+            "fill_nan",
+            "replace",
             "reverse",
             "sort",
+            "argsort",
             "unique",
+            "top_k",
+            "concatenate",
             "slice",
             "array_iterator",
             "ArrayIterator",
             "lazy_array",
             "LazyArray",
+            "QuantileSketch",
+            "HyperLogLog",
+            "count_distinct",
+            "FrequencySketch",
+            "rolling_sum",
+            "rolling_mean",
+            "rolling_var",
+            "rolling_std",
+            "rolling_min",
+            "rolling_max",
+            "cumsum",
+            "cumprod",
+            "cummin",
+            "cummax",
+            "dot",
+            "norm",
+            "cosine",
+            "dot_batch",
+            "cosine_batch",
+            "groupby_agg",
+            "segment_sum",
+            "segment_mean",
+            "segment_min",
+            "segment_max",
+            "segment_count",
+            "histogram",
+            "bincount",
+            "value_counts",
+            "mode",
+            "searchsorted",
+            "isin",
+            "intersect1d",
+            "union1d",
+            "setdiff1d",
+            "take",
+            "put",
+            "greater",
+            "greater_equal",
+            "less",
+            "less_equal",
+            "equal",
+            "not_equal",
+            "between",
+            "compress",
+            "nonzero",
         ]
 
         for func_name in expected_functions:
@@ -60,21 +127,88 @@ class TestModuleInitialization:
             "mean",
             "min",
             "max",
+            "min_max",
+            "argmin",
+            "argmax",
+            "argminmax",
             "std",
             "var",
             "median",
+            "average",
+            "cov",
+            "corr",
+            "linregress",
+            "nansum",
+            "nanmean",
+            "nanmin",
+            "nanmax",
+            "nanvar",
+            "nanstd",
+            "nanmedian",
+            "count_nan",
             "add",
             "multiply",
             "clip",
             "normalize",
+            "where",
+            "fill_nan",
+            "replace",
             "reverse",
             "sort",
+            "argsort",
             "unique",
+            "top_k",
+            "concatenate",
             "slice",
             "array_iterator",
             "ArrayIterator",
             "lazy_array",
             "LazyArray",
+            "QuantileSketch",
+            "HyperLogLog",
+            "count_distinct",
+            "FrequencySketch",
+            "rolling_sum",
+            "rolling_mean",
+            "rolling_var",
+            "rolling_std",
+            "rolling_min",
+            "rolling_max",
+            "cumsum",
+            "cumprod",
+            "cummin",
+            "cummax",
+            "dot",
+            "norm",
+            "cosine",
+            "dot_batch",
+            "cosine_batch",
+            "groupby_agg",
+            "segment_sum",
+            "segment_mean",
+            "segment_min",
+            "segment_max",
+            "segment_count",
+            "histogram",
+            "bincount",
+            "value_counts",
+            "mode",
+            "searchsorted",
+            "isin",
+            "intersect1d",
+            "union1d",
+            "setdiff1d",
+            "take",
+            "put",
+            "greater",
+            "greater_equal",
+            "less",
+            "less_equal",
+            "equal",
+            "not_equal",
+            "between",
+            "compress",
+            "nonzero",
         ]
 
         assert set(arrayops.__all__) == set(expected_functions)
@@ -0,0 +1,108 @@
+"""Tests for NaN-aware reductions (nansum, nanmean, nanvar, nanmin, ...)."""
+
+import array
+import math
+import statistics
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+NAN = float("nan")
+
+
+def _with_gaps(n):
+    return [NAN if i % 5 == 2 else math.sin(i) * 10 for i in range(n)]
+
+
+class TestNanReductions:
+    """Tests for the nan-skipping reductions on float arrays."""
+
+    def test_against_filtered_reference(self):
+        """Test every reduction against the same statistic of the filtered values."""
+        import arrayops as ao
+
+        for n in [3, 17, 1000, 5000]:
+            values = _with_gaps(n)
+            kept = [v for v in values if not math.isnan(v)]
+            for typecode in ["f", "d"]:
+                arr = array.array(typecode, values)
+                ref = list(array.array(typecode, kept))
+                msg = f"Failed for type {typecode}"
+                assert ao.nansum(arr) == pytest.approx(sum(ref), abs=1e-3), msg
+                assert ao.nanmean(arr) == pytest.approx(statistics.fmean(ref), abs=1e-4), msg
+                assert ao.nanvar(arr) == pytest.approx(statistics.pvariance(ref), rel=1e-6), msg
+                assert ao.nanstd(arr) == pytest.approx(statistics.pstdev(ref), rel=1e-6), msg
+                assert ao.nanmin(arr) == min(ref), msg
+                assert ao.nanmax(arr) == max(ref), msg
+                assert ao.nanmedian(arr) == sorted(ref)[(len(ref) - 1) // 2], msg
+                assert ao.count_nan(arr) == n - len(kept), msg
+
+    def test_nan_position_does_not_matter(self):
+        """Test results are the same wherever the NaN values sit."""
+        import arrayops as ao
+
+        for values in ([NAN, 1.0, 3.0], [1.0, NAN, 3.0], [1.0, 3.0, NAN]):
+            arr = array.array("d", values)
+            assert ao.nanmin(arr) == 1.0
+            assert ao.nanmax(arr) == 3.0
+            assert ao.nanmean(arr) == 2.0
+            assert math.isnan(ao.min(arr))
+            assert math.isnan(ao.max(arr))
+
+    def test_all_nan(self):
+        """Test all-NaN arrays: nansum is 0.0, the others raise ValueError."""
+        import arrayops as ao
+
+        arr = array.array("d", [NAN, NAN, NAN])
+        assert ao.nansum(arr) == 0.0
+        assert ao.count_nan(arr) == 3
+        for func in [ao.nanmean, ao.nanvar, ao.nanstd, ao.nanmin, ao.nanmax, ao.nanmedian]:
+            with pytest.raises(ValueError, match="All-NaN"):
+                func(arr)
+
+    def test_empty(self):
+        """Test empty arrays."""
+        import arrayops as ao
+
+        arr = array.array("d")
+        assert ao.nansum(arr) == 0.0
+        assert ao.count_nan(arr) == 0
+        for func in [ao.nanmean, ao.nanvar, ao.nanmin, ao.nanmax, ao.nanmedian]:
+            with pytest.raises(ValueError, match="empty"):
+                func(arr)
+
+    def test_integer_arrays(self):
+        """Test integer arrays behave like the plain reductions."""
+        import arrayops as ao
+
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L"]:
+            arr = array.array(typecode, [4, 1, 7, 2])
+            msg = f"Failed for type {typecode}"
+            assert ao.nansum(arr) == 14, msg
+            assert ao.nanmean(arr) == 3.5, msg
+            assert ao.nanvar(arr) == ao.var(arr), msg
+            assert ao.nanmin(arr) == 1, msg
+            assert ao.nanmax(arr) == 7, msg
+            assert ao.nanmedian(arr) == ao.median(arr), msg
+            assert ao.count_nan(arr) == 0, msg
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test against NumPy's nan-functions."""
+        import arrayops as ao
+
+        rng = np.random.default_rng(1)
+        arr = rng.normal(size=20_000)
+        arr[rng.random(20_000) < 0.1] = np.nan
+        assert ao.nansum(arr) == pytest.approx(np.nansum(arr))
+        assert ao.nanmean(arr) == pytest.approx(np.nanmean(arr))
+        assert ao.nanvar(arr) == pytest.approx(np.nanvar(arr))
+        assert ao.nanmin(arr) == np.nanmin(arr)
+        assert ao.nanmax(arr) == np.nanmax(arr)
+        assert ao.count_nan(arr) == int(np.isnan(arr).sum())
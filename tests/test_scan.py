@@ -0,0 +1,134 @@
+"""Tests for cumulative (prefix-scan) operations."""
+
+import array
+import itertools
+import math
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class TestCumulative:
+    """Tests for cumsum, cumprod, cummin and cummax."""
+
+    def test_inclusive(self):
+        """Test inclusive scans against itertools.accumulate."""
+        import arrayops as ao
+
+        values = [3, 1, 4, 1, 5, 9, 2, 6]
+        arr = array.array("i", values)
+        assert list(ao.cumsum(arr)) == list(itertools.accumulate(values))
+        assert list(ao.cumprod(arr)) == list(itertools.accumulate(values, lambda a, b: a * b))
+        assert list(ao.cummin(arr)) == list(itertools.accumulate(values, min))
+        assert list(ao.cummax(arr)) == list(itertools.accumulate(values, max))
+
+    def test_exclusive(self):
+        """Test exclusive scans start from the identity and omit the last element."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2, 3, 4])
+        assert list(ao.cumsum(arr, exclusive=True)) == [0, 1, 3, 6]
+        assert list(ao.cumprod(arr, exclusive=True)) == [1, 1, 2, 6]
+        assert list(ao.cummin(arr, exclusive=True)) == [2**31 - 1, 1, 1, 1]
+        farr = array.array("d", [2.0, 1.0])
+        assert list(ao.cummax(farr, exclusive=True)) == [-math.inf, 2.0]
+
+    def test_preserves_type(self):
+        """Test results keep the input typecode."""
+        import arrayops as ao
+
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            arr = array.array(typecode, [1, 2, 3])
+            result = ao.cumsum(arr)
+            assert isinstance(result, array.array), f"Failed for type {typecode}"
+            assert result.typecode == typecode
+            assert list(result) == [1, 3, 6]
+
+    def test_overflow_raises(self):
+        """Test integer overflow raises instead of wrapping."""
+        import arrayops as ao
+
+        with pytest.raises(OverflowError, match="widen"):
+            ao.cumsum(array.array("b", [100, 100]))
+        with pytest.raises(OverflowError):
+            ao.cumprod(array.array("B", [16, 16]))
+        # Exclusive scans never need the grand total
+        assert list(ao.cumsum(array.array("b", [100, 27, 100]), exclusive=True)) == [0, 100, 127]
+
+    def test_widen(self):
+        """Test widened accumulators and result typecodes."""
+        import arrayops as ao
+
+        result = ao.cumsum(array.array("b", [100, 100]), widen=True)
+        assert result.typecode == "l"
+        assert list(result) == [100, 200]
+        assert ao.cumprod(array.array("B", [16, 16]), widen=True).typecode == "L"
+        assert ao.cumsum(array.array("f", [0.5]), widen=True).typecode == "d"
+
+    def test_nan_propagates(self):
+        """Test NaN propagates through cummin/cummax."""
+        import arrayops as ao
+
+        result = ao.cummax(array.array("d", [1.0, math.nan, 3.0]))
+        assert result[0] == 1.0
+        assert math.isnan(result[1]) and math.isnan(result[2])
+
+    def test_out_parameter(self):
+        """Test writing into a preallocated output."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2, 3])
+        out = array.array("i", [0, 0, 0])
+        assert ao.cumsum(arr, out=out) is out
+        assert list(out) == [1, 3, 6]
+        with pytest.raises(TypeError, match="typecode"):
+            ao.cumsum(arr, out=array.array("d", [0.0] * 3))
+        with pytest.raises(ValueError, match="length"):
+            ao.cumsum(arr, out=array.array("i", [0]))
+
+    def test_out_is_input(self):
+        """Test scanning in place, where out aliases the input."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2, 3, 4])
+        assert ao.cumsum(arr, out=arr) is arr
+        assert list(arr) == [1, 3, 6, 10]
+        arr = array.array("i", [1, 2, 3, 4])
+        assert ao.cumsum(arr, exclusive=True, out=arr) is arr
+        assert list(arr) == [0, 1, 3, 6]
+
+    def test_empty(self):
+        """Test empty input gives an empty result."""
+        import arrayops as ao
+
+        assert len(ao.cumsum(array.array("i", []))) == 0
+        assert len(ao.cummax(array.array("d", []), exclusive=True)) == 0
+
+    def test_large_array(self):
+        """Test arrays large enough to take the parallel two-phase scan."""
+        import arrayops as ao
+
+        n = 500_000
+        arr = array.array("l", range(n))
+        result = ao.cumsum(arr)
+        assert result[-1] == n * (n - 1) // 2
+        assert result[123_456] == 123_456 * 123_457 // 2
+        assert ao.cummax(arr, exclusive=True)[-1] == n - 2
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy_input(self):
+        """Test NumPy input matches numpy.cumsum."""
+        import arrayops as ao
+
+        arr = np.arange(1, 11, dtype=np.int32)
+        result = ao.cumsum(arr)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.int32
+        np.testing.assert_array_equal(result, np.cumsum(arr))
+        np.testing.assert_array_equal(ao.cumsum(arr, widen=True), np.cumsum(arr, dtype=np.int64))
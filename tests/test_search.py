@@ -0,0 +1,98 @@
+"""Tests for searchsorted."""
+
+import array
+import bisect
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class TestSearchsorted:
+    """Tests for searchsorted."""
+
+    def test_all_types(self):
+        """Test both sides against bisect for every typecode."""
+        import arrayops as ao
+
+        data = [1, 3, 3, 3, 7, 9]
+        queries = [0, 3, 5, 9, 10, 1]
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            arr = array.array(typecode, data)
+            q = array.array(typecode, queries)
+            left = ao.searchsorted(arr, q)
+            right = ao.searchsorted(arr, q, side="right")
+            assert list(left) == [bisect.bisect_left(data, x) for x in queries], (
+                f"Failed for type {typecode}"
+            )
+            assert list(right) == [bisect.bisect_right(data, x) for x in queries], (
+                f"Failed for type {typecode}"
+            )
+            assert left.typecode == "I"
+
+    def test_sorted_and_unsorted_queries_agree(self):
+        """Test the merge path (sorted queries) matches the binary search path."""
+        import arrayops as ao
+
+        data = array.array("i", sorted((i * 7919) % 5003 for i in range(2000)))
+        queries = [(i * 31) % 6000 - 500 for i in range(5000)]
+        for side in ("left", "right"):
+            unsorted = ao.searchsorted(data, array.array("i", queries), side=side)
+            merged = ao.searchsorted(data, array.array("i", sorted(queries)), side=side)
+            expected = dict(zip(queries, unsorted))
+            assert [expected[x] for x in sorted(queries)] == list(merged)
+
+    def test_nan_and_signed_zero(self):
+        """Test NaN queries go among the trailing NaNs and -0.0 equals 0.0."""
+        import arrayops as ao
+
+        nan = float("nan")
+        data = array.array("d", [-1.0, 0.0, 0.0, 2.0, nan, nan])
+        queries = array.array("d", [nan, -0.0, 3.0])
+        assert list(ao.searchsorted(data, queries)) == [4, 1, 4]
+        assert list(ao.searchsorted(data, queries, side="right")) == [6, 3, 4]
+
+    def test_empty(self):
+        """Test empty queries and an empty sorted array."""
+        import arrayops as ao
+
+        assert len(ao.searchsorted(array.array("i", [1, 2]), array.array("i"))) == 0
+        result = ao.searchsorted(array.array("i"), array.array("i", [5, 6]))
+        assert list(result) == [0, 0]
+
+    def test_invalid(self):
+        """Test a bad side and mismatched typecodes are rejected."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2])
+        with pytest.raises(ValueError, match="side"):
+            ao.searchsorted(arr, arr, side="middle")
+        with pytest.raises(TypeError, match="same type"):
+            ao.searchsorted(arr, array.array("d", [1.0]))
+
+    def test_large(self):
+        """Test many queries against few boundaries (exercises the parallel path if enabled)."""
+        import arrayops as ao
+
+        bounds = list(range(0, 100_000, 10))
+        queries = [(i * 7919) % 100_003 for i in range(200_000)]
+        result = ao.searchsorted(array.array("l", bounds), array.array("l", queries))
+        assert list(result) == [bisect.bisect_left(bounds, x) for x in queries]
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs match numpy.searchsorted."""
+        import arrayops as ao
+
+        rng = np.random.default_rng(0)
+        data = np.sort(rng.normal(size=10_000))
+        queries = rng.normal(size=50_000)
+        for side in ("left", "right"):
+            result = ao.searchsorted(data, queries, side=side)
+            assert isinstance(result, np.ndarray)
+            np.testing.assert_array_equal(result, np.searchsorted(data, queries, side=side))
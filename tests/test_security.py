@@ -145,10 +145,9 @@ class TestDenialOfService:
 class TestIntegerOverflow:
     """Test integer overflow handling.
 
-    Note: Integer overflow behavior follows Python's semantics.
-    In Rust debug mode, integer overflow can panic (this is expected).
-    In release mode, Rust uses wrapping arithmetic by default.
-    These tests verify that overflow is handled appropriately.
+    Integer sums accumulate in widened types (64-bit lanes, 128 bits for 64-bit
+    inputs), so they never wrap; an explicit ``dtype="int64"`` accumulator raises
+    OverflowError instead of returning a wrong answer.
     """
 
     def test_large_positive_integers(self):
@@ -185,23 +184,22 @@ class TestIntegerOverflow:
     def test_integer_overflow_does_not_crash(self):
         """Test that integer overflow is handled safely.
 
-        Note: In debug mode, Rust will panic on overflow (expected behavior for catching bugs).
-        In release mode, Rust uses wrapping arithmetic (safe, doesn't cause crashes).
-        For production use, compile in release mode where wrapping is the default.
-
-        This test verifies that overflow doesn't cause memory safety issues.
+        Sums past the int64 range are exact by default and raise OverflowError
+        with an explicit int64 accumulator.
         """
         import arrayops
 
-        # Test with values that sum to within i64 range (no overflow)
-        # This verifies that large values are handled correctly
-        # Actual overflow testing would require release mode compilation
         arr = array.array("l", [4_611_686_018_427_387_500, 4_611_686_018_427_387_500])
         result = arrayops.sum(arr)
         # Result should be valid
         assert isinstance(result, int)
         assert result == 9_223_372_036_854_775_000
 
+        arr = array.array("l", [9_000_000_000_000_000_000, 9_000_000_000_000_000_000])
+        assert arrayops.sum(arr) == 18_000_000_000_000_000_000
+        with pytest.raises(OverflowError):
+            arrayops.sum(arr, dtype="int64")
+
 
 class TestTypeConfusion:
     """Test prevention of type confusion attacks."""
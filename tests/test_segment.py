@@ -0,0 +1,165 @@
+"""Tests for the offsets-delimited segment reductions."""
+
+import array
+import math
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _segments(values, offsets):
+    return [list(values[offsets[i] : offsets[i + 1]]) for i in range(len(offsets) - 1)]
+
+
+class TestSegmentReductions:
+    """Tests for segment_sum, segment_mean, segment_min, segment_max and segment_count."""
+
+    def test_all_types(self):
+        """Test every reduction against a pure Python reference for every typecode."""
+        import arrayops as ao
+
+        values = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+        offsets = array.array("l", [0, 3, 4, 10])
+        segments = _segments(values, offsets)
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            arr = array.array(typecode, values)
+            sums = ao.segment_sum(arr, offsets)
+            assert list(sums) == [sum(s) for s in segments], f"Failed for type {typecode}"
+            assert list(ao.segment_mean(arr, offsets)) == pytest.approx(
+                [sum(s) / len(s) for s in segments]
+            ), f"Failed for type {typecode}"
+            assert list(ao.segment_min(arr, offsets)) == [min(s) for s in segments]
+            assert list(ao.segment_max(arr, offsets)) == [max(s) for s in segments]
+            assert list(ao.segment_count(arr, offsets)) == [3, 1, 6]
+
+    def test_result_typecodes(self):
+        """Test sums widen to 64 bits, means are float64 and counts uint64."""
+        import arrayops as ao
+
+        offsets = array.array("l", [0, 2])
+        assert ao.segment_sum(array.array("b", [100, 100]), offsets).typecode == "l"
+        assert ao.segment_sum(array.array("H", [1, 2]), offsets).typecode == "L"
+        assert ao.segment_sum(array.array("f", [1.0, 2.0]), offsets).typecode == "d"
+        assert ao.segment_mean(array.array("i", [1, 2]), offsets).typecode == "d"
+        assert ao.segment_min(array.array("h", [1, 2]), offsets).typecode == "h"
+        assert ao.segment_count(array.array("f", [1.0, 2.0]), offsets).typecode == "L"
+        assert list(ao.segment_sum(array.array("b", [100, 100]), offsets)) == [200]
+
+    def test_empty_segments(self):
+        """Test empty segments sum to zero, average to NaN and reject min/max."""
+        import arrayops as ao
+
+        values = array.array("i", [1, 2, 3])
+        offsets = array.array("l", [0, 0, 3, 3])
+        assert list(ao.segment_sum(values, offsets)) == [0, 6, 0]
+        means = ao.segment_mean(values, offsets)
+        assert math.isnan(means[0]) and means[1] == 2.0 and math.isnan(means[2])
+        assert list(ao.segment_count(values, offsets)) == [0, 3, 0]
+        with pytest.raises(ValueError, match="segment_min\\(\\) of empty segment"):
+            ao.segment_min(values, offsets)
+        with pytest.raises(ValueError, match="segment_max\\(\\) of empty segment"):
+            ao.segment_max(values, offsets)
+
+    def test_empty_values(self):
+        """Test empty values with only empty segments keep the result typecodes."""
+        import arrayops as ao
+
+        offsets = array.array("l", [0, 0, 0])
+        for typecode, sum_typecode in [("b", "l"), ("H", "L"), ("f", "d")]:
+            values = array.array(typecode)
+            sums = ao.segment_sum(values, offsets)
+            assert list(sums) == [0, 0], f"Failed for type {typecode}"
+            assert sums.typecode == sum_typecode
+        means = ao.segment_mean(array.array("d"), offsets)
+        assert means.typecode == "d" and all(math.isnan(m) for m in means)
+        with pytest.raises(ValueError, match="segment_min\\(\\) of empty segment 0"):
+            ao.segment_min(array.array("d"), offsets)
+
+    def test_offsets_need_not_cover_values(self):
+        """Test offsets may start after 0 and end before len(values)."""
+        import arrayops as ao
+
+        values = array.array("d", [10.0, 1.0, 2.0, 3.0, 20.0])
+        offsets = array.array("i", [1, 3, 4])
+        assert list(ao.segment_sum(values, offsets)) == [3.0, 3.0]
+
+    def test_no_segments(self):
+        """Test a single offset produces empty results, even for empty values."""
+        import arrayops as ao
+
+        for values in [array.array("i", [1, 2]), array.array("i")]:
+            offsets = array.array("l", [0])
+            assert len(ao.segment_sum(values, offsets)) == 0
+            assert len(ao.segment_min(values, offsets)) == 0
+            assert len(ao.segment_count(values, offsets)) == 0
+
+    def test_nan_propagates(self):
+        """Test NaN propagates within its segment only."""
+        import arrayops as ao
+
+        values = array.array("d", [1.0, float("nan"), 3.0, 4.0])
+        offsets = array.array("l", [0, 2, 4])
+        mins = ao.segment_min(values, offsets)
+        assert math.isnan(mins[0]) and mins[1] == 3.0
+        maxs = ao.segment_max(values, offsets)
+        assert math.isnan(maxs[0]) and maxs[1] == 4.0
+
+    def test_overflow(self):
+        """Test an integer segment sum that exceeds 64 bits raises OverflowError."""
+        import arrayops as ao
+
+        big = 2**63 - 1
+        values = array.array("l", [big, 1, big])
+        with pytest.raises(OverflowError, match="segment_sum"):
+            ao.segment_sum(values, array.array("l", [0, 2, 3]))
+        assert list(ao.segment_sum(values, array.array("l", [0, 1, 2, 3]))) == [big, 1, big]
+
+    def test_invalid_offsets(self):
+        """Test empty, decreasing, out-of-bounds and float offsets are rejected."""
+        import arrayops as ao
+
+        values = array.array("i", [1, 2, 3])
+        with pytest.raises(ValueError, match="at least one"):
+            ao.segment_sum(values, array.array("l"))
+        with pytest.raises(ValueError, match="non-decreasing"):
+            ao.segment_sum(values, array.array("l", [0, 2, 1]))
+        with pytest.raises(ValueError, match="out of bounds"):
+            ao.segment_mean(values, array.array("l", [0, 4]))
+        with pytest.raises(ValueError, match="out of bounds"):
+            ao.segment_count(values, array.array("l", [-1, 2]))
+        with pytest.raises(TypeError, match="integer"):
+            ao.segment_min(values, array.array("d", [0.0, 3.0]))
+
+    def test_many_segments(self):
+        """Test a large input with many segments (exercises the parallel path if enabled)."""
+        import arrayops as ao
+
+        n = 200_000
+        values = array.array("i", [(i * 7) % 1000 - 500 for i in range(n)])
+        bounds = list(range(0, n, 37)) + [n]
+        offsets = array.array("l", bounds)
+        segments = _segments(values, bounds)
+        assert list(ao.segment_sum(values, offsets)) == [sum(s) for s in segments]
+        assert list(ao.segment_min(values, offsets)) == [min(s) for s in segments]
+        assert list(ao.segment_max(values, offsets)) == [max(s) for s in segments]
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs return NumPy arrays matching np.add.reduceat."""
+        import arrayops as ao
+
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=10_000)
+        offsets = np.array([0, 10, 500, 9_000, 10_000], dtype=np.int64)
+        result = ao.segment_sum(values, offsets)
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_allclose(result, np.add.reduceat(values, offsets[:-1]))
+        np.testing.assert_allclose(
+            ao.segment_max(values, offsets), np.maximum.reduceat(values, offsets[:-1])
+        )
@@ -0,0 +1,88 @@
+"""Tests for top-k selection."""
+
+import array
+import math
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class TestTopK:
+    """Tests for top_k."""
+
+    def test_all_types(self):
+        """Test top_k against sorted() for every typecode."""
+        import arrayops as ao
+
+        values = [5, 3, 9, 1, 7, 2, 8, 6, 4, 10, 0, 9]
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            arr = array.array(typecode, values)
+            result = ao.top_k(arr, 3)
+            assert isinstance(result, array.array) and result.typecode == typecode
+            assert list(result) == [10, 9, 9], f"Failed for type {typecode}"
+            assert list(ao.top_k(arr, 3, largest=False)) == [0, 1, 2], f"Failed for type {typecode}"
+
+    def test_heap_and_selection_paths(self):
+        """Test small k (heap) and large k (partial selection) agree with sorting."""
+        import arrayops as ao
+
+        values = [(i * 7919) % 10_007 - 5000 for i in range(20_000)]
+        arr = array.array("i", values)
+        for k in [1, 5, 100, 1000, 5000, 19_999, 20_000]:
+            assert list(ao.top_k(arr, k)) == sorted(values, reverse=True)[:k], f"k={k}"
+            assert list(ao.top_k(arr, k, largest=False)) == sorted(values)[:k], f"k={k}"
+
+    def test_return_indices(self):
+        """Test indices point at the selected values, earlier element first on ties."""
+        import arrayops as ao
+
+        arr = array.array("d", [2.0, 7.0, 7.0, -1.0, 5.0])
+        values, indices = ao.top_k(arr, 3, return_indices=True)
+        assert list(values) == [7.0, 7.0, 5.0]
+        assert list(indices) == [1, 2, 4]
+        assert indices.typecode == "I"
+        values, indices = ao.top_k(arr, 2, largest=False, return_indices=True)
+        assert list(values) == [-1.0, 2.0]
+        assert list(indices) == [3, 0]
+
+    def test_k_edge_cases(self):
+        """Test k=0, k larger than the array and empty input."""
+        import arrayops as ao
+
+        arr = array.array("i", [3, 1, 2])
+        assert list(ao.top_k(arr, 0)) == []
+        assert list(ao.top_k(arr, 10)) == [3, 2, 1]
+        empty = ao.top_k(array.array("i"), 5)
+        assert isinstance(empty, array.array) and len(empty) == 0
+        values, indices = ao.top_k(array.array("d"), 2, return_indices=True)
+        assert len(values) == 0 and len(indices) == 0
+        assert indices.typecode == "I"
+
+    def test_nan_ranks_last(self):
+        """Test NaN is only selected after every number."""
+        import arrayops as ao
+
+        arr = array.array("d", [math.nan, 1.0, 3.0, math.nan, 2.0])
+        assert list(ao.top_k(arr, 2)) == [3.0, 2.0]
+        assert list(ao.top_k(arr, 2, largest=False)) == [1.0, 2.0]
+        result = ao.top_k(arr, 4)
+        assert list(result)[:3] == [3.0, 2.0, 1.0] and math.isnan(result[3])
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy input returns NumPy arrays."""
+        import arrayops as ao
+
+        rng = np.random.default_rng(2)
+        arr = rng.normal(size=10_000)
+        values, indices = ao.top_k(arr, 10, return_indices=True)
+        assert isinstance(values, np.ndarray) and values.dtype == np.float64
+        np.testing.assert_array_equal(values, np.sort(arr)[::-1][:10])
+        np.testing.assert_array_equal(arr[indices], values)
+        assert indices.dtype == np.uint32
@@ -0,0 +1,188 @@
+"""Tests for isin and the set operations."""
+
+import array
+import math
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+TYPECODES = ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]
+
+
+class TestIsin:
+    """Tests for isin."""
+
+    def test_all_types(self):
+        """Test the mask and indices for every typecode."""
+        import arrayops as ao
+
+        data = [7, 3, 9, 3, 1, 0]
+        values = [3, 9, 11]
+        for typecode in TYPECODES:
+            arr = array.array(typecode, data)
+            mask = ao.isin(arr, array.array(typecode, values))
+            assert mask.typecode == "B"
+            assert list(mask) == [int(x in values) for x in data], f"Failed for type {typecode}"
+            indices = ao.isin(arr, array.array(typecode, values), return_indices=True)
+            assert indices.typecode == "I"
+            assert list(indices) == [1, 2, 3], f"Failed for type {typecode}"
+
+    def test_sorted_and_unsorted_agree(self):
+        """Test the merge path (sorted input) matches the hash path."""
+        import arrayops as ao
+
+        data = [(i * 7919) % 5003 for i in range(10_000)]
+        values = array.array("i", [(i * 31) % 6000 for i in range(300)])
+        expected = set(values)
+        unsorted = ao.isin(array.array("i", data), values)
+        merged = ao.isin(array.array("i", sorted(data)), values)
+        assert list(unsorted) == [int(x in expected) for x in data]
+        assert list(merged) == [int(x in expected) for x in sorted(data)]
+
+    def test_nan_and_signed_zero(self):
+        """Test NaN matches NaN and -0.0 matches 0.0."""
+        import arrayops as ao
+
+        nan = float("nan")
+        arr = array.array("d", [nan, -0.0, 1.0, 2.0])
+        assert list(ao.isin(arr, array.array("d", [0.0, nan]))) == [1, 1, 0, 0]
+        assert list(ao.isin(arr, array.array("d", [2.0]))) == [0, 0, 0, 1]
+
+    def test_empty(self):
+        """Test empty arrays and empty value sets."""
+        import arrayops as ao
+
+        empty = ao.isin(array.array("i"), array.array("i", [1]))
+        assert len(empty) == 0 and empty.typecode == "B"
+        assert len(ao.isin(array.array("i"), array.array("i"), return_indices=True)) == 0
+        assert list(ao.isin(array.array("i", [1, 2]), array.array("i"))) == [0, 0]
+
+    def test_type_mismatch(self):
+        """Test mismatched typecodes are rejected."""
+        import arrayops as ao
+
+        with pytest.raises(TypeError, match="same type"):
+            ao.isin(array.array("i", [1]), array.array("d", [1.0]))
+
+    def test_large(self):
+        """Test a large input (exercises the parallel path if enabled)."""
+        import arrayops as ao
+
+        data = [(i * 7919) % 100_003 for i in range(200_000)]
+        values = array.array("l", range(0, 100_003, 7))
+        mask = ao.isin(array.array("l", data), values)
+        assert list(mask) == [int(x % 7 == 0) for x in data]
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs match numpy.isin."""
+        import arrayops as ao
+
+        rng = np.random.default_rng(0)
+        data = rng.integers(0, 1000, size=50_000, dtype=np.int64)
+        values = rng.integers(0, 1000, size=200, dtype=np.int64)
+        mask = ao.isin(data, values)
+        assert isinstance(mask, np.ndarray)
+        np.testing.assert_array_equal(mask.astype(bool), np.isin(data, values))
+        indices = ao.isin(data, values, return_indices=True)
+        np.testing.assert_array_equal(indices, np.flatnonzero(np.isin(data, values)))
+
+
+class TestSetOperations:
+    """Tests for intersect1d, union1d and setdiff1d."""
+
+    def test_all_types(self):
+        """Test all three operations for every typecode."""
+        import arrayops as ao
+
+        a = [7, 3, 9, 3, 1]
+        b = [9, 11, 3, 0]
+        for typecode in TYPECODES:
+            x, y = array.array(typecode, a), array.array(typecode, b)
+            assert list(ao.intersect1d(x, y)) == sorted(set(a) & set(b)), (
+                f"Failed for type {typecode}"
+            )
+            assert list(ao.union1d(x, y)) == sorted(set(a) | set(b)), (
+                f"Failed for type {typecode}"
+            )
+            assert list(ao.setdiff1d(x, y)) == sorted(set(a) - set(b)), (
+                f"Failed for type {typecode}"
+            )
+            assert ao.union1d(x, y).typecode == typecode
+
+    def test_skewed_sorted_inputs(self):
+        """Test a small array against a large sorted one in both argument orders."""
+        import arrayops as ao
+
+        large = array.array("i", range(0, 200_000, 3))
+        small = array.array("i", [-5, 0, 4, 9, 150_000, 199_998, 300_000])
+        common = [0, 9, 150_000]
+        assert list(ao.intersect1d(small, large)) == common
+        assert list(ao.intersect1d(large, small)) == common
+        assert list(ao.setdiff1d(small, large)) == [-5, 4, 199_998, 300_000]
+        assert len(ao.setdiff1d(large, small)) == len(large) - len(common)
+        assert len(ao.union1d(small, large)) == len(large) + 4
+
+    def test_unsorted_large(self):
+        """Test large unsorted inputs (radix sort path) against Python sets."""
+        import arrayops as ao
+
+        a = [(i * 7919) % 50_021 for i in range(40_000)]
+        b = [(i * 104_729) % 60_013 for i in range(30_000)]
+        x, y = array.array("l", a), array.array("l", b)
+        assert list(ao.intersect1d(x, y)) == sorted(set(a) & set(b))
+        assert list(ao.union1d(x, y)) == sorted(set(a) | set(b))
+        assert list(ao.setdiff1d(x, y)) == sorted(set(a) - set(b))
+
+    def test_nan_and_signed_zero(self):
+        """Test NaNs collapse into one trailing value and -0.0 equals 0.0."""
+        import arrayops as ao
+
+        nan = float("nan")
+        a = array.array("d", [nan, 1.0, -0.0, nan])
+        b = array.array("d", [0.0, nan, 2.0])
+        union = list(ao.union1d(a, b))
+        assert union[:3] == [0.0, 1.0, 2.0] and math.isnan(union[3]) and len(union) == 4
+        common = list(ao.intersect1d(a, b))
+        assert common[0] == 0.0 and math.isnan(common[1]) and len(common) == 2
+        assert list(ao.setdiff1d(a, b)) == [1.0]
+
+    def test_empty(self):
+        """Test one or both inputs empty."""
+        import arrayops as ao
+
+        empty = array.array("i")
+        values = array.array("i", [3, 1, 3])
+        assert len(ao.union1d(empty, empty)) == 0
+        assert list(ao.union1d(empty, values)) == [1, 3]
+        assert list(ao.union1d(values, empty)) == [1, 3]
+        assert len(ao.intersect1d(empty, values)) == 0
+        assert list(ao.setdiff1d(values, empty)) == [1, 3]
+        assert len(ao.setdiff1d(empty, values)) == 0
+
+    def test_type_mismatch(self):
+        """Test mismatched typecodes are rejected."""
+        import arrayops as ao
+
+        with pytest.raises(TypeError, match="same type"):
+            ao.union1d(array.array("i", [1]), array.array("h", [1]))
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs match the NumPy set routines."""
+        import arrayops as ao
+
+        rng = np.random.default_rng(0)
+        a = rng.normal(size=20_000).round(2)
+        b = rng.normal(size=5_000).round(2)
+        result = ao.intersect1d(a, b)
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_array_equal(result, np.intersect1d(a, b))
+        np.testing.assert_array_equal(ao.union1d(a, b), np.union1d(a, b))
+        np.testing.assert_array_equal(ao.setdiff1d(a, b), np.setdiff1d(a, b))
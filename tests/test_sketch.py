@@ -0,0 +1,372 @@
+"""Tests for streaming sketches."""
+
+import array
+import pickle
+import random
+import struct
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class TestQuantileSketch:
+    """Tests for QuantileSketch."""
+
+    def test_small_exact(self):
+        """Test quantile and cdf on a handful of values."""
+        import arrayops as ao
+
+        sketch = ao.QuantileSketch()
+        sketch.add(array.array("d", [5.0, 1.0, 3.0, 2.0, 4.0]))
+        assert sketch.quantile(0.5) == 3.0
+        assert sketch.quantile(0.0) == 1.0
+        assert sketch.quantile(1.0) == 5.0
+        assert sketch.cdf(3.0) == 0.5
+        assert sketch.cdf(0.0) == 0.0
+        assert sketch.cdf(10.0) == 1.0
+        assert sketch.count == 5
+        assert sketch.min == 1.0
+        assert sketch.max == 5.0
+
+    def test_large_accuracy(self):
+        """Test tail quantiles stay within 1% of the value range."""
+        import arrayops as ao
+
+        n = 100_000
+        values = list(range(n))
+        random.Random(42).shuffle(values)
+        sketch = ao.QuantileSketch(compression=100)
+        sketch.add(array.array("i", values))
+        for q in [0.001, 0.01, 0.5, 0.99, 0.999]:
+            assert abs(sketch.quantile(q) - q * (n - 1)) <= 0.01 * n
+
+    def test_chunked_add_and_merge(self):
+        """Test merging per-chunk sketches matches one sketch over all data."""
+        import arrayops as ao
+
+        data = array.array("d", [float(i % 1000) for i in range(20_000)])
+        whole = ao.QuantileSketch()
+        whole.add(data)
+
+        merged = ao.QuantileSketch()
+        for start in range(0, len(data), 5_000):
+            part = ao.QuantileSketch()
+            part.add(ao.slice(data, start, start + 5_000))
+            merged.merge(part)
+
+        assert merged.count == whole.count == 20_000
+        for q in [0.1, 0.5, 0.9]:
+            assert abs(merged.quantile(q) - whole.quantile(q)) < 10
+
+    def test_merge_self(self):
+        """Test merging a sketch into itself doubles its weight."""
+        import arrayops as ao
+
+        sketch = ao.QuantileSketch()
+        sketch.add(array.array("i", [1, 2, 3]))
+        sketch.merge(sketch)
+        assert sketch.count == 6
+
+    def test_serialization_roundtrip(self):
+        """Test to_bytes/from_bytes and pickle preserve the sketch."""
+        import arrayops as ao
+
+        sketch = ao.QuantileSketch(compression=50)
+        sketch.add(array.array("f", [float(i) for i in range(1000)]))
+
+        restored = ao.QuantileSketch.from_bytes(sketch.to_bytes())
+        assert restored.compression == 50.0
+        assert restored.count == sketch.count
+        assert restored.quantile(0.9) == sketch.quantile(0.9)
+
+        unpickled = pickle.loads(pickle.dumps(sketch))
+        assert unpickled.quantile(0.25) == sketch.quantile(0.25)
+
+    def test_invalid_bytes(self):
+        """Test from_bytes rejects malformed data."""
+        import arrayops as ao
+
+        with pytest.raises(ValueError):
+            ao.QuantileSketch.from_bytes(b"not a sketch")
+
+    def test_invalid_centroids(self):
+        """Test from_bytes rejects bad centroids and min/max bounds."""
+        import arrayops as ao
+
+        sketch = ao.QuantileSketch()
+        sketch.add(array.array("d", [1.0, 2.0, 3.0]))
+        data = sketch.to_bytes()
+        # 37-byte header (min at 13, max at 21), then (mean, weight) pairs
+        cases = [
+            (37, float("nan"), "mean is not finite"),
+            (37, float("inf"), "mean is not finite"),
+            (45, 0.0, "weight is not finite and positive"),
+            (45, -1.0, "weight is not finite and positive"),
+            (37, 10.0, "not sorted by mean"),
+            (13, 10.0, "min is greater than max"),
+        ]
+        for offset, value, message in cases:
+            corrupted = data[:offset] + struct.pack("<d", value) + data[offset + 8 :]
+            with pytest.raises(ValueError, match=message):
+                ao.QuantileSketch.from_bytes(corrupted)
+
+    def test_nan_skipped(self):
+        """Test NaN values are ignored."""
+        import arrayops as ao
+
+        sketch = ao.QuantileSketch()
+        sketch.add(array.array("d", [float("nan"), 1.0, float("nan"), 2.0]))
+        assert sketch.count == 2
+
+    def test_empty(self):
+        """Test empty sketches raise on queries."""
+        import arrayops as ao
+
+        sketch = ao.QuantileSketch()
+        sketch.add(array.array("d", []))
+        assert sketch.count == 0
+        assert sketch.min is None
+        with pytest.raises(ValueError, match="empty"):
+            sketch.quantile(0.5)
+        with pytest.raises(ValueError, match="empty"):
+            sketch.cdf(0.0)
+
+    def test_invalid_arguments(self):
+        """Test compression and q validation."""
+        import arrayops as ao
+
+        with pytest.raises(ValueError, match="compression"):
+            ao.QuantileSketch(compression=1)
+        sketch = ao.QuantileSketch()
+        sketch.add(array.array("i", [1, 2, 3]))
+        with pytest.raises(ValueError, match="range"):
+            sketch.quantile(1.5)
+        with pytest.raises(TypeError):
+            sketch.add([1, 2, 3])
+
+    def test_all_typecodes(self):
+        """Test add works for every supported typecode."""
+        import arrayops as ao
+
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            sketch = ao.QuantileSketch()
+            sketch.add(array.array(typecode, [1, 2, 3, 4, 5]))
+            assert sketch.quantile(0.5) == 3.0, f"Failed for type {typecode}"
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy_input(self):
+        """Test add accepts NumPy arrays."""
+        import arrayops as ao
+
+        sketch = ao.QuantileSketch()
+        sketch.add(np.arange(1, 6, dtype=np.float64))
+        assert sketch.quantile(0.5) == 3.0
+
+
+class TestHyperLogLog:
+    """Tests for HyperLogLog and count_distinct."""
+
+    def test_small_counts(self):
+        """Test small cardinalities are estimated almost exactly."""
+        import arrayops as ao
+
+        hll = ao.HyperLogLog()
+        hll.add(array.array("i", [1, 2, 2, 3, 3, 3]))
+        assert hll.count() == 3
+        assert hll.precision == 14
+
+    def test_large_accuracy(self):
+        """Test estimates stay within the expected error bound."""
+        import arrayops as ao
+
+        n = 100_000
+        hll = ao.HyperLogLog()
+        hll.add(array.array("l", [i % n for i in range(2 * n)]))
+        assert abs(hll.count() - n) <= 0.03 * n
+
+    def test_merge_matches_union(self):
+        """Test merging sketches gives the same estimate as one sketch."""
+        import arrayops as ao
+
+        whole = ao.HyperLogLog(precision=12)
+        whole.add(array.array("i", range(30_000)))
+
+        left = ao.HyperLogLog(precision=12)
+        left.add(array.array("i", range(20_000)))
+        right = ao.HyperLogLog(precision=12)
+        right.add(array.array("i", range(10_000, 30_000)))
+        left.merge(right)
+        assert left.count() == whole.count()
+
+    def test_merge_precision_mismatch(self):
+        """Test merging sketches with different precision raises."""
+        import arrayops as ao
+
+        with pytest.raises(ValueError, match="precision"):
+            ao.HyperLogLog(precision=10).merge(ao.HyperLogLog(precision=12))
+
+    def test_serialization_roundtrip(self):
+        """Test to_bytes/from_bytes and pickle preserve the sketch."""
+        import arrayops as ao
+
+        hll = ao.HyperLogLog(precision=10)
+        hll.add(array.array("d", [float(i) for i in range(5000)]))
+        restored = ao.HyperLogLog.from_bytes(hll.to_bytes())
+        assert restored.precision == 10
+        assert restored.count() == hll.count()
+        assert pickle.loads(pickle.dumps(hll)).count() == hll.count()
+        with pytest.raises(ValueError):
+            ao.HyperLogLog.from_bytes(b"not a sketch")
+
+    def test_invalid_precision(self):
+        """Test precision outside [4, 18] raises."""
+        import arrayops as ao
+
+        with pytest.raises(ValueError, match="precision"):
+            ao.HyperLogLog(precision=3)
+        with pytest.raises(ValueError, match="precision"):
+            ao.count_distinct(array.array("i", [1]), precision=19)
+
+    def test_float_canonicalization(self):
+        """Test -0.0/0.0 and NaNs count as one value each."""
+        import arrayops as ao
+
+        arr = array.array("d", [0.0, -0.0, float("nan"), float("nan"), 1.5])
+        assert ao.count_distinct(arr, approx=False) == 3
+        assert ao.count_distinct(arr) == 3
+
+    def test_count_distinct_exact(self):
+        """Test exact distinct counting for every typecode."""
+        import arrayops as ao
+
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            arr = array.array(typecode, [1, 2, 3, 2, 1, 5])
+            assert ao.count_distinct(arr, approx=False) == 4, f"Failed for type {typecode}"
+            assert ao.count_distinct(arr) == 4, f"Failed for type {typecode}"
+
+    def test_count_distinct_empty(self):
+        """Test empty arrays have zero distinct values."""
+        import arrayops as ao
+
+        assert ao.count_distinct(array.array("i", [])) == 0
+        assert ao.count_distinct(array.array("i", []), approx=False) == 0
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy_input(self):
+        """Test add and count_distinct accept NumPy arrays."""
+        import arrayops as ao
+
+        arr = np.array([1, 1, 2, 3, 5, 8], dtype=np.int64)
+        hll = ao.HyperLogLog()
+        hll.add(arr)
+        assert hll.count() == 5
+        assert ao.count_distinct(arr, approx=False) == 5
+
+
+class TestFrequencySketch:
+    """Tests for FrequencySketch."""
+
+    def test_small_exact(self):
+        """Test counts are exact when nothing collides."""
+        import arrayops as ao
+
+        sketch = ao.FrequencySketch()
+        sketch.add(array.array("l", [7, 7, 7, 3, 3, 9]))
+        assert sketch.top_k(2) == [(7, 3), (3, 2)]
+        assert sketch.estimate(9) == 1
+        assert sketch.estimate(12345) == 0
+        assert sketch.total == 6
+
+    def test_heavy_hitters(self):
+        """Test heavy hitters are found among a long tail of singletons."""
+        import arrayops as ao
+
+        values = []
+        for key in range(1, 21):
+            values.extend([key] * (1000 // key))
+        values.extend(range(10_000, 60_000))
+        random.Random(7).shuffle(values)
+
+        sketch = ao.FrequencySketch(capacity=32)
+        sketch.add(array.array("i", values))
+        top = sketch.top_k(5)
+        assert [value for value, _ in top] == [1, 2, 3, 4, 5]
+        for value, count in top:
+            assert count >= 1000 // value
+
+    def test_merge_shards(self):
+        """Test merging per-shard sketches."""
+        import arrayops as ao
+
+        left = ao.FrequencySketch()
+        left.add(array.array("i", [1] * 50 + [2] * 10))
+        right = ao.FrequencySketch()
+        right.add(array.array("i", [2] * 45 + [3] * 5))
+        left.merge(right)
+        assert left.top_k(3) == [(2, 55), (1, 50), (3, 5)]
+        assert left.total == 110
+
+        with pytest.raises(ValueError, match="width"):
+            left.merge(ao.FrequencySketch(width=16))
+
+    def test_negative_and_unsigned_values(self):
+        """Test negative and large unsigned values are reported as Python ints."""
+        import arrayops as ao
+
+        sketch = ao.FrequencySketch()
+        sketch.add(array.array("L", [2**32 - 1] * 2))
+        sketch.add(array.array("b", [-1, -1, -1]))
+        assert sketch.top_k(2) == [(-1, 3), (2**32 - 1, 2)]
+
+    def test_serialization_roundtrip(self):
+        """Test to_bytes/from_bytes and pickle preserve the sketch."""
+        import arrayops as ao
+
+        sketch = ao.FrequencySketch(width=256, depth=3, capacity=8)
+        sketch.add(array.array("h", [1, 1, 2, 3, 3, 3]))
+        restored = ao.FrequencySketch.from_bytes(sketch.to_bytes())
+        assert (restored.width, restored.depth, restored.capacity) == (256, 3, 8)
+        assert restored.top_k(3) == sketch.top_k(3)
+        assert pickle.loads(pickle.dumps(sketch)).estimate(3) == 3
+        with pytest.raises(ValueError):
+            ao.FrequencySketch.from_bytes(b"not a sketch")
+
+    def test_invalid_arguments(self):
+        """Test dimension, k and input type validation."""
+        import arrayops as ao
+
+        with pytest.raises(ValueError, match="width"):
+            ao.FrequencySketch(width=0)
+        with pytest.raises(ValueError, match="depth"):
+            ao.FrequencySketch(depth=17)
+        with pytest.raises(ValueError, match="capacity"):
+            ao.FrequencySketch(capacity=0)
+        sketch = ao.FrequencySketch(capacity=4)
+        with pytest.raises(ValueError, match="capacity"):
+            sketch.top_k(5)
+        with pytest.raises(TypeError, match="integer"):
+            sketch.add(array.array("d", [1.0]))
+
+    def test_all_integer_typecodes(self):
+        """Test add works for every integer typecode."""
+        import arrayops as ao
+
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L"]:
+            sketch = ao.FrequencySketch()
+            sketch.add(array.array(typecode, [5, 5, 1]))
+            assert sketch.top_k(1) == [(5, 2)], f"Failed for type {typecode}"
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy_input(self):
+        """Test add accepts NumPy arrays."""
+        import arrayops as ao
+
+        sketch = ao.FrequencySketch()
+        sketch.add(np.array([4, 4, 4, 1], dtype=np.int64))
+        assert sketch.top_k(1) == [(4, 3)]
@@ -0,0 +1,117 @@
+"""Tests for the sorted, return_counts and return_inverse options of unique."""
+
+import array
+import math
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _first_occurrence(data):
+    seen = set()
+    return [x for x in data if not (x in seen or seen.add(x))]
+
+
+class TestUniqueOptions:
+    """Tests for unique(sorted=, return_counts=, return_inverse=)."""
+
+    def test_all_types(self):
+        """Test values, inverse and counts for every typecode in both orders."""
+        import arrayops as ao
+
+        data = [5, 2, 8, 2, 1, 5, 9, 5]
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            arr = array.array(typecode, data)
+            for sort in (True, False):
+                values, inverse, counts = ao.unique(
+                    arr, sorted=sort, return_inverse=True, return_counts=True
+                )
+                expected = sorted(set(data)) if sort else _first_occurrence(data)
+                assert list(values) == expected, f"Failed for type {typecode}"
+                assert values.typecode == typecode
+                assert [values[i] for i in inverse] == data, f"Failed for type {typecode}"
+                assert list(counts) == [data.count(v) for v in expected]
+                assert inverse.typecode == "I" and counts.typecode == "L"
+
+    def test_return_shapes(self):
+        """Test the result is a bare array or a tuple of only the requested arrays."""
+        import arrayops as ao
+
+        arr = array.array("i", [3, 1, 3])
+        assert list(ao.unique(arr)) == [1, 3]
+        values, counts = ao.unique(arr, return_counts=True)
+        assert list(values) == [1, 3] and list(counts) == [1, 2]
+        values, inverse = ao.unique(arr, return_inverse=True)
+        assert list(inverse) == [1, 0, 1]
+        assert list(ao.unique(arr, sorted=False)) == [3, 1]
+
+    def test_small_types_counting_path(self):
+        """Test counts from the 8- and 16-bit counting table match the hash path."""
+        import arrayops as ao
+
+        data = [(i * 37) % 300 - 150 for i in range(5000)]
+        arr = array.array("h", data)
+        values, counts = ao.unique(arr, return_counts=True)
+        assert list(values) == sorted(set(data))
+        assert list(counts) == [data.count(v) for v in values]
+        _, inverse, hashed_counts = ao.unique(arr, return_inverse=True, return_counts=True)
+        assert list(hashed_counts) == list(counts)
+        assert [values[i] for i in inverse] == data
+
+    def test_nan_and_signed_zero(self):
+        """Test all NaNs form one value placed last, and -0.0 and 0.0 are one value."""
+        import arrayops as ao
+
+        arr = array.array("d", [float("nan"), -0.0, 1.0, float("nan"), 0.0, -1.0])
+        values, counts = ao.unique(arr, return_counts=True)
+        assert list(values[:3]) == [-1.0, 0.0, 1.0] and math.isnan(values[3])
+        assert list(counts) == [1, 2, 1, 2]
+        values = ao.unique(arr, sorted=False)
+        assert math.isnan(values[0])
+        assert math.copysign(1.0, values[1]) == -1.0
+
+    def test_empty(self):
+        """Test empty input returns empty arrays of the expected typecodes."""
+        import arrayops as ao
+
+        values, inverse, counts = ao.unique(
+            array.array("f"), return_inverse=True, return_counts=True
+        )
+        assert len(values) == len(inverse) == len(counts) == 0
+        assert (values.typecode, inverse.typecode, counts.typecode) == ("f", "I", "L")
+
+    def test_high_cardinality(self):
+        """Test a large, mostly distinct input (exercises the parallel build if enabled)."""
+        import arrayops as ao
+
+        n = 300_000
+        data = [(i * 2654435761) % 1_000_003 for i in range(n)]
+        arr = array.array("l", data)
+        values, inverse, counts = ao.unique(
+            arr, sorted=False, return_inverse=True, return_counts=True
+        )
+        assert list(values) == _first_occurrence(data)
+        assert [values[i] for i in inverse] == data
+        assert sum(counts) == n
+        assert list(ao.unique(arr)) == sorted(set(data))
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs match numpy.unique(return_inverse=True, return_counts=True)."""
+        import arrayops as ao
+
+        data = np.random.default_rng(0).integers(0, 1000, size=50_000).astype(np.int64)
+        values, inverse, counts = ao.unique(data, return_inverse=True, return_counts=True)
+        expected, expected_inverse, expected_counts = np.unique(
+            data, return_inverse=True, return_counts=True
+        )
+        assert isinstance(values, np.ndarray) and inverse.dtype == np.uint32
+        np.testing.assert_array_equal(values, expected)
+        np.testing.assert_array_equal(inverse, expected_inverse.ravel())
+        np.testing.assert_array_equal(counts, expected_counts)
@@ -0,0 +1,127 @@
+"""Tests for value_counts and mode."""
+
+import array
+import math
+from collections import Counter
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class TestValueCounts:
+    """Tests for value_counts."""
+
+    def test_all_types(self):
+        """Test value_counts against collections.Counter for every typecode."""
+        import arrayops as ao
+
+        data = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+        counter = Counter(data)
+        expected = sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            values, counts = ao.value_counts(array.array(typecode, data))
+            assert list(values) == [v for v, _ in expected], f"Failed for type {typecode}"
+            assert list(counts) == [c for _, c in expected], f"Failed for type {typecode}"
+            assert values.typecode == typecode and counts.typecode == "L"
+
+    def test_unsorted_is_ascending(self):
+        """Test sort=False returns the values in ascending order like unique()."""
+        import arrayops as ao
+
+        arr = array.array("h", [5, -3, 5, 0, -3, 5])
+        values, counts = ao.value_counts(arr, sort=False)
+        assert list(values) == list(ao.unique(arr)) == [-3, 0, 5]
+        assert list(counts) == [2, 1, 3]
+
+    def test_dense_signed_range(self):
+        """Test the full 8-bit range, including negative values, through the dense table."""
+        import arrayops as ao
+
+        data = list(range(-128, 128)) * 3 + [-128]
+        values, counts = ao.value_counts(array.array("b", data))
+        assert values[0] == -128 and counts[0] == 4
+        assert sorted(values) == list(range(-128, 128))
+        assert sum(counts) == len(data)
+
+    def test_large_16_bit(self):
+        """Test a large 16-bit input (dense table; parallel path if enabled)."""
+        import arrayops as ao
+
+        n = 200_000
+        data = array.array("H", [(i * 7919) % 65536 for i in range(n)])
+        values, counts = ao.value_counts(data, sort=False)
+        expected = sorted(Counter(data).items())
+        assert list(values) == [v for v, _ in expected]
+        assert list(counts) == [c for _, c in expected]
+
+    def test_large_hash(self):
+        """Test a large 32-bit input (hash table; parallel path if enabled)."""
+        import arrayops as ao
+
+        n = 250_000
+        data = array.array("i", [(i * 2654435761) % 1000 - 500 for i in range(n)])
+        values, counts = ao.value_counts(data)
+        assert len(values) == 1000
+        assert set(counts) == {n // 1000}
+        assert list(values) == sorted(values)
+
+    def test_float_special_values(self):
+        """Test NaNs count as one value sorted last and -0.0 equals 0.0."""
+        import arrayops as ao
+
+        nan = float("nan")
+        arr = array.array("d", [nan, 0.0, -0.0, 1.5, nan, 1.5, nan])
+        values, counts = ao.value_counts(arr, sort=False)
+        assert list(values[:2]) == [0.0, 1.5] and math.isnan(values[2])
+        assert list(counts) == [2, 2, 3]
+
+    def test_empty(self):
+        """Test an empty array gives two empty arrays."""
+        import arrayops as ao
+
+        values, counts = ao.value_counts(array.array("i"))
+        assert len(values) == 0 and len(counts) == 0
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs match numpy.unique(return_counts=True)."""
+        import arrayops as ao
+
+        data = np.random.default_rng(0).integers(-50, 50, size=10_000, dtype=np.int64)
+        values, counts = ao.value_counts(data, sort=False)
+        expected_values, expected_counts = np.unique(data, return_counts=True)
+        assert isinstance(values, np.ndarray)
+        np.testing.assert_array_equal(values, expected_values)
+        np.testing.assert_array_equal(counts, expected_counts)
+
+
+class TestMode:
+    """Tests for mode."""
+
+    def test_all_types(self):
+        """Test mode for every typecode."""
+        import arrayops as ao
+
+        data = [2, 7, 7, 1, 7, 2]
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            assert ao.mode(array.array(typecode, data)) == 7, f"Failed for type {typecode}"
+
+    def test_ties_pick_smallest(self):
+        """Test ties resolve to the smallest value."""
+        import arrayops as ao
+
+        assert ao.mode(array.array("i", [4, 1, 4, 1, 7])) == 1
+        assert ao.mode(array.array("d", [2.5, -1.0])) == -1.0
+
+    def test_empty(self):
+        """Test mode of an empty array raises ValueError."""
+        import arrayops as ao
+
+        with pytest.raises(ValueError, match="empty"):
+            ao.mode(array.array("i"))
@@ -0,0 +1,185 @@
+"""Tests for vector operations (dot, norm, cosine and their batched forms)."""
+
+import array
+import math
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class TestDot:
+    """Tests for dot."""
+
+    def test_all_types(self):
+        """Test dot against a pure Python reference for every typecode."""
+        import arrayops as ao
+
+        a = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
+        b = [5, 4, 3, 2, 1, 0, 1, 2, 3, 4, 5]
+        expected = sum(x * y for x, y in zip(a, b))
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            result = ao.dot(array.array(typecode, a), array.array(typecode, b))
+            assert result == expected, f"Failed for type {typecode}"
+            assert isinstance(result, float if typecode in "fd" else int)
+
+    @pytest.mark.skipif(array.array("l").itemsize < 8, reason="'l' is 32-bit on this platform")
+    def test_no_integer_overflow(self):
+        """Test integer dot products are exact beyond the element type range."""
+        import arrayops as ao
+
+        a = array.array("b", [127] * 1000)
+        assert ao.dot(a, a) == 127 * 127 * 1000
+        big = array.array("l", [2**62, 2**62])
+        assert ao.dot(big, big) == 2 * 2**124
+
+    def test_extremes_exact(self):
+        """Test extreme 8-, 16- and 32-bit values across many lanes are exact."""
+        import arrayops as ao
+
+        for typecode, low, high in [
+            ("b", -(2**7), 2**7 - 1),
+            ("H", 0, 2**16 - 1),
+            ("i", -(2**31), 2**31 - 1),
+            ("I", 0, 2**32 - 1),
+        ]:
+            a = [low, high, high] * 1001
+            b = [low, low, high] * 1001
+            expected = sum(x * y for x, y in zip(a, b))
+            result = ao.dot(array.array(typecode, a), array.array(typecode, b))
+            assert result == expected, f"Failed for type {typecode}"
+
+    @pytest.mark.skipif(array.array("l").itemsize < 8, reason="'l' is 32-bit on this platform")
+    def test_overflow_raises(self):
+        """Test OverflowError when the exact result exceeds 128 bits."""
+        import arrayops as ao
+
+        big = array.array("l", [-(2**63)] * 4)
+        with pytest.raises(OverflowError):
+            ao.dot(big, big)
+
+    def test_empty_and_validation(self):
+        """Test empty arrays and the type/length checks."""
+        import arrayops as ao
+
+        assert ao.dot(array.array("i"), array.array("i")) == 0
+        assert ao.dot(array.array("d"), array.array("d")) == 0.0
+        with pytest.raises(TypeError, match="same type"):
+            ao.dot(array.array("i", [1]), array.array("d", [1.0]))
+        with pytest.raises(ValueError, match="same length"):
+            ao.dot(array.array("i", [1]), array.array("i", [1, 2]))
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test dot with NumPy arrays."""
+        import arrayops as ao
+
+        a = np.linspace(-1.0, 1.0, 1001)
+        b = np.cos(a)
+        assert ao.dot(a, b) == pytest.approx(float(np.dot(a, b)))
+
+
+class TestNorm:
+    """Tests for norm."""
+
+    def test_orders(self):
+        """Test ord=1, 2 and inf."""
+        import arrayops as ao
+
+        values = [3, -4, 12, 0, -1, 2, 5, -7, 9]
+        for typecode in ["b", "h", "i", "l", "f", "d"]:
+            arr = array.array(typecode, values)
+            assert ao.norm(arr) == pytest.approx(math.sqrt(sum(v * v for v in values)))
+            assert ao.norm(arr, ord=1) == pytest.approx(sum(abs(v) for v in values))
+            assert ao.norm(arr, ord=math.inf) == 12.0, f"Failed for type {typecode}"
+
+    def test_nan_and_empty(self):
+        """Test NaN propagation and empty arrays."""
+        import arrayops as ao
+
+        arr = array.array("d", [1.0, math.nan, 2.0])
+        assert math.isnan(ao.norm(arr))
+        assert math.isnan(ao.norm(arr, ord=math.inf))
+        assert ao.norm(array.array("d")) == 0.0
+
+    def test_invalid_ord(self):
+        """Test unsupported orders raise ValueError."""
+        import arrayops as ao
+
+        with pytest.raises(ValueError, match="ord"):
+            ao.norm(array.array("d", [1.0]), ord=3)
+
+
+class TestCosine:
+    """Tests for cosine and the batched forms."""
+
+    def test_cosine(self):
+        """Test cosine similarity against a pure Python reference."""
+        import arrayops as ao
+
+        a = [1.0, 2.0, 3.0, -1.0, 0.5, 4.0, 2.0, 1.0, -3.0]
+        b = [2.0, 0.0, 1.0, 1.0, -0.5, 3.0, 1.0, 2.0, 1.0]
+        expected = sum(x * y for x, y in zip(a, b)) / (
+            math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        )
+        assert ao.cosine(array.array("d", a), array.array("d", b)) == pytest.approx(expected)
+        assert ao.cosine(array.array("i", [1, 2]), array.array("i", [2, 4])) == pytest.approx(1.0)
+
+    def test_zero_vector_is_nan(self):
+        """Test a zero vector gives NaN."""
+        import arrayops as ao
+
+        assert math.isnan(ao.cosine(array.array("d", [0.0, 0.0]), array.array("d", [1.0, 2.0])))
+
+    def test_batch(self):
+        """Test batched scores match the single-pair functions."""
+        import arrayops as ao
+
+        query = array.array("f", [0.5, -1.0, 2.0, 3.0])
+        candidates = [
+            array.array("f", [1.0, 1.0, 1.0, 1.0]),
+            array.array("f", [-2.0, 0.0, 4.0, 1.5]),
+            array.array("f", [0.5, -1.0, 2.0, 3.0]),
+        ]
+        dots = ao.dot_batch(query, candidates)
+        cosines = ao.cosine_batch(query, iter(candidates))
+        assert isinstance(dots, array.array) and dots.typecode == "d"
+        for i, candidate in enumerate(candidates):
+            assert dots[i] == pytest.approx(ao.dot(query, candidate))
+            assert cosines[i] == pytest.approx(ao.cosine(query, candidate))
+        assert len(ao.dot_batch(query, [])) == 0
+
+    def test_batch_validation(self):
+        """Test candidates are checked against the query."""
+        import arrayops as ao
+
+        query = array.array("d", [1.0, 2.0])
+        with pytest.raises(TypeError, match="same type"):
+            ao.dot_batch(query, [array.array("i", [1, 2])])
+        with pytest.raises(ValueError, match="same length"):
+            ao.cosine_batch(query, [array.array("d", [1.0, 2.0]), array.array("d", [1.0])])
+
+    def test_batch_empty_query(self):
+        """Test an empty query gives zero dots and raises for cosine, as cosine() does."""
+        import arrayops as ao
+
+        empty = array.array("d")
+        assert list(ao.dot_batch(empty, [array.array("d")])) == [0.0]
+        with pytest.raises(ValueError, match="empty"):
+            ao.cosine_batch(empty, [array.array("d")])
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_batch_numpy(self):
+        """Test a NumPy query returns a NumPy result."""
+        import arrayops as ao
+
+        query = np.array([1.0, 2.0, 3.0])
+        candidates = [np.array([1.0, 0.0, 0.0]), np.array([0.0, 0.0, 2.0])]
+        result = ao.dot_batch(query, candidates)
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_allclose(result, [1.0, 6.0])
@@ -0,0 +1,186 @@
+"""Tests for where, fill_nan and replace."""
+
+import array
+import math
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+TYPECODES = ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]
+
+
+class TestWhere:
+    """Tests for where."""
+
+    def test_all_types(self):
+        """Test array and scalar operands for every typecode."""
+        import arrayops as ao
+
+        mask = array.array("B", [1, 0, 2, 0])
+        for typecode in TYPECODES:
+            a = array.array(typecode, [1, 2, 3, 4])
+            b = array.array(typecode, [5, 6, 7, 8])
+            result = ao.where(mask, a, b)
+            assert result.typecode == typecode
+            assert list(result) == [1, 6, 3, 8], f"Failed for type {typecode}"
+            assert list(ao.where(mask, a, 0)) == [1, 0, 3, 0], f"Failed for type {typecode}"
+            assert list(ao.where(mask, 9, b)) == [9, 6, 9, 8], f"Failed for type {typecode}"
+
+    def test_scalars_with_out(self):
+        """Test two scalars take their typecode from out."""
+        import arrayops as ao
+
+        out = array.array("h", [0, 0, 0])
+        result = ao.where(array.array("B", [0, 1, 1]), 1, -1, out=out)
+        assert result is out
+        assert list(out) == [-1, 1, 1]
+        with pytest.raises(TypeError, match="array"):
+            ao.where(array.array("B", [0, 1]), 1, -1)
+
+    def test_in_place_through_out(self):
+        """Test out may alias an operand to update it in place."""
+        import arrayops as ao
+
+        arr = array.array("d", [-2.0, 5.0, -1.0, 3.0])
+        ao.where(ao.less(arr, 0.0), 0.0, arr, out=arr)
+        assert list(arr) == [0.0, 5.0, 0.0, 3.0]
+
+    def test_invalid(self):
+        """Test mask, length and typecode mismatches are rejected."""
+        import arrayops as ao
+
+        a = array.array("i", [1, 2, 3])
+        with pytest.raises(TypeError, match="uint8"):
+            ao.where(array.array("i", [1, 0, 1]), a, 0)
+        with pytest.raises(ValueError, match="length"):
+            ao.where(array.array("B", [1, 0]), a, 0)
+        with pytest.raises(TypeError):
+            ao.where(array.array("B", [1, 0, 1]), a, array.array("d", [0.0, 0.0, 0.0]))
+        with pytest.raises(TypeError):
+            ao.where(array.array("B", [1, 0, 1]), a, 0.5)
+
+    def test_empty(self):
+        """Test an empty mask gives an empty result of the operand's type."""
+        import arrayops as ao
+
+        result = ao.where(array.array("B"), array.array("f"), 0.0)
+        assert len(result) == 0 and result.typecode == "f"
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs match numpy.where."""
+        import arrayops as ao
+
+        rng = np.random.default_rng(0)
+        a = rng.normal(size=100_000)
+        b = rng.normal(size=100_000)
+        result = ao.where(ao.greater(a, b.mean()), a, b)
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_array_equal(result, np.where(a > b.mean(), a, b))
+
+
+class TestFillNan:
+    """Tests for fill_nan."""
+
+    def test_floats(self):
+        """Test NaN elements are replaced and others kept."""
+        import arrayops as ao
+
+        for typecode in ["f", "d"]:
+            arr = array.array(typecode, [float("nan"), 1.5, float("nan"), -0.0])
+            ao.fill_nan(arr, 0.25)
+            assert list(arr) == [0.25, 1.5, 0.25, -0.0], f"Failed for type {typecode}"
+
+    def test_integers_unchanged(self):
+        """Test integer arrays are left as they are."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2, 3])
+        ao.fill_nan(arr, 0)
+        assert list(arr) == [1, 2, 3]
+        ao.fill_nan(array.array("d"), 0.0)
+
+    def test_read_only(self):
+        """Test read-only memoryviews are rejected."""
+        import arrayops as ao
+
+        with pytest.raises(ValueError, match="read-only"):
+            ao.fill_nan(memoryview(bytes(16)).cast("d"), 0.0)
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy(self):
+        """Test NumPy inputs match numpy.nan_to_num for NaN."""
+        import arrayops as ao
+
+        arr = np.random.default_rng(0).normal(size=50_000)
+        arr[::7] = np.nan
+        expected = np.where(np.isnan(arr), -1.0, arr)
+        ao.fill_nan(arr, -1.0)
+        np.testing.assert_array_equal(arr, expected)
+
+
+class TestReplace:
+    """Tests for replace."""
+
+    def test_all_types(self):
+        """Test replace for every typecode."""
+        import arrayops as ao
+
+        for typecode in TYPECODES:
+            arr = array.array(typecode, [3, 1, 3, 2])
+            ao.replace(arr, 3, 7)
+            assert list(arr) == [7, 1, 7, 2], f"Failed for type {typecode}"
+
+    def test_nan_and_exact_comparison(self):
+        """Test a NaN old value matches NaN, and old is compared as in equal()."""
+        import arrayops as ao
+
+        arr = array.array("d", [float("nan"), 1.0])
+        ao.replace(arr, float("nan"), 2.0)
+        assert list(arr) == [2.0, 1.0]
+
+        ints = array.array("i", [2, 3])
+        ao.replace(ints, 2.5, 0)
+        assert list(ints) == [2, 3]
+        ao.replace(ints, 2.0, 0)
+        assert list(ints) == [0, 3]
+
+        small = array.array("b", [1, -1])
+        ao.replace(small, 300, 0)
+        assert list(small) == [1, -1]
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_out_of_range_old_on_64bit(self):
+        """Test an old value just past the int64 range matches nothing."""
+        import arrayops as ao
+
+        top = np.iinfo(np.int64).max
+        arr = np.array([top, top - 511, 0], dtype=np.int64)
+        ao.replace(arr, 2**63, 1)
+        ao.replace(arr, float(2**63), 1)
+        assert list(arr) == [top, top - 511, 0]
+        ao.replace(arr, top, 1)
+        assert list(arr) == [1, top - 511, 0]
+
+    def test_invalid(self):
+        """Test a new value that does not fit and read-only inputs."""
+        import arrayops as ao
+
+        with pytest.raises(TypeError):
+            ao.replace(array.array("i", [1]), 1, 0.5)
+        with pytest.raises(ValueError, match="read-only"):
+            ao.replace(memoryview(bytes(8)).cast("i"), 0, 1)
+
+    def test_float_new_kept_exact(self):
+        """Test the replacement value is stored as given."""
+        import arrayops as ao
+
+        arr = array.array("d", [0.0, 1.0])
+        ao.replace(arr, 0.0, math.pi)
+        assert list(arr) == [math.pi, 1.0]
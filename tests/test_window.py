@@ -0,0 +1,187 @@
+"""Tests for rolling-window operations."""
+
+import array
+import math
+import random
+
+import pytest
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def naive_rolling(values, window, min_periods, func):
+    """Reference implementation: apply func to each trailing window's non-NaN values."""
+    result = []
+    for i in range(len(values)):
+        chunk = [v for v in values[max(0, i - window + 1) : i + 1] if not math.isnan(v)]
+        result.append(func(chunk) if len(chunk) >= min_periods else math.nan)
+    return result
+
+
+def population_var(chunk):
+    mean = sum(chunk) / len(chunk)
+    return sum((v - mean) ** 2 for v in chunk) / len(chunk)
+
+
+def assert_close(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        if math.isnan(e):
+            assert math.isnan(a)
+        else:
+            assert a == pytest.approx(e, rel=1e-9, abs=1e-9)
+
+
+class TestRolling:
+    """Tests for rolling_sum/mean/var/std/min/max."""
+
+    def test_basic_examples(self):
+        """Test the documented examples."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2, 3, 4, 5])
+        assert_close(ao.rolling_sum(arr, 3), [math.nan, math.nan, 6.0, 9.0, 12.0])
+        assert_close(ao.rolling_sum(arr, 3, min_periods=1), [1.0, 3.0, 6.0, 9.0, 12.0])
+        assert_close(
+            ao.rolling_mean(array.array("d", [1.0, 2.0, 3.0, 4.0]), 2),
+            [math.nan, 1.5, 2.5, 3.5],
+        )
+        assert_close(
+            ao.rolling_std(array.array("d", [1.0, 3.0, 5.0, 9.0]), 2),
+            [math.nan, 1.0, 1.0, 2.0],
+        )
+        data = array.array("i", [5, 1, 4, 1, 5, 9, 2, 6])
+        assert_close(ao.rolling_min(data, 3), [math.nan, math.nan, 1, 1, 1, 1, 2, 2])
+        assert_close(ao.rolling_max(data, 3), [math.nan, math.nan, 5, 4, 5, 9, 9, 9])
+
+    def test_matches_reference(self):
+        """Test every kernel against a naive per-window computation."""
+        import arrayops as ao
+
+        rng = random.Random(0)
+        values = [rng.uniform(-100, 100) for _ in range(2000)]
+        values[10] = values[11] = math.nan
+        arr = array.array("d", values)
+        funcs = {
+            ao.rolling_sum: sum,
+            ao.rolling_mean: lambda c: sum(c) / len(c),
+            ao.rolling_var: population_var,
+            ao.rolling_std: lambda c: math.sqrt(population_var(c)),
+            ao.rolling_min: min,
+            ao.rolling_max: max,
+        }
+        for window, min_periods in [(1, 1), (5, 3), (64, 64), (3000, 1)]:
+            for op, func in funcs.items():
+                expected = naive_rolling(values, window, min_periods, func)
+                assert_close(op(arr, window, min_periods=min_periods), expected)
+
+    def test_ddof(self):
+        """Test sample variance via ddof=1."""
+        import arrayops as ao
+
+        arr = array.array("d", [1.0, 2.0, 4.0, 8.0])
+        result = ao.rolling_var(arr, 3, min_periods=1, ddof=1)
+        assert math.isnan(result[0])
+        assert result[1] == pytest.approx(0.5)
+        assert result[3] == pytest.approx(population_var([2.0, 4.0, 8.0]) * 3 / 2)
+
+    def test_infinity_leaves_window(self):
+        """Test an infinity only affects the windows that contain it."""
+        import arrayops as ao
+
+        arr = array.array("d", [1.0, math.inf, 1.0, 1.0, 1.0])
+        assert list(ao.rolling_sum(arr, 2)[1:]) == [math.inf, math.inf, 2.0, 2.0]
+        var = ao.rolling_var(arr, 2)
+        assert math.isnan(var[2])
+        assert var[3] == 0.0
+
+    def test_result_type(self):
+        """Test results are float64 arrays of the input length."""
+        import arrayops as ao
+
+        for typecode in ["b", "B", "h", "H", "i", "I", "l", "L", "f", "d"]:
+            arr = array.array(typecode, [1, 2, 3, 4])
+            result = ao.rolling_sum(arr, 2)
+            assert isinstance(result, array.array), f"Failed for type {typecode}"
+            assert result.typecode == "d"
+            assert list(result[1:]) == [3.0, 5.0, 7.0]
+
+    def test_out_parameter(self):
+        """Test writing into a preallocated output."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2, 3, 4])
+        out = array.array("d", [0.0] * 4)
+        result = ao.rolling_max(arr, 2, out=out)
+        assert result is out
+        assert list(out[1:]) == [2.0, 3.0, 4.0]
+
+        with pytest.raises(TypeError, match="typecode"):
+            ao.rolling_sum(arr, 2, out=array.array("f", [0.0] * 4))
+        with pytest.raises(ValueError, match="length"):
+            ao.rolling_sum(arr, 2, out=array.array("d", [0.0] * 3))
+        with pytest.raises(ValueError):
+            ao.rolling_sum(arr, 2, out=memoryview(bytes(32)).cast("d"))
+
+    def test_out_is_input(self):
+        """Test out may be the input array itself."""
+        import arrayops as ao
+
+        values = [float((i * 7919) % 101) for i in range(500)]
+        arr = array.array("d", values)
+        expected = list(ao.rolling_max(arr, 7))
+        assert ao.rolling_max(arr, 7, out=arr) is arr
+        assert_close(list(arr), expected)
+
+    def test_empty(self):
+        """Test empty input gives an empty result."""
+        import arrayops as ao
+
+        result = ao.rolling_mean(array.array("d", []), 3)
+        assert len(result) == 0
+
+    def test_invalid_arguments(self):
+        """Test window and min_periods validation."""
+        import arrayops as ao
+
+        arr = array.array("i", [1, 2, 3])
+        with pytest.raises(ValueError, match="window"):
+            ao.rolling_sum(arr, 0)
+        with pytest.raises(ValueError, match="min_periods"):
+            ao.rolling_sum(arr, 2, min_periods=3)
+        with pytest.raises(ValueError, match="min_periods"):
+            ao.rolling_sum(arr, 2, min_periods=0)
+        with pytest.raises(TypeError):
+            ao.rolling_sum([1, 2, 3], 2)
+
+    def test_large_array(self):
+        """Test arrays large enough to take the chunked parallel path."""
+        import arrayops as ao
+
+        n = 300_000
+        arr = array.array("l", range(n))
+        result = ao.rolling_sum(arr, 10)
+        assert math.isnan(result[8])
+        assert result[9] == sum(range(10))
+        assert result[n - 1] == sum(range(n - 10, n))
+        assert ao.rolling_min(arr, 1000)[200_000] == 199_001.0
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+    def test_numpy_input(self):
+        """Test NumPy input returns a float64 ndarray."""
+        import arrayops as ao
+
+        arr = np.array([1, 2, 3, 4], dtype=np.int32)
+        result = ao.rolling_mean(arr, 2)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.float64
+        np.testing.assert_allclose(result[1:], [1.5, 2.5, 3.5])
+
+        out = np.zeros(4)
+        ao.rolling_sum(arr, 2, out=out)
+        np.testing.assert_allclose(out[1:], [3.0, 5.0, 7.0])